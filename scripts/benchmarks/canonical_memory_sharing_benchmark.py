@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""ライブ評価で canonical memory が大きいときの、1 ターンあたりの受け渡し費用を計測する。
+
+エージェントと judge は即時に返すスタブで、judge は毎ターン同じ大きさの memory
+（事前に組み立てた dict）を返す。計測値はエージェント数 × memory のキー数ごとの
+`run_episode` の 1 ターンあたり μs で、ほぼすべてが memory の受け渡し費用になる。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/canonical_memory_sharing_benchmark.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Mapping
+
+from acc.application.use_cases.live_multi_agent_evaluation import LiveMultiAgentEvaluationUseCase
+from acc.domain.value_objects.evaluation import HallucinationAudit, OutcomeScores
+from acc.domain.value_objects.live_evaluation import (
+    AgentTurnResponse,
+    EvaluationTurnQuery,
+    JudgeAgentEvaluation,
+    JudgeTurnResult,
+)
+
+
+class _ReadingAgent:
+    """memory から 1 キーだけ読んで応答するエージェントスタブ。"""
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """1 キーだけ memory から読んで固定応答を返す。"""
+        return AgentTurnResponse(
+            response_text=str(canonical_memory.get("fact-0", query.user_query)),
+            memory_tokens=1,
+        )
+
+
+class _FixedJudge:
+    """事前に組み立てた memory を返す judge スタブ。"""
+
+    def __init__(self, memory: dict[str, object]) -> None:
+        """毎ターン返す memory を受け取る。"""
+        self._memory = memory
+        self._evaluation = JudgeAgentEvaluation(
+            outcome_scores=OutcomeScores(
+                relevance=7.0, answer_quality=7.0, instruction_following=7.0, coherence=7.0
+            ),
+            hallucination_audit=HallucinationAudit(supported_claims=1, unsupported_claims=0),
+            drift_audit=None,
+        )
+
+    def evaluate_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+        agent_responses: Mapping[str, AgentTurnResponse],
+    ) -> JudgeTurnResult:
+        """固定の評価と memory を返す。"""
+        del query, canonical_memory
+        return JudgeTurnResult(
+            updated_canonical_memory=self._memory,
+            evaluations_by_agent={name: self._evaluation for name in agent_responses},
+        )
+
+
+def _per_turn_microseconds(agents: int, keys: int, turns: int, rounds: int) -> float:
+    memory: dict[str, object] = {f"fact-{index}": f"値 {index}" for index in range(keys)}
+    use_case = LiveMultiAgentEvaluationUseCase(
+        agent_runners={f"agent-{index}": _ReadingAgent() for index in range(agents)},
+        judge_evaluator=_FixedJudge(memory),
+        max_concurrent_agents=1,
+    )
+    queries = tuple(
+        EvaluationTurnQuery(turn_id=turn_id, user_query=f"質問 {turn_id}")
+        for turn_id in range(1, turns + 1)
+    )
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        use_case.run_episode(queries, initial_canonical_memory=memory)
+        best = min(best, time.perf_counter() - started)
+    return best / turns * 1e6
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, nargs="+", default=[2, 8])
+    parser.add_argument("--keys", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'agents':>6} {'keys':>8} {'μs/turn':>10}")
+    for agents in args.agents:
+        for keys in args.keys:
+            micros = _per_turn_microseconds(agents, keys, args.turns, args.rounds)
+            print(f"{agents:>6} {keys:>8,} {micros:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""JSONL に保存した CCS payload の一括検証スループット（行/秒）を、逐次とプロセスプールで比較する。
+
+`sequential` は 1 行ずつ `json.loads` と `parse_and_validate_ccs_payload` を呼ぶ従来の方法、
+`batch wN` は `iter_validate_ccs_jsonl(workers=N)`。`--invalid-rate` の割合で不正な行を混ぜる。
+JSONL は計測前に一時ファイルへ書き出し、計測はファイルの読み込みから含める。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_batch_validation_benchmark.py --records 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from acc.application.services.ccs_batch_validation import iter_validate_ccs_jsonl
+from acc.domain.services.ccs_schema import CCSValidationError, parse_and_validate_ccs_payload
+
+
+def _write_dataset(path: Path, records: int, invalid_rate: float, seed: int) -> None:
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as file:
+        for turn_id in range(1, records + 1):
+            payload: dict[str, object] = {
+                "episodic_trace": [f"t{turn_id - 1}: upstream を調査", f"t{turn_id}: GC を確認"],
+                "semantic_gist": f"web-01 の 502 を調査中（ターン {turn_id}）",
+                "focal_entities": ["web-01", "nginx", "app-02"],
+                "relational_map": ["web-01 -> app-02"],
+                "goal_orientation": "502 の原因を特定する",
+                "constraints": ["本番の設定変更は承認後に行う"],
+                "predictive_cue": ["app-02 の GC ログを見る"],
+                "uncertainty_signal": "中",
+                "retrieved_artifacts": [f"log-{turn_id}"],
+            }
+            if rng.random() < invalid_rate:
+                payload["constraints"] = "本番の設定変更は承認後に行う"
+            file.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+def _sequential(path: Path) -> int:
+    invalid = 0
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            try:
+                parse_and_validate_ccs_payload(json.loads(line))
+            except CCSValidationError:
+                invalid += 1
+    return invalid
+
+
+def _batch(workers: int) -> Callable[[Path], int]:
+    def run(path: Path) -> int:
+        with path.open(encoding="utf-8") as file:
+            return sum(not record.ok for record in iter_validate_ccs_jsonl(file, workers=workers))
+
+    return run
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--invalid-rate", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    modes: list[tuple[str, Callable[[Path], int]]] = [("sequential", _sequential)]
+    modes.extend((f"batch w{workers}", _batch(workers)) for workers in sorted({1, args.workers}))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "ccs.jsonl"
+        _write_dataset(path, args.records, args.invalid_rate, args.seed)
+        print(f"CPU {os.cpu_count()}、{args.records:,} 行")
+        print(f"{'mode':<11} {'不正行':>8} {'秒':>7} {'行/秒':>10}")
+        for mode, run in modes:
+            started = time.perf_counter()
+            invalid = run(path)
+            elapsed = time.perf_counter() - started
+            print(f"{mode:<11} {invalid:>8,} {elapsed:>7.2f} {args.records / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""CCS スナップショットのバイナリコーデックと JSON の速度・サイズを比較する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_codec_benchmark.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+from acc.adapters.outbound.ccs_binary_codec import (
+    decode_session_snapshot,
+    encode_session_snapshot,
+)
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+
+
+def build_snapshot(turn_id: int = 42) -> SessionSnapshot:
+    """上限件数まで埋まった典型的なスナップショットを作る。"""
+    return SessionSnapshot(
+        committed_state=CompressedCognitiveState(
+            episodic_trace=tuple(
+                f"t{turn_id - i}: ユーザーが API 設計の論点 {i} を確認" for i in range(3)
+            ),
+            semantic_gist="決済 API の再設計。冪等キーとリトライ方針を中心に合意形成中。",
+            focal_entities=tuple(f"entity-{i}" for i in range(8)),
+            relational_map=tuple(f"service-{i} -> db-{i}" for i in range(8)),
+            goal_orientation="v2 API の契約を確定する",
+            constraints=tuple(f"制約 {i}: 後方互換を維持" for i in range(8)),
+            predictive_cue=tuple(f"次に {i} を検討" for i in range(4)),
+            uncertainty_signal="medium",
+            retrieved_artifacts=tuple(f"artifact-{i:04d}" for i in range(5)),
+        ),
+        turn_id=turn_id,
+        recent_dialogue_turns=tuple(
+            RecentDialogueTurn(
+                turn_id=turn_id - i,
+                user_input=f"質問 {i}: 冪等キーの保持期間はどうする？",
+                assistant_response=f"回答 {i}: 24 時間を提案します。理由は再送窓の最大値です。",
+            )
+            for i in range(2)
+        ),
+    )
+
+
+def encode_json(snapshot: SessionSnapshot) -> bytes:
+    """`asdict` + JSON で符号化する。"""
+    return json.dumps(asdict(snapshot), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def decode_json(data: bytes) -> SessionSnapshot:
+    """JSON からスナップショットを復元する。"""
+    payload = json.loads(data)
+    state = payload["committed_state"]
+    return SessionSnapshot(
+        committed_state=CompressedCognitiveState(
+            **{
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in state.items()
+            }
+        ),
+        turn_id=payload["turn_id"],
+        recent_dialogue_turns=tuple(
+            RecentDialogueTurn(**turn) for turn in payload["recent_dialogue_turns"]
+        ),
+    )
+
+
+def _ops_per_second(func: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    snapshot = build_snapshot()
+    binary = encode_session_snapshot(snapshot)
+    json_bytes = encode_json(snapshot)
+    assert decode_session_snapshot(binary) == snapshot
+    assert decode_json(json_bytes) == snapshot
+
+    rows = (
+        (
+            "binary",
+            len(binary),
+            _ops_per_second(lambda: encode_session_snapshot(snapshot), args.iterations),
+            _ops_per_second(lambda: decode_session_snapshot(binary), args.iterations),
+        ),
+        (
+            "json",
+            len(json_bytes),
+            _ops_per_second(lambda: encode_json(snapshot), args.iterations),
+            _ops_per_second(lambda: decode_json(json_bytes), args.iterations),
+        ),
+    )
+    print(f"{'codec':<8} {'bytes':>7} {'encode/s':>12} {'decode/s':>12}")
+    for name, size, encode_rate, decode_rate in rows:
+        print(f"{name:<8} {size:>7} {encode_rate:>12,.0f} {decode_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""CCS の構造共有有無で、多セッション・多ターン保持時の RSS を比較する。
+
+各モードは別プロセスで実行し、ピーク RSS（`ru_maxrss`）を比較する。
+評価・チェックポイント用途を想定し、全ターンの CCS を保持する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_interning_memory_benchmark.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+_CONSTRAINTS = (
+    "個人情報を出力しない",
+    "既存 API の後方互換を維持する",
+    "回答は日本語で簡潔にする",
+    "外部サービスへの書き込みは承認後に行う",
+    "コストは月額予算内に収める",
+)
+_ENTITIES = ("決済API", "冪等キー", "リトライ", "監査ログ", "請求書")
+
+
+def run_workload(*, sessions: int, turns: int, share_structure: bool) -> dict[str, float]:
+    """全ターンの CCS を保持しながらセッションを進め、RSS と所要時間を返す。"""
+    compressor = SimpleCognitiveCompressorAdapter(share_structure=share_structure)
+    baseline_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    history: list[list[CompressedCognitiveState]] = []
+    for session_index in range(sessions):
+        state = CompressedCognitiveState.empty()
+        states: list[CompressedCognitiveState] = []
+        for turn_id in range(1, turns + 1):
+            # モデル出力の JSON 復元を模し、同値でも毎ターン新しい文字列を作る。
+            signal = TurnInteractionSignal(
+                turn_id=turn_id,
+                user_input=f"session {session_index} turn {turn_id}: 進捗を確認したい",
+                focus_entities=tuple("".join(list(entity)) for entity in _ENTITIES),
+                active_goal="".join(list("決済 API の再設計を完了する")),
+                active_constraints=tuple("".join(list(item)) for item in _CONSTRAINTS),
+            )
+            state = compressor.commit_next_state(signal, state, ())
+            states.append(state)
+        history.append(states)
+    elapsed = time.perf_counter() - started
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "states": float(sum(len(states) for states in history)),
+        "rss_delta_mib": (peak_kib - baseline_kib) / 1024,
+        "peak_rss_mib": peak_kib / 1024,
+        "seconds": elapsed,
+    }
+
+
+def main() -> None:
+    """モードごとに子プロセスを起動して結果を比較表示する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--mode", choices=("baseline", "shared"), default=None)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        result = run_workload(
+            sessions=args.sessions,
+            turns=args.turns,
+            share_structure=args.mode == "shared",
+        )
+        print(json.dumps(result))
+        return
+
+    print(f"sessions={args.sessions} turns={args.turns}")
+    print(f"{'mode':<9} {'states':>8} {'rss_delta_MiB':>14} {'peak_MiB':>9} {'seconds':>8}")
+    for mode in ("baseline", "shared"):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--sessions",
+                str(args.sessions),
+                "--turns",
+                str(args.turns),
+                "--mode",
+                mode,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        result = json.loads(completed.stdout)
+        print(
+            f"{mode:<9} {int(result['states']):>8} {result['rss_delta_mib']:>14.1f} "
+            f"{result['peak_rss_mib']:>9.1f} {result['seconds']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
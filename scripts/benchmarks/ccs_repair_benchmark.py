@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""圧縮モデルの出力に形式不正が混じるとき、strict と lenient で失敗ターン数と所要時間を比較する。
+
+`--malformed-rate` の割合で、配列フィールドのスカラー化・空要素・欠落のいずれかを起こした
+payload を返すスタブを `SchemaAwareCognitiveCompressorAdapter` に通す。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_repair_benchmark.py --turns 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Sequence
+
+from acc.adapters.outbound.schema_aware_cognitive_compressor import (
+    CCSRepairStats,
+    SchemaAwareCognitiveCompressorAdapter,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.ccs_schema import CCSValidationError
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+
+class _MalformingModel(CognitiveCompressorModelPort):
+    """一定割合で配列フィールドの形式を崩した payload を返す圧縮モデルスタブ。"""
+
+    def __init__(self, malformed_rate: float, rng: random.Random) -> None:
+        """形式不正の割合と乱数生成器を受け取る。"""
+        self._malformed_rate = malformed_rate
+        self._rng = rng
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> dict[str, object]:
+        """妥当な payload を作り、一定割合で 1 フィールドを崩す。"""
+        del committed_state, qualified_artifacts
+        payload: dict[str, object] = {
+            "episodic_trace": [f"t{interaction_signal.turn_id}: 調査を進めた"],
+            "semantic_gist": "web-01 の 502 を調査中",
+            "focal_entities": ["web-01", "nginx"],
+            "relational_map": ["web-01 -> app-02"],
+            "goal_orientation": "502 の原因を特定する",
+            "constraints": ["本番の設定変更は承認後に行う"],
+            "predictive_cue": ["app-02 の GC ログを見る"],
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        }
+        if self._rng.random() < self._malformed_rate:
+            kind = self._rng.choice(("scalar", "empty_item", "missing"))
+            if kind == "scalar":
+                payload["constraints"] = "本番の設定変更は承認後に行う"
+            elif kind == "empty_item":
+                payload["focal_entities"] = ["web-01", ""]
+            else:
+                del payload["predictive_cue"]
+        return payload
+
+
+def _run(
+    repair_mode: str, *, turns: int, malformed_rate: float, seed: int
+) -> tuple[int, float, CCSRepairStats]:
+    """`turns` ターン流し、失敗ターン数・1 ターンあたり秒数・補修の集計値を返す。"""
+    compressor = SchemaAwareCognitiveCompressorAdapter(
+        model=_MalformingModel(malformed_rate, random.Random(seed)),
+        repair_mode=repair_mode,
+    )
+    state = CompressedCognitiveState.empty()
+    failed = 0
+    started = time.perf_counter()
+    for turn_id in range(1, turns + 1):
+        try:
+            state = compressor.commit_next_state(
+                interaction_signal=TurnInteractionSignal(turn_id=turn_id, user_input="続けて"),
+                committed_state=state,
+                qualified_artifacts=(),
+            )
+        except CCSValidationError:
+            failed += 1
+    return failed, (time.perf_counter() - started) / turns, compressor.repair_stats()
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--malformed-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'失敗ターン':>10} {'補修率':>7} {'μs/turn':>8}")
+    for repair_mode in ("strict", "lenient"):
+        failed, seconds, stats = _run(
+            repair_mode,
+            turns=args.turns,
+            malformed_rate=args.malformed_rate,
+            seed=args.seed,
+        )
+        print(
+            f"{repair_mode:<8} {failed:>10} {stats.repair_rate * 100:>6.1f}% {seconds * 1e6:>8.1f}"
+        )
+        for field_name, action, count in stats.field_repairs:
+            print(f"  {field_name}:{action}={count}")
+
+
+if __name__ == "__main__":
+    main()
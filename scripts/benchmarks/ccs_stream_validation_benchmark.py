@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""CCS payload の逐次検証で、不正な応答を検出するまでの時間と CPU 負荷を比較する。
+
+疑似ストリームは CCS JSON を `--chunk-chars` 文字ずつ、1 差分あたり `--delta-ms` 待って返す。
+`buffered` は全差分を受け取ってから `json.loads` + フィールド検証、`streamed` は
+`IncrementalJSONObjectParser` で閉じたフィールドから検証し、不正を見つけた時点で打ち切る。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_stream_validation_benchmark.py --delta-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Iterator
+
+from acc.adapters.outbound.incremental_json import IncrementalJSONObjectParser
+from acc.domain.services.ccs_schema import (
+    REQUIRED_FIELDS,
+    CCSValidationError,
+    validate_ccs_field,
+)
+
+
+def _payload(*, broken_field: str | None) -> str:
+    payload: dict[str, object] = {
+        "episodic_trace": ["web-01 で 502 を確認", "upstream タイムアウトを確認"],
+        "semantic_gist": "web-01 の 502 は app-02 の GC 停止による upstream タイムアウトが原因",
+        "focal_entities": ["web-01", "nginx", "app-02"],
+        "relational_map": ["web-01 -> app-02"],
+        "goal_orientation": "502 の原因を特定し、安全に復旧する",
+        "constraints": ["本番の設定変更は承認後に行う"],
+        "predictive_cue": ["app-02 を一時的に外す"],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": ["log-1"],
+    }
+    if broken_field is not None:
+        payload[broken_field] = [1]
+    return json.dumps({field: payload[field] for field in REQUIRED_FIELDS}, ensure_ascii=False)
+
+
+def _stream(text: str, *, chunk_chars: int, delay_seconds: float) -> Iterator[str]:
+    for index in range(0, len(text), chunk_chars):
+        if delay_seconds:
+            time.sleep(delay_seconds)
+        yield text[index : index + chunk_chars]
+
+
+def buffered(deltas: Iterator[str]) -> bool:
+    """全差分を受け取ってから検証し、妥当なら True を返す。"""
+    payload = json.loads("".join(deltas))
+    try:
+        for field_name, value in payload.items():
+            validate_ccs_field(field_name, value)
+    except CCSValidationError:
+        return False
+    return True
+
+
+def streamed(deltas: Iterator[str]) -> bool:
+    """閉じたフィールドから検証し、不正を見つけた時点で打ち切る。"""
+    parser = IncrementalJSONObjectParser()
+    try:
+        for delta in deltas:
+            for field_name, value in parser.feed(delta):
+                validate_ccs_field(field_name, value)
+    except CCSValidationError:
+        return False
+    parser.finish()
+    return True
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunk-chars", type=int, default=4)
+    parser.add_argument("--delta-ms", type=float, default=20.0)
+    parser.add_argument("--cpu-repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'case':<26} {'mode':<9} {'検出ms':>8} {'CPUμs':>7}")
+    for case, broken_field in (
+        ("valid", None),
+        ("broken episodic_trace", "episodic_trace"),
+        ("broken retrieved_artifacts", "retrieved_artifacts"),
+    ):
+        text = _payload(broken_field=broken_field)
+        for mode, check in (("buffered", buffered), ("streamed", streamed)):
+            started = time.perf_counter()
+            check(_stream(text, chunk_chars=args.chunk_chars, delay_seconds=args.delta_ms / 1000))
+            detect_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            for _ in range(args.cpu_repeat):
+                check(_stream(text, chunk_chars=args.chunk_chars, delay_seconds=0))
+            cpu_us = (time.perf_counter() - started) / args.cpu_repeat * 1e6
+            print(f"{case:<26} {mode:<9} {detect_ms:>8.0f} {cpu_us:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
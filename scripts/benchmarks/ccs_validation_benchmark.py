@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""CCS payload の検証スループット（回/秒）を、妥当な payload と不正な payload で比較する。
+
+`per-call` は呼び出しごとに配列上限を解決する `parse_and_validate_ccs_payload(list_limits=...)`、
+`compiled` は `build_ccs_validator` で一度だけ解決した検証器の `validate`。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/ccs_validation_benchmark.py --rounds 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Mapping
+
+from acc.domain.services.ccs_schema import (
+    CCSValidationError,
+    build_ccs_validator,
+    parse_and_validate_ccs_payload,
+)
+
+_LIST_LIMITS: Mapping[str, int] = {"retrieved_artifacts": 3}
+
+
+def _valid_payload() -> dict[str, object]:
+    return {
+        "episodic_trace": [
+            "t1: web-01 で 502 を確認",
+            "t2: upstream を調査",
+            " t3: GC 停止を確認 ",
+        ],
+        "semantic_gist": "web-01 の 502 は app-02 の GC 停止による upstream タイムアウトが原因",
+        "focal_entities": ["web-01", "nginx", "app-02"],
+        "relational_map": ["web-01 -> app-01", "web-01 -> app-02"],
+        "goal_orientation": "502 の原因を特定し、安全に復旧する",
+        "constraints": ["本番の設定変更は承認後に行う", "読み取り操作を優先する"],
+        "predictive_cue": ["app-02 を一時的に外す"],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": ["log-1", "log-2", "log-3", "log-4"],
+    }
+
+
+def _cases() -> tuple[tuple[str, dict[str, object]], ...]:
+    valid = _valid_payload()
+    missing = dict(valid)
+    missing.pop("constraints")
+    return (
+        ("valid", valid),
+        ("invalid: 末尾の型違い", {**valid, "retrieved_artifacts": "log-1"}),
+        ("invalid: 要素の空文字", {**valid, "focal_entities": ["web-01", " "]}),
+        ("invalid: 必須欠落", missing),
+    )
+
+
+def _throughput(
+    validate: Callable[[dict[str, object]], object],
+    payload: dict[str, object],
+    repeat: int,
+    rounds: int,
+) -> float:
+    """`repeat` 回の検証を `rounds` 回計測し、最速の回のスループットを返す。"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            try:
+                validate(payload)
+            except CCSValidationError:
+                pass
+        best = min(best, time.perf_counter() - started)
+    return repeat / best
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    validator = build_ccs_validator(_LIST_LIMITS)
+    modes: tuple[tuple[str, Callable[[dict[str, object]], object]], ...] = (
+        (
+            "per-call",
+            lambda payload: parse_and_validate_ccs_payload(payload, list_limits=_LIST_LIMITS),
+        ),
+        ("compiled", validator.validate),
+    )
+    print(f"{'case':<22} {'mode':<9} {'回/秒':>10}")
+    for case, payload in _cases():
+        for mode, validate in modes:
+            print(
+                f"{case:<22} {mode:<9} {_throughput(validate, payload, args.repeat, args.rounds):>10,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
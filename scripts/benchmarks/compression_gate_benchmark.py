@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""圧縮前ゲートの省略率と、節約できる時間・入力 token の概算を台本会話で計測する。
+
+モデル呼び出しは固定遅延のスタブで代替する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/compression_gate_benchmark.py --model-latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Mapping, Sequence
+
+from acc.adapters.outbound.schema_aware_cognitive_compressor import (
+    CompressionGateStats,
+    SchemaAwareCognitiveCompressorAdapter,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.compression_gate import CompressionGate
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+SCRIPT: tuple[str, ...] = (
+    "決済 API の冪等キー設計を相談したい",
+    "ありがとう",
+    "冪等キーの保持期間はどれくらいが妥当？",
+    "了解です",
+    "Redis と PostgreSQL のどちらに保存する？",
+    "OK",
+    "冪等キーの保持期間をもう一度",
+    "thanks!",
+    "リトライ時のレスポンス再送方針も決めたい",
+    "承知しました、ありがとう",
+)
+
+
+class _FixedLatencyModel(CognitiveCompressorModelPort):
+    """入力をそのまま要約に写す、固定遅延の圧縮モデルスタブ。"""
+
+    def __init__(self, latency_seconds: float) -> None:
+        """1 呼び出しあたりの遅延秒数を受け取る。"""
+        self._latency_seconds = latency_seconds
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """前状態に入力を積んだ payload を返す。"""
+        del qualified_artifacts
+        time.sleep(self._latency_seconds)
+        return {
+            "episodic_trace": [*committed_state.episodic_trace[-2:], interaction_signal.user_input],
+            "semantic_gist": interaction_signal.user_input,
+            "focal_entities": list(committed_state.focal_entities),
+            "relational_map": list(committed_state.relational_map),
+            "goal_orientation": committed_state.goal_orientation or "決済 API の冪等性を設計する",
+            "constraints": list(committed_state.constraints),
+            "predictive_cue": list(committed_state.predictive_cue),
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        }
+
+
+def run(
+    *, gated: bool, sessions: int, latency_seconds: float
+) -> tuple[float, CompressionGateStats]:
+    """台本会話を `sessions` 回流し、経過秒と集計値を返す。"""
+    compressor = SchemaAwareCognitiveCompressorAdapter(
+        model=_FixedLatencyModel(latency_seconds),
+        gate=CompressionGate() if gated else None,
+    )
+    started = time.perf_counter()
+    for _ in range(sessions):
+        state = CompressedCognitiveState.empty()
+        for turn_id, user_input in enumerate(SCRIPT, start=1):
+            state = compressor.commit_next_state(
+                interaction_signal=TurnInteractionSignal(turn_id=turn_id, user_input=user_input),
+                committed_state=state,
+                qualified_artifacts=(),
+            )
+    return time.perf_counter() - started, compressor.gate_stats()
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--model-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    latency_seconds = args.model_latency_ms / 1000
+    print(
+        f"{'mode':<8} {'turns':>6} {'calls':>6} {'skip%':>6} {'秒':>7} "
+        f"{'節約秒(推定)':>12} {'節約token(推定)':>16}"
+    )
+    for gated in (False, True):
+        elapsed, stats = run(gated=gated, sessions=args.sessions, latency_seconds=latency_seconds)
+        turns = args.sessions * len(SCRIPT)
+        print(
+            f"{'gated' if gated else 'baseline':<8} {turns:>6} {stats.model_calls:>6} "
+            f"{stats.skip_rate * 100:>6.1f} {elapsed:>7.2f} "
+            f"{stats.estimated_saved_seconds:>12.2f} {stats.estimated_saved_input_tokens:>16,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
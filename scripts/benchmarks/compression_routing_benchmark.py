@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""規則ベース圧縮とモデル圧縮の経路選択で、モデル呼び出し数と所要時間を台本会話で比較する。
+
+モデル呼び出しは固定遅延のスタブで代替する。`baseline` は全ターンをモデルで圧縮し、
+`routed` は `CompressionRouter` が切り替えを指示したターンだけモデルで圧縮する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/compression_routing_benchmark.py --model-latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Mapping, Sequence
+
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.adapters.outbound.routing_cognitive_compressor import (
+    CompressionRouteStats,
+    RoutingCognitiveCompressorAdapter,
+)
+from acc.adapters.outbound.schema_aware_cognitive_compressor import (
+    SchemaAwareCognitiveCompressorAdapter,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.compression_gate import CompressionRouter
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
+
+SCRIPT: tuple[str, ...] = (
+    "web-01 で nginx が 502 を返しています。原因を一緒に調べてください。",
+    "本番の設定変更は承認が必要です。",
+    "nginx の error.log を見ます",
+    "upstream は app-01 と app-02 で、app-02 の CPU が 95% です。",
+    "app-02 の CPU をもう一度見ます",
+    "GC の停止時間が原因かもしれません",
+    "nginx の upstream を続けて見ます",
+    "ありがとう",
+    "app-02 を外す手順を見ます",
+    "OK",
+)
+
+
+class _FixedLatencyModel(CognitiveCompressorModelPort):
+    """入力をそのまま要約に写す、固定遅延の圧縮モデルスタブ。"""
+
+    def __init__(self, latency_seconds: float) -> None:
+        """1 呼び出しあたりの遅延秒数を受け取る。"""
+        self._latency_seconds = latency_seconds
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """前状態に入力を積んだ payload を返す。"""
+        del qualified_artifacts
+        time.sleep(self._latency_seconds)
+        return {
+            "episodic_trace": [*committed_state.episodic_trace[-2:], interaction_signal.user_input],
+            "semantic_gist": interaction_signal.user_input,
+            "focal_entities": ["web-01", "nginx", "app-02"],
+            "relational_map": list(committed_state.relational_map),
+            "goal_orientation": committed_state.goal_orientation or "502 の原因を特定する",
+            "constraints": list(committed_state.constraints),
+            "predictive_cue": list(committed_state.predictive_cue),
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        }
+
+
+def run(
+    *, routed: bool, sessions: int, latency_seconds: float
+) -> tuple[float, CompressionRouteStats | None]:
+    """台本会話を `sessions` 回流し、経過秒と経路ごとの集計値を返す。"""
+    model_compressor = SchemaAwareCognitiveCompressorAdapter(
+        model=_FixedLatencyModel(latency_seconds)
+    )
+    routing = RoutingCognitiveCompressorAdapter(
+        SimpleCognitiveCompressorAdapter(),
+        model_compressor,
+        router=CompressionRouter(),
+    )
+    compressor: CognitiveCompressorPort = routing if routed else model_compressor
+    started = time.perf_counter()
+    for _ in range(sessions):
+        state = CompressedCognitiveState.empty()
+        for turn_id, user_input in enumerate(SCRIPT, start=1):
+            state = compressor.commit_next_state(
+                interaction_signal=TurnInteractionSignal(turn_id=turn_id, user_input=user_input),
+                committed_state=state,
+                qualified_artifacts=(),
+            )
+    return time.perf_counter() - started, routing.route_stats() if routed else None
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--model-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    latency_seconds = args.model_latency_ms / 1000
+    turns = args.sessions * len(SCRIPT)
+    print(f"{'mode':<8} {'route':<6} {'turns':>6} {'平均ms':>8} {'合計秒':>7}")
+    for routed in (False, True):
+        elapsed, stats = run(routed=routed, sessions=args.sessions, latency_seconds=latency_seconds)
+        if stats is None:
+            print(
+                f"{'baseline':<8} {'model':<6} {turns:>6} {elapsed / turns * 1000:>8.2f} {elapsed:>7.2f}"
+            )
+            continue
+        for route in stats.routes:
+            print(
+                f"{'routed':<8} {route.route:<6} {route.turns:>6} "
+                f"{route.mean_seconds * 1000:>8.2f} {route.seconds:>7.2f}"
+            )
+        print(f"routed 合計 {elapsed:.2f} 秒、モデル比率 {stats.escalation_rate * 100:.1f}%")
+        print(
+            "切り替え理由: "
+            + ", ".join(f"{name}={count}" for name, count in stats.escalation_reasons)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""1 エージェント分の評価レコード集計を、Python 実装と numpy の列形式で比較する。
+
+レコードは乱数で組み立てる（drift 監査は約 7 割のターンに付く）。計測値は各方式の
+`rounds` 回のうち最短の秒数で、列形式は行列の組み立てを含む。`max diff` は平均・標準偏差・
+平均率の両方式の差の最大値。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/evaluation_summary_benchmark.py --records 1000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Sequence
+
+from acc.application.services.columnar_evaluation_summary import summarize_agent_records_columnar
+from acc.domain.services.evaluation_metrics import summarize_agent_records
+from acc.domain.value_objects.evaluation import (
+    AgentEvaluationSummary,
+    AgentTurnEvaluationRecord,
+    DriftAudit,
+    HallucinationAudit,
+    OutcomeScores,
+)
+
+
+def _build_records(count: int, seed: int) -> list[AgentTurnEvaluationRecord]:
+    rng = random.Random(seed)
+    return [
+        AgentTurnEvaluationRecord(
+            turn_id=turn_id,
+            outcome_scores=OutcomeScores(
+                relevance=rng.uniform(0.0, 10.0),
+                answer_quality=rng.uniform(0.0, 10.0),
+                instruction_following=rng.uniform(0.0, 10.0),
+                coherence=rng.uniform(0.0, 10.0),
+            ),
+            hallucination_audit=HallucinationAudit(
+                supported_claims=rng.randint(0, 5),
+                unsupported_claims=rng.randint(0, 2),
+            ),
+            drift_audit=(
+                DriftAudit(
+                    violations=rng.randint(0, 2),
+                    omissions=rng.randint(0, 2),
+                    active_constraints=("no_restart", "safe_change", "format")[: rng.randint(0, 3)],
+                )
+                if rng.random() < 0.7
+                else None
+            ),
+            memory_tokens=rng.randint(50, 500),
+        )
+        for turn_id in range(1, count + 1)
+    ]
+
+
+def _best_seconds(
+    summarize: Callable[[Sequence[AgentTurnEvaluationRecord]], AgentEvaluationSummary],
+    records: Sequence[AgentTurnEvaluationRecord],
+    rounds: int,
+) -> tuple[float, AgentEvaluationSummary]:
+    best = float("inf")
+    summary = summarize(records)
+    for _ in range(rounds):
+        started = time.perf_counter()
+        summary = summarize(records)
+        best = min(best, time.perf_counter() - started)
+    return best, summary
+
+
+def _max_diff(left: AgentEvaluationSummary, right: AgentEvaluationSummary) -> float:
+    pairs = [
+        (getattr(left.outcome_mean, name), getattr(right.outcome_mean, name))
+        for name in ("relevance", "answer_quality", "instruction_following", "coherence")
+    ]
+    pairs += [
+        (getattr(left.outcome_std, name), getattr(right.outcome_std, name))
+        for name in ("relevance", "answer_quality", "instruction_following", "coherence")
+    ]
+    pairs += [
+        (left.hallucination_average, right.hallucination_average),
+        (left.drift_average or 0.0, right.drift_average or 0.0),
+        (left.memory_average, right.memory_average),
+    ]
+    return max(abs(a - b) for a, b in pairs)
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'records':>9} {'python 秒':>10} {'numpy 秒':>10} {'倍率':>6} {'max diff':>9}")
+    for count in args.records:
+        records = _build_records(count, args.seed)
+        python_seconds, expected = _best_seconds(summarize_agent_records, records, args.rounds)
+        numpy_seconds, actual = _best_seconds(
+            summarize_agent_records_columnar, records, args.rounds
+        )
+        print(
+            f"{count:>9,} {python_seconds:>10.3f} {numpy_seconds:>10.3f} "
+            f"{python_seconds / numpy_seconds:>6.1f} {_max_diff(expected, actual):>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""2 回呼び出し（圧縮モデル + ポリシー）と 1 回呼び出しモードのターンレイテンシ p50/p99 を比較する。
+
+モデルは `time.sleep` で応答時間を模すスタブで、1 呼び出しあたり
+`--call-ms`（対数正規の揺らぎ付き）+ 出力 token 数 × `--token-ms` だけ待つ。
+1 回呼び出しの出力は CCS と応答文の合計 token 数、`--reject-rate` の割合で検証に落ち、
+そのターンは 2 回呼び出しへフォールバックする。どちらも実際の `ACCMultiturnControlLoop` と
+スキーマ検証アダプタを通して計測する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/fused_turn_latency_benchmark.py --turns 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from acc.adapters.outbound.in_memory_acc_components import (
+    InMemoryArtifactMemory,
+    InMemoryArtifactRecallAdapter,
+    InMemoryEvidenceStoreAdapter,
+    TokenOverlapQualificationAdapter,
+)
+from acc.adapters.outbound.schema_aware_cognitive_compressor import (
+    SchemaAwareCognitiveCompressorAdapter,
+    SchemaAwareFusedTurnAdapter,
+)
+from acc.application.use_cases.acc_multiturn_control_loop import ACCMultiturnControlLoop
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import (
+    AgentDecision,
+    RecentDialogueTurn,
+    TurnInteractionSignal,
+)
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+@dataclass
+class _SimulatedModel:
+    """呼び出しごとに決まった分布の時間だけ待つ、3 種のモデルポートを兼ねるスタブ。"""
+
+    call_ms: float
+    token_ms: float
+    state_tokens: int
+    reply_tokens: int
+    reject_rate: float
+    rng: random.Random
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> dict[str, object]:
+        """CCS だけを返す。"""
+        del committed_state, qualified_artifacts
+        self._wait(self.state_tokens)
+        return _state_payload(interaction_signal.turn_id)
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        """応答文だけを返す。"""
+        del recent_dialogue_turns, committed_state, role, tools
+        self._wait(self.reply_tokens)
+        return AgentDecision(
+            response=f"ターン {interaction_signal.turn_id} の回答", tool_actions=()
+        )
+
+    def generate_fused_turn_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> dict[str, object]:
+        """CCS と応答文を 1 回で返す。一定割合で型の壊れた CCS を返す。"""
+        del committed_state, qualified_artifacts, recent_dialogue_turns, role, tools
+        self._wait(self.state_tokens + self.reply_tokens)
+        state = _state_payload(interaction_signal.turn_id)
+        if self.rng.random() < self.reject_rate:
+            state["constraints"] = "承認後に変更する"
+        return {"next_state": state, "response": f"ターン {interaction_signal.turn_id} の回答"}
+
+    def _wait(self, output_tokens: int) -> None:
+        overhead_ms = self.call_ms * self.rng.lognormvariate(0.0, 0.3)
+        time.sleep((overhead_ms + output_tokens * self.token_ms) / 1000)
+
+
+def _state_payload(turn_id: int) -> dict[str, object]:
+    return {
+        "episodic_trace": [f"t{turn_id}: 調査を進めた"],
+        "semantic_gist": f"web-01 の 502 を調査中（ターン {turn_id}）",
+        "focal_entities": ["web-01", "nginx"],
+        "relational_map": ["web-01 -> app-02"],
+        "goal_orientation": "502 の原因を特定する",
+        "constraints": ["本番の設定変更は承認後に行う"],
+        "predictive_cue": ["app-02 の GC ログを見る"],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": [],
+    }
+
+
+def _run(model: _SimulatedModel, *, fused: bool, turns: int) -> list[float]:
+    memory = InMemoryArtifactMemory()
+    loop = ACCMultiturnControlLoop(
+        artifact_recall=InMemoryArtifactRecallAdapter(memory),
+        artifact_qualification=TokenOverlapQualificationAdapter(),
+        cognitive_compressor=SchemaAwareCognitiveCompressorAdapter(model=model),
+        agent_policy=model,
+        evidence_store=InMemoryEvidenceStoreAdapter(memory),
+        fused_turn=SchemaAwareFusedTurnAdapter(model) if fused else None,
+    )
+    state = CompressedCognitiveState.empty()
+    latencies_ms: list[float] = []
+    for turn_id in range(1, turns + 1):
+        signal = TurnInteractionSignal(
+            turn_id=turn_id, user_input=f"web-01 の 502 について {turn_id}"
+        )
+        started = time.perf_counter()
+        state = loop.run_turn(interaction_signal=signal, committed_state=state).committed_state
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return latencies_ms
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(ratio * (len(ordered) - 1)))]
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--call-ms", type=float, default=60.0)
+    parser.add_argument("--token-ms", type=float, default=0.2)
+    parser.add_argument("--state-tokens", type=int, default=250)
+    parser.add_argument("--reply-tokens", type=int, default=200)
+    parser.add_argument("--reject-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'mode':<9} {'p50ms':>7} {'p99ms':>7} {'meanms':>7}")
+    for mode, fused in (("two-call", False), ("fused", True)):
+        model = _SimulatedModel(
+            call_ms=args.call_ms,
+            token_ms=args.token_ms,
+            state_tokens=args.state_tokens,
+            reply_tokens=args.reply_tokens,
+            reject_rate=args.reject_rate,
+            rng=random.Random(args.seed),
+        )
+        latencies = _run(model, fused=fused, turns=args.turns)
+        print(
+            f"{mode:<9} {_percentile(latencies, 0.5):>7.0f} {_percentile(latencies, 0.99):>7.0f} "
+            f"{statistics.mean(latencies):>7.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
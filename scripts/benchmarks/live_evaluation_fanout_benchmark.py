@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""ライブ評価の 1 ターンあたりの所要時間を、エージェントの順次実行と並行実行で比較する。
+
+エージェントは `--agent-ms`（対数正規の揺らぎ付き）だけ待つスタブ、judge は即時に返すスタブ。
+`slowest` は各ターンで最も遅かったエージェントの待ち時間の平均で、並行実行の下限の目安。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/live_evaluation_fanout_benchmark.py --agents 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Mapping
+
+from acc.application.use_cases.live_multi_agent_evaluation import LiveMultiAgentEvaluationUseCase
+from acc.domain.value_objects.evaluation import HallucinationAudit, OutcomeScores
+from acc.domain.value_objects.live_evaluation import (
+    AgentTurnResponse,
+    EvaluationTurnQuery,
+    JudgeAgentEvaluation,
+    JudgeTurnResult,
+)
+
+
+class _SleepingAgent:
+    """ターンごとに決まった待ち時間だけ待って応答するエージェントスタブ。"""
+
+    def __init__(self, delays_seconds: Mapping[int, float]) -> None:
+        """ターン ID ごとの待ち時間を受け取る。"""
+        self._delays_seconds = delays_seconds
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """待ってから固定応答を返す。"""
+        del canonical_memory
+        time.sleep(self._delays_seconds[query.turn_id])
+        return AgentTurnResponse(response_text=f"回答 {query.turn_id}", memory_tokens=1)
+
+
+class _InstantJudge:
+    """全エージェントに同じ評価を返す judge スタブ。"""
+
+    def evaluate_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+        agent_responses: Mapping[str, AgentTurnResponse],
+    ) -> JudgeTurnResult:
+        """固定の評価を返す。"""
+        del query
+        evaluation = JudgeAgentEvaluation(
+            outcome_scores=OutcomeScores(
+                relevance=7.0, answer_quality=7.0, instruction_following=7.0, coherence=7.0
+            ),
+            hallucination_audit=HallucinationAudit(supported_claims=1, unsupported_claims=0),
+            drift_audit=None,
+        )
+        return JudgeTurnResult(
+            updated_canonical_memory=dict(canonical_memory),
+            evaluations_by_agent={name: evaluation for name in agent_responses},
+        )
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--agent-ms", type=float, default=80.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    delays = [
+        {
+            turn_id: args.agent_ms * rng.lognormvariate(0.0, 0.3) / 1000
+            for turn_id in range(1, args.turns + 1)
+        }
+        for _ in range(args.agents)
+    ]
+    queries = tuple(
+        EvaluationTurnQuery(turn_id=turn_id, user_query=f"質問 {turn_id}")
+        for turn_id in range(1, args.turns + 1)
+    )
+    slowest_ms = (
+        sum(max(agent[turn_id] for agent in delays) for turn_id in range(1, args.turns + 1))
+        / args.turns
+        * 1000
+    )
+    print(f"{'mode':<11} {'ms/turn':>8}")
+    print(f"{'slowest':<11} {slowest_ms:>8.1f}")
+    for mode, max_concurrent_agents in (("sequential", 1), ("concurrent", None)):
+        use_case = LiveMultiAgentEvaluationUseCase(
+            agent_runners={f"agent-{index}": _SleepingAgent(d) for index, d in enumerate(delays)},
+            judge_evaluator=_InstantJudge(),
+            max_concurrent_agents=max_concurrent_agents,
+        )
+        started = time.perf_counter()
+        use_case.run_episode(queries)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        use_case.close()
+        print(f"{mode:<11} {elapsed_ms / args.turns:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""多数のライブ評価 episode の所要時間を、ワーカー数を変えて比較する。
+
+エージェントと judge は `--agent-ms` / `--judge-ms` だけ待つスタブ。結果は一時ディレクトリの
+JSONL に追記し、完了後に同じ JSONL で再実行して再開（全 episode の読み込みと集計）の時間も測る。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/live_evaluation_runner_benchmark.py --episodes 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from acc.application.services.live_evaluation_runner import (
+    LiveEvaluationEpisode,
+    LiveEvaluationRunner,
+)
+from acc.application.use_cases.live_multi_agent_evaluation import LiveMultiAgentEvaluationUseCase
+from acc.domain.value_objects.evaluation import HallucinationAudit, OutcomeScores
+from acc.domain.value_objects.live_evaluation import (
+    AgentTurnResponse,
+    EvaluationTurnQuery,
+    JudgeAgentEvaluation,
+    JudgeTurnResult,
+)
+
+# ワーカーは fork で起動するため、main で設定した値がそのまま引き継がれる。
+_AGENT_SECONDS = 0.02
+_JUDGE_SECONDS = 0.02
+
+
+class _SleepingAgent:
+    """固定時間待って応答するエージェントスタブ。"""
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """待ってから固定応答を返す。"""
+        del canonical_memory
+        time.sleep(_AGENT_SECONDS)
+        return AgentTurnResponse(response_text=query.user_query, memory_tokens=10 * query.turn_id)
+
+
+class _SleepingJudge:
+    """固定時間待って全エージェントに同じ評価を返す judge スタブ。"""
+
+    def evaluate_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+        agent_responses: Mapping[str, AgentTurnResponse],
+    ) -> JudgeTurnResult:
+        """待ってから固定の評価を返す。"""
+        del query
+        time.sleep(_JUDGE_SECONDS)
+        evaluation = JudgeAgentEvaluation(
+            outcome_scores=OutcomeScores(
+                relevance=7.0, answer_quality=7.0, instruction_following=7.0, coherence=7.0
+            ),
+            hallucination_audit=HallucinationAudit(supported_claims=1, unsupported_claims=0),
+            drift_audit=None,
+        )
+        return JudgeTurnResult(
+            updated_canonical_memory=dict(canonical_memory),
+            evaluations_by_agent={name: evaluation for name in agent_responses},
+        )
+
+
+def _build_use_case() -> LiveMultiAgentEvaluationUseCase:
+    return LiveMultiAgentEvaluationUseCase(
+        agent_runners={"acc": _SleepingAgent(), "baseline": _SleepingAgent()},
+        judge_evaluator=_SleepingJudge(),
+    )
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    global _AGENT_SECONDS, _JUDGE_SECONDS
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--episodes", type=int, default=40)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--agent-ms", type=float, default=20.0)
+    parser.add_argument("--judge-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+    _AGENT_SECONDS = args.agent_ms / 1000
+    _JUDGE_SECONDS = args.judge_ms / 1000
+
+    episodes = [
+        LiveEvaluationEpisode(
+            episode_id=f"ep-{index}",
+            queries=tuple(
+                EvaluationTurnQuery(turn_id=turn_id, user_query=f"質問 {turn_id}")
+                for turn_id in range(1, args.turns + 1)
+            ),
+        )
+        for index in range(args.episodes)
+    ]
+    print(f"{'workers':>7} {'秒':>7} {'episode/秒':>10} {'再開秒':>7}")
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = Path(directory) / "results.jsonl"
+            runner = LiveEvaluationRunner(_build_use_case, workers=workers)
+            started = time.perf_counter()
+            runner.run(episodes, output_path)
+            elapsed = time.perf_counter() - started
+            started = time.perf_counter()
+            runner.run(episodes, output_path)
+            resumed = time.perf_counter() - started
+        print(f"{workers:>7} {elapsed:>7.2f} {args.episodes / elapsed:>10.1f} {resumed:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""障害注入スタブに対して、再送・ヘッジ・サーキットブレーカーの効果を計測する。
+
+スタブは一定割合で遅延（テール）と一時的な失敗（タイムアウト相当）を起こす。
+`degraded` シナリオでは全呼び出しがタイムアウトし、ブレーカーによる即時失敗を比較する。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/model_resilience_benchmark.py --calls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from acc.adapters.outbound.openai_chat_adapters import OpenAIRequestError
+from acc.adapters.outbound.resilient_model_adapters import (
+    CircuitBreaker,
+    HedgePolicy,
+    ModelCallGuard,
+    ModelCircuitOpenError,
+    ResilientCognitiveCompressorModelAdapter,
+    RetryPolicy,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+
+class FaultInjectingModel(CognitiveCompressorModelPort):
+    """遅延と一時的な失敗を確率的に注入する圧縮モデルスタブ。"""
+
+    def __init__(
+        self,
+        *,
+        base_seconds: float,
+        slow_seconds: float,
+        slow_rate: float,
+        failure_rate: float,
+        failure_seconds: float,
+        seed: int,
+    ) -> None:
+        """遅延・失敗の分布を受け取る。"""
+        self._base_seconds = base_seconds
+        self._slow_seconds = slow_seconds
+        self._slow_rate = slow_rate
+        self._failure_rate = failure_rate
+        self._failure_seconds = failure_seconds
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """分布に従って待ち、失敗または固定 payload を返す。"""
+        del committed_state, qualified_artifacts
+        with self._lock:
+            draw = self._rng.random()
+            jitter = self._rng.uniform(0.8, 1.2)
+        if draw < self._failure_rate:
+            time.sleep(self._failure_seconds)
+            raise OpenAIRequestError("injected timeout", retryable=True)
+        if draw < self._failure_rate + self._slow_rate:
+            time.sleep(self._slow_seconds * jitter)
+        else:
+            time.sleep(self._base_seconds * jitter)
+        return {"semantic_gist": interaction_signal.user_input}
+
+
+def run(
+    model: CognitiveCompressorModelPort,
+    *,
+    calls: int,
+    concurrency: int,
+) -> tuple[list[float], int]:
+    """`calls` 回を並行実行し、呼び出しごとの経過秒と成功数を返す。"""
+    signal = TurnInteractionSignal(turn_id=1, user_input="hello")
+    state = CompressedCognitiveState.empty()
+
+    def _call(_: int) -> tuple[float, bool]:
+        started = time.perf_counter()
+        try:
+            model.generate_next_state_payload(signal, state, ())
+        except (OpenAIRequestError, ModelCircuitOpenError):
+            return time.perf_counter() - started, False
+        return time.perf_counter() - started, True
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(_call, range(calls)))
+    return [elapsed for elapsed, _ in results], sum(1 for _, ok in results if ok)
+
+
+def _percentile(samples: list[float], quantile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def _report(name: str, latencies: list[float], successes: int, note: str = "") -> None:
+    print(
+        f"{name:<14} {successes / len(latencies) * 100:>7.1f} "
+        f"{statistics.median(latencies) * 1000:>7.0f} "
+        f"{_percentile(latencies, 0.95) * 1000:>7.0f} "
+        f"{_percentile(latencies, 0.99) * 1000:>7.0f} "
+        f"{max(latencies) * 1000:>7.0f}  {note}"
+    )
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--base-ms", type=float, default=40.0)
+    parser.add_argument("--slow-ms", type=float, default=800.0)
+    parser.add_argument("--slow-rate", type=float, default=0.04)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    def _model(*, failure_rate: float = args.failure_rate) -> FaultInjectingModel:
+        return FaultInjectingModel(
+            base_seconds=args.base_ms / 1000,
+            slow_seconds=args.slow_ms / 1000,
+            slow_rate=args.slow_rate,
+            failure_rate=failure_rate,
+            failure_seconds=0.2,
+            seed=42,
+        )
+
+    retry = RetryPolicy(max_attempts=3, base_delay_seconds=0.05, max_delay_seconds=0.4)
+    print(f"{'mode':<14} {'成功%':>7} {'p50ms':>7} {'p95ms':>7} {'p99ms':>7} {'maxms':>7}")
+
+    latencies, successes = run(_model(), calls=args.calls, concurrency=args.concurrency)
+    _report("baseline", latencies, successes)
+
+    guard = ModelCallGuard(retry=retry, breaker=CircuitBreaker(failure_threshold=50))
+    latencies, successes = run(
+        ResilientCognitiveCompressorModelAdapter(_model(), guard=guard),
+        calls=args.calls,
+        concurrency=args.concurrency,
+    )
+    _report("retry", latencies, successes, f"retries={guard.stats().retries}")
+
+    guard = ModelCallGuard(
+        retry=retry,
+        hedge=HedgePolicy(quantile=0.9, min_samples=50),
+        breaker=CircuitBreaker(failure_threshold=50),
+    )
+    latencies, successes = run(
+        ResilientCognitiveCompressorModelAdapter(_model(), guard=guard),
+        calls=args.calls,
+        concurrency=args.concurrency,
+    )
+    guard.close()
+    stats = guard.stats()
+    _report(
+        "retry+hedge",
+        latencies,
+        successes,
+        f"retries={stats.retries} hedges={stats.hedges} wins={stats.hedge_wins}",
+    )
+
+    degraded_calls = max(args.calls // 10, args.concurrency)
+    latencies, successes = run(
+        _model(failure_rate=1.0),
+        calls=degraded_calls,
+        concurrency=args.concurrency,
+    )
+    _report("degraded", latencies, successes)
+
+    guard = ModelCallGuard(retry=retry, breaker=CircuitBreaker(failure_threshold=5))
+    latencies, successes = run(
+        ResilientCognitiveCompressorModelAdapter(_model(failure_rate=1.0), guard=guard),
+        calls=degraded_calls,
+        concurrency=args.concurrency,
+    )
+    _report(
+        "degraded+cb",
+        latencies,
+        successes,
+        f"short_circuits={guard.stats().short_circuits}",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""ローカルの疑似 Responses API に対して同期・非同期アダプタのスループットを比較する。
+
+1 セッション = CCM 呼び出し 1 回 + ポリシー呼び出し 1 回。疑似サーバは固定遅延で応答する。
+同期はセッション数と同じスレッド数、非同期はセッション数と同じタスク数で並行実行し、
+どちらも接続数（非同期は `max_in_flight` も）を `--max-connections` で揃える。
+`--max-connections 0` はセッション数まで接続を張る（上限なし相当）。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/openai_async_load_test.py --sessions 50 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from acc.adapters.outbound.openai_chat_adapters import (
+    AsyncOpenAIAgentPolicyAdapter,
+    AsyncOpenAICognitiveCompressorModelAdapter,
+    OpenAIAgentPolicyAdapter,
+    OpenAICognitiveCompressorModelAdapter,
+)
+from acc.adapters.outbound.openai_transport import (
+    AsyncOpenAITransport,
+    OpenAITransport,
+    OpenAITransportConfig,
+)
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+_CCS_TEXT = json.dumps(
+    {
+        "episodic_trace": ["t1"],
+        "semantic_gist": "要約",
+        "focal_entities": [],
+        "relational_map": [],
+        "goal_orientation": "目的",
+        "constraints": [],
+        "predictive_cue": [],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": [],
+    },
+    ensure_ascii=False,
+)
+
+
+class FakeResponsesServer:
+    """asyncio で動く keep-alive 対応の最小 Responses API サーバ。"""
+
+    def __init__(self, latency_seconds: float) -> None:
+        """応答遅延を受け取り、別スレッドのイベントループで待ち受けを始める。"""
+        self._latency_seconds = latency_seconds
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI クライアントに渡す base URL を返す。"""
+        return f"http://127.0.0.1:{self._port}/v1"
+
+    def stop(self) -> None:
+        """イベントループを止める。"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=4096)
+        )
+        self._port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while request_line := await reader.readline():
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                await asyncio.sleep(self._latency_seconds)
+                payload = self._payload(request_line, body)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _payload(self, request_line: bytes, body: bytes) -> bytes:
+        if request_line.startswith(b"GET"):
+            return b'{"object":"list","data":[]}'
+        request = json.loads(body)
+        text = _CCS_TEXT if "Cognitive Compressor" in request["instructions"] else "ok"
+        return json.dumps(
+            {
+                "id": "resp_fake",
+                "object": "response",
+                "created_at": 0,
+                "status": "completed",
+                "model": request["model"],
+                "output": [
+                    {
+                        "type": "message",
+                        "id": "msg_fake",
+                        "status": "completed",
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": text, "annotations": []}],
+                    }
+                ],
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+
+def _signal(session_index: int) -> TurnInteractionSignal:
+    return TurnInteractionSignal(turn_id=1, user_input=f"session {session_index}")
+
+
+def _config(base_url: str, connections: int) -> OpenAITransportConfig:
+    return OpenAITransportConfig(
+        base_url=base_url,
+        max_connections=connections,
+        max_keepalive_connections=connections,
+        pool_timeout_seconds=120.0,
+        max_retries=0,
+    )
+
+
+def run_sync(base_url: str, sessions: int, connections: int) -> float:
+    """スレッドで `sessions` 件を並行実行し、経過秒を返す。"""
+    transport = OpenAITransport(_config(base_url, connections), api_key="sk-load-test")
+    compressor = OpenAICognitiveCompressorModelAdapter(model="fake", transport=transport)
+    policy = OpenAIAgentPolicyAdapter(model="fake", transport=transport)
+
+    def _session(session_index: int) -> None:
+        signal = _signal(session_index)
+        compressor.generate_next_state_payload(signal, CompressedCognitiveState.empty(), ())
+        policy.decide(signal, (), CompressedCognitiveState.empty(), "ops", ())
+
+    transport.warm_up()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        list(executor.map(_session, range(sessions)))
+    elapsed = time.perf_counter() - started
+    transport.close()
+    return elapsed
+
+
+async def run_async(base_url: str, sessions: int, connections: int) -> float:
+    """タスクで `sessions` 件を並行実行し、経過秒を返す。"""
+    transport = AsyncOpenAITransport(
+        _config(base_url, connections),
+        api_key="sk-load-test",
+        max_in_flight=connections,
+    )
+    compressor = AsyncOpenAICognitiveCompressorModelAdapter(model="fake", transport=transport)
+    policy = AsyncOpenAIAgentPolicyAdapter(model="fake", transport=transport)
+
+    async def _session(session_index: int) -> None:
+        signal = _signal(session_index)
+        await compressor.generate_next_state_payload(signal, CompressedCognitiveState.empty(), ())
+        await policy.decide(signal, (), CompressedCognitiveState.empty(), "ops", ())
+
+    await transport.warm_up()
+    started = time.perf_counter()
+    await asyncio.gather(*(_session(index) for index in range(sessions)))
+    elapsed = time.perf_counter() - started
+    await transport.aclose()
+    return elapsed
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--max-connections", type=int, default=100)
+    args = parser.parse_args()
+
+    server = FakeResponsesServer(args.latency_ms / 1000)
+    print(f"{'sessions':>8} {'conns':>6} {'mode':<6} {'秒':>7} {'req/s':>9}")
+    try:
+        for sessions in args.sessions:
+            connections = min(args.max_connections or sessions, sessions)
+            for mode in ("sync", "async"):
+                if mode == "sync":
+                    elapsed = run_sync(server.base_url, sessions, connections)
+                else:
+                    elapsed = asyncio.run(run_async(server.base_url, sessions, connections))
+                print(
+                    f"{sessions:>8} {connections:>6} {mode:<6} {elapsed:>7.2f} "
+                    f"{sessions * 2 / elapsed:>9,.0f}"
+                )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
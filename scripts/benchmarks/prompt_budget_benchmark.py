@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""プロンプト予算の適用前後で、圧縮モデル・ポリシーの入力 JSON の token 数を比較する。
+
+Artifact（ログ断片）の長さと件数、直近対話の応答長を変えた合成入力を使う。
+適用前は従来の `json.dumps(..., ensure_ascii=False)`、適用後は `PromptBudgeter.render` の出力。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/prompt_budget_benchmark.py --artifact-chars 200 2000 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from acc.adapters.outbound.prompt_budget import JSONValue, PromptBudgeter, PromptKind
+from acc.adapters.outbound.token_counters import HeuristicTokenCounterAdapter
+
+_LOG_LINE = "2026-10-19T10:00:00Z web-01 nginx: upstream timed out (110) while reading 応答ヘッダ\n"
+
+
+def _state() -> JSONValue:
+    return {
+        "episodic_trace": ["t1: web-01 で 502 を確認", "t2: nginx の upstream を調査"],
+        "semantic_gist": "web-01 の 502 は upstream タイムアウトが原因の可能性が高い",
+        "focal_entities": ["web-01", "nginx"],
+        "relational_map": [],
+        "goal_orientation": "502 の原因を特定する",
+        "constraints": ["本番の設定変更は承認後に行う"],
+        "predictive_cue": [],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": [],
+    }
+
+
+def _compressor_payload(artifact_chars: int, artifacts: int) -> dict[str, JSONValue]:
+    content = (_LOG_LINE * (artifact_chars // len(_LOG_LINE) + 1))[:artifact_chars]
+    return {
+        "interaction_signal": {
+            "turn_id": 3,
+            "user_input": "ログを見て原因を教えてください",
+            "new_facts": [],
+            "focus_entities": ["web-01"],
+            "active_goal": "",
+            "active_constraints": [],
+            "expected_next_steps": [],
+        },
+        "previous_committed_state": _state(),
+        "qualified_artifacts": [
+            {"artifact_id": f"log-{index}", "source": "tool", "content": content}
+            for index in range(artifacts)
+        ],
+    }
+
+
+def _policy_payload(response_chars: int, turns: int) -> dict[str, JSONValue]:
+    return {
+        "interaction_signal": {
+            "turn_id": turns + 1,
+            "user_input": "一個前の回答を要約して",
+            "active_goal": "",
+            "active_constraints": [],
+            "focus_entities": [],
+            "expected_next_steps": [],
+        },
+        "recent_dialogue_turns": [
+            {
+                "turn_id": index + 1,
+                "user_input": "状況を教えて",
+                "assistant_response": ("調査結果の説明です。" * response_chars)[:response_chars],
+            }
+            for index in range(turns)
+        ],
+        "role": "ops",
+        "tools": [],
+        "committed_state": _state(),
+    }
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--artifact-chars", type=int, nargs="+", default=[200, 2000, 8000])
+    parser.add_argument("--artifacts", type=int, default=3)
+    parser.add_argument("--turns", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'kind':<10} {'chars':>6} {'before':>7} {'after':>7} {'削減%':>6} {'μs/回':>8}")
+    for chars in args.artifact_chars:
+        cases: tuple[tuple[PromptKind, dict[str, JSONValue]], ...] = (
+            ("compressor", _compressor_payload(chars, args.artifacts)),
+            ("policy", _policy_payload(chars, args.turns)),
+        )
+        for kind, payload in cases:
+            budgeter = PromptBudgeter(token_counter=HeuristicTokenCounterAdapter())
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                budgeter.render(kind, payload)
+            elapsed = time.perf_counter() - started
+            stats = budgeter.stats()
+            print(
+                f"{kind:<10} {chars:>6} {stats.tokens_before // stats.prompts:>7} "
+                f"{stats.tokens_after // stats.prompts:>7} {stats.saved_ratio * 100:>6.1f} "
+                f"{elapsed / args.repeat * 1e6:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
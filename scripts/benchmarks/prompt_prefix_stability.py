@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""1 セッション内の連続するターンで、モデルへ送るプロンプトの先頭一致率を計測する。
+
+上流の prompt caching は前回と一致する先頭部分にだけ効く。応答を記録するスタブ
+クライアントで `ChatSessionUseCase` を複数ターン動かし、圧縮モデル・ポリシーそれぞれの
+`instructions + input` の UTF-8 バイト列が直前ターンと先頭から何バイト一致するかを出す。
+
+実行例:
+    PYTHONPATH=src python3 scripts/benchmarks/prompt_prefix_stability.py --turns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, cast
+
+from acc.adapters.outbound.openai_chat_adapters import (
+    OpenAIAgentPolicyAdapter,
+    OpenAICognitiveCompressorModelAdapter,
+)
+from acc.adapters.outbound.openai_transport import OpenAITransport
+from acc.adapters.outbound.schema_aware_cognitive_compressor import (
+    SchemaAwareCognitiveCompressorAdapter,
+)
+from acc.application.use_cases.chat_session import ChatSessionUseCase
+
+_MESSAGES = (
+    "web-01 で nginx が 502 を返しています。原因を一緒に調べてください。",
+    "本番の設定変更は承認が必要です。まず読み取りだけで確認したいです。",
+    "error.log には upstream timed out (110) が大量に出ています。",
+    "upstream は app-01 と app-02 で、app-02 の CPU が 95% です。",
+    "app-02 の GC ログに長い停止が見えます。",
+    "一個前の発言で言った GC の停止時間はどのくらいが問題ですか？",
+    "ヒープを増やす案と app-02 を一時的に外す案、どちらが安全ですか？",
+    "外す場合の手順をまとめてください。",
+    "ありがとう。最後に今回の原因を一文でまとめて。",
+    "再発防止のために監視すべき指標は？",
+)
+
+
+@dataclass
+class _RecordingResponses:
+    """`responses.create` の引数を記録し、決まった応答を返すスタブ。"""
+
+    requests: dict[str, list[bytes]] = field(
+        default_factory=lambda: {"compressor": [], "policy": []}
+    )
+    turn: int = 0
+
+    def create(self, **kwargs: Any) -> SimpleNamespace:
+        """送信内容を記録し、圧縮モデルには少しずつ変わる CCS を返す。"""
+        instructions = kwargs["instructions"]
+        sent = f"{instructions}\n{kwargs['input']}".encode()
+        if "Cognitive Compressor" in instructions:
+            self.turn += 1
+            self.requests["compressor"].append(sent)
+            return SimpleNamespace(output_text=json.dumps(self._next_state(), ensure_ascii=False))
+        self.requests["policy"].append(sent)
+        return SimpleNamespace(
+            output_text=f"ターン {self.turn} の回答です。" + "根拠と次の手順。" * 8
+        )
+
+    def _next_state(self) -> dict[str, object]:
+        return {
+            "episodic_trace": [f"t{index}: 調査を進めた" for index in range(1, self.turn + 1)][-5:],
+            "semantic_gist": f"web-01 の 502 を調査中（ターン {self.turn}）",
+            "focal_entities": ["web-01", "nginx", "app-02"][: 1 + min(self.turn, 2)],
+            "relational_map": ["web-01 -> app-01", "web-01 -> app-02"],
+            "goal_orientation": "502 の原因を特定し、安全に復旧する",
+            "constraints": ["本番の設定変更は承認後に行う", "読み取り操作を優先する"],
+            "predictive_cue": [f"次はターン {self.turn + 1} の確認"],
+            "uncertainty_signal": "中" if self.turn % 2 else "高",
+            "retrieved_artifacts": [],
+        }
+
+
+@dataclass
+class _RecordingTransport:
+    """`OpenAITransport.client` の代わりに記録用スタブを返す。"""
+
+    responses: _RecordingResponses = field(default_factory=_RecordingResponses)
+
+    @property
+    def client(self) -> SimpleNamespace:
+        return SimpleNamespace(responses=self.responses)
+
+
+def _shared_prefix_bytes(previous: bytes, current: bytes) -> int:
+    limit = min(len(previous), len(current))
+    index = 0
+    while index < limit and previous[index] == current[index]:
+        index += 1
+    return index
+
+
+def main() -> None:
+    """計測結果を表形式で出力する。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=len(_MESSAGES))
+    args = parser.parse_args()
+
+    recording = _RecordingTransport()
+    transport = cast(OpenAITransport, recording)
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SchemaAwareCognitiveCompressorAdapter(
+            model=OpenAICognitiveCompressorModelAdapter(model="stub", transport=transport),
+        ),
+        agent_policy=OpenAIAgentPolicyAdapter(model="stub", transport=transport),
+        role="acc-assistant",
+    )
+    session_id = use_case.create_session()
+    for turn in range(args.turns):
+        use_case.send_message(session_id=session_id, message=_MESSAGES[turn % len(_MESSAGES)])
+    use_case.close()
+
+    print(f"{'kind':<10} {'平均bytes':>9} {'一致bytes':>9} {'一致率%':>7} {'最小%':>6}")
+    for kind, sent in recording.responses.requests.items():
+        shares = [
+            _shared_prefix_bytes(previous, current) / len(current)
+            for previous, current in zip(sent, sent[1:], strict=False)
+        ]
+        shared = [
+            _shared_prefix_bytes(previous, current)
+            for previous, current in zip(sent, sent[1:], strict=False)
+        ]
+        print(
+            f"{kind:<10} {statistics.mean(map(len, sent[1:])):>9.0f} "
+            f"{statistics.mean(shared):>9.0f} {statistics.mean(shares) * 100:>7.1f} "
+            f"{min(shares) * 100:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,50 +2,134 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 import os
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, FastAPI, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
 
 from acc.adapters.inbound.http.schemas import (
     ChatMessageRequest,
     ChatMessageResponse,
+    CommittedStateDeltaResponse,
     CommittedStateResponse,
     CreateSessionResponse,
     ErrorResponse,
     HealthResponse,
     MechanismResponse,
 )
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.adapters.outbound.model_response_cache import (
+    CachingAgentPolicyAdapter,
+    CachingCognitiveCompressorModelAdapter,
+    CachingStreamingAgentPolicyAdapter,
+    ModelResponseCache,
+)
 from acc.adapters.outbound.openai_chat_adapters import (
+    COMPRESSOR_OUTPUT_MODES,
     OpenAIAgentPolicyAdapter,
     OpenAICognitiveCompressorModelAdapter,
     OpenAIConfigurationError,
+    OpenAIFusedTurnModelAdapter,
     OpenAIRequestError,
     OpenAIResponseFormatError,
 )
+from acc.adapters.outbound.openai_transport import OpenAITransport, OpenAITransportConfig
+from acc.adapters.outbound.prompt_budget import MIN_BUDGET_TOKENS, PromptBudget, PromptBudgeter
+from acc.adapters.outbound.resilient_model_adapters import (
+    CircuitBreaker,
+    HedgePolicy,
+    ModelCallGuard,
+    ModelCircuitOpenError,
+    ResilientAgentPolicyAdapter,
+    ResilientCognitiveCompressorModelAdapter,
+    ResilientStreamingAgentPolicyAdapter,
+    RetryPolicy,
+)
+from acc.adapters.outbound.routing_cognitive_compressor import RoutingCognitiveCompressorAdapter
 from acc.adapters.outbound.schema_aware_cognitive_compressor import (
     SchemaAwareCognitiveCompressorAdapter,
+    SchemaAwareFusedTurnAdapter,
 )
+from acc.adapters.outbound.session_stores import SessionStoreError, build_session_store
+from acc.adapters.outbound.token_counters import TOKEN_COUNTER_MODES, build_token_counter
 from acc.application.use_cases.chat_session import (
+    ChatReply,
+    ChatReplyDelta,
+    ChatSessionConflictError,
     ChatSessionNotFoundError,
     ChatSessionUseCase,
+    ChatStreamEvent,
 )
-from acc.domain.services.ccs_schema import CCSValidationError
+from acc.domain.services.ccs_schema import CCS_REPAIR_MODES, CCSValidationError
+from acc.domain.services.compression_gate import (
+    ESCALATION_SIGNALS,
+    CompressionGate,
+    CompressionRouter,
+    CompressionRoutingPolicy,
+)
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
 
 _BASE_DIR = Path(__file__).resolve().parent
 _STATIC_HTML = _BASE_DIR / "static" / "index.html"
+# 先に一致したものを使うため、`ValueError` の派生である CCS 検証エラーを先に置く。
+_CHAT_ERROR_STATUS_CODES: tuple[tuple[type[Exception], int], ...] = (
+    (CCSValidationError, status.HTTP_502_BAD_GATEWAY),
+    (ValueError, status.HTTP_400_BAD_REQUEST),
+    (ChatSessionNotFoundError, status.HTTP_404_NOT_FOUND),
+    (ChatSessionConflictError, status.HTTP_409_CONFLICT),
+    (OpenAIConfigurationError, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (ModelCircuitOpenError, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (SessionStoreError, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (OpenAIRequestError, status.HTTP_502_BAD_GATEWAY),
+    (OpenAIResponseFormatError, status.HTTP_502_BAD_GATEWAY),
+)
+_CHAT_ERRORS = tuple(error_type for error_type, _ in _CHAT_ERROR_STATUS_CODES)
 
 
 def create_app(*, chat_session_use_case: ChatSessionUseCase | None = None) -> FastAPI:
     """ACC チャット API アプリを構築する。"""
     _load_runtime_env()
-    use_case = chat_session_use_case or _build_default_chat_use_case()
+    transport: OpenAITransport | None = None
+    model_call_guards: tuple[ModelCallGuard, ...] = ()
+    if chat_session_use_case is None:
+        transport = _build_openai_transport()
+        use_case, model_call_guards = _build_default_chat_use_case(transport)
+    else:
+        use_case = chat_session_use_case
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if (
+            transport is not None
+            and _resolve_choice_env(
+                "ACC_OPENAI_WARMUP",
+                choices=("off", "on"),
+                default="on",
+            )
+            == "on"
+        ):
+            await asyncio.to_thread(transport.warm_up)
+        yield
+        use_case.close()
+        for guard in model_call_guards:
+            guard.close()
+        if transport is not None:
+            transport.close()
 
     app = FastAPI(
         title="ACC Chat API",
         version="0.1.0",
+        lifespan=lifespan,
     )
     app.state.chat_session_use_case = use_case
     _register_routes(app)
@@ -62,10 +146,17 @@ def _register_routes(app: FastAPI) -> None:
     @api.post(
         "/chat/sessions",
         response_model=CreateSessionResponse,
+        responses={503: {"model": ErrorResponse}},
     )
     def create_session() -> CreateSessionResponse:
         use_case: ChatSessionUseCase = app.state.chat_session_use_case
-        session_id = use_case.create_session()
+        try:
+            session_id = use_case.create_session()
+        except SessionStoreError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(exc),
+            ) from exc
         return CreateSessionResponse(session_id=session_id)
 
     @api.post(
@@ -85,51 +176,44 @@ def _register_routes(app: FastAPI) -> None:
                 session_id=request.session_id,
                 message=request.message,
             )
-        except CCSValidationError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=str(exc),
-            ) from exc
-        except ValueError as exc:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-        except ChatSessionNotFoundError as exc:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        except OpenAIConfigurationError as exc:
+        except _CHAT_ERRORS as exc:
             raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                status_code=_chat_error_status_code(exc),
                 detail=str(exc),
             ) from exc
-        except OpenAIRequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=str(exc),
-            ) from exc
-        except OpenAIResponseFormatError as exc:
+        return _build_chat_message_response(reply, state_mode=request.state_mode)
+
+    @api.post(
+        "/chat/messages/stream",
+        response_class=StreamingResponse,
+        responses={
+            200: {"content": {"text/event-stream": {}}},
+            400: {"model": ErrorResponse},
+            404: {"model": ErrorResponse},
+            502: {"model": ErrorResponse},
+            503: {"model": ErrorResponse},
+        },
+    )
+    def stream_message(request: ChatMessageRequest) -> StreamingResponse:
+        use_case: ChatSessionUseCase = app.state.chat_session_use_case
+        try:
+            events = use_case.stream_message(
+                session_id=request.session_id,
+                message=request.message,
+            )
+            # CCS 更新を含む最初の差分までをここで実行し、応答前の失敗は HTTP ステータスで返す。
+            first_event = next(events)
+        except _CHAT_ERRORS as exc:
             raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
+                status_code=_chat_error_status_code(exc),
                 detail=str(exc),
             ) from exc
-
-        return ChatMessageResponse(
-            session_id=reply.session_id,
-            turn_id=reply.turn_id,
-            reply=reply.reply,
-            memory_tokens=reply.memory_tokens,
-            mechanism=MechanismResponse(
-                recalled_artifact_count=reply.mechanism.recalled_artifact_count,
-                qualified_artifact_count=reply.mechanism.qualified_artifact_count,
-                committed_state=CommittedStateResponse(
-                    episodic_trace=list(reply.mechanism.committed_state.episodic_trace),
-                    semantic_gist=reply.mechanism.committed_state.semantic_gist,
-                    focal_entities=list(reply.mechanism.committed_state.focal_entities),
-                    relational_map=list(reply.mechanism.committed_state.relational_map),
-                    goal_orientation=reply.mechanism.committed_state.goal_orientation,
-                    constraints=list(reply.mechanism.committed_state.constraints),
-                    predictive_cue=list(reply.mechanism.committed_state.predictive_cue),
-                    uncertainty_signal=reply.mechanism.committed_state.uncertainty_signal,
-                    retrieved_artifacts=list(reply.mechanism.committed_state.retrieved_artifacts),
-                ),
+        return StreamingResponse(
+            _iterate_until_closed(
+                _chat_stream_sse(first_event, events, state_mode=request.state_mode)
             ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     @app.get("/", response_class=FileResponse)
@@ -143,30 +227,310 @@ def _register_routes(app: FastAPI) -> None:
     app.include_router(api)
 
 
-def _build_default_chat_use_case() -> ChatSessionUseCase:
+def _chat_error_status_code(exc: Exception) -> int:
+    """チャット処理の例外に対応する HTTP ステータスを返す。"""
+    for error_type, status_code in _CHAT_ERROR_STATUS_CODES:
+        if isinstance(exc, error_type):
+            return status_code
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _chat_stream_sse(
+    first_event: ChatStreamEvent,
+    events: Generator[ChatStreamEvent, None, None],
+    *,
+    state_mode: str,
+) -> Generator[str, None, None]:
+    """ストリーミング応答を SSE（`delta` / `done` / `error` イベント）へ変換する。
+
+    このジェネレータが閉じられると、ユースケース側も閉じてターンを破棄する。
+    """
+    try:
+        for event in itertools.chain((first_event,), events):
+            if isinstance(event, ChatReplyDelta):
+                yield _sse_message("delta", {"text": event.text})
+            else:
+                response = _build_chat_message_response(event, state_mode=state_mode)
+                yield _sse_message("done", response.model_dump(mode="json"))
+    except _CHAT_ERRORS as exc:
+        yield _sse_message(
+            "error",
+            {"status_code": _chat_error_status_code(exc), "detail": str(exc)},
+        )
+    finally:
+        events.close()
+
+
+async def _iterate_until_closed(chunks: Generator[str, None, None]) -> AsyncIterator[str]:
+    """同期ジェネレータをスレッドプールで読み進め、終了・切断のどちらでも必ず閉じる。
+
+    Starlette が同期イテレータに使う `iterate_in_threadpool` はクライアント切断時に元の
+    ジェネレータを閉じないため、セッションロックを握ったままになる。切断による取り消しは
+    読み出し中のスレッドの完了を待ってから届くので、`finally` では実行中でないジェネレータを閉じる。
+    """
+    try:
+        while (chunk := await run_in_threadpool(next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        # 取り消し中は await できないため同期で閉じる（ターンの破棄・上流ストリームの解放・ロック解放だけ）。
+        chunks.close()
+
+
+def _sse_message(event: str, data: dict[str, object]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _build_chat_message_response(reply: ChatReply, *, state_mode: str) -> ChatMessageResponse:
+    """ユースケースの応答を `state_mode` に応じた API レスポンスへ変換する。"""
+    mechanism = reply.mechanism
+    if state_mode == "delta":
+        mechanism_response = MechanismResponse(
+            recalled_artifact_count=mechanism.recalled_artifact_count,
+            qualified_artifact_count=mechanism.qualified_artifact_count,
+            committed_state_delta=CommittedStateDeltaResponse(
+                base_turn_id=reply.turn_id - 1,
+                changes={
+                    name: list(value) if isinstance(value, tuple) else value
+                    for name, value in mechanism.committed_state_delta.changes
+                },
+            ),
+        )
+    else:
+        mechanism_response = MechanismResponse(
+            recalled_artifact_count=mechanism.recalled_artifact_count,
+            qualified_artifact_count=mechanism.qualified_artifact_count,
+            committed_state=CommittedStateResponse(
+                episodic_trace=list(mechanism.committed_state.episodic_trace),
+                semantic_gist=mechanism.committed_state.semantic_gist,
+                focal_entities=list(mechanism.committed_state.focal_entities),
+                relational_map=list(mechanism.committed_state.relational_map),
+                goal_orientation=mechanism.committed_state.goal_orientation,
+                constraints=list(mechanism.committed_state.constraints),
+                predictive_cue=list(mechanism.committed_state.predictive_cue),
+                uncertainty_signal=mechanism.committed_state.uncertainty_signal,
+                retrieved_artifacts=list(mechanism.committed_state.retrieved_artifacts),
+            ),
+        )
+
+    return ChatMessageResponse(
+        session_id=reply.session_id,
+        turn_id=reply.turn_id,
+        reply=reply.reply,
+        memory_tokens=reply.memory_tokens,
+        mechanism=mechanism_response,
+    )
+
+
+def _build_openai_transport() -> OpenAITransport:
+    """環境変数から共有 OpenAI トランスポートを組み立てる。"""
+    defaults = OpenAITransportConfig()
+    max_connections = _resolve_non_negative_int_env(
+        "ACC_OPENAI_MAX_CONNECTIONS",
+        default=defaults.max_connections,
+    )
+    max_keepalive_connections = _resolve_non_negative_int_env(
+        "ACC_OPENAI_MAX_KEEPALIVE_CONNECTIONS",
+        default=defaults.max_keepalive_connections,
+    )
+    read_timeout_seconds = _resolve_non_negative_int_env(
+        "ACC_OPENAI_TIMEOUT_SECONDS",
+        default=int(defaults.read_timeout_seconds),
+    )
+    http2_mode = _resolve_choice_env("ACC_OPENAI_HTTP2", choices=("off", "on"), default="off")
+    max_connections = max_connections or defaults.max_connections
+    return OpenAITransport(
+        OpenAITransportConfig(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive_connections, max_connections),
+            read_timeout_seconds=read_timeout_seconds or defaults.read_timeout_seconds,
+            http2=http2_mode == "on",
+            # 再送層を使う場合は SDK 側の再送と重ねない。
+            max_retries=0 if _model_resilience_enabled() else defaults.max_retries,
+        )
+    )
+
+
+def _model_resilience_enabled() -> bool:
+    return _resolve_choice_env("ACC_MODEL_RESILIENCE", choices=("off", "on"), default="off") == "on"
+
+
+def _build_default_chat_use_case(
+    transport: OpenAITransport,
+) -> tuple[ChatSessionUseCase, tuple[ModelCallGuard, ...]]:
+    """既定のユースケースと、終了時に閉じるモデル呼び出しガードを組み立てる。"""
     compressor_model_name = _resolve_model_name(primary_env="OPENAI_COMPRESSOR_MODEL")
     agent_model_name = _resolve_model_name(primary_env="OPENAI_AGENT_MODEL")
     short_history_turns = _resolve_non_negative_int_env("ACC_SHORT_HISTORY_TURNS", default=2)
+    session_idle_ttl_seconds = _resolve_non_negative_int_env(
+        "ACC_SESSION_IDLE_TTL_SECONDS",
+        default=0,
+    )
+    max_session_bytes = _resolve_non_negative_int_env("ACC_SESSION_MAX_BYTES", default=0)
+    token_counter_mode = _resolve_choice_env(
+        "ACC_TOKEN_COUNTER",
+        choices=TOKEN_COUNTER_MODES,
+        default="auto",
+    )
+    session_store_url = os.getenv("ACC_SESSION_STORE", "").strip()
+    session_store_flush_turns = _resolve_non_negative_int_env(
+        "ACC_SESSION_STORE_FLUSH_TURNS",
+        default=1,
+    )
+    session_store_delta_frames = _resolve_non_negative_int_env(
+        "ACC_SESSION_STORE_DELTA_FRAMES",
+        default=0,
+    )
+    compression_gate_mode = _resolve_choice_env(
+        "ACC_COMPRESSION_GATE",
+        choices=("off", "on"),
+        default="off",
+    )
+    model_cache_entries = _resolve_non_negative_int_env("ACC_MODEL_CACHE_ENTRIES", default=0)
+    model_cache_dir = os.getenv("ACC_MODEL_CACHE_DIR", "").strip()
+    model_retry_attempts = _resolve_non_negative_int_env("ACC_MODEL_RETRY_ATTEMPTS", default=3)
+    model_hedge_mode = _resolve_choice_env("ACC_MODEL_HEDGE", choices=("off", "on"), default="off")
+    model_breaker_failures = _resolve_non_negative_int_env(
+        "ACC_MODEL_BREAKER_FAILURES",
+        default=5,
+    )
+    token_counter = build_token_counter(token_counter_mode)
+    prompt_budgeter = PromptBudgeter(_resolve_prompt_budget(), token_counter=token_counter)
+    prompt_cache_key = os.getenv("ACC_PROMPT_CACHE_KEY", "").strip() or None
+    compressor_output_mode = _resolve_choice_env(
+        "ACC_COMPRESSOR_OUTPUT",
+        choices=COMPRESSOR_OUTPUT_MODES,
+        default="json",
+    )
+    fused_turn_mode = _resolve_choice_env("ACC_FUSED_TURN", choices=("off", "on"), default="off")
+    ccs_repair_mode = _resolve_choice_env(
+        "ACC_CCS_REPAIR",
+        choices=CCS_REPAIR_MODES,
+        default="strict",
+    )
+    compressor_routing_mode = _resolve_choice_env(
+        "ACC_COMPRESSOR_ROUTING",
+        choices=("off", "on"),
+        default="off",
+    )
 
+    compressor_temperature, policy_temperature = _resolve_model_temperatures(
+        cache_enabled=model_cache_entries > 0
+    )
     compressor_model = OpenAICognitiveCompressorModelAdapter(
         model=compressor_model_name,
-        temperature=0.1,
+        temperature=compressor_temperature,
         max_output_tokens=900,
+        transport=transport,
+        prompt_budgeter=prompt_budgeter,
+        prompt_cache_key=prompt_cache_key,
+        output_mode=compressor_output_mode,
     )
-    compressor = SchemaAwareCognitiveCompressorAdapter(model=compressor_model)
     policy = OpenAIAgentPolicyAdapter(
         model=agent_model_name,
-        temperature=0.2,
+        temperature=policy_temperature,
         max_output_tokens=1000,
+        transport=transport,
+        prompt_budgeter=prompt_budgeter,
+        prompt_cache_key=prompt_cache_key,
+    )
+    cached_compressor_model: CognitiveCompressorModelPort = compressor_model
+    cached_policy: AgentPolicyPort = policy
+    model_call_guards: tuple[ModelCallGuard, ...] = ()
+    # SSE の応答生成も一括の応答生成と同じガード・キャッシュを通す。
+    streaming_policy: StreamingAgentPolicyPort = policy
+    if _model_resilience_enabled():
+        # 両アダプタは同じ上流を呼ぶのでブレーカーは共有し、レイテンシ分布は別々に持つ。
+        breaker = CircuitBreaker(failure_threshold=model_breaker_failures or 5)
+        retry = RetryPolicy(max_attempts=model_retry_attempts or 1)
+        hedge = HedgePolicy() if model_hedge_mode == "on" else None
+        compressor_guard = ModelCallGuard(retry=retry, hedge=hedge, breaker=breaker)
+        policy_guard = ModelCallGuard(retry=retry, hedge=hedge, breaker=breaker)
+        model_call_guards = (compressor_guard, policy_guard)
+        cached_compressor_model = ResilientCognitiveCompressorModelAdapter(
+            compressor_model,
+            guard=compressor_guard,
+        )
+        cached_policy = ResilientAgentPolicyAdapter(policy, guard=policy_guard)
+        streaming_policy = ResilientStreamingAgentPolicyAdapter(policy, guard=policy_guard)
+    if model_cache_entries:
+        model_cache = ModelResponseCache(
+            max_entries=model_cache_entries,
+            directory=Path(model_cache_dir) if model_cache_dir else None,
+        )
+        # 両モデルは temperature 0 で組み立て済みなので opt-in なしで全呼び出しが対象になる。
+        cached_compressor_model = CachingCognitiveCompressorModelAdapter(
+            cached_compressor_model,
+            cache=model_cache,
+            model_parameters=compressor_model.model_parameters,
+        )
+        cached_policy = CachingAgentPolicyAdapter(
+            cached_policy,
+            cache=model_cache,
+            model_parameters=policy.model_parameters,
+        )
+        streaming_policy = CachingStreamingAgentPolicyAdapter(
+            streaming_policy,
+            cache=model_cache,
+            model_parameters=policy.model_parameters,
+        )
+    compressor: CognitiveCompressorPort = SchemaAwareCognitiveCompressorAdapter(
+        model=cached_compressor_model,
+        gate=CompressionGate() if compression_gate_mode == "on" else None,
+        token_counter=token_counter,
+        repair_mode=ccs_repair_mode,
     )
-    return ChatSessionUseCase(
+    if compressor_routing_mode == "on":
+        compressor = RoutingCognitiveCompressorAdapter(
+            SimpleCognitiveCompressorAdapter(),
+            compressor,
+            router=CompressionRouter(_resolve_routing_policy()),
+        )
+    use_case = ChatSessionUseCase(
         cognitive_compressor=compressor,
-        agent_policy=policy,
+        agent_policy=cached_policy,
         role="acc-assistant",
         recall_limit=5,
         max_sessions=200,
         short_history_turns=short_history_turns,
+        token_counter=token_counter,
+        session_idle_ttl_seconds=session_idle_ttl_seconds or None,
+        max_session_bytes=max_session_bytes or None,
+        session_store=(
+            build_session_store(
+                session_store_url,
+                delta_frames_per_snapshot=session_store_delta_frames,
+            )
+            if session_store_url
+            else None
+        ),
+        session_store_flush_turns=session_store_flush_turns or 1,
+        streaming_agent_policy=streaming_policy,
+        fused_turn=(
+            SchemaAwareFusedTurnAdapter(
+                OpenAIFusedTurnModelAdapter(
+                    model=agent_model_name,
+                    transport=transport,
+                    prompt_budgeter=prompt_budgeter,
+                    prompt_cache_key=prompt_cache_key,
+                ),
+                repair_mode=ccs_repair_mode,
+            )
+            if fused_turn_mode == "on"
+            else None
+        ),
     )
+    return use_case, model_call_guards
+
+
+def _resolve_model_temperatures(*, cache_enabled: bool) -> tuple[float, float]:
+    """圧縮モデルとポリシーの temperature を返す。
+
+    応答キャッシュは同じ入力に同じ応答を返す前提なので、有効時はどちらも 0 にする。
+    temperature > 0 のままだと全呼び出しが素通しになり、キャッシュが効かない。
+    """
+    if cache_enabled:
+        return 0.0, 0.0
+    return 0.1, 0.2
 
 
 def _load_runtime_env() -> None:
@@ -191,6 +555,59 @@ def _resolve_model_name(*, primary_env: str, default: str = "gpt-4.1-mini") -> s
     return default
 
 
+def _resolve_prompt_budget() -> PromptBudget:
+    """環境変数からプロンプトのセクション別 token 上限を解決する。
+
+    0 は上限なし。下限未満の値は下限に切り上げる。
+    """
+    defaults = PromptBudget()
+    resolved = {
+        field_name: _resolve_non_negative_int_env(env_name, default=default or 0)
+        for field_name, env_name, default in (
+            ("artifact_tokens", "ACC_PROMPT_ARTIFACT_TOKENS", defaults.artifact_tokens),
+            ("artifacts_tokens", "ACC_PROMPT_ARTIFACTS_TOKENS", defaults.artifacts_tokens),
+            ("dialogue_tokens", "ACC_PROMPT_DIALOGUE_TOKENS", defaults.dialogue_tokens),
+            ("state_tokens", "ACC_PROMPT_STATE_TOKENS", defaults.state_tokens),
+        )
+    }
+    return PromptBudget(
+        **{
+            field_name: max(value, MIN_BUDGET_TOKENS) if value else None
+            for field_name, value in resolved.items()
+        }
+    )
+
+
+def _resolve_routing_policy() -> CompressionRoutingPolicy:
+    """環境変数から規則ベース圧縮をモデルへ切り替える条件を解決する。
+
+    `ACC_COMPRESSOR_ROUTING_SIGNALS` はカンマ区切りの信号名で、未知の名前は無視する。
+    未設定または有効な名前が 1 つもなければ全信号を使う。
+    """
+    defaults = CompressionRoutingPolicy()
+    requested = {
+        name.strip().lower()
+        for name in os.getenv("ACC_COMPRESSOR_ROUTING_SIGNALS", "").split(",")
+        if name.strip()
+    }
+    escalate_on = frozenset(
+        signal_name for signal_name in ESCALATION_SIGNALS if signal_name in requested
+    )
+    return CompressionRoutingPolicy(
+        escalate_on=escalate_on or defaults.escalate_on,
+        min_new_entities=_resolve_non_negative_int_env(
+            "ACC_COMPRESSOR_ROUTING_MIN_NEW_ENTITIES",
+            default=defaults.min_new_entities,
+        )
+        or defaults.min_new_entities,
+        max_rule_input_chars=_resolve_non_negative_int_env(
+            "ACC_COMPRESSOR_ROUTING_MAX_RULE_CHARS",
+            default=defaults.max_rule_input_chars,
+        )
+        or defaults.max_rule_input_chars,
+    )
+
+
 def _resolve_non_negative_int_env(env_name: str, *, default: int) -> int:
     """非負整数環境変数を解決する。不正値は default を返す。"""
     raw_value = os.getenv(env_name, "").strip()
@@ -205,3 +622,11 @@ def _resolve_non_negative_int_env(env_name: str, *, default: int) -> int:
     if resolved < 0:
         return default
     return resolved
+
+
+def _resolve_choice_env(env_name: str, *, choices: tuple[str, ...], default: str) -> str:
+    """選択肢つき環境変数を解決する。不正値は default を返す。"""
+    raw_value = os.getenv(env_name, "").strip().lower()
+    if raw_value in choices:
+        return raw_value
+    return default
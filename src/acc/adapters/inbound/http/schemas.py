@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -22,6 +24,7 @@ class ChatMessageRequest(BaseModel):
 
     session_id: str = Field(min_length=1)
     message: str = Field(min_length=1, max_length=10_000)
+    state_mode: Literal["full", "delta"] = "full"
 
 
 class CommittedStateResponse(BaseModel):
@@ -38,12 +41,23 @@ class CommittedStateResponse(BaseModel):
     retrieved_artifacts: list[str]
 
 
+class CommittedStateDeltaResponse(BaseModel):
+    """前ターンの CCS から変化した項目だけを持つ差分。"""
+
+    base_turn_id: int = Field(ge=0)
+    changes: dict[str, str | list[str]]
+
+
 class MechanismResponse(BaseModel):
-    """ACC 1ターン処理の可視化情報。"""
+    """ACC 1ターン処理の可視化情報。
+
+    `state_mode=delta` のときは `committed_state` を省略し、`committed_state_delta` を返す。
+    """
 
     recalled_artifact_count: int = Field(ge=0)
     qualified_artifact_count: int = Field(ge=0)
-    committed_state: CommittedStateResponse
+    committed_state: CommittedStateResponse | None = None
+    committed_state_delta: CommittedStateDeltaResponse | None = None
 
 
 class ChatMessageResponse(BaseModel):
@@ -0,0 +1,427 @@
+"""CCS 関連オブジェクトの版番号つきバイナリコーデック。
+
+形式は `magic(2) + version(1) + kind(1) + 整数配列 + 文字数配列 + UTF-8 本体`。
+整数配列（要素数・ターン番号・日時）と文字数配列は「件数(LEB128) + 幅コード(1) +
+最大値に合わせた幅の struct 配列」、本体は全文字列を連結した UTF-8 で表す。
+復号は本体を 1 回だけ UTF-8 復号し、文字数の累積でスライスするため、
+文字列ごとの復号呼び出しが発生しない。CCS 差分は変化フィールドのビットマスクと
+変化した値だけを持つ。
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta, timezone
+from itertools import accumulate
+from itertools import islice as _islice
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.services.ccs_delta import (
+    CCS_FIELD_NAMES,
+    CCS_TUPLE_FIELD_NAMES,
+    CCSDelta,
+    CCSFieldValue,
+    apply_ccs_delta,
+    diff_ccs,
+)
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+
+CCS_CODEC_MAGIC = b"\xacC"
+CCS_CODEC_VERSION = 1
+
+_KIND_CCS = 0x01
+_KIND_ARTIFACT = 0x02
+_KIND_RECENT_DIALOGUE_TURN = 0x03
+_KIND_SESSION_SNAPSHOT = 0x04
+_KIND_CCS_DELTA = 0x05
+_KIND_SESSION_SNAPSHOT_DELTA = 0x06
+
+_HEADER = struct.Struct("<2sBB")
+_UINT_ARRAY_FORMATS: tuple[tuple[int, str], ...] = (
+    (0xFF, "B"),
+    (0xFFFF, "H"),
+    (0xFFFFFFFF, "I"),
+    (0xFFFFFFFFFFFFFFFF, "Q"),
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class CCSCodecError(ValueError):
+    """バイナリ表現の復元に失敗したことを表す例外。"""
+
+
+def encode_ccs(state: CompressedCognitiveState) -> bytes:
+    """CCS をバイナリへ変換する。"""
+    writer = _Writer()
+    _write_ccs(writer, state)
+    return writer.to_bytes(_KIND_CCS)
+
+
+def decode_ccs(data: bytes) -> CompressedCognitiveState:
+    """バイナリから CCS を復元する。"""
+    reader = _Reader(data, kind=_KIND_CCS)
+    state = _read_ccs(reader)
+    reader.finish()
+    return state
+
+
+def encode_artifact(artifact: Artifact) -> bytes:
+    """Artifact をバイナリへ変換する。"""
+    writer = _Writer()
+    writer.strings += (artifact.artifact_id, artifact.content, artifact.source)
+    offset = artifact.created_at.utcoffset() or timedelta(0)
+    elapsed = artifact.created_at - _EPOCH
+    writer.ints += (
+        _zigzag((elapsed.days * 86_400 + elapsed.seconds) * 1_000_000 + elapsed.microseconds),
+        _zigzag(offset.days * 86_400 + offset.seconds),
+    )
+    return writer.to_bytes(_KIND_ARTIFACT)
+
+
+def decode_artifact(data: bytes) -> Artifact:
+    """バイナリから Artifact を復元する。"""
+    reader = _Reader(data, kind=_KIND_ARTIFACT)
+    artifact_id, content, source = reader.next_str(), reader.next_str(), reader.next_str()
+    micros, offset_seconds = _unzigzag(reader.next_int()), _unzigzag(reader.next_int())
+    reader.finish()
+    try:
+        tz = UTC if offset_seconds == 0 else timezone(timedelta(seconds=offset_seconds))
+        created_at = (_EPOCH + timedelta(microseconds=micros)).astimezone(tz)
+    except (OverflowError, ValueError) as exc:
+        raise CCSCodecError("日時を復元できません。") from exc
+    return _build(
+        Artifact,
+        artifact_id=artifact_id,
+        content=content,
+        source=source,
+        created_at=created_at,
+    )
+
+
+def encode_recent_dialogue_turn(turn: RecentDialogueTurn) -> bytes:
+    """短期対話の 1 ターンをバイナリへ変換する。"""
+    writer = _Writer()
+    _write_recent_dialogue_turn(writer, turn)
+    return writer.to_bytes(_KIND_RECENT_DIALOGUE_TURN)
+
+
+def decode_recent_dialogue_turn(data: bytes) -> RecentDialogueTurn:
+    """バイナリから短期対話の 1 ターンを復元する。"""
+    reader = _Reader(data, kind=_KIND_RECENT_DIALOGUE_TURN)
+    turn = _read_recent_dialogue_turn(reader)
+    reader.finish()
+    return turn
+
+
+def encode_session_snapshot(snapshot: SessionSnapshot) -> bytes:
+    """セッションスナップショットをバイナリへ変換する。"""
+    writer = _Writer()
+    writer.ints += (snapshot.turn_id, len(snapshot.recent_dialogue_turns))
+    _write_ccs(writer, snapshot.committed_state)
+    for turn in snapshot.recent_dialogue_turns:
+        _write_recent_dialogue_turn(writer, turn)
+    return writer.to_bytes(_KIND_SESSION_SNAPSHOT)
+
+
+def decode_session_snapshot(data: bytes) -> SessionSnapshot:
+    """バイナリからセッションスナップショットを復元する。"""
+    reader = _Reader(data, kind=_KIND_SESSION_SNAPSHOT)
+    turn_id = reader.next_int()
+    turn_count = reader.next_int()
+    committed_state = _read_ccs(reader)
+    recent_dialogue_turns = tuple(_read_recent_dialogue_turn(reader) for _ in range(turn_count))
+    reader.finish()
+    return _build(
+        SessionSnapshot,
+        committed_state=committed_state,
+        turn_id=turn_id,
+        recent_dialogue_turns=recent_dialogue_turns,
+    )
+
+
+def encode_ccs_delta(delta: CCSDelta) -> bytes:
+    """CCS 差分をバイナリへ変換する。"""
+    writer = _Writer()
+    _write_ccs_delta(writer, delta)
+    return writer.to_bytes(_KIND_CCS_DELTA)
+
+
+def decode_ccs_delta(data: bytes) -> CCSDelta:
+    """バイナリから CCS 差分を復元する。"""
+    reader = _Reader(data, kind=_KIND_CCS_DELTA)
+    delta = _read_ccs_delta(reader)
+    reader.finish()
+    return delta
+
+
+def encode_session_snapshot_delta(base: SessionSnapshot, snapshot: SessionSnapshot) -> bytes:
+    """`base` からの差分としてセッションスナップショットを変換する。
+
+    短期対話バッファは数ターン分と小さいため全量を持ち、CCS だけ差分化する。
+    """
+    writer = _Writer()
+    writer.ints += (base.turn_id, snapshot.turn_id, len(snapshot.recent_dialogue_turns))
+    for turn in snapshot.recent_dialogue_turns:
+        _write_recent_dialogue_turn(writer, turn)
+    _write_ccs_delta(writer, diff_ccs(base.committed_state, snapshot.committed_state))
+    return writer.to_bytes(_KIND_SESSION_SNAPSHOT_DELTA)
+
+
+def apply_session_snapshot_delta(base: SessionSnapshot, data: bytes) -> SessionSnapshot:
+    """`base` に差分バイナリを適用したスナップショットを返す。"""
+    reader = _Reader(data, kind=_KIND_SESSION_SNAPSHOT_DELTA)
+    base_turn_id = reader.next_int()
+    if base_turn_id != base.turn_id:
+        raise CCSCodecError(
+            f"差分の基準ターンが一致しません: expected={base.turn_id} actual={base_turn_id}"
+        )
+    turn_id = reader.next_int()
+    turn_count = reader.next_int()
+    recent_dialogue_turns = tuple(_read_recent_dialogue_turn(reader) for _ in range(turn_count))
+    delta = _read_ccs_delta(reader)
+    reader.finish()
+    return _build(
+        SessionSnapshot,
+        committed_state=apply_ccs_delta(base.committed_state, delta),
+        turn_id=turn_id,
+        recent_dialogue_turns=recent_dialogue_turns,
+    )
+
+
+def is_ccs_codec_payload(data: bytes) -> bool:
+    """このコーデックで符号化されたデータかを先頭バイトで判定する。"""
+    return data[: len(CCS_CODEC_MAGIC)] == CCS_CODEC_MAGIC
+
+
+def _write_ccs(writer: _Writer, state: CompressedCognitiveState) -> None:
+    writer.ints += (
+        len(state.episodic_trace),
+        len(state.focal_entities),
+        len(state.relational_map),
+        len(state.constraints),
+        len(state.predictive_cue),
+        len(state.retrieved_artifacts),
+    )
+    strings = writer.strings
+    strings += state.episodic_trace
+    strings.append(state.semantic_gist)
+    strings += state.focal_entities
+    strings += state.relational_map
+    strings.append(state.goal_orientation)
+    strings += state.constraints
+    strings += state.predictive_cue
+    strings.append(state.uncertainty_signal)
+    strings += state.retrieved_artifacts
+
+
+def _read_ccs(reader: _Reader) -> CompressedCognitiveState:
+    next_int = reader.next_int
+    episodic, focal, relational, constraints, predictive, retrieved = (
+        next_int(),
+        next_int(),
+        next_int(),
+        next_int(),
+        next_int(),
+        next_int(),
+    )
+    take = reader.take_strs
+    next_str = reader.next_str
+    return CompressedCognitiveState(
+        episodic_trace=take(episodic),
+        semantic_gist=next_str(),
+        focal_entities=take(focal),
+        relational_map=take(relational),
+        goal_orientation=next_str(),
+        constraints=take(constraints),
+        predictive_cue=take(predictive),
+        uncertainty_signal=next_str(),
+        retrieved_artifacts=take(retrieved),
+    )
+
+
+def _write_recent_dialogue_turn(writer: _Writer, turn: RecentDialogueTurn) -> None:
+    writer.ints.append(turn.turn_id)
+    writer.strings += (turn.user_input, turn.assistant_response)
+
+
+def _read_recent_dialogue_turn(reader: _Reader) -> RecentDialogueTurn:
+    return _build(
+        RecentDialogueTurn,
+        turn_id=reader.next_int(),
+        user_input=reader.next_str(),
+        assistant_response=reader.next_str(),
+    )
+
+
+def _write_ccs_delta(writer: _Writer, delta: CCSDelta) -> None:
+    mask = 0
+    for name, _ in delta.changes:
+        mask |= 1 << CCS_FIELD_NAMES.index(name)
+    writer.ints.append(mask)
+    for _, value in delta.changes:
+        if isinstance(value, tuple):
+            writer.ints.append(len(value))
+            writer.strings += value
+        else:
+            writer.strings.append(value)
+
+
+def _read_ccs_delta(reader: _Reader) -> CCSDelta:
+    mask = reader.next_int()
+    if mask >> len(CCS_FIELD_NAMES):
+        raise CCSCodecError("未知の CCS フィールドが含まれています。")
+    changes: list[tuple[str, CCSFieldValue]] = []
+    for index, name in enumerate(CCS_FIELD_NAMES):
+        if not mask & (1 << index):
+            continue
+        if name in CCS_TUPLE_FIELD_NAMES:
+            changes.append((name, reader.take_strs(reader.next_int())))
+        else:
+            changes.append((name, reader.next_str()))
+    return CCSDelta(changes=tuple(changes))
+
+
+def _build[T](factory: type[T], **fields: object) -> T:
+    """不変条件違反をコーデック例外へ変換しつつオブジェクトを組み立てる。"""
+    try:
+        return factory(**fields)
+    except ValueError as exc:
+        raise CCSCodecError(f"{factory.__name__} の復元に失敗しました: {exc}") from exc
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+def _append_uint(buffer: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError("符号なし整数に負値は指定できません。")
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+class _Writer:
+    """整数列と文字列表を集め、最後に 1 つのバイト列へまとめる。"""
+
+    __slots__ = ("ints", "strings")
+
+    def __init__(self) -> None:
+        """空の整数列と文字列表を用意する。"""
+        self.ints: list[int] = []
+        self.strings: list[str] = []
+
+    def to_bytes(self, kind: int) -> bytes:
+        buffer = bytearray(_HEADER.pack(CCS_CODEC_MAGIC, CCS_CODEC_VERSION, kind))
+        _append_uint_array(buffer, self.ints)
+        _append_uint_array(buffer, [len(value) for value in self.strings])
+        buffer += "".join(self.strings).encode("utf-8")
+        return bytes(buffer)
+
+
+class _Reader:
+    """ヘッダを検証し、整数列と文字列表を先頭から順に取り出す。"""
+
+    __slots__ = ("_ints", "_strings")
+
+    def __init__(self, data: bytes, *, kind: int) -> None:
+        """ヘッダ検証と整数列・文字列表の展開を行う。"""
+        if len(data) < _HEADER.size:
+            raise CCSCodecError("データが短すぎます。")
+        magic, version, actual_kind = _HEADER.unpack_from(data)
+        if magic != CCS_CODEC_MAGIC:
+            raise CCSCodecError("CCS コーデックの形式ではありません。")
+        if version != CCS_CODEC_VERSION:
+            raise CCSCodecError(f"未対応のコーデック版です: {version}")
+        if actual_kind != kind:
+            raise CCSCodecError(f"データ種別が一致しません: expected={kind} actual={actual_kind}")
+
+        ints, offset = _read_uint_array(data, _HEADER.size)
+        lengths, offset = _read_uint_array(data, offset)
+        try:
+            text = str(data[offset:], "utf-8")
+        except UnicodeDecodeError as exc:
+            raise CCSCodecError("UTF-8 として復号できません。") from exc
+        ends = list(accumulate(lengths))
+        total = ends[-1] if ends else 0
+        if total != len(text):
+            raise CCSCodecError(
+                "データが途中で終わっています。"
+                if total > len(text)
+                else "末尾に余分なデータがあります。"
+            )
+        starts = [0, *ends[:-1]]
+        self._ints: Iterator[int] = iter(ints)
+        self._strings: Iterator[str] = iter(
+            [text[start:end] for start, end in zip(starts, ends, strict=True)]
+        )
+
+    def next_int(self) -> int:
+        try:
+            return next(self._ints)
+        except StopIteration:
+            raise CCSCodecError("データが途中で終わっています。") from None
+
+    def next_str(self) -> str:
+        try:
+            return next(self._strings)
+        except StopIteration:
+            raise CCSCodecError("データが途中で終わっています。") from None
+
+    def take_strs(self, count: int) -> tuple[str, ...]:
+        if count == 0:
+            return ()
+        values = tuple(_islice(self._strings, count))
+        if len(values) != count:
+            raise CCSCodecError("データが途中で終わっています。")
+        return values
+
+    def finish(self) -> None:
+        if next(self._ints, None) is not None or next(self._strings, None) is not None:
+            raise CCSCodecError("末尾に余分なデータがあります。")
+
+
+def _append_uint_array(buffer: bytearray, values: list[int]) -> None:
+    """件数・幅コード・struct 配列の順に非負整数列を書き込む。"""
+    largest = max(values, default=0)
+    width_code = next(
+        (index for index, (limit, _) in enumerate(_UINT_ARRAY_FORMATS) if largest <= limit),
+        None,
+    )
+    if width_code is None:
+        raise ValueError("整数が 64bit に収まりません。")
+    code = _UINT_ARRAY_FORMATS[width_code][1]
+    _append_uint(buffer, len(values))
+    buffer.append(width_code)
+    buffer += struct.pack(f"<{len(values)}{code}", *values)
+
+
+def _read_uint_array(data: bytes, offset: int) -> tuple[tuple[int, ...], int]:
+    count = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise CCSCodecError("データが途中で終わっています。")
+        byte = data[offset]
+        offset += 1
+        count |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    if offset >= len(data) or data[offset] >= len(_UINT_ARRAY_FORMATS):
+        raise CCSCodecError("データが途中で終わっています。")
+    code = _UINT_ARRAY_FORMATS[data[offset]][1]
+    offset += 1
+    # 要素数は信頼できない入力なので、Struct を組み立てる前に残りの長さと照合する。
+    if count * struct.calcsize(code) > len(data) - offset:
+        raise CCSCodecError("データが途中で終わっています。")
+    array_format = struct.Struct(f"<{count}{code}")
+    return array_format.unpack_from(data, offset), offset + array_format.size
@@ -9,6 +9,7 @@ from datetime import UTC, datetime
 
 from acc.domain.entities.artifact import Artifact
 from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.services.ccs_interning import DEFAULT_CCS_INTERNER
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 from acc.ports.outbound.agent_policy_port import AgentPolicyPort
 from acc.ports.outbound.artifact_qualification_port import ArtifactQualificationPort
@@ -41,6 +42,14 @@ class InMemoryArtifactMemory:
         self._artifacts: list[Artifact] = list(seed_artifacts)
         self._turn_records: list[StoredTurnEvidence] = []
         self._now_provider = now_provider or (lambda: datetime.now(UTC))
+        self._approximate_size_bytes = sum(
+            _artifact_size_bytes(artifact) for artifact in self._artifacts
+        )
+
+    @property
+    def approximate_size_bytes(self) -> int:
+        """保持中 Artifact の UTF-8 バイト数の概算を返す。"""
+        return self._approximate_size_bytes
 
     @property
     def turn_records(self) -> tuple[StoredTurnEvidence, ...]:
@@ -69,6 +78,7 @@ class InMemoryArtifactMemory:
             created_at=timestamp,
         )
         self._artifacts.append(artifact)
+        self._approximate_size_bytes += _artifact_size_bytes(artifact)
         self._turn_records.append(
             StoredTurnEvidence(
                 interaction_signal=interaction_signal,
@@ -128,11 +138,12 @@ class TokenOverlapQualificationAdapter(ArtifactQualificationPort):
 class SimpleCognitiveCompressorAdapter(CognitiveCompressorPort):
     """規則ベースで CCS を再構成する簡易圧縮アダプタ。"""
 
-    def __init__(self, max_retrieved_artifacts: int = 5) -> None:
-        """出力 CCS に保持する Artifact 参照上限を設定する。"""
+    def __init__(self, max_retrieved_artifacts: int = 5, *, share_structure: bool = True) -> None:
+        """出力 CCS に保持する Artifact 参照上限と、前状態との構造共有の有無を設定する。"""
         if max_retrieved_artifacts < 1:
             raise ValueError("max_retrieved_artifacts は 1 以上である必要があります。")
         self._max_retrieved_artifacts = max_retrieved_artifacts
+        self._share_structure = share_structure
 
     def commit_next_state(
         self,
@@ -159,7 +170,7 @@ class SimpleCognitiveCompressorAdapter(CognitiveCompressorPort):
         )
         uncertainty_signal = "低" if retrieved_artifacts else "中"
 
-        return CompressedCognitiveState(
+        next_state = CompressedCognitiveState(
             episodic_trace=episodic_trace,
             semantic_gist=semantic_gist,
             focal_entities=_dedupe_and_bound(focal_entities_source, limit=8),
@@ -173,6 +184,9 @@ class SimpleCognitiveCompressorAdapter(CognitiveCompressorPort):
             uncertainty_signal=uncertainty_signal,
             retrieved_artifacts=retrieved_artifacts,
         )
+        if not self._share_structure:
+            return next_state
+        return DEFAULT_CCS_INTERNER.share(next_state, previous=committed_state)
 
 
 class EchoAgentPolicyAdapter(AgentPolicyPort):
@@ -218,6 +232,15 @@ class InMemoryEvidenceStoreAdapter(EvidenceStorePort):
         )
 
 
+def _artifact_size_bytes(artifact: Artifact) -> int:
+    """Artifact の文字列フィールドの UTF-8 バイト数を返す。"""
+    return (
+        len(artifact.artifact_id.encode("utf-8"))
+        + len(artifact.content.encode("utf-8"))
+        + len(artifact.source.encode("utf-8"))
+    )
+
+
 def _normalize_tokens(text: str) -> set[str]:
     """テキストを比較用トークン集合へ正規化する。"""
     ascii_tokens = {token.lower() for token in _ASCII_TOKEN_PATTERN.findall(text)}
@@ -0,0 +1,100 @@
+"""ストリーミング応答の JSON object をトップレベルのメンバー単位で逐次デコードする。"""
+
+from __future__ import annotations
+
+import json
+
+_OPENERS = frozenset("{[")
+_CLOSERS = frozenset("}]")
+
+
+class IncrementalJSONObjectParser:
+    """テキスト差分を受け取り、値が閉じたトップレベルのメンバーから順に返す。
+
+    文字列・ネストの境界だけを 1 文字ずつ追い、メンバーの区切り（深さ 1 の `,` か
+    閉じ `}`）に達したときにそのメンバーだけを `json.loads` する。走査は前回の位置から
+    再開し、デコード済みのメンバーの文字列は捨てるため、保持するのは未完了の 1 メンバー分だけ。
+    """
+
+    def __init__(self) -> None:
+        """空の状態で始める。"""
+        self._pending = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: int | None = None
+        self._closed = False
+        self._members: dict[str, object] = {}
+
+    @property
+    def closed(self) -> bool:
+        """トップレベルの object が閉じたかを返す。"""
+        return self._closed
+
+    def feed(self, delta: str) -> list[tuple[str, object]]:
+        """差分を追加し、今回新たに閉じたメンバーを到着順に返す。
+
+        JSON として不正な入力は `ValueError`（`json.JSONDecodeError` を含む）を送出する。
+        """
+        text = self._pending + delta
+        completed: list[tuple[str, object]] = []
+        for index in range(self._position, len(text)):
+            char = text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if self._closed:
+                if not char.isspace():
+                    raise ValueError("JSON object の後に余分な文字があります。")
+                continue
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = index + 1
+                elif not char.isspace():
+                    raise ValueError("応答が JSON object で始まっていません。")
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in _OPENERS:
+                self._depth += 1
+            elif char in _CLOSERS:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._closed = True
+                    completed.extend(self._decode_member(text, index))
+                    self._member_start = None
+            elif char == "," and self._depth == 1:
+                completed.extend(self._decode_member(text, index))
+                self._member_start = index + 1
+        # デコード済みの部分を捨て、位置を残りの文字列基準に直す。
+        consumed = len(text) if self._member_start is None else self._member_start
+        self._pending = text[consumed:]
+        self._position = len(text) - consumed
+        if self._member_start is not None:
+            self._member_start = 0
+        return completed
+
+    def finish(self) -> dict[str, object]:
+        """閉じた object 全体を返す。途中で終わっていれば `ValueError`。"""
+        if not self._closed:
+            raise ValueError("JSON object が閉じる前に応答が終わりました。")
+        return dict(self._members)
+
+    def _decode_member(self, text: str, end: int) -> list[tuple[str, object]]:
+        start = self._member_start if self._member_start is not None else end
+        member_text = text[start:end]
+        if not member_text.strip():
+            if self._closed and not self._members:
+                return []
+            raise ValueError("JSON object のメンバーが空です。")
+        decoded = json.loads("{" + member_text + "}")
+        members = list(decoded.items())
+        self._members.update(members)
+        return members
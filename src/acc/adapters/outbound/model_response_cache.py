@@ -0,0 +1,411 @@
+"""圧縮モデル・ポリシー呼び出しを正規化入力で memo 化するデコレータ。"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+_LOG = logging.getLogger(__name__)
+
+type SamplingOptIn = Callable[[TurnInteractionSignal], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class ModelCacheStats:
+    """キャッシュの参照結果の集計値。"""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    bypassed: int
+
+    @property
+    def hits(self) -> int:
+        """メモリ層とディスク層のヒット数合計を返す。"""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """キャッシュを参照した呼び出しのうちヒットした割合を返す。"""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class ModelResponseCache:
+    """JSON 互換の応答を保持する上限つき LRU と、任意のディスク層。
+
+    ディスク層は `directory/<key 先頭 2 文字>/<key>.json` に 1 応答ずつ書き、
+    一時ファイルからの `os.replace` で途中書きのファイルを見せない。
+    出し入れのたびに複製するので、呼び出し側が応答を書き換えても保存済みの応答は変わらない。
+    """
+
+    def __init__(self, *, max_entries: int = 1024, directory: Path | None = None) -> None:
+        """メモリ層の上限件数とディスク層の保存先を受け取る。"""
+        if max_entries < 1:
+            raise ValueError("max_entries は 1 以上である必要があります。")
+        self._max_entries = max_entries
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._bypassed = 0
+
+    def stats(self) -> ModelCacheStats:
+        """参照結果の集計値を返す。"""
+        with self._lock:
+            return ModelCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                bypassed=self._bypassed,
+            )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """キーに対応する応答を返す。メモリ層になくディスク層にあれば昇格する。"""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+                return copy.deepcopy(cached)
+
+        from_disk = self._read_disk(key)
+        with self._lock:
+            if from_disk is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, copy.deepcopy(from_disk))
+        return from_disk
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """応答を両層へ保存する。"""
+        with self._lock:
+            self._remember(key, copy.deepcopy(value))
+        self._write_disk(key, value)
+
+    def record_bypass(self) -> None:
+        """キャッシュ対象外として素通しした呼び出しを数える。"""
+        with self._lock:
+            self._bypassed += 1
+
+    def _remember(self, key: str, value: dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._directory is None:
+            return None
+        return self._directory / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> dict[str, Any] | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _LOG.warning("model cache entry unreadable: path=%s error=%s", path, exc)
+            return None
+        return loaded if isinstance(loaded, dict) else None
+
+    def _write_disk(self, key: str, value: dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                json.dump(value, handle, ensure_ascii=False)
+            os.replace(handle.name, path)
+        except (OSError, TypeError, ValueError) as exc:
+            # ディスク層は最適化なので、書けなくても呼び出し自体は成功させる。
+            _LOG.warning("model cache entry not written: path=%s error=%s", path, exc)
+
+
+class CachingCognitiveCompressorModelAdapter(CognitiveCompressorModelPort):
+    """`CognitiveCompressorModelPort` の応答を正規化入力で memo 化する。
+
+    キーは入力信号・前状態・資格判定済み Artifact ID・モデル設定の正規化 JSON の SHA-256。
+    temperature > 0 のモデルは `sampling_opt_in` が真を返した呼び出しだけをキャッシュする。
+    """
+
+    def __init__(
+        self,
+        model: CognitiveCompressorModelPort,
+        *,
+        cache: ModelResponseCache,
+        model_parameters: Mapping[str, object],
+        sampling_opt_in: SamplingOptIn | None = None,
+    ) -> None:
+        """包むモデル・キャッシュ・キーに含めるモデル設定を受け取る。"""
+        self._model = model
+        self._cache = cache
+        self._model_parameters = dict(model_parameters)
+        self._sampling_opt_in = sampling_opt_in
+
+    @property
+    def cache(self) -> ModelResponseCache:
+        """利用中のキャッシュを返す。"""
+        return self._cache
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """キャッシュ済みならその payload を、なければモデル出力を返す。"""
+        if not _is_cacheable(self._model_parameters, self._sampling_opt_in, interaction_signal):
+            self._cache.record_bypass()
+            return self._model.generate_next_state_payload(
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts,
+            )
+
+        key = cache_key(
+            "compressor",
+            {
+                "interaction_signal": asdict(interaction_signal),
+                "committed_state": asdict(committed_state),
+                "qualified_artifact_ids": [
+                    artifact.artifact_id for artifact in qualified_artifacts
+                ],
+                "model_parameters": self._model_parameters,
+            },
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        payload = self._model.generate_next_state_payload(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts,
+        )
+        self._cache.put(key, dict(payload))
+        return payload
+
+
+class CachingAgentPolicyAdapter(AgentPolicyPort):
+    """`AgentPolicyPort` の決定を正規化入力で memo 化する。
+
+    キーは入力信号・短期対話・状態・ロール・ツール・モデル設定の正規化 JSON の SHA-256。
+    """
+
+    def __init__(
+        self,
+        policy: AgentPolicyPort,
+        *,
+        cache: ModelResponseCache,
+        model_parameters: Mapping[str, object],
+        sampling_opt_in: SamplingOptIn | None = None,
+    ) -> None:
+        """包むポリシー・キャッシュ・キーに含めるモデル設定を受け取る。"""
+        self._policy = policy
+        self._cache = cache
+        self._model_parameters = dict(model_parameters)
+        self._sampling_opt_in = sampling_opt_in
+
+    @property
+    def cache(self) -> ModelResponseCache:
+        """利用中のキャッシュを返す。"""
+        return self._cache
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        """キャッシュ済みならその決定を、なければポリシーの決定を返す。"""
+        if not _is_cacheable(self._model_parameters, self._sampling_opt_in, interaction_signal):
+            self._cache.record_bypass()
+            return self._policy.decide(
+                interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=committed_state,
+                role=role,
+                tools=tools,
+            )
+
+        key = _policy_cache_key(
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
+            model_parameters=self._model_parameters,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return AgentDecision(
+                response=str(cached["response"]),
+                tool_actions=tuple(str(action) for action in cached["tool_actions"]),
+            )
+
+        decision = self._policy.decide(
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
+        )
+        self._cache.put(
+            key,
+            {"response": decision.response, "tool_actions": list(decision.tool_actions)},
+        )
+        return decision
+
+
+class CachingStreamingAgentPolicyAdapter(StreamingAgentPolicyPort):
+    """`StreamingAgentPolicyPort` の応答を `CachingAgentPolicyAdapter` と同じキーで memo 化する。
+
+    ヒットしたら保存済みの応答を 1 つの差分として返す。ミスなら包んだポリシーの差分を
+    そのまま返し、末尾まで読み切った応答だけを保存する（途中で閉じられたら保存しない）。
+    """
+
+    def __init__(
+        self,
+        policy: StreamingAgentPolicyPort,
+        *,
+        cache: ModelResponseCache,
+        model_parameters: Mapping[str, object],
+        sampling_opt_in: SamplingOptIn | None = None,
+    ) -> None:
+        """包むポリシー・キャッシュ・キーに含めるモデル設定を受け取る。"""
+        self._policy = policy
+        self._cache = cache
+        self._model_parameters = dict(model_parameters)
+        self._sampling_opt_in = sampling_opt_in
+
+    @property
+    def cache(self) -> ModelResponseCache:
+        """利用中のキャッシュを返す。"""
+        return self._cache
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        """キャッシュ済みならその応答を、なければポリシーの差分を返す。"""
+        stream = functools.partial(
+            self._policy.stream_decide,
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
+        )
+        if not _is_cacheable(self._model_parameters, self._sampling_opt_in, interaction_signal):
+            self._cache.record_bypass()
+            yield from stream()
+            return
+
+        key = _policy_cache_key(
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
+            model_parameters=self._model_parameters,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield str(cached["response"])
+            return
+
+        deltas: list[str] = []
+        for delta in stream():
+            deltas.append(delta)
+            yield delta
+        response = "".join(deltas).strip()
+        if response:
+            self._cache.put(key, {"response": response, "tool_actions": []})
+
+
+def cache_key(kind: str, inputs: Mapping[str, object]) -> str:
+    """呼び出し種別と入力から安定したキャッシュキー（SHA-256 16 進）を返す。
+
+    キー順をソートし、タプルは配列として JSON 化するので、同値な入力は常に同じキーになる。
+    """
+    canonical = json.dumps(
+        {"kind": kind, "inputs": inputs},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _policy_cache_key(
+    *,
+    interaction_signal: TurnInteractionSignal,
+    recent_dialogue_turns: Sequence[RecentDialogueTurn],
+    committed_state: CompressedCognitiveState,
+    role: str,
+    tools: Sequence[str],
+    model_parameters: Mapping[str, object],
+) -> str:
+    """ポリシー応答のキーを返す。一括・逐次のどちらの呼び出しも同じキーを使う。"""
+    return cache_key(
+        "policy",
+        {
+            "interaction_signal": asdict(interaction_signal),
+            "recent_dialogue_turns": [asdict(turn) for turn in recent_dialogue_turns],
+            "committed_state": asdict(committed_state),
+            "role": role,
+            "tools": list(tools),
+            "model_parameters": model_parameters,
+        },
+    )
+
+
+def _is_cacheable(
+    model_parameters: Mapping[str, object],
+    sampling_opt_in: SamplingOptIn | None,
+    interaction_signal: TurnInteractionSignal,
+) -> bool:
+    """決定的な設定か、サンプリングありでも呼び出し単位で明示許可されたかを返す。"""
+    temperature = model_parameters.get("temperature", 0.0)
+    if not isinstance(temperature, int | float) or temperature <= 0:
+        return True
+    return sampling_opt_in is not None and sampling_opt_in(interaction_signal)
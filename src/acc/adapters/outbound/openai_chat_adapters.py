@@ -4,30 +4,105 @@ from __future__ import annotations
 
 import json
 import os
-from collections.abc import Mapping, Sequence
+from collections.abc import Generator, Iterator, Mapping, Sequence
+from contextlib import closing
 from dataclasses import asdict
 from typing import Any
 
 from openai import (
     APIConnectionError,
-    APIError,
-    APITimeoutError,
+    AsyncOpenAI,
     AuthenticationError,
+    InternalServerError,
     OpenAI,
     OpenAIError,
+    RateLimitError,
+)
+from openai.types.responses import (
+    ResponseErrorEvent,
+    ResponseFailedEvent,
+    ResponseTextDeltaEvent,
 )
 
+from acc.adapters.outbound.incremental_json import IncrementalJSONObjectParser
+from acc.adapters.outbound.openai_transport import (
+    AsyncOpenAITransport,
+    OpenAIConfigurationError,
+    OpenAITransport,
+)
+from acc.adapters.outbound.prompt_budget import JSONValue, PromptBudgeter
 from acc.domain.entities.artifact import Artifact
 from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.services.ccs_schema import (
+    CCSValidationError,
+    build_ccs_json_schema,
+    build_ccs_validator,
+)
 from acc.domain.value_objects.ccs import CompressedCognitiveState
-from acc.ports.outbound.agent_policy_port import AgentPolicyPort
-from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+from acc.ports.outbound.agent_policy_port import (
+    AgentPolicyPort,
+    AsyncAgentPolicyPort,
+    StreamingAgentPolicyPort,
+)
+from acc.ports.outbound.cognitive_compressor_model_port import (
+    AsyncCognitiveCompressorModelPort,
+    CognitiveCompressorModelPort,
+)
+from acc.ports.outbound.fused_turn_model_port import FusedTurnModelPort
+from acc.ports.outbound.fused_turn_port import FusedTurnRejectedError
 
 _DEFAULT_MODEL = "gpt-4.1-mini"
+COMPRESSOR_OUTPUT_MODES: tuple[str, ...] = ("json", "schema", "schema_stream")
+_COMPRESSOR_INSTRUCTIONS = (
+    "あなたは ACC の Cognitive Compressor Model です。"
+    " 有効な JSON object のみを返してください。Markdown フェンスは禁止です。"
+    " Required keys: episodic_trace, semantic_gist, focal_entities, relational_map,"
+    " goal_orientation, constraints, predictive_cue, uncertainty_signal, retrieved_artifacts."
+    " 配列フィールドは空文字を含まない文字列配列にしてください。"
+    " CCS の自然言語フィールドは日本語で記述してください。"
+    " ホスト名・ID・製品名など識別子は原文を保持して構いません。"
+    " semantic_gist / goal_orientation / uncertainty_signal は必ず非空にしてください。"
+    " goal_orientation が未確定なら previous_committed_state.goal_orientation を維持し、"
+    " uncertainty_signal は保守的に '高' を選択してください。"
+    " 状態は簡潔かつ意思決定に必要な情報へ圧縮してください。"
+)
+_POLICY_INSTRUCTIONS = (
+    "あなたは運用支援アシスタントです。"
+    " 回答は必ず最新の user_input への直接回答から始めてください。"
+    " 既出の自己紹介や謝辞の復唱は、質問解決に必要な場合のみ許可します。"
+    " recent_dialogue_turns がある場合、"
+    "『一個前/二個前の発言』のような相対参照は recent_dialogue_turns を優先して解決してください。"
+    " バッファ外で正確に参照できない場合は、推測せず不足を明示してください。"
+    " committed_state.constraints を優先し、違反しないでください。"
+    " uncertainty_signal が高い/不明な場合は不確実性を明示してください。"
+    " 簡潔で実行可能な回答にしてください。"
+)
 
-
-class OpenAIConfigurationError(RuntimeError):
-    """OpenAI 設定不備を表す例外。"""
+# 制約・目的はセッション中ほぼ変わらず、要約と直近の経緯は毎ターン変わる。
+_STATE_FIELDS_BY_STABILITY = (
+    "constraints",
+    "goal_orientation",
+    "focal_entities",
+    "relational_map",
+    "retrieved_artifacts",
+    "predictive_cue",
+    "semantic_gist",
+    "uncertainty_signal",
+    "episodic_trace",
+)
+_FUSED_INSTRUCTIONS = (
+    "あなたは ACC の Cognitive Compressor Model 兼運用支援アシスタントです。"
+    " next_state と response の 2 つを持つ JSON object を返してください。"
+    " next_state: previous_committed_state と入力から次の CCS を作ります。"
+    " CCS の自然言語フィールドは日本語で、識別子は原文を保持して構いません。"
+    " semantic_gist / goal_orientation / uncertainty_signal は必ず非空にしてください。"
+    " goal_orientation が未確定なら previous_committed_state.goal_orientation を維持し、"
+    " uncertainty_signal は保守的に '高' を選択してください。"
+    " response: next_state を前提に、最新の user_input への直接回答から始めてください。"
+    " 相対参照は recent_dialogue_turns を優先して解決し、正確に参照できない場合は不足を明示してください。"
+    " next_state.constraints を優先して違反せず、不確実性が高い場合は明示してください。"
+    " 簡潔で実行可能な回答にしてください。"
+)
 
 
 class OpenAIResponseFormatError(RuntimeError):
@@ -35,10 +110,78 @@ class OpenAIResponseFormatError(RuntimeError):
 
 
 class OpenAIRequestError(RuntimeError):
-    """OpenAI API 呼び出し失敗を表す例外。"""
+    """OpenAI API 呼び出し失敗を表す例外。
+
+    `retryable` はタイムアウト・接続失敗・レート制限・5xx のように、
+    同じリクエストを再送すれば成功しうる失敗かを表す。
+    """
 
+    def __init__(self, message: str, *, retryable: bool = False) -> None:
+        """メッセージと再送可否を受け取る。"""
+        super().__init__(message)
+        self.retryable = retryable
 
-class _OpenAIResponsesBase:
+
+class _ResponsesCallSettings:
+    """同期・非同期アダプタ共通のモデル設定。"""
+
+    def __init__(
+        self,
+        *,
+        model: str | None,
+        temperature: float,
+        max_output_tokens: int,
+        timeout_seconds: float | None,
+        prompt_budgeter: PromptBudgeter | None,
+        prompt_cache_key: str | None,
+    ) -> None:
+        """モデル設定・呼び出し単位のタイムアウト・プロンプト予算を検証して保持する。"""
+        if timeout_seconds is not None and timeout_seconds <= 0:
+            raise ValueError("timeout_seconds は正の値である必要があります。")
+        self._model: str = model if model is not None else os.getenv("OPENAI_MODEL", _DEFAULT_MODEL)
+        self._temperature = temperature
+        self._max_output_tokens = max_output_tokens
+        self._timeout_seconds = timeout_seconds
+        self._prompt_budgeter = prompt_budgeter or PromptBudgeter()
+        self._prompt_cache_key = prompt_cache_key
+
+    @property
+    def prompt_budgeter(self) -> PromptBudgeter:
+        """プロンプトの token 予算を適用する budgeter を返す。"""
+        return self._prompt_budgeter
+
+    @property
+    def model_parameters(self) -> dict[str, object]:
+        """応答内容に影響する呼び出しパラメータを返す。"""
+        return {
+            "model": self._model,
+            "temperature": self._temperature,
+            "max_output_tokens": self._max_output_tokens,
+            "prompt_budget": asdict(self._prompt_budgeter.budget),
+        }
+
+    def _request_arguments(
+        self,
+        *,
+        instructions: str,
+        prompt: str,
+        text_format: Mapping[str, object] | None = None,
+    ) -> dict[str, Any]:
+        arguments: dict[str, Any] = {
+            "model": self._model,
+            "instructions": instructions,
+            "input": prompt,
+            "temperature": self._temperature,
+            "max_output_tokens": self._max_output_tokens,
+        }
+        if self._prompt_cache_key is not None:
+            arguments["prompt_cache_key"] = self._prompt_cache_key
+        if text_format is not None:
+            arguments["text"] = {"format": text_format}
+        return arguments
+
+
+class _OpenAIResponsesBase(_ResponsesCallSettings):
     """Responses API 呼び出しの共通処理。"""
 
     def __init__(
@@ -48,52 +191,193 @@ class _OpenAIResponsesBase:
         api_key: str | None = None,
         temperature: float = 0.2,
         max_output_tokens: int = 1000,
+        transport: OpenAITransport | None = None,
+        timeout_seconds: float | None = None,
+        prompt_budgeter: PromptBudgeter | None = None,
+        prompt_cache_key: str | None = None,
     ) -> None:
-        """モデル設定と呼び出しパラメータを初期化する。"""
-        self._model: str = model if model is not None else os.getenv("OPENAI_MODEL", _DEFAULT_MODEL)
-        self._api_key = api_key or os.getenv("OPENAI_API_KEY", "")
-        self._temperature = temperature
-        self._max_output_tokens = max_output_tokens
-        self._client: OpenAI | None = None
+        """モデル設定と呼び出しパラメータを初期化する。
+
+        `transport` を渡すと接続プールを他のアダプタと共有する（`api_key` は無視される）。
+        `timeout_seconds` は呼び出し単位の読み取りタイムアウトで、未指定ならトランスポート設定に従う。
+        `prompt_budgeter` はプロンプト JSON のセクション別 token 上限を適用する。
+        `prompt_cache_key` は上流の prompt caching で同じ先頭を持つリクエストをまとめるキー。
+        """
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            timeout_seconds=timeout_seconds,
+            prompt_budgeter=prompt_budgeter,
+            prompt_cache_key=prompt_cache_key,
+        )
+        self._transport = transport or OpenAITransport(api_key=api_key)
 
     def _get_client(self) -> OpenAI:
-        if self._client is None:
-            if not self._api_key:
-                raise OpenAIConfigurationError("OPENAI_API_KEY が設定されていません。")
-            self._client = OpenAI(api_key=self._api_key)
-        return self._client
+        client = self._transport.client
+        if self._timeout_seconds is None:
+            return client
+        return client.with_options(timeout=self._timeout_seconds)
 
-    def _request_text(self, *, instructions: str, prompt: str) -> str:
+    def _request_text(
+        self,
+        *,
+        instructions: str,
+        prompt: str,
+        text_format: Mapping[str, object] | None = None,
+    ) -> str:
         try:
             response = self._get_client().responses.create(
-                model=self._model,
-                instructions=instructions,
-                input=prompt,
-                temperature=self._temperature,
-                max_output_tokens=self._max_output_tokens,
+                **self._request_arguments(
+                    instructions=instructions,
+                    prompt=prompt,
+                    text_format=text_format,
+                )
             )
-        except AuthenticationError as exc:
-            raise OpenAIConfigurationError(
-                "OpenAI 認証に失敗しました。OPENAI_API_KEY を確認してください。"
-            ) from exc
-        except (APITimeoutError, APIConnectionError, APIError, OpenAIError) as exc:
-            raise OpenAIRequestError(
-                f"OpenAI API 呼び出しに失敗しました: {exc.__class__.__name__}"
-            ) from exc
-        output_text = getattr(response, "output_text", None)
-        if not isinstance(output_text, str):
-            raise OpenAIResponseFormatError("OpenAI 応答に output_text が含まれていません。")
-        normalized_text = output_text.strip()
-        if not normalized_text:
+        except OpenAIError as exc:
+            raise _translate_openai_error(exc) from exc
+        return _extract_output_text(response)
+
+    def _stream_text(
+        self,
+        *,
+        instructions: str,
+        prompt: str,
+        text_format: Mapping[str, object] | None = None,
+    ) -> Generator[str, None, None]:
+        """応答テキストの差分を到着順に返す。先頭の空白だけの差分は捨てる。"""
+        started = False
+        try:
+            stream = self._get_client().responses.create(
+                **self._request_arguments(
+                    instructions=instructions,
+                    prompt=prompt,
+                    text_format=text_format,
+                ),
+                stream=True,
+            )
+            # 途中で閉じられた場合も `with` で HTTP レスポンスを閉じ、上流の生成を打ち切る。
+            with stream:
+                for event in stream:
+                    if isinstance(event, ResponseTextDeltaEvent):
+                        delta = event.delta if started else event.delta.lstrip()
+                        if delta:
+                            started = True
+                            yield delta
+                    elif isinstance(event, ResponseFailedEvent | ResponseErrorEvent):
+                        raise OpenAIRequestError("OpenAI ストリーミング応答が失敗しました。")
+        except OpenAIError as exc:
+            raise _translate_openai_error(exc) from exc
+        if not started:
             raise OpenAIResponseFormatError("OpenAI 応答テキストが空です。")
-        return normalized_text
+
+
+class _AsyncOpenAIResponsesBase(_ResponsesCallSettings):
+    """Responses API の非同期呼び出しの共通処理。
+
+    同時実行数はトランスポートの上限で抑える。呼び出し中のタスクが取り消されると
+    HTTP リクエストも中断され、上限の枠はその場で解放される。
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str | None = None,
+        api_key: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int = 1000,
+        transport: AsyncOpenAITransport | None = None,
+        timeout_seconds: float | None = None,
+        prompt_budgeter: PromptBudgeter | None = None,
+        prompt_cache_key: str | None = None,
+    ) -> None:
+        """モデル設定と呼び出しパラメータを初期化する。"""
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            timeout_seconds=timeout_seconds,
+            prompt_budgeter=prompt_budgeter,
+            prompt_cache_key=prompt_cache_key,
+        )
+        self._transport = transport or AsyncOpenAITransport(api_key=api_key)
+
+    def _get_client(self) -> AsyncOpenAI:
+        client = self._transport.client
+        if self._timeout_seconds is None:
+            return client
+        return client.with_options(timeout=self._timeout_seconds)
+
+    async def _request_text(
+        self,
+        *,
+        instructions: str,
+        prompt: str,
+        text_format: Mapping[str, object] | None = None,
+    ) -> str:
+        async with self._transport.limiter:
+            try:
+                response = await self._get_client().responses.create(
+                    **self._request_arguments(
+                        instructions=instructions,
+                        prompt=prompt,
+                        text_format=text_format,
+                    )
+                )
+            except OpenAIError as exc:
+                raise _translate_openai_error(exc) from exc
+        return _extract_output_text(response)
 
 
 class OpenAICognitiveCompressorModelAdapter(
     _OpenAIResponsesBase,
     CognitiveCompressorModelPort,
 ):
-    """CCS payload を OpenAI で生成する CCM アダプタ。"""
+    """CCS payload を OpenAI で生成する CCM アダプタ。
+
+    `output_mode` は応答形式を選ぶ。
+
+    - `json`: 自由形式の JSON を求め、応答全体を受け取ってからパースする。
+    - `schema`: CCS の JSON Schema を structured output（strict）として送り、形式不正を上流で防ぐ。
+    - `schema_stream`: `schema` に加えて応答を逐次受け取り、閉じたフィールドから先に検証する。
+      不正なフィールドが届いた時点で接続を閉じて生成を打ち切る。
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str | None = None,
+        api_key: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int = 1000,
+        transport: OpenAITransport | None = None,
+        timeout_seconds: float | None = None,
+        prompt_budgeter: PromptBudgeter | None = None,
+        prompt_cache_key: str | None = None,
+        output_mode: str = "json",
+        list_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """モデル設定と応答形式を初期化する。
+
+        `list_limits` は JSON Schema の `maxItems` と逐次検証に使う配列上限で、
+        `SchemaAwareCognitiveCompressorAdapter` に渡す値と揃える。
+        """
+        super().__init__(
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            transport=transport,
+            timeout_seconds=timeout_seconds,
+            prompt_budgeter=prompt_budgeter,
+            prompt_cache_key=prompt_cache_key,
+        )
+        self._output = _CCSOutputFormat(output_mode, list_limits)
+
+    @property
+    def model_parameters(self) -> dict[str, object]:
+        """応答内容に影響する呼び出しパラメータを返す。"""
+        return {**super().model_parameters, "output_mode": self._output.mode}
 
     def generate_next_state_payload(
         self,
@@ -102,32 +386,28 @@ class OpenAICognitiveCompressorModelAdapter(
         qualified_artifacts: Sequence[Artifact],
     ) -> Mapping[str, object]:
         """CCS スキーマ準拠 JSON payload を返す。"""
-        instructions = (
-            "あなたは ACC の Cognitive Compressor Model です。"
-            " 有効な JSON object のみを返してください。Markdown フェンスは禁止です。"
-            " Required keys: episodic_trace, semantic_gist, focal_entities, relational_map,"
-            " goal_orientation, constraints, predictive_cue, uncertainty_signal, retrieved_artifacts."
-            " 配列フィールドは空文字を含まない文字列配列にしてください。"
-            " CCS の自然言語フィールドは日本語で記述してください。"
-            " ホスト名・ID・製品名など識別子は原文を保持して構いません。"
-            " semantic_gist / goal_orientation / uncertainty_signal は必ず非空にしてください。"
-            " goal_orientation が未確定なら previous_committed_state.goal_orientation を維持し、"
-            " uncertainty_signal は保守的に '高' を選択してください。"
-            " 状態は簡潔かつ意思決定に必要な情報へ圧縮してください。"
-        )
         prompt = _build_compressor_prompt(
+            self._prompt_budgeter,
             interaction_signal=interaction_signal,
             committed_state=committed_state,
             qualified_artifacts=qualified_artifacts,
         )
-        response_text = self._request_text(instructions=instructions, prompt=prompt)
-        payload = _parse_json_object(response_text)
-        if not isinstance(payload, dict):
-            raise OpenAIResponseFormatError("CCS payload が JSON object ではありません。")
-        return payload
+        if self._output.mode == "schema_stream":
+            deltas = self._stream_text(
+                instructions=_COMPRESSOR_INSTRUCTIONS,
+                prompt=prompt,
+                text_format=self._output.text_format,
+            )
+            return self._output.parse_stream(deltas)
+        response_text = self._request_text(
+            instructions=_COMPRESSOR_INSTRUCTIONS,
+            prompt=prompt,
+            text_format=self._output.text_format,
+        )
+        return _parse_json_object(response_text)
 
 
-class OpenAIAgentPolicyAdapter(_OpenAIResponsesBase, AgentPolicyPort):
+class OpenAIAgentPolicyAdapter(_OpenAIResponsesBase, AgentPolicyPort, StreamingAgentPolicyPort):
     """コミット済み CCS からユーザー応答を OpenAI で生成する。"""
 
     def decide(
@@ -139,67 +419,291 @@ class OpenAIAgentPolicyAdapter(_OpenAIResponsesBase, AgentPolicyPort):
         tools: Sequence[str],
     ) -> AgentDecision:
         """CCS と役割情報を使って応答文を返す。"""
-        instructions = (
-            "あなたは運用支援アシスタントです。"
-            " 回答は必ず最新の user_input への直接回答から始めてください。"
-            " 既出の自己紹介や謝辞の復唱は、質問解決に必要な場合のみ許可します。"
-            " recent_dialogue_turns がある場合、"
-            "『一個前/二個前の発言』のような相対参照は recent_dialogue_turns を優先して解決してください。"
-            " バッファ外で正確に参照できない場合は、推測せず不足を明示してください。"
-            " committed_state.constraints を優先し、違反しないでください。"
-            " uncertainty_signal が高い/不明な場合は不確実性を明示してください。"
-            " 簡潔で実行可能な回答にしてください。"
+        prompt = _build_policy_prompt(
+            self._prompt_budgeter,
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
         )
+        response_text = self._request_text(instructions=_POLICY_INSTRUCTIONS, prompt=prompt)
+        return AgentDecision(response=response_text, tool_actions=())
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        """`decide` と同じプロンプトで応答テキストを逐次返す。"""
         prompt = _build_policy_prompt(
+            self._prompt_budgeter,
             interaction_signal=interaction_signal,
             recent_dialogue_turns=recent_dialogue_turns,
             committed_state=committed_state,
             role=role,
             tools=tools,
         )
-        response_text = self._request_text(instructions=instructions, prompt=prompt)
+        return self._stream_text(instructions=_POLICY_INSTRUCTIONS, prompt=prompt)
+
+
+class AsyncOpenAICognitiveCompressorModelAdapter(
+    _AsyncOpenAIResponsesBase,
+    AsyncCognitiveCompressorModelPort,
+):
+    """CCS payload を OpenAI で非同期に生成する CCM アダプタ。
+
+    `output_mode` は同期版と同じだが、逐次検証の `schema_stream` には対応しない。
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str | None = None,
+        api_key: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int = 1000,
+        transport: AsyncOpenAITransport | None = None,
+        timeout_seconds: float | None = None,
+        prompt_budgeter: PromptBudgeter | None = None,
+        prompt_cache_key: str | None = None,
+        output_mode: str = "json",
+        list_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """モデル設定と応答形式を初期化する。"""
+        if output_mode == "schema_stream":
+            raise ValueError("非同期アダプタは output_mode=schema_stream に対応していません。")
+        super().__init__(
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            transport=transport,
+            timeout_seconds=timeout_seconds,
+            prompt_budgeter=prompt_budgeter,
+            prompt_cache_key=prompt_cache_key,
+        )
+        self._output = _CCSOutputFormat(output_mode, list_limits)
+
+    @property
+    def model_parameters(self) -> dict[str, object]:
+        """応答内容に影響する呼び出しパラメータを返す。"""
+        return {**super().model_parameters, "output_mode": self._output.mode}
+
+    async def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """CCS スキーマ準拠 JSON payload を返す。"""
+        prompt = _build_compressor_prompt(
+            self._prompt_budgeter,
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts,
+        )
+        response_text = await self._request_text(
+            instructions=_COMPRESSOR_INSTRUCTIONS,
+            prompt=prompt,
+            text_format=self._output.text_format,
+        )
+        return _parse_json_object(response_text)
+
+
+class AsyncOpenAIAgentPolicyAdapter(_AsyncOpenAIResponsesBase, AsyncAgentPolicyPort):
+    """コミット済み CCS からユーザー応答を OpenAI で非同期に生成する。"""
+
+    async def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        """CCS と役割情報を使って応答文を返す。"""
+        prompt = _build_policy_prompt(
+            self._prompt_budgeter,
+            interaction_signal=interaction_signal,
+            recent_dialogue_turns=recent_dialogue_turns,
+            committed_state=committed_state,
+            role=role,
+            tools=tools,
+        )
+        response_text = await self._request_text(instructions=_POLICY_INSTRUCTIONS, prompt=prompt)
         return AgentDecision(response=response_text, tool_actions=())
 
 
+class _CCSOutputFormat:
+    """圧縮モデルの応答形式と、それに対応する Responses API の `text.format`。"""
+
+    def __init__(self, mode: str, list_limits: Mapping[str, int] | None) -> None:
+        if mode not in COMPRESSOR_OUTPUT_MODES:
+            raise ValueError(f"圧縮モデルの output_mode が不正です: {mode}")
+        self.mode = mode
+        self._validator = build_ccs_validator(list_limits)
+        self.text_format: Mapping[str, object] | None = (
+            None
+            if mode == "json"
+            else {
+                "type": "json_schema",
+                "name": "compressed_cognitive_state",
+                "schema": build_ccs_json_schema(list_limits),
+                "strict": True,
+            }
+        )
+
+    def parse_stream(self, deltas: Generator[str, None, None]) -> dict[str, object]:
+        """差分を逐次パースし、閉じたフィールドから検証した payload を返す。
+
+        検証に失敗した時点で差分の iterator を閉じ、上流の生成を打ち切る。
+        """
+        parser = IncrementalJSONObjectParser()
+        with closing(deltas):
+            try:
+                for delta in deltas:
+                    for field_name, value in parser.feed(delta):
+                        self._validator.validate_field(field_name, value)
+                return parser.finish()
+            except CCSValidationError:
+                # CCSValidationError も ValueError なので、形式エラーへ変換せずにそのまま送出する。
+                raise
+            except ValueError as exc:
+                raise OpenAIResponseFormatError(
+                    "CCS payload JSON のパースに失敗しました。"
+                ) from exc
+
+
+class OpenAIFusedTurnModelAdapter(_OpenAIResponsesBase, FusedTurnModelPort):
+    """次の CCS payload と応答文を 1 回の structured output で生成するアダプタ。
+
+    応答形式は `next_state`（CCS の JSON Schema）と `response` を持つ strict な JSON Schema。
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str | None = None,
+        api_key: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int = 1900,
+        transport: OpenAITransport | None = None,
+        timeout_seconds: float | None = None,
+        prompt_budgeter: PromptBudgeter | None = None,
+        prompt_cache_key: str | None = None,
+        list_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """モデル設定と `next_state` の配列上限を初期化する。
+
+        既定の `max_output_tokens` は圧縮モデル（900）とポリシー（1000）の合計。
+        """
+        super().__init__(
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            transport=transport,
+            timeout_seconds=timeout_seconds,
+            prompt_budgeter=prompt_budgeter,
+            prompt_cache_key=prompt_cache_key,
+        )
+        self._text_format: Mapping[str, object] = {
+            "type": "json_schema",
+            "name": "fused_turn",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "next_state": build_ccs_json_schema(list_limits),
+                    "response": {"type": "string"},
+                },
+                "required": ["next_state", "response"],
+                "additionalProperties": False,
+            },
+            "strict": True,
+        }
+
+    def generate_fused_turn_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> Mapping[str, object]:
+        """`next_state` と `response` を持つ payload を返す。"""
+        prompt = _build_fused_prompt(
+            self._prompt_budgeter,
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts,
+            recent_dialogue_turns=recent_dialogue_turns,
+            role=role,
+            tools=tools,
+        )
+        response_text = self._request_text(
+            instructions=_FUSED_INSTRUCTIONS,
+            prompt=prompt,
+            text_format=self._text_format,
+        )
+        try:
+            return _parse_json_object(response_text)
+        except OpenAIResponseFormatError as exc:
+            raise FusedTurnRejectedError(str(exc)) from exc
+
+
+def _translate_openai_error(exc: OpenAIError) -> RuntimeError:
+    """SDK 例外をアダプタの例外へ変換する。"""
+    if isinstance(exc, AuthenticationError):
+        return OpenAIConfigurationError(
+            "OpenAI 認証に失敗しました。OPENAI_API_KEY を確認してください。"
+        )
+    return OpenAIRequestError(
+        f"OpenAI API 呼び出しに失敗しました: {exc.__class__.__name__}",
+        retryable=isinstance(exc, APIConnectionError | RateLimitError | InternalServerError),
+    )
+
+
+def _extract_output_text(response: object) -> str:
+    """Responses API 応答から前後空白を除いた output_text を取り出す。"""
+    output_text = getattr(response, "output_text", None)
+    if not isinstance(output_text, str):
+        raise OpenAIResponseFormatError("OpenAI 応答に output_text が含まれていません。")
+    normalized_text = output_text.strip()
+    if not normalized_text:
+        raise OpenAIResponseFormatError("OpenAI 応答テキストが空です。")
+    return normalized_text
+
+
 def _build_compressor_prompt(
+    budgeter: PromptBudgeter,
     *,
     interaction_signal: TurnInteractionSignal,
     committed_state: CompressedCognitiveState,
     qualified_artifacts: Sequence[Artifact],
 ) -> str:
-    committed_state_dict = asdict(committed_state)
-    artifacts_payload = [
-        {
-            "artifact_id": artifact.artifact_id,
-            "source": artifact.source,
-            "content": artifact.content,
-        }
-        for artifact in qualified_artifacts
-    ]
-
-    prompt_payload: dict[str, Any] = {
-        "interaction_signal": {
-            "turn_id": interaction_signal.turn_id,
-            "user_input": interaction_signal.user_input,
-            "new_facts": list(interaction_signal.new_facts),
-            "focus_entities": list(interaction_signal.focus_entities),
-            "active_goal": interaction_signal.active_goal,
-            "active_constraints": list(interaction_signal.active_constraints),
-            "expected_next_steps": list(interaction_signal.expected_next_steps),
-        },
-        "previous_committed_state": committed_state_dict,
-        "qualified_artifacts": artifacts_payload,
+    # 上流の prompt caching は先頭一致部分にだけ効くため、ターン間で変わりにくい順に並べ、
+    # ターンごとに変わる interaction_signal を末尾に置く。
+    prompt_payload: dict[str, JSONValue] = {
+        "previous_committed_state": _state_payload(committed_state),
+        "qualified_artifacts": _artifacts_payload(qualified_artifacts),
+        "interaction_signal": _compressor_signal_payload(interaction_signal),
     }
 
     return (
         "次の入力 JSON をもとに ACC の次状態を更新してください。\n"
         "入力:\n"
-        f"{json.dumps(prompt_payload, ensure_ascii=False)}\n"
+        f"{budgeter.render('compressor', prompt_payload)}\n"
         "出力は次の CCS を表す JSON object のみを返してください。"
     )
 
 
 def _build_policy_prompt(
+    budgeter: PromptBudgeter,
     *,
     interaction_signal: TurnInteractionSignal,
     recent_dialogue_turns: Sequence[RecentDialogueTurn],
@@ -207,7 +711,12 @@ def _build_policy_prompt(
     role: str,
     tools: Sequence[str],
 ) -> str:
-    payload = {
+    # `_build_compressor_prompt` と同じく、ターン間で変わりにくい順に並べる。
+    payload: dict[str, JSONValue] = {
+        "role": role,
+        "tools": list(tools),
+        "committed_state": _state_payload(committed_state),
+        "recent_dialogue_turns": _dialogue_payload(recent_dialogue_turns),
         "interaction_signal": {
             "turn_id": interaction_signal.turn_id,
             "user_input": interaction_signal.user_input,
@@ -216,27 +725,86 @@ def _build_policy_prompt(
             "focus_entities": list(interaction_signal.focus_entities),
             "expected_next_steps": list(interaction_signal.expected_next_steps),
         },
-        "recent_dialogue_turns": [
-            {
-                "turn_id": turn.turn_id,
-                "user_input": turn.user_input,
-                "assistant_response": turn.assistant_response,
-            }
-            for turn in recent_dialogue_turns
-        ],
-        "role": role,
-        "tools": list(tools),
-        "committed_state": asdict(committed_state),
     }
     return (
         "次の JSON を使って、最新 user_input に対する回答を作成してください。\n"
         "最初の文で user_input に直接回答し、その後に必要なら根拠や次アクションを補足してください。\n"
         "JSON:\n"
-        f"{json.dumps(payload, ensure_ascii=False)}\n"
+        f"{budgeter.render('policy', payload)}\n"
         "必ず goal と constraints を守ってください。"
     )
 
 
+def _build_fused_prompt(
+    budgeter: PromptBudgeter,
+    *,
+    interaction_signal: TurnInteractionSignal,
+    committed_state: CompressedCognitiveState,
+    qualified_artifacts: Sequence[Artifact],
+    recent_dialogue_turns: Sequence[RecentDialogueTurn],
+    role: str,
+    tools: Sequence[str],
+) -> str:
+    # 圧縮モデル・ポリシーの入力を合わせ、ターン間で変わりにくい順に並べる。
+    payload: dict[str, JSONValue] = {
+        "role": role,
+        "tools": list(tools),
+        "previous_committed_state": _state_payload(committed_state),
+        "qualified_artifacts": _artifacts_payload(qualified_artifacts),
+        "recent_dialogue_turns": _dialogue_payload(recent_dialogue_turns),
+        "interaction_signal": _compressor_signal_payload(interaction_signal),
+    }
+    return (
+        "次の入力 JSON をもとに ACC の次状態を更新し、その状態を前提に最新 user_input へ回答してください。\n"
+        "入力:\n"
+        f"{budgeter.render('fused', payload)}\n"
+        "必ず goal と constraints を守ってください。"
+    )
+
+
+def _artifacts_payload(qualified_artifacts: Sequence[Artifact]) -> list[JSONValue]:
+    return [
+        {
+            "artifact_id": artifact.artifact_id,
+            "source": artifact.source,
+            "content": artifact.content,
+        }
+        for artifact in qualified_artifacts
+    ]
+
+
+def _dialogue_payload(recent_dialogue_turns: Sequence[RecentDialogueTurn]) -> list[JSONValue]:
+    return [
+        {
+            "turn_id": turn.turn_id,
+            "user_input": turn.user_input,
+            "assistant_response": turn.assistant_response,
+        }
+        for turn in recent_dialogue_turns
+    ]
+
+
+def _compressor_signal_payload(interaction_signal: TurnInteractionSignal) -> JSONValue:
+    return {
+        "turn_id": interaction_signal.turn_id,
+        "user_input": interaction_signal.user_input,
+        "new_facts": list(interaction_signal.new_facts),
+        "focus_entities": list(interaction_signal.focus_entities),
+        "active_goal": interaction_signal.active_goal,
+        "active_constraints": list(interaction_signal.active_constraints),
+        "expected_next_steps": list(interaction_signal.expected_next_steps),
+    }
+
+
+def _state_payload(committed_state: CompressedCognitiveState) -> JSONValue:
+    """CCS をターン間で変わりにくいフィールド順の JSON 値（tuple は list）へ変換する。"""
+    return {
+        name: list(value) if isinstance(value, tuple) else value
+        for name in _STATE_FIELDS_BY_STABILITY
+        for value in (getattr(committed_state, name),)
+    }
+
+
 def _parse_json_object(response_text: str) -> dict[str, object]:
     """モデル応答文字列から JSON object を抽出する。"""
     text = response_text.strip()
@@ -0,0 +1,272 @@
+"""OpenAI アダプタ間で共有する接続プール付きトランスポート。"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    OpenAIError,
+    Timeout,
+)
+
+_LOG = logging.getLogger(__name__)
+# openai SDK の版によって HTTP 実装のパッケージが異なるため、Limits 型は SDK の既定値から取る。
+_Limits = type(DEFAULT_CONNECTION_LIMITS)
+
+
+class OpenAIConfigurationError(RuntimeError):
+    """OpenAI 設定不備を表す例外。"""
+
+
+@dataclass(frozen=True, slots=True)
+class OpenAITransportConfig:
+    """接続プール・keep-alive・タイムアウトの設定。
+
+    `http2=True` でも `h2` パッケージが無い環境では HTTP/1.1 keep-alive で動かす。
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 60.0
+    write_timeout_seconds: float = 10.0
+    pool_timeout_seconds: float = 5.0
+    http2: bool = False
+    max_retries: int = 2
+    base_url: str | None = None
+
+    def __post_init__(self) -> None:
+        """上限値と秒数の整合性を検証する。"""
+        if self.max_connections < 1:
+            raise ValueError("max_connections は 1 以上である必要があります。")
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ValueError(
+                "max_keepalive_connections は 0 以上 max_connections 以下である必要があります。"
+            )
+        if self.max_retries < 0:
+            raise ValueError("max_retries は 0 以上である必要があります。")
+        if (
+            min(
+                self.keepalive_expiry_seconds,
+                self.connect_timeout_seconds,
+                self.read_timeout_seconds,
+                self.write_timeout_seconds,
+                self.pool_timeout_seconds,
+            )
+            <= 0
+        ):
+            raise ValueError("タイムアウト秒数は正の値である必要があります。")
+
+
+class OpenAITransport:
+    """1 つの HTTP 接続プールを持つ `OpenAI` クライアントを遅延生成して共有する。
+
+    複数アダプタが同じインスタンスを受け取ることで、TCP/TLS 接続を使い回す。
+    """
+
+    def __init__(
+        self,
+        config: OpenAITransportConfig | None = None,
+        *,
+        api_key: str | None = None,
+    ) -> None:
+        """接続設定と API キー（未指定なら `OPENAI_API_KEY`）を受け取る。"""
+        self._config = config or OpenAITransportConfig()
+        self._api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self._lock = threading.Lock()
+        self._http_client: DefaultHttpxClient | None = None
+        self._client: OpenAI | None = None
+
+    @property
+    def config(self) -> OpenAITransportConfig:
+        """接続設定を返す。"""
+        return self._config
+
+    @property
+    def client(self) -> OpenAI:
+        """共有 `OpenAI` クライアントを返す。初回呼び出しで接続プールを作る。"""
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                if not self._api_key:
+                    raise OpenAIConfigurationError("OPENAI_API_KEY が設定されていません。")
+                self._http_client = self._build_http_client()
+                self._client = OpenAI(
+                    api_key=self._api_key,
+                    base_url=self._config.base_url,
+                    max_retries=self._config.max_retries,
+                    http_client=self._http_client,
+                )
+            return self._client
+
+    def warm_up(self) -> bool:
+        """モデル一覧を 1 回取得して接続を確立しておく。失敗しても例外は送出しない。"""
+        try:
+            self.client.with_options(max_retries=0).models.list()
+        except (OpenAIConfigurationError, OpenAIError) as exc:
+            _LOG.warning("OpenAI transport warm-up failed: %s", exc.__class__.__name__)
+            return False
+        return True
+
+    def close(self) -> None:
+        """接続プールを閉じる。以降の呼び出しでは新しいプールを作る。"""
+        with self._lock:
+            http_client, self._http_client, self._client = self._http_client, None, None
+        if http_client is not None:
+            http_client.close()
+
+    def _build_http_client(self) -> DefaultHttpxClient:
+        return DefaultHttpxClient(**_http_client_options(self._config))
+
+
+class InFlightLimiter:
+    """1 つのイベントループ内の非同期呼び出しの同時実行数を上限で抑える。
+
+    `async with limiter:` で使う。上限は `asyncio.Semaphore` で数えるため、最初に使った
+    イベントループの中でだけ効く。別のイベントループ（別スレッドの `asyncio.run` など）から
+    使うと `RuntimeError` を送出する。待機中・実行中のタスクが取り消されても枠は必ず解放される。
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        """同時実行数の上限を受け取る。"""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight は 1 以上である必要があります。")
+        self._max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @property
+    def max_in_flight(self) -> int:
+        """同時実行数の上限を返す。"""
+        return self._max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """実行中の呼び出し数を返す。"""
+        return self._in_flight
+
+    @property
+    def peak_in_flight(self) -> int:
+        """これまでの同時実行数の最大値を返す。"""
+        return self._peak_in_flight
+
+    async def __aenter__(self) -> None:
+        """枠が空くまで待って確保する。"""
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("InFlightLimiter は最初に使ったイベントループの中でだけ使えます。")
+        await self._semaphore.acquire()
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """確保した枠を解放する。"""
+        self._in_flight -= 1
+        self._semaphore.release()
+
+
+class AsyncOpenAITransport:
+    """`AsyncOpenAI` クライアントと同時実行数の上限を 1 つのイベントループ内で共有する。
+
+    イベントループ 1 つにつき 1 インスタンスを作り、そのループで動く全ての非同期アダプタへ渡す。
+    上限はループごとに効くため、プロセス全体やワーカー間の同時実行数は抑えない。
+    """
+
+    def __init__(
+        self,
+        config: OpenAITransportConfig | None = None,
+        *,
+        api_key: str | None = None,
+        max_in_flight: int = 64,
+    ) -> None:
+        """接続設定・API キー・同時実行数の上限を受け取る。"""
+        self._config = config or OpenAITransportConfig()
+        self._api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self._limiter = InFlightLimiter(max_in_flight)
+        self._http_client: DefaultAsyncHttpxClient | None = None
+        self._client: AsyncOpenAI | None = None
+
+    @property
+    def config(self) -> OpenAITransportConfig:
+        """接続設定を返す。"""
+        return self._config
+
+    @property
+    def limiter(self) -> InFlightLimiter:
+        """同時実行数の上限を返す。"""
+        return self._limiter
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """共有 `AsyncOpenAI` クライアントを返す。初回呼び出しで接続プールを作る。"""
+        if self._client is None:
+            if not self._api_key:
+                raise OpenAIConfigurationError("OPENAI_API_KEY が設定されていません。")
+            self._http_client = DefaultAsyncHttpxClient(**_http_client_options(self._config))
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=self._config.base_url,
+                max_retries=self._config.max_retries,
+                http_client=self._http_client,
+            )
+        return self._client
+
+    async def warm_up(self) -> bool:
+        """モデル一覧を 1 回取得して接続を確立しておく。失敗しても例外は送出しない。"""
+        try:
+            await self.client.with_options(max_retries=0).models.list()
+        except (OpenAIConfigurationError, OpenAIError) as exc:
+            _LOG.warning("OpenAI async transport warm-up failed: %s", exc.__class__.__name__)
+            return False
+        return True
+
+    async def aclose(self) -> None:
+        """接続プールを閉じる。"""
+        http_client, self._http_client, self._client = self._http_client, None, None
+        if http_client is not None:
+            await http_client.aclose()
+
+
+def _http_client_options(config: OpenAITransportConfig) -> dict[str, Any]:
+    """同期・非同期共通の HTTP クライアント設定を返す。"""
+    http2 = config.http2 and importlib.util.find_spec("h2") is not None
+    if config.http2 and not http2:
+        _LOG.warning("h2 パッケージが無いため HTTP/1.1 keep-alive で接続します。")
+    return {
+        "http2": http2,
+        "limits": _Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+        "timeout": Timeout(
+            connect=config.connect_timeout_seconds,
+            read=config.read_timeout_seconds,
+            write=config.write_timeout_seconds,
+            pool=config.pool_timeout_seconds,
+        ),
+    }
@@ -0,0 +1,263 @@
+"""圧縮モデル・ポリシーのプロンプト JSON をセクション別 token 上限に収める。"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Literal
+
+from acc.adapters.outbound.token_counters import HeuristicTokenCounterAdapter
+from acc.ports.outbound.token_counter_port import TokenCounterPort
+
+_LOG = logging.getLogger(__name__)
+
+type JSONValue = str | int | float | bool | None | list[JSONValue] | dict[str, JSONValue]
+type PromptKind = Literal["compressor", "policy", "fused"]
+
+_TRUNCATION_MARKER = " …[省略]… "
+# これ以上は縮めない文字列の token 数。識別子や短い事実を潰さないための下限。
+MIN_BUDGET_TOKENS = 16
+_MAX_SHRINK_ROUNDS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class PromptBudget:
+    """プロンプト JSON のセクション別 token 上限。None は上限なし。
+
+    `artifact_tokens` は Artifact 1 件あたりの文字列上限で、`artifacts_tokens` は
+    資格判定済み Artifact セクション全体の上限。
+    """
+
+    artifact_tokens: int | None = 500
+    artifacts_tokens: int | None = 2000
+    dialogue_tokens: int | None = 1200
+    state_tokens: int | None = None
+
+    def __post_init__(self) -> None:
+        """上限値が下限以上であることを検証する。"""
+        for name, value in asdict(self).items():
+            if value is not None and value < MIN_BUDGET_TOKENS:
+                raise ValueError(f"{name} は {MIN_BUDGET_TOKENS} 以上である必要があります。")
+
+
+@dataclass(frozen=True, slots=True)
+class PromptSizeReport:
+    """1 回のプロンプト生成での JSON 部分の token 数。"""
+
+    kind: PromptKind
+    tokens_before: int
+    tokens_after: int
+    truncated_sections: tuple[str, ...]
+
+    @property
+    def saved_tokens(self) -> int:
+        """削減できた token 数を返す。"""
+        return self.tokens_before - self.tokens_after
+
+
+@dataclass(frozen=True, slots=True)
+class PromptBudgetStats:
+    """プロンプト生成の累計値。"""
+
+    prompts: int
+    truncated_prompts: int
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        """削減前に対する削減 token 数の割合を返す。"""
+        if self.tokens_before == 0:
+            return 0.0
+        return 1 - self.tokens_after / self.tokens_before
+
+
+class PromptBudgeter:
+    """空のフィールドを落とし、上限を超えたセクションの長い文字列から順に切り詰める。
+
+    切り詰めは先頭 2/3 と末尾 1/3 を残して中間を省略記号に置き換える。JSON は区切り
+    文字の空白を省いて出力する。生成ごとに予算適用前後の token 数を記録する。
+    """
+
+    def __init__(
+        self,
+        budget: PromptBudget | None = None,
+        *,
+        token_counter: TokenCounterPort | None = None,
+        on_report: Callable[[PromptSizeReport], None] | None = None,
+    ) -> None:
+        """上限・token counter・生成ごとの通知先を受け取る。"""
+        self._budget = budget or PromptBudget()
+        self._token_counter = token_counter or HeuristicTokenCounterAdapter()
+        self._on_report = on_report
+        self._section_limits: dict[str, tuple[int | None, int | None]] = {
+            "qualified_artifacts": (self._budget.artifacts_tokens, self._budget.artifact_tokens),
+            "recent_dialogue_turns": (self._budget.dialogue_tokens, None),
+            "previous_committed_state": (self._budget.state_tokens, None),
+            "committed_state": (self._budget.state_tokens, None),
+        }
+        self._lock = threading.Lock()
+        self._prompts = 0
+        self._truncated_prompts = 0
+        self._tokens_before = 0
+        self._tokens_after = 0
+
+    @property
+    def budget(self) -> PromptBudget:
+        """適用中の上限を返す。"""
+        return self._budget
+
+    def stats(self) -> PromptBudgetStats:
+        """プロンプト生成の累計値を返す。"""
+        with self._lock:
+            return PromptBudgetStats(
+                prompts=self._prompts,
+                truncated_prompts=self._truncated_prompts,
+                tokens_before=self._tokens_before,
+                tokens_after=self._tokens_after,
+            )
+
+    def render(self, kind: PromptKind, payload: Mapping[str, JSONValue]) -> str:
+        """セクション別の上限を適用した compact JSON を返す。"""
+        tokens_before = self._count(json.dumps(payload, ensure_ascii=False))
+        fitted: dict[str, JSONValue] = {}
+        truncated_sections: list[str] = []
+        for name, value in payload.items():
+            pruned = _prune_empty(value)
+            if pruned is None:
+                continue
+            max_tokens, max_leaf_tokens = self._section_limits.get(name, (None, None))
+            if self._fit_section(pruned, max_tokens, max_leaf_tokens):
+                truncated_sections.append(name)
+            fitted[name] = pruned
+
+        rendered = _compact_json(fitted)
+        report = PromptSizeReport(
+            kind=kind,
+            tokens_before=tokens_before,
+            tokens_after=self._count(rendered),
+            truncated_sections=tuple(truncated_sections),
+        )
+        self._record(report)
+        return rendered
+
+    def _fit_section(
+        self,
+        section: JSONValue,
+        max_tokens: int | None,
+        max_leaf_tokens: int | None,
+    ) -> bool:
+        """セクションをその場で上限に収め、切り詰めたかを返す。"""
+        slots = [(text, self._count(text), setter) for text, setter in _string_slots(section)]
+        truncated = False
+        if max_leaf_tokens is not None:
+            for index, (text, tokens, setter) in enumerate(slots):
+                if tokens > max_leaf_tokens:
+                    shortened = self._truncate(text, max_leaf_tokens)
+                    setter(shortened)
+                    slots[index] = (shortened, self._count(shortened), setter)
+                    truncated = True
+        if max_tokens is None:
+            return truncated
+
+        for _ in range(_MAX_SHRINK_ROUNDS):
+            excess = self._count(_compact_json(section)) - max_tokens
+            if excess <= 0 or not slots:
+                break
+            index = max(range(len(slots)), key=lambda position: slots[position][1])
+            text, tokens, setter = slots[index]
+            if tokens <= MIN_BUDGET_TOKENS:
+                break
+            shortened = self._truncate(text, max(MIN_BUDGET_TOKENS, tokens - excess))
+            setter(shortened)
+            slots[index] = (shortened, self._count(shortened), setter)
+            truncated = True
+        return truncated
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """中間を省略して `max_tokens` 以下に収めた文字列を返す。"""
+        tokens = self._count(text)
+        if tokens <= max_tokens:
+            return text
+        shortest = _TRUNCATION_MARKER.strip()
+        # 文字数と token 数はほぼ比例するので、探索範囲を比例見積もりの 2 倍までに絞る。
+        low, high = 1, min(len(text) - 1, 2 * len(text) * max_tokens // tokens + 1)
+        while low <= high:
+            keep = (low + high) // 2
+            candidate = _head_and_tail(text, keep)
+            if self._count(candidate) <= max_tokens:
+                shortest = candidate
+                low = keep + 1
+            else:
+                high = keep - 1
+        return shortest
+
+    def _count(self, text: str) -> int:
+        return self._token_counter.count_tokens(text)
+
+    def _record(self, report: PromptSizeReport) -> None:
+        with self._lock:
+            self._prompts += 1
+            self._truncated_prompts += bool(report.truncated_sections)
+            self._tokens_before += report.tokens_before
+            self._tokens_after += report.tokens_after
+        _LOG.debug(
+            "Prompt budget applied: kind=%s tokens_before=%s tokens_after=%s truncated=%s",
+            report.kind,
+            report.tokens_before,
+            report.tokens_after,
+            ",".join(report.truncated_sections) or "-",
+        )
+        if self._on_report is not None:
+            self._on_report(report)
+
+
+def _prune_empty(value: JSONValue) -> JSONValue:
+    """空文字・None・空配列・空 object を再帰的に取り除いた複製を返す。空なら None。"""
+    if isinstance(value, dict):
+        pruned_dict: dict[str, JSONValue] = {
+            key: pruned
+            for key, pruned in ((key, _prune_empty(item)) for key, item in value.items())
+            if pruned is not None
+        }
+        return pruned_dict or None
+    if isinstance(value, list):
+        pruned_list: list[JSONValue] = [
+            pruned for pruned in (_prune_empty(item) for item in value) if pruned is not None
+        ]
+        return pruned_list or None
+    if value == "":
+        return None
+    return value
+
+
+def _string_slots(value: JSONValue) -> list[tuple[str, Callable[[str], None]]]:
+    """入れ子の中の文字列と、その位置を書き換える関数の組を返す。"""
+    slots: list[tuple[str, Callable[[str], None]]] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, str):
+                slots.append((item, functools.partial(value.__setitem__, key)))
+            else:
+                slots.extend(_string_slots(item))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, str):
+                slots.append((item, functools.partial(value.__setitem__, index)))
+            else:
+                slots.extend(_string_slots(item))
+    return slots
+
+
+def _head_and_tail(text: str, keep: int) -> str:
+    head = keep * 2 // 3
+    tail = keep - head
+    return text[:head] + _TRUNCATION_MARKER + (text[-tail:] if tail else "")
+
+
+def _compact_json(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
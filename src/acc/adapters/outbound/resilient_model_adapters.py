@@ -0,0 +1,480 @@
+"""圧縮モデル・ポリシー呼び出しに再送・ヘッジ・サーキットブレーカーを掛けるデコレータ。"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Literal
+
+from acc.adapters.outbound.openai_chat_adapters import OpenAIRequestError
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+_LOG = logging.getLogger(__name__)
+
+type CircuitState = Literal["closed", "open", "half_open"]
+
+
+class ModelCircuitOpenError(RuntimeError):
+    """上流の劣化中にサーキットブレーカーが呼び出しを遮断したことを表す例外。"""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """一時的な失敗に対する試行回数と、指数バックオフ + full jitter の待機時間。"""
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.2
+    max_delay_seconds: float = 2.0
+
+    def __post_init__(self) -> None:
+        """試行回数と待機秒数の整合性を検証する。"""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts は 1 以上である必要があります。")
+        if not 0 <= self.base_delay_seconds <= self.max_delay_seconds:
+            raise ValueError(
+                "base_delay_seconds は 0 以上 max_delay_seconds 以下である必要があります。"
+            )
+
+    def backoff_seconds(self, retry_number: int, rng: random.Random) -> float:
+        """`retry_number` 回目（1 始まり）の再送前に待つ秒数を返す。"""
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (retry_number - 1))
+        return rng.uniform(0.0, ceiling)
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    """応答が遅い呼び出しに、同じリクエストを 1 本だけ追加で送る条件。
+
+    待ち時間は直近 `window` 件の成功レイテンシの `quantile` 分位点。
+    `min_samples` 件たまるまでは `initial_delay_seconds` を使い、None ならヘッジしない。
+    """
+
+    quantile: float = 0.95
+    window: int = 200
+    min_samples: int = 20
+    initial_delay_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        """分位点・標本数・初期待ち時間を検証する。"""
+        if not 0.0 < self.quantile < 1.0:
+            raise ValueError("quantile は 0 より大きく 1 未満である必要があります。")
+        if not 1 <= self.min_samples <= self.window:
+            raise ValueError("min_samples は 1 以上 window 以下である必要があります。")
+        if self.initial_delay_seconds is not None and self.initial_delay_seconds <= 0:
+            raise ValueError("initial_delay_seconds は正の値である必要があります。")
+
+
+@dataclass(frozen=True, slots=True)
+class ResilienceStats:
+    """呼び出し結果の集計値。"""
+
+    calls: int
+    retries: int
+    hedges: int
+    hedge_wins: int
+    short_circuits: int
+    failures: int
+
+
+class CircuitBreaker:
+    """連続失敗で開き、一定時間後に試行を 1 件だけ通すサーキットブレーカー。
+
+    同じ上流を呼ぶアダプタ間で共有すると、劣化中の呼び出しをまとめて遮断できる。
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """開くまでの連続失敗数と、開いてから試行を再開するまでの秒数を受け取る。"""
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold は 1 以上である必要があります。")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("reset_timeout_seconds は正の値である必要があります。")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """現在の状態を返す。"""
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """呼び出しを通してよいかを返す。half-open では同時に 1 件だけ通す。"""
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "open" or self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """上流が応答したことを記録して閉じる。"""
+        with self._lock:
+            self._state = "closed"
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """一時的な失敗を記録し、閾値到達または試行失敗で開く。"""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._probe_in_flight or self._consecutive_failures >= self._failure_threshold:
+                if self._state != "open":
+                    _LOG.warning(
+                        "Model circuit opened: consecutive_failures=%s",
+                        self._consecutive_failures,
+                    )
+                self._state = "open"
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def _current_state(self) -> CircuitState:
+        if self._state == "open" and self._clock() - self._opened_at >= self._reset_timeout_seconds:
+            self._state = "half_open"
+        return self._state
+
+
+class ModelCallGuard:
+    """1 種類のモデル呼び出しに再送・ヘッジ・遮断を掛ける。
+
+    ヘッジを有効にすると呼び出しは内部のスレッドプールで実行する。負けた側の
+    リクエストは取り消せないため完了まで走り、結果は捨てる。
+    """
+
+    def __init__(
+        self,
+        *,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        is_transient: Callable[[Exception], bool] | None = None,
+        max_hedge_workers: int = 64,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.perf_counter,
+        rng: random.Random | None = None,
+    ) -> None:
+        """再送・ヘッジ・遮断の設定を受け取る。
+
+        `is_transient` 未指定なら `OpenAIRequestError.retryable` が真の失敗だけを再送し、
+        ブレーカーの失敗として数える。それ以外の失敗は上流が応答したものとして扱う。
+        """
+        self._retry = retry or RetryPolicy()
+        self._hedge = hedge
+        self._breaker = breaker or CircuitBreaker()
+        self._is_transient = is_transient or is_transient_model_error
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=hedge.window if hedge is not None else 1)
+        self._executor: ThreadPoolExecutor | None = None
+        if hedge is not None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_hedge_workers,
+                thread_name_prefix="acc-model-hedge",
+            )
+        self._calls = 0
+        self._retries = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._short_circuits = 0
+        self._failures = 0
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """利用中のサーキットブレーカーを返す。"""
+        return self._breaker
+
+    def stats(self) -> ResilienceStats:
+        """呼び出し結果の集計値を返す。"""
+        with self._lock:
+            return ResilienceStats(
+                calls=self._calls,
+                retries=self._retries,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+                short_circuits=self._short_circuits,
+                failures=self._failures,
+            )
+
+    def close(self) -> None:
+        """ヘッジ用スレッドプールを止める。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def call[T](self, operation: Callable[[], T]) -> T:
+        """`operation` を実行し、一時的な失敗はバックオフを挟んで再送する。"""
+        with self._lock:
+            self._calls += 1
+        attempt = 1
+        while True:
+            if not self._breaker.allow():
+                with self._lock:
+                    self._short_circuits += 1
+                raise ModelCircuitOpenError(
+                    "上流モデル API が不安定なため、呼び出しを一時停止しています。"
+                )
+            try:
+                result = self._call_once(operation)
+            except Exception as exc:
+                transient = self._is_transient(exc)
+                if transient:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+                if not transient or attempt >= self._retry.max_attempts:
+                    with self._lock:
+                        self._failures += 1
+                    raise
+                delay = self._retry.backoff_seconds(attempt, self._rng)
+                _LOG.info(
+                    "Retrying model call: attempt=%s delay_seconds=%.3f error=%s",
+                    attempt,
+                    delay,
+                    exc.__class__.__name__,
+                )
+                with self._lock:
+                    self._retries += 1
+                self._sleep(delay)
+                attempt += 1
+                continue
+            self._breaker.record_success()
+            return result
+
+    def stream[T](self, open_stream: Callable[[], Iterator[T]]) -> Iterator[T]:
+        """`open_stream` の差分を順に返す。最初の差分より前の一時的な失敗だけを再送する。
+
+        差分を返し始めた後の失敗は、利用側へ渡した出力と重複するため再送せずに送出する。
+        ヘッジは掛けない。途中で閉じられた場合は上流の生成も閉じ、応答したものとして記録する。
+        """
+        with self._lock:
+            self._calls += 1
+        attempt = 1
+        while True:
+            if not self._breaker.allow():
+                with self._lock:
+                    self._short_circuits += 1
+                raise ModelCircuitOpenError(
+                    "上流モデル API が不安定なため、呼び出しを一時停止しています。"
+                )
+            emitted = False
+            try:
+                stream = open_stream()
+                try:
+                    for item in stream:
+                        emitted = True
+                        yield item
+                finally:
+                    close = getattr(stream, "close", None)
+                    if close is not None:
+                        close()
+            except GeneratorExit:
+                self._breaker.record_success()
+                raise
+            except Exception as exc:
+                transient = self._is_transient(exc)
+                if transient:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+                if emitted or not transient or attempt >= self._retry.max_attempts:
+                    with self._lock:
+                        self._failures += 1
+                    raise
+                delay = self._retry.backoff_seconds(attempt, self._rng)
+                _LOG.info(
+                    "Retrying model stream: attempt=%s delay_seconds=%.3f error=%s",
+                    attempt,
+                    delay,
+                    exc.__class__.__name__,
+                )
+                with self._lock:
+                    self._retries += 1
+                self._sleep(delay)
+                attempt += 1
+                continue
+            self._breaker.record_success()
+            return
+
+    def _call_once[T](self, operation: Callable[[], T]) -> T:
+        """1 回分の試行を行う。遅ければ同じ呼び出しをもう 1 本送り、先に成功した方を返す。"""
+        delay = self._hedge_delay()
+        started = self._clock()
+        if delay is None or self._executor is None:
+            result = operation()
+            self._record_latency(self._clock() - started)
+            return result
+
+        primary = self._executor.submit(operation)
+        done, _ = wait((primary,), timeout=delay)
+        if done:
+            result = primary.result()
+            self._record_latency(self._clock() - started)
+            return result
+
+        hedged = self._executor.submit(operation)
+        with self._lock:
+            self._hedges += 1
+        pending: set[Future[T]] = {primary, hedged}
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                if future is hedged:
+                    with self._lock:
+                        self._hedge_wins += 1
+                self._record_latency(self._clock() - started)
+                return future.result()
+        raise errors[0]
+
+    def _hedge_delay(self) -> float | None:
+        hedge = self._hedge
+        if hedge is None:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < hedge.min_samples:
+            return hedge.initial_delay_seconds
+        index = min(len(samples) - 1, math.ceil(hedge.quantile * len(samples)) - 1)
+        return samples[index]
+
+    def _record_latency(self, seconds: float) -> None:
+        if self._hedge is None:
+            return
+        with self._lock:
+            self._latencies.append(seconds)
+
+
+class ResilientCognitiveCompressorModelAdapter(CognitiveCompressorModelPort):
+    """`CognitiveCompressorModelPort` の呼び出しを `ModelCallGuard` 越しに行う。"""
+
+    def __init__(self, model: CognitiveCompressorModelPort, *, guard: ModelCallGuard) -> None:
+        """包むモデルとガードを受け取る。"""
+        self._model = model
+        self._guard = guard
+
+    @property
+    def guard(self) -> ModelCallGuard:
+        """利用中のガードを返す。"""
+        return self._guard
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """包んだモデルの payload を返す。"""
+        return self._guard.call(
+            functools.partial(
+                self._model.generate_next_state_payload,
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts,
+            )
+        )
+
+
+class ResilientAgentPolicyAdapter(AgentPolicyPort):
+    """`AgentPolicyPort` の呼び出しを `ModelCallGuard` 越しに行う。"""
+
+    def __init__(self, policy: AgentPolicyPort, *, guard: ModelCallGuard) -> None:
+        """包むポリシーとガードを受け取る。"""
+        self._policy = policy
+        self._guard = guard
+
+    @property
+    def guard(self) -> ModelCallGuard:
+        """利用中のガードを返す。"""
+        return self._guard
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        """包んだポリシーの決定を返す。"""
+        return self._guard.call(
+            functools.partial(
+                self._policy.decide,
+                interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=committed_state,
+                role=role,
+                tools=tools,
+            )
+        )
+
+
+class ResilientStreamingAgentPolicyAdapter(StreamingAgentPolicyPort):
+    """`StreamingAgentPolicyPort` の逐次生成を `ModelCallGuard.stream` 越しに行う。
+
+    同じ上流を呼ぶ `ResilientAgentPolicyAdapter` とガードを共有すると、遮断と集計が揃う。
+    """
+
+    def __init__(self, policy: StreamingAgentPolicyPort, *, guard: ModelCallGuard) -> None:
+        """包むポリシーとガードを受け取る。"""
+        self._policy = policy
+        self._guard = guard
+
+    @property
+    def guard(self) -> ModelCallGuard:
+        """利用中のガードを返す。"""
+        return self._guard
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        """包んだポリシーの差分を順に返す。"""
+        return self._guard.stream(
+            functools.partial(
+                self._policy.stream_decide,
+                interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=committed_state,
+                role=role,
+                tools=tools,
+            )
+        )
+
+
+def is_transient_model_error(exc: Exception) -> bool:
+    """再送すれば成功しうるモデル呼び出しの失敗かを返す。"""
+    return isinstance(exc, OpenAIRequestError) and exc.retryable
@@ -0,0 +1,125 @@
+"""規則ベース圧縮を既定にし、必要なターンだけモデル圧縮へ切り替える経路選択アダプタ。"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.compression_gate import CompressionRoute, CompressionRouter
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
+
+_LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionRouteLatency:
+    """1 経路の処理ターン数と所要時間の合計。"""
+
+    route: CompressionRoute
+    turns: int
+    seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        """1 ターンあたりの平均所要時間を返す。"""
+        if self.turns == 0:
+            return 0.0
+        return self.seconds / self.turns
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionRouteStats:
+    """経路選択の集計値。"""
+
+    routes: tuple[CompressionRouteLatency, ...]
+    escalation_reasons: tuple[tuple[str, int], ...]
+
+    @property
+    def escalation_rate(self) -> float:
+        """処理したターンのうちモデルへ切り替えた割合を返す。"""
+        total = sum(route.turns for route in self.routes)
+        if total == 0:
+            return 0.0
+        escalated = sum(route.turns for route in self.routes if route.route == "model")
+        return escalated / total
+
+
+class RoutingCognitiveCompressorAdapter(CognitiveCompressorPort):
+    """`CompressionRouter` の判定で規則ベース圧縮とモデル圧縮を使い分ける。"""
+
+    def __init__(
+        self,
+        rule_compressor: CognitiveCompressorPort,
+        model_compressor: CognitiveCompressorPort,
+        *,
+        router: CompressionRouter | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """2 つの圧縮アダプタと経路選択の判定器を受け取る。"""
+        self._compressors: dict[CompressionRoute, CognitiveCompressorPort] = {
+            "rule": rule_compressor,
+            "model": model_compressor,
+        }
+        self._router = router or CompressionRouter()
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self._route_turns: Counter[CompressionRoute] = Counter()
+        self._route_seconds: dict[CompressionRoute, float] = {"rule": 0.0, "model": 0.0}
+        self._escalation_reasons: Counter[str] = Counter()
+
+    def route_stats(self) -> CompressionRouteStats:
+        """経路ごとのターン数・所要時間と、モデルへ切り替えた理由の内訳を返す。"""
+        with self._stats_lock:
+            return CompressionRouteStats(
+                routes=tuple(
+                    CompressionRouteLatency(
+                        route=route,
+                        turns=self._route_turns[route],
+                        seconds=self._route_seconds[route],
+                    )
+                    for route in self._compressors
+                ),
+                escalation_reasons=tuple(sorted(self._escalation_reasons.items())),
+            )
+
+    def commit_next_state(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> CompressedCognitiveState:
+        """判定した経路の圧縮アダプタで次状態を確定する。"""
+        qualified_artifacts_tuple = tuple(qualified_artifacts)
+        decision = self._router.evaluate(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts_tuple,
+        )
+        started_at = self._clock()
+        try:
+            return self._compressors[decision.route].commit_next_state(
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts_tuple,
+            )
+        finally:
+            elapsed = self._clock() - started_at
+            with self._stats_lock:
+                self._route_turns[decision.route] += 1
+                self._route_seconds[decision.route] += elapsed
+                if decision.route == "model":
+                    self._escalation_reasons[decision.reason] += 1
+            _LOG.debug(
+                "CCS compression routed: turn_id=%s route=%s reason=%s seconds=%.3f",
+                interaction_signal.turn_id,
+                decision.route,
+                decision.reason,
+                elapsed,
+            )
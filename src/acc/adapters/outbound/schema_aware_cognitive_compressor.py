@@ -3,27 +3,80 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, Sequence
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 
+from acc.adapters.outbound.token_counters import HeuristicTokenCounterAdapter
 from acc.domain.entities.artifact import Artifact
-from acc.domain.entities.interaction import TurnInteractionSignal
-from acc.domain.services.ccs_schema import CCSValidationError, parse_and_validate_ccs_payload
+from acc.domain.entities.interaction import (
+    AgentDecision,
+    RecentDialogueTurn,
+    TurnInteractionSignal,
+)
+from acc.domain.services.ccs_schema import (
+    CCS_REPAIR_MODES,
+    CCSRepair,
+    CCSValidationError,
+    build_ccs_validator,
+    repair_ccs_list_fields,
+)
+from acc.domain.services.compression_gate import UNCERTAINTY_MARKERS, CompressionGate
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
 from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
+from acc.ports.outbound.fused_turn_model_port import FusedTurnModelPort
+from acc.ports.outbound.fused_turn_port import FusedTurnPort, FusedTurnRejectedError
+from acc.ports.outbound.token_counter_port import TokenCounterPort
 
 _LOG = logging.getLogger(__name__)
 _DEFAULT_GOAL = "ユーザー意図の確認と課題解決を継続する"
-_UNCERTAINTY_MARKERS: tuple[str, ...] = (
-    "不明",
-    "わから",
-    "未確認",
-    "確認できない",
-    "推測",
-    "かもしれ",
-    "不確実",
-    "?",
-)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionGateStats:
+    """事前ゲートの集計値。
+
+    節約量は、実際に呼んだモデルの平均所要時間と、省略したターンの入力 token 概算から見積もる。
+    """
+
+    evaluated_turns: int
+    skipped_turns: int
+    skip_reasons: tuple[tuple[str, int], ...]
+    model_calls: int
+    model_seconds: float
+    estimated_saved_seconds: float
+    estimated_saved_input_tokens: int
+
+    @property
+    def skip_rate(self) -> float:
+        """判定したターンのうち圧縮を省略した割合を返す。"""
+        if self.evaluated_turns == 0:
+            return 0.0
+        return self.skipped_turns / self.evaluated_turns
+
+
+@dataclass(frozen=True, slots=True)
+class CCSRepairStats:
+    """モデル出力 payload の補完・補修の集計値。
+
+    `field_repairs` は (フィールド名, 補修の種類, 件数)。補修の種類は `CCSRepairAction` と、
+    文字列フィールドの意味補完を表す `semantic_fallback`。
+    """
+
+    validated_payloads: int
+    repaired_payloads: int
+    rejected_payloads: int
+    field_repairs: tuple[tuple[str, str, int], ...]
+
+    @property
+    def repair_rate(self) -> float:
+        """検証した payload のうち補完・補修を加えた割合を返す。"""
+        if self.validated_payloads == 0:
+            return 0.0
+        return self.repaired_payloads / self.validated_payloads
 
 
 class SchemaAwareCognitiveCompressorAdapter(CognitiveCompressorPort):
@@ -34,10 +87,48 @@ class SchemaAwareCognitiveCompressorAdapter(CognitiveCompressorPort):
         model: CognitiveCompressorModelPort,
         *,
         list_limits: Mapping[str, int] | None = None,
+        gate: CompressionGate | None = None,
+        token_counter: TokenCounterPort | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        repair_mode: str = "strict",
     ) -> None:
-        """モデルポートと任意の配列上限設定を受け取る。"""
+        """モデルポートと任意の配列上限設定、圧縮前ゲートを受け取る。
+
+        `token_counter` は省略したターンの入力 token 概算にだけ使う。
+        `repair_mode="lenient"` では配列フィールドの形式不正を `repair_ccs_list_fields` で補修する。
+        """
         self._model = model
-        self._list_limits = dict(list_limits) if list_limits else None
+        self._payload_committer = _CCSPayloadCommitter(list_limits, repair_mode=repair_mode)
+        self._gate = gate
+        self._token_counter = token_counter or HeuristicTokenCounterAdapter()
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self._skip_reasons: Counter[str] = Counter()
+        self._evaluated_turns = 0
+        self._model_calls = 0
+        self._model_seconds = 0.0
+        self._saved_input_tokens = 0
+
+    def repair_stats(self) -> CCSRepairStats:
+        """モデル出力 payload の補完・補修の集計値を返す。"""
+        return self._payload_committer.stats()
+
+    def gate_stats(self) -> CompressionGateStats:
+        """事前ゲートの集計値を返す。"""
+        with self._stats_lock:
+            skipped_turns = sum(self._skip_reasons.values())
+            mean_model_seconds = (
+                self._model_seconds / self._model_calls if self._model_calls else 0.0
+            )
+            return CompressionGateStats(
+                evaluated_turns=self._evaluated_turns,
+                skipped_turns=skipped_turns,
+                skip_reasons=tuple(sorted(self._skip_reasons.items())),
+                model_calls=self._model_calls,
+                model_seconds=self._model_seconds,
+                estimated_saved_seconds=mean_model_seconds * skipped_turns,
+                estimated_saved_input_tokens=self._saved_input_tokens,
+            )
 
     def commit_next_state(
         self,
@@ -45,18 +136,175 @@ class SchemaAwareCognitiveCompressorAdapter(CognitiveCompressorPort):
         committed_state: CompressedCognitiveState,
         qualified_artifacts: Sequence[Artifact],
     ) -> CompressedCognitiveState:
-        """モデル出力 payload を検証して次状態を返す。"""
+        """モデル出力 payload を検証して次状態を返す。
+
+        ゲートが更新不要と判定したターンはモデルを呼ばず、前状態をそのまま確定する。
+        """
         qualified_artifacts_tuple = tuple(qualified_artifacts)
+        if self._gate is not None:
+            decision = self._gate.evaluate(
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts_tuple,
+            )
+            if not decision.should_compress:
+                saved_tokens = self._estimate_prompt_tokens(
+                    interaction_signal,
+                    committed_state,
+                    qualified_artifacts_tuple,
+                )
+                with self._stats_lock:
+                    self._evaluated_turns += 1
+                    self._skip_reasons[decision.reason] += 1
+                    self._saved_input_tokens += saved_tokens
+                _LOG.info(
+                    "CCS compression skipped: turn_id=%s reason=%s novelty=%.2f",
+                    interaction_signal.turn_id,
+                    decision.reason,
+                    decision.novelty,
+                )
+                return committed_state
+
+        started_at = self._clock()
         payload = self._model.generate_next_state_payload(
             interaction_signal=interaction_signal,
             committed_state=committed_state,
             qualified_artifacts=qualified_artifacts_tuple,
         )
+        elapsed = self._clock() - started_at
+        with self._stats_lock:
+            if self._gate is not None:
+                self._evaluated_turns += 1
+            self._model_calls += 1
+            self._model_seconds += elapsed
+        return self._payload_committer.commit(
+            payload,
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts_tuple,
+        )
+
+    def _estimate_prompt_tokens(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> int:
+        """省略したモデル呼び出しの入力 token 数を概算する。"""
+        count = self._token_counter.count_tokens
+        state_tokens = sum(
+            count(value) if isinstance(value, str) else sum(count(item) for item in value)
+            for value in (
+                committed_state.episodic_trace,
+                committed_state.semantic_gist,
+                committed_state.focal_entities,
+                committed_state.relational_map,
+                committed_state.goal_orientation,
+                committed_state.constraints,
+                committed_state.predictive_cue,
+                committed_state.uncertainty_signal,
+                committed_state.retrieved_artifacts,
+            )
+        )
+        artifact_tokens = sum(count(artifact.content) for artifact in qualified_artifacts)
+        return count(interaction_signal.user_input) + state_tokens + artifact_tokens
+
+
+class SchemaAwareFusedTurnAdapter(FusedTurnPort):
+    """1 回呼び出しの payload から、2 回呼び出しと同じ補完・検証で次状態と応答を確定する。"""
+
+    def __init__(
+        self,
+        model: FusedTurnModelPort,
+        *,
+        list_limits: Mapping[str, int] | None = None,
+        repair_mode: str = "strict",
+    ) -> None:
+        """モデルポートと任意の配列上限設定、補修モードを受け取る。"""
+        self._model = model
+        self._payload_committer = _CCSPayloadCommitter(list_limits, repair_mode=repair_mode)
+
+    def repair_stats(self) -> CCSRepairStats:
+        """`next_state` の補完・補修の集計値を返す。"""
+        return self._payload_committer.stats()
+
+    def commit_fused_turn(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> tuple[CompressedCognitiveState, AgentDecision]:
+        """`next_state` を CCS として検証し、`response` と組にして返す。"""
+        qualified_artifacts_tuple = tuple(qualified_artifacts)
+        payload = self._model.generate_fused_turn_payload(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts_tuple,
+            recent_dialogue_turns=recent_dialogue_turns,
+            role=role,
+            tools=tools,
+        )
+        state_payload = payload.get("next_state")
+        response = payload.get("response")
+        if not isinstance(state_payload, Mapping):
+            raise FusedTurnRejectedError("next_state が JSON object ではありません。")
+        if not isinstance(response, str) or not response.strip():
+            raise FusedTurnRejectedError("response が空か文字列ではありません。")
+
+        try:
+            next_state = self._payload_committer.commit(
+                state_payload,
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts_tuple,
+            )
+        except CCSValidationError as exc:
+            raise FusedTurnRejectedError(str(exc)) from exc
+        return next_state, AgentDecision(response=response.strip(), tool_actions=())
+
+
+class _CCSPayloadCommitter:
+    """意味補完・補修・検証を順に適用して CCS を確定し、補修の内訳を集計する。"""
+
+    def __init__(self, list_limits: Mapping[str, int] | None, *, repair_mode: str) -> None:
+        if repair_mode not in CCS_REPAIR_MODES:
+            raise ValueError(f"repair_mode が不正です: {repair_mode}")
+        self._validator = build_ccs_validator(list_limits)
+        self._lenient = repair_mode == "lenient"
+        self._lock = threading.Lock()
+        self._validated = 0
+        self._repaired = 0
+        self._rejected = 0
+        self._field_repairs: Counter[tuple[str, str]] = Counter()
+
+    def stats(self) -> CCSRepairStats:
+        with self._lock:
+            return CCSRepairStats(
+                validated_payloads=self._validated,
+                repaired_payloads=self._repaired,
+                rejected_payloads=self._rejected,
+                field_repairs=tuple(
+                    (field_name, action, count)
+                    for (field_name, action), count in sorted(self._field_repairs.items())
+                ),
+            )
+
+    def commit(
+        self,
+        payload: Mapping[str, object],
+        *,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: tuple[Artifact, ...],
+    ) -> CompressedCognitiveState:
         repaired_payload, applied_fields = _apply_semantic_fallback(
             payload=payload,
             interaction_signal=interaction_signal,
             committed_state=committed_state,
-            qualified_artifacts=qualified_artifacts_tuple,
+            qualified_artifacts=qualified_artifacts,
         )
         if applied_fields:
             _LOG.info(
@@ -64,11 +312,39 @@ class SchemaAwareCognitiveCompressorAdapter(CognitiveCompressorPort):
                 interaction_signal.turn_id,
                 ",".join(applied_fields),
             )
+        repairs: tuple[CCSRepair, ...] = ()
+        if self._lenient:
+            repaired_list_payload, repairs = repair_ccs_list_fields(
+                repaired_payload,
+                previous_state=committed_state,
+            )
+            if repairs:
+                _LOG.info(
+                    "CCS payload repaired: turn_id=%s repairs=%s",
+                    interaction_signal.turn_id,
+                    ",".join(f"{repair.field_name}:{repair.action}" for repair in repairs),
+                )
+        else:
+            repaired_list_payload = repaired_payload
         try:
-            return parse_and_validate_ccs_payload(repaired_payload, list_limits=self._list_limits)
-        except CCSValidationError:
             # 補正対象外の不正は明示的に失敗させる。
+            next_state = self._validator.validate(
+                repaired_list_payload,
+                previous_state=committed_state,
+            )
+        except CCSValidationError:
+            with self._lock:
+                self._rejected += 1
             raise
+        with self._lock:
+            self._validated += 1
+            if applied_fields or repairs:
+                self._repaired += 1
+            for field_name in applied_fields:
+                self._field_repairs[(field_name, "semantic_fallback")] += 1
+            for repair in repairs:
+                self._field_repairs[(repair.field_name, repair.action)] += repair.count
+        return next_state
 
 
 def _apply_semantic_fallback(
@@ -166,7 +442,7 @@ def _fallback_uncertainty_signal(
 ) -> str:
     """uncertainty_signal の意味準拠フォールバックを返す。"""
     user_input = interaction_signal.user_input
-    if any(marker in user_input for marker in _UNCERTAINTY_MARKERS):
+    if any(marker in user_input for marker in UNCERTAINTY_MARKERS):
         return "高"
 
     qualified_count = len(qualified_artifacts)
@@ -0,0 +1,565 @@
+"""チャットセッション状態の外部保存アダプタ群。"""
+
+from __future__ import annotations
+
+import socket
+import sqlite3
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from acc.adapters.outbound.ccs_binary_codec import (
+    CCSCodecError,
+    apply_session_snapshot_delta,
+    decode_session_snapshot,
+    encode_session_snapshot,
+    encode_session_snapshot_delta,
+)
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+from acc.ports.outbound.session_store_port import SessionStoreConflictError, SessionStorePort
+
+_DEFAULT_REDIS_KEY_PREFIX = "acc:session:"
+# 全量スナップショットの後ろに差分フレームを追記するログ形式の先頭バイト。
+_DELTA_LOG_MAGIC = b"\xacL"
+_FRAME_LENGTH = struct.Struct("<I")
+_MAX_DELTA_BASES = 10_000
+
+
+class SessionStoreError(RuntimeError):
+    """セッションストアの読み書き失敗を表す例外。"""
+
+
+class SQLiteSessionStoreAdapter(SessionStorePort):
+    """SQLite ファイルにセッション状態を保存するアダプタ。"""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        busy_timeout_seconds: float = 5.0,
+        delta_frames_per_snapshot: int = 0,
+    ) -> None:
+        """保存先ファイルを開き、テーブルを用意する。
+
+        `delta_frames_per_snapshot` が 1 以上なら、全量保存の後はこの件数まで
+        CCS 差分だけを追記し、上限に達したら全量保存で差分を畳み込む。
+        """
+        self._lock = threading.Lock()
+        self._delta_bases = _DeltaBaseCache(frames_per_snapshot=delta_frames_per_snapshot)
+        self._connection = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chat_sessions ("
+                " session_id TEXT PRIMARY KEY,"
+                " turn_id INTEGER NOT NULL,"
+                " payload BLOB NOT NULL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chat_session_deltas ("
+                " session_id TEXT NOT NULL,"
+                " seq INTEGER NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " PRIMARY KEY (session_id, seq)"
+                ")"
+            )
+
+    def load(self, session_id: str) -> SessionSnapshot | None:
+        """保存済みセッション状態を返す。差分が積まれていれば順に適用する。"""
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT payload FROM chat_sessions WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()
+                deltas = self._connection.execute(
+                    "SELECT payload FROM chat_session_deltas WHERE session_id = ? ORDER BY seq",
+                    (session_id,),
+                ).fetchall()
+        except sqlite3.Error as exc:
+            raise SessionStoreError("SQLite からのセッション読み込みに失敗しました。") from exc
+        if row is None:
+            return None
+        snapshot = _decode_snapshot(bytes(row[0]))
+        for (delta_payload,) in deltas:
+            snapshot = _apply_delta_frame(snapshot, bytes(delta_payload))
+        self._delta_bases.remember(session_id, snapshot, delta_count=len(deltas))
+        return snapshot
+
+    def save(
+        self,
+        session_id: str,
+        snapshot: SessionSnapshot,
+        *,
+        expected_turn_id: int | None = None,
+    ) -> None:
+        """セッション状態を保存する。差分保存が有効なら可能な限り差分だけを追記する。
+
+        `expected_turn_id` の照合と書き込みは 1 つの書き込みトランザクションで行う。
+        差分の基準が保存済みの turn_id と一致しなければ全量で書き直す。
+        """
+        base = self._delta_bases.base_for_delta(session_id)
+        delta_count = 0
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._connection.execute(
+                        "SELECT turn_id FROM chat_sessions WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchone()
+                    stored_turn_id = None if row is None else int(row[0])
+                    _ensure_expected_turn_id(session_id, expected_turn_id, stored_turn_id)
+                    # 差分は自プロセスの基準が保存済みの内容と同じ版のときだけ追記する。
+                    if base is not None and stored_turn_id == base[0].turn_id:
+                        base_snapshot, delta_count = base
+                        delta_count += 1
+                        self._connection.execute(
+                            "INSERT INTO chat_session_deltas (session_id, seq, payload)"
+                            " VALUES (?, ?, ?)",
+                            (
+                                session_id,
+                                delta_count,
+                                encode_session_snapshot_delta(base_snapshot, snapshot),
+                            ),
+                        )
+                        self._connection.execute(
+                            "UPDATE chat_sessions SET turn_id = ? WHERE session_id = ?",
+                            (snapshot.turn_id, session_id),
+                        )
+                    else:
+                        self._connection.execute(
+                            "INSERT INTO chat_sessions (session_id, turn_id, payload)"
+                            " VALUES (?, ?, ?)"
+                            " ON CONFLICT(session_id) DO UPDATE SET"
+                            " turn_id = excluded.turn_id, payload = excluded.payload",
+                            (session_id, snapshot.turn_id, _encode_snapshot(snapshot)),
+                        )
+                        self._connection.execute(
+                            "DELETE FROM chat_session_deltas WHERE session_id = ?",
+                            (session_id,),
+                        )
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+        except SessionStoreConflictError:
+            self._delta_bases.forget(session_id)
+            raise
+        except sqlite3.Error as exc:
+            self._delta_bases.forget(session_id)
+            raise SessionStoreError("SQLite へのセッション保存に失敗しました。") from exc
+        self._delta_bases.remember(session_id, snapshot, delta_count=delta_count)
+
+    def delete(self, session_id: str) -> None:
+        """セッション状態を削除する。"""
+        self._delta_bases.forget(session_id)
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "DELETE FROM chat_sessions WHERE session_id = ?",
+                    (session_id,),
+                )
+                self._connection.execute(
+                    "DELETE FROM chat_session_deltas WHERE session_id = ?",
+                    (session_id,),
+                )
+        except sqlite3.Error as exc:
+            raise SessionStoreError("SQLite のセッション削除に失敗しました。") from exc
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        with self._lock:
+            self._connection.close()
+
+
+class RedisSessionStoreAdapter(SessionStorePort):
+    """Redis プロトコル（RESP）でセッション状態を保存するアダプタ。"""
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        db: int = 0,
+        key_prefix: str = _DEFAULT_REDIS_KEY_PREFIX,
+        ttl_seconds: int | None = None,
+        socket_timeout_seconds: float = 5.0,
+        delta_frames_per_snapshot: int = 0,
+    ) -> None:
+        """接続先とキー設計を受け取る。接続は初回利用時に張る。
+
+        `delta_frames_per_snapshot` が 1 以上なら、値を「全量 + 差分フレーム列」の
+        ログ形式で保持し、保存時は `APPEND` で差分だけを送る。
+        """
+        if ttl_seconds is not None and ttl_seconds < 1:
+            raise ValueError("ttl_seconds は 1 以上である必要があります。")
+        self._connection = _RespConnection(
+            host=host,
+            port=port,
+            db=db,
+            socket_timeout_seconds=socket_timeout_seconds,
+        )
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._delta_log_enabled = delta_frames_per_snapshot > 0
+        self._delta_bases = _DeltaBaseCache(frames_per_snapshot=delta_frames_per_snapshot)
+
+    def load(self, session_id: str) -> SessionSnapshot | None:
+        """保存済みセッション状態を返す。"""
+        reply = self._connection.execute(b"GET", self._key(session_id))
+        if reply is None:
+            return None
+        if not isinstance(reply, bytes):
+            raise SessionStoreError("Redis GET の応答形式が不正です。")
+        if not reply.startswith(_DELTA_LOG_MAGIC):
+            return _decode_snapshot(reply)
+        snapshot, delta_count = _decode_delta_log(reply)
+        self._delta_bases.remember(session_id, snapshot, delta_count=delta_count)
+        return snapshot
+
+    def save(
+        self,
+        session_id: str,
+        snapshot: SessionSnapshot,
+        *,
+        expected_turn_id: int | None = None,
+    ) -> None:
+        """セッション状態を保存する。TTL 指定時は期限つきで保存する。
+
+        turn_id は別キーに保持し、`expected_turn_id` の照合は `WATCH` / `MULTI` で行う。
+        差分は保存済みの turn_id が差分の基準と一致するときだけ追記し、一致しなければ
+        （他のワーカーが書いた後なら）全量で書き直す。
+        """
+        key = self._key(session_id)
+        turn_key = self._turn_key(session_id)
+        base = self._delta_bases.base_for_delta(session_id)
+        expire: tuple[bytes, ...] = ()
+        if self._ttl_seconds is not None:
+            expire = (b"EX", str(self._ttl_seconds).encode("ascii"))
+        turn_command = (b"SET", turn_key, str(snapshot.turn_id).encode("ascii"), *expire)
+        try:
+            if base is not None and expected_turn_id in (None, base[0].turn_id):
+                base_snapshot, delta_count = base
+                commands: list[tuple[bytes, ...]] = [
+                    (b"APPEND", key, _frame(encode_session_snapshot_delta(base_snapshot, snapshot)))
+                ]
+                if self._ttl_seconds is not None:
+                    commands.append((b"EXPIRE", key, str(self._ttl_seconds).encode("ascii")))
+                if self._connection.execute_transaction(
+                    [*commands, turn_command],
+                    watch_key=turn_key,
+                    expected_value=str(base_snapshot.turn_id).encode("ascii"),
+                ):
+                    self._delta_bases.remember(session_id, snapshot, delta_count=delta_count + 1)
+                    return
+                self._delta_bases.forget(session_id)
+                if expected_turn_id is not None:
+                    raise _turn_id_conflict(session_id, expected_turn_id)
+
+            payload = _encode_snapshot(snapshot)
+            if self._delta_log_enabled:
+                payload = _DELTA_LOG_MAGIC + _frame(payload)
+            applied = self._connection.execute_transaction(
+                [(b"SET", key, payload, *expire), turn_command],
+                watch_key=turn_key,
+                expected_value=(
+                    None if expected_turn_id is None else str(expected_turn_id).encode("ascii")
+                ),
+            )
+        except SessionStoreError:
+            self._delta_bases.forget(session_id)
+            raise
+        if not applied:
+            self._delta_bases.forget(session_id)
+            raise _turn_id_conflict(session_id, expected_turn_id)
+        self._delta_bases.remember(session_id, snapshot, delta_count=0)
+
+    def delete(self, session_id: str) -> None:
+        """セッション状態を削除する。"""
+        self._delta_bases.forget(session_id)
+        self._connection.execute(b"DEL", self._key(session_id), self._turn_key(session_id))
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        self._connection.close()
+
+    def _key(self, session_id: str) -> bytes:
+        return f"{self._key_prefix}{session_id}".encode()
+
+    def _turn_key(self, session_id: str) -> bytes:
+        return f"{self._key_prefix}{session_id}:turn_id".encode()
+
+
+class _DeltaBaseCache:
+    """差分保存の基準となる直前の保存内容と、積み上げ済み差分数を保持する。
+
+    基準は自プロセスが保存・読み込みした内容なので、他のワーカーが書いた後は古くなる。
+    各ストアは追記の前に保存済みの turn_id と基準の turn_id を不可分に照合し、一致しなければ
+    全量保存に切り替える。差分が効くのは同一セッションを同じワーカーへ振り分ける構成のとき。
+    """
+
+    def __init__(self, *, frames_per_snapshot: int) -> None:
+        """全量保存までに積む差分数の上限を受け取る。0 なら差分保存しない。"""
+        if frames_per_snapshot < 0:
+            raise ValueError("delta_frames_per_snapshot は 0 以上である必要があります。")
+        self._frames_per_snapshot = frames_per_snapshot
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[SessionSnapshot, int]] = OrderedDict()
+
+    def base_for_delta(self, session_id: str) -> tuple[SessionSnapshot, int] | None:
+        """差分を追記できるなら基準スナップショットと差分数を返す。"""
+        if self._frames_per_snapshot == 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(session_id)
+        if entry is None or entry[1] >= self._frames_per_snapshot:
+            return None
+        return entry
+
+    def remember(self, session_id: str, snapshot: SessionSnapshot, *, delta_count: int) -> None:
+        """保存・読み込みした内容を次の差分の基準として記録する。"""
+        if self._frames_per_snapshot == 0:
+            return
+        with self._lock:
+            self._entries[session_id] = (snapshot, delta_count)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > _MAX_DELTA_BASES:
+                self._entries.popitem(last=False)
+
+    def forget(self, session_id: str) -> None:
+        """基準を破棄し、次回は全量保存させる。"""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+
+class _RespConnection:
+    """単一ソケットで RESP2 コマンドを直列実行する最小クライアント。"""
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        db: int,
+        socket_timeout_seconds: float,
+    ) -> None:
+        """接続先を保持する。"""
+        self._address = (host, port)
+        self._db = db
+        self._socket_timeout_seconds = socket_timeout_seconds
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._reader: Any = None
+
+    def execute(self, *arguments: bytes) -> object:
+        """コマンドを送って応答を返す。接続断は1回だけ再接続して再送する。"""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    self._ensure_connected()
+                    return self._round_trip(arguments)
+                except OSError as exc:
+                    self._reset()
+                    if attempt == 1:
+                        raise SessionStoreError("Redis への接続に失敗しました。") from exc
+        raise AssertionError("unreachable")
+
+    def execute_transaction(
+        self,
+        commands: list[tuple[bytes, ...]],
+        *,
+        watch_key: bytes,
+        expected_value: bytes | None,
+    ) -> bool:
+        """`MULTI` / `EXEC` でコマンド列を不可分に実行し、実行したかを返す。
+
+        `expected_value` を指定すると `watch_key` を `WATCH` し、値が一致しない、または
+        `EXEC` までに他の接続が書き換えた場合は実行せずに False を返す。
+        接続断による再送は `EXEC` を送る前だけ行う。
+        """
+        with self._lock:
+            for attempt in range(2):
+                exec_sent = False
+                try:
+                    self._ensure_connected()
+                    if expected_value is not None:
+                        _, current = self._pipeline([(b"WATCH", watch_key), (b"GET", watch_key)])
+                        if current != expected_value:
+                            self._round_trip((b"UNWATCH",))
+                            return False
+                    exec_sent = True
+                    replies = self._pipeline([(b"MULTI",), *commands, (b"EXEC",)])
+                except OSError as exc:
+                    self._reset()
+                    if exec_sent or attempt == 1:
+                        raise SessionStoreError("Redis への接続に失敗しました。") from exc
+                    continue
+                except SessionStoreError:
+                    # WATCH / MULTI の状態を持ち越さないよう接続を張り直す。
+                    self._reset()
+                    raise
+                return replies[-1] is not None
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        with self._lock:
+            self._reset()
+
+    def _ensure_connected(self) -> None:
+        if self._socket is not None:
+            return
+        connection = socket.create_connection(self._address, timeout=self._socket_timeout_seconds)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = connection
+        self._reader = connection.makefile("rb")
+        if self._db:
+            self._round_trip((b"SELECT", str(self._db).encode("ascii")))
+
+    def _round_trip(self, arguments: tuple[bytes, ...]) -> object:
+        assert self._socket is not None
+        self._socket.sendall(_encode_resp_command(arguments))
+        return self._read_reply()
+
+    def _pipeline(self, commands: list[tuple[bytes, ...]]) -> list[object]:
+        """コマンド列をまとめて送り、応答を順に読む。"""
+        assert self._socket is not None
+        self._socket.sendall(b"".join(_encode_resp_command(command) for command in commands))
+        return [self._read_reply() for _ in commands]
+
+    def _read_reply(self) -> object:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Redis 接続が切断されました。")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode("utf-8")
+        if prefix == b"-":
+            raise SessionStoreError(f"Redis エラー応答: {body.decode('utf-8', 'replace')}")
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Redis 接続が切断されました。")
+            return bytes(data[:-2])
+        if prefix == b"*":
+            count = int(body)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise SessionStoreError("Redis 応答の形式が不正です。")
+
+    def _reset(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def build_session_store(url: str, *, delta_frames_per_snapshot: int = 0) -> SessionStorePort:
+    """`sqlite:///path` または `redis://host:port/db` からストアを生成する。"""
+    parsed = urlsplit(url)
+    if parsed.scheme == "sqlite":
+        path = parsed.path
+        if not path or path == "/":
+            raise ValueError(f"SQLite のファイルパスが指定されていません: {url}")
+        return SQLiteSessionStoreAdapter(
+            path[1:] if path.startswith("//") else path,
+            delta_frames_per_snapshot=delta_frames_per_snapshot,
+        )
+    if parsed.scheme == "redis":
+        db_text = parsed.path.lstrip("/")
+        return RedisSessionStoreAdapter(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=int(db_text) if db_text else 0,
+            delta_frames_per_snapshot=delta_frames_per_snapshot,
+        )
+    raise ValueError(f"未対応のセッションストア URL です: {url}")
+
+
+def _encode_resp_command(arguments: tuple[bytes, ...]) -> bytes:
+    parts = [b"*%d\r\n" % len(arguments)]
+    for argument in arguments:
+        parts.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+    return b"".join(parts)
+
+
+def _ensure_expected_turn_id(
+    session_id: str,
+    expected_turn_id: int | None,
+    stored_turn_id: int | None,
+) -> None:
+    if expected_turn_id is not None and stored_turn_id != expected_turn_id:
+        raise _turn_id_conflict(session_id, expected_turn_id, stored_turn_id)
+
+
+def _turn_id_conflict(
+    session_id: str,
+    expected_turn_id: int | None,
+    stored_turn_id: int | None = None,
+) -> SessionStoreConflictError:
+    detail = "" if stored_turn_id is None else f" stored_turn_id={stored_turn_id}"
+    return SessionStoreConflictError(
+        f"セッションが他のワーカーで更新されています: session_id={session_id}"
+        f" expected_turn_id={expected_turn_id}{detail}"
+    )
+
+
+def _frame(payload: bytes) -> bytes:
+    return _FRAME_LENGTH.pack(len(payload)) + payload
+
+
+def _decode_delta_log(data: bytes) -> tuple[SessionSnapshot, int]:
+    """全量フレームに差分フレームを順に適用し、復元結果と差分数を返す。"""
+    frames: list[bytes] = []
+    offset = len(_DELTA_LOG_MAGIC)
+    while offset < len(data):
+        if offset + _FRAME_LENGTH.size > len(data):
+            raise SessionStoreError("差分ログが途中で終わっています。")
+        (length,) = _FRAME_LENGTH.unpack_from(data, offset)
+        offset += _FRAME_LENGTH.size
+        if offset + length > len(data):
+            raise SessionStoreError("差分ログが途中で終わっています。")
+        frames.append(data[offset : offset + length])
+        offset += length
+    if not frames:
+        raise SessionStoreError("差分ログに全量スナップショットがありません。")
+    snapshot = _decode_snapshot(frames[0])
+    for frame in frames[1:]:
+        snapshot = _apply_delta_frame(snapshot, frame)
+    return snapshot, len(frames) - 1
+
+
+def _apply_delta_frame(snapshot: SessionSnapshot, frame: bytes) -> SessionSnapshot:
+    try:
+        return apply_session_snapshot_delta(snapshot, frame)
+    except CCSCodecError as exc:
+        raise SessionStoreError("セッション差分の適用に失敗しました。") from exc
+
+
+def _encode_snapshot(snapshot: SessionSnapshot) -> bytes:
+    return encode_session_snapshot(snapshot)
+
+
+def _decode_snapshot(data: bytes) -> SessionSnapshot:
+    try:
+        return decode_session_snapshot(data)
+    except CCSCodecError as exc:
+        raise SessionStoreError("セッションスナップショットの復元に失敗しました。") from exc
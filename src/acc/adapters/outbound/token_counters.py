@@ -0,0 +1,126 @@
+"""CCS のメモリ量計測に使う token counter アダプタ群。"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import math
+import re
+from collections.abc import Sequence
+from typing import Protocol
+
+from acc.ports.outbound.token_counter_port import TokenCounterPort
+
+_LOG = logging.getLogger(__name__)
+_DEFAULT_ENCODING = "o200k_base"
+TOKEN_COUNTER_MODES: tuple[str, ...] = ("auto", "tiktoken", "heuristic")
+
+# 係数は o200k_base における日英テキストの一般的な文字数/token 比を目安にした概算値。
+_LATIN_CHARS_PER_TOKEN = 4.0
+_DIGITS_PER_TOKEN = 3.0
+_OTHER_LETTERS_PER_TOKEN = 2.0
+_KANA_TOKENS_PER_CHAR = 0.6
+_KANJI_TOKENS_PER_CHAR = 1.0
+
+_SCRIPT_RUN_PATTERN = re.compile(
+    r"(?P<latin>[A-Za-z]+)"
+    r"|(?P<digit>[0-9]+)"
+    r"|(?P<kana>[ぁ-んァ-ヶーｦ-ﾟ]+)"
+    r"|(?P<kanji>[一-龠々〆〤]+)"
+    r"|(?P<space>\s+)"
+    r"|(?P<other>[^\W\d_]+)"
+    r"|(?P<symbol>.)",
+    re.DOTALL,
+)
+
+
+class TokenizerUnavailableError(RuntimeError):
+    """ローカル tokenizer を利用できない場合の例外。"""
+
+
+class _BPEEncoding(Protocol):
+    """Tiktoken 互換 encoding の最小契約。"""
+
+    def encode_ordinary(self, text: str) -> Sequence[int]:
+        """特殊 token を解釈せずに token 列へ変換する。"""
+
+
+class HeuristicTokenCounterAdapter(TokenCounterPort):
+    """文字種ごとの係数で token 数を近似するアダプタ。"""
+
+    def count_tokens(self, text: str) -> int:
+        """文字種の連続区間ごとに token 数を見積もって合計する。"""
+        if not text:
+            return 0
+
+        total = 0.0
+        for match in _SCRIPT_RUN_PATTERN.finditer(text):
+            run_length = match.end() - match.start()
+            kind = match.lastgroup
+            if kind == "latin":
+                total += math.ceil(run_length / _LATIN_CHARS_PER_TOKEN)
+            elif kind == "digit":
+                total += math.ceil(run_length / _DIGITS_PER_TOKEN)
+            elif kind == "kana":
+                total += run_length * _KANA_TOKENS_PER_CHAR
+            elif kind == "kanji":
+                total += run_length * _KANJI_TOKENS_PER_CHAR
+            elif kind == "other":
+                total += math.ceil(run_length / _OTHER_LETTERS_PER_TOKEN)
+            elif kind == "symbol":
+                total += 1
+        if total == 0:
+            return 0
+        return max(1, math.ceil(total))
+
+
+class TiktokenTokenCounterAdapter(TokenCounterPort):
+    """ローカル BPE tokenizer（tiktoken）で token 数を数えるアダプタ。"""
+
+    def __init__(
+        self,
+        encoding_name: str = _DEFAULT_ENCODING,
+        *,
+        encoding: _BPEEncoding | None = None,
+    ) -> None:
+        """Encoding 名、またはロード済み encoding を受け取る。"""
+        self._encoding = encoding or _load_tiktoken_encoding(encoding_name)
+
+    def count_tokens(self, text: str) -> int:
+        """BPE 分割後の token 数を返す。"""
+        if not text:
+            return 0
+        return len(self._encoding.encode_ordinary(text))
+
+
+def build_token_counter(mode: str = "auto") -> TokenCounterPort:
+    """モード指定に応じた token counter を返す。"""
+    if mode not in TOKEN_COUNTER_MODES:
+        raise ValueError(f"token counter モードが不正です: {mode}")
+    if mode == "heuristic":
+        return HeuristicTokenCounterAdapter()
+    if mode == "tiktoken":
+        return TiktokenTokenCounterAdapter()
+
+    try:
+        return TiktokenTokenCounterAdapter()
+    except TokenizerUnavailableError as exc:
+        _LOG.info("Local tokenizer unavailable, using heuristic counter: %s", exc)
+        return HeuristicTokenCounterAdapter()
+
+
+def _load_tiktoken_encoding(encoding_name: str) -> _BPEEncoding:
+    """Tiktoken が導入済みなら encoding をロードする。"""
+    try:
+        tiktoken = importlib.import_module("tiktoken")
+    except ImportError as exc:
+        raise TokenizerUnavailableError("tiktoken がインストールされていません。") from exc
+
+    try:
+        encoding: _BPEEncoding = tiktoken.get_encoding(encoding_name)
+    except Exception as exc:
+        # 語彙ファイルの取得失敗（オフライン環境など）も利用不可として扱う。
+        raise TokenizerUnavailableError(
+            f"tiktoken encoding をロードできません: {encoding_name}"
+        ) from exc
+    return encoding
@@ -0,0 +1,183 @@
+"""保存済み CCS payload（JSONL）をプロセスプールで一括検証する。"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+
+from acc.domain.services.ccs_schema import CCSValidationError, CCSValidator, build_ccs_validator
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+_INDEX_PATTERN = re.compile(r"\[\d+\]")
+_JSON_ERROR = "JSON として解釈できません。"
+_NOT_OBJECT_ERROR = "CCS payload は JSON object である必要があります。"
+
+# ワーカープロセスごとに 1 回だけ構築する検証器。
+_WORKER_VALIDATOR: CCSValidator | None = None
+
+type _ChunkResult = list[tuple[int, CompressedCognitiveState | None, str | None]]
+
+
+@dataclass(frozen=True, slots=True)
+class CCSRecordValidation:
+    """1 行分の検証結果。`state` は `keep_states=True` のときだけ入る。"""
+
+    line_number: int
+    state: CompressedCognitiveState | None
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        """検証に通ったかを返す。"""
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class CCSBatchValidationReport:
+    """一括検証の行ごとの結果とエラーの集計値。
+
+    `error_counts` は配列の添字を `[]` に丸めたエラーメッセージごとの件数（多い順）。
+    """
+
+    records: tuple[CCSRecordValidation, ...]
+    error_counts: tuple[tuple[str, int], ...]
+
+    @property
+    def total(self) -> int:
+        """検証した行数（空行を除く）を返す。"""
+        return len(self.records)
+
+    @property
+    def invalid(self) -> int:
+        """検証に落ちた行数を返す。"""
+        return sum(count for _, count in self.error_counts)
+
+    @property
+    def valid(self) -> int:
+        """検証に通った行数を返す。"""
+        return self.total - self.invalid
+
+
+def iter_validate_ccs_jsonl(
+    lines: Iterable[str],
+    *,
+    list_limits: Mapping[str, int] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 2000,
+    keep_states: bool = False,
+) -> Iterator[CCSRecordValidation]:
+    """JSONL の各行を CCS payload として検証し、行の順に結果を返す。
+
+    空行は読み飛ばす（行番号は数える）。検証に落ちた行も例外にせず結果として返す。
+    `workers` は省略時に CPU 数、1 以下なら呼び出し元のプロセスで検証する。
+    プールへ渡す行は `chunk_size` 行ずつにまとめ、未完了のチャンクはワーカー数の 2 倍までに抑える。
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size は 1 以上である必要があります。")
+    worker_count = (os.cpu_count() or 1) if workers is None else workers
+    chunks = _numbered_chunks(lines, chunk_size)
+    if worker_count <= 1:
+        validator = build_ccs_validator(list_limits)
+        for start, chunk in chunks:
+            yield from _records(_validate_chunk(validator, start, chunk, keep_states))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=_init_worker,
+        initargs=(dict(list_limits) if list_limits else None,),
+    ) as executor:
+        pending: deque[Future[_ChunkResult]] = deque()
+        for start, chunk in chunks:
+            pending.append(executor.submit(_validate_chunk_in_worker, start, chunk, keep_states))
+            if len(pending) >= worker_count * 2:
+                yield from _records(pending.popleft().result())
+        while pending:
+            yield from _records(pending.popleft().result())
+
+
+def validate_ccs_jsonl(
+    lines: Iterable[str],
+    *,
+    list_limits: Mapping[str, int] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 2000,
+    keep_states: bool = False,
+) -> CCSBatchValidationReport:
+    """`iter_validate_ccs_jsonl` の結果をまとめ、エラーを集計したレポートを返す。"""
+    records: list[CCSRecordValidation] = []
+    error_counts: Counter[str] = Counter()
+    for record in iter_validate_ccs_jsonl(
+        lines,
+        list_limits=list_limits,
+        workers=workers,
+        chunk_size=chunk_size,
+        keep_states=keep_states,
+    ):
+        records.append(record)
+        if record.error is not None:
+            error_counts[_INDEX_PATTERN.sub("[]", record.error)] += 1
+    return CCSBatchValidationReport(
+        records=tuple(records),
+        error_counts=tuple(error_counts.most_common()),
+    )
+
+
+def _numbered_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[tuple[int, list[str]]]:
+    iterator = iter(lines)
+    start = 1
+    while chunk := list(islice(iterator, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _records(results: _ChunkResult) -> Iterator[CCSRecordValidation]:
+    for line_number, state, error in results:
+        yield CCSRecordValidation(line_number=line_number, state=state, error=error)
+
+
+def _init_worker(list_limits: Mapping[str, int] | None) -> None:
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = build_ccs_validator(list_limits)
+
+
+def _validate_chunk_in_worker(start: int, chunk: list[str], keep_states: bool) -> _ChunkResult:
+    assert _WORKER_VALIDATOR is not None
+    return _validate_chunk(_WORKER_VALIDATOR, start, chunk, keep_states)
+
+
+def _validate_chunk(
+    validator: CCSValidator,
+    start: int,
+    chunk: list[str],
+    keep_states: bool,
+) -> _ChunkResult:
+    # プロセス間の受け渡しを軽くするため、結果は dataclass ではなくタプルで返す。
+    results: _ChunkResult = []
+    for line_number, line in enumerate(chunk, start=start):
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except (ValueError, RecursionError):
+            # 入れ子が深すぎる行は RecursionError になる。その行だけを不正として続ける。
+            results.append((line_number, None, _JSON_ERROR))
+            continue
+        if not isinstance(payload, dict):
+            results.append((line_number, None, _NOT_OBJECT_ERROR))
+            continue
+        try:
+            # 捨てる CCS はインターンしない。保持する CCS はインターンして、
+            # チャンク内の同値タプルを共有させる（pickle の転送量も減る）。
+            state = validator.validate(payload, share=keep_states)
+        except CCSValidationError as exc:
+            results.append((line_number, None, str(exc)))
+            continue
+        results.append((line_number, state if keep_states else None, None))
+    return results
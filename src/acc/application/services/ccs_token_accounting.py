@@ -0,0 +1,39 @@
+"""CCS の memory token をフィールド単位キャッシュつきで計測する。"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.token_counter_port import TokenCounterPort
+
+_CCS_FIELD_NAMES: tuple[str, ...] = tuple(field.name for field in fields(CompressedCognitiveState))
+
+
+class CCSTokenAccountant:
+    """前回計測値をフィールドごとに保持し、変化したフィールドだけ再計測する。"""
+
+    def __init__(self, token_counter: TokenCounterPort) -> None:
+        """利用する token counter を受け取る。"""
+        self._token_counter = token_counter
+        self._field_cache: dict[str, tuple[str | tuple[str, ...], int]] = {}
+
+    def count(self, state: CompressedCognitiveState) -> int:
+        """CCS 全フィールドの token 数合計を返す。"""
+        total = 0
+        for field_name in _CCS_FIELD_NAMES:
+            value: str | tuple[str, ...] = getattr(state, field_name)
+            cached = self._field_cache.get(field_name)
+            if cached is not None and (cached[0] is value or cached[0] == value):
+                total += cached[1]
+                continue
+
+            field_tokens = self._count_field(value)
+            self._field_cache[field_name] = (value, field_tokens)
+            total += field_tokens
+        return total
+
+    def _count_field(self, value: str | tuple[str, ...]) -> int:
+        if isinstance(value, str):
+            return self._token_counter.count_tokens(value)
+        return sum(self._token_counter.count_tokens(item) for item in value)
@@ -0,0 +1,126 @@
+"""評価レコードの集計を numpy の列形式で行う経路と、集計方式の選択。
+
+ドメインの `summarize_agent_records` は標準ライブラリだけで計算する。numpy は任意依存
+（`columnar` extra）なので、読み込みと方式の選択はこのアプリケーション層に置く。
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Sequence
+from itertools import chain
+from types import ModuleType
+from typing import Any
+
+from acc.domain.services.evaluation_metrics import summarize_agent_records
+from acc.domain.value_objects.evaluation import (
+    AgentEvaluationSummary,
+    AgentTurnEvaluationRecord,
+    OutcomeScores,
+)
+
+EVALUATION_SUMMARY_BACKENDS: tuple[str, ...] = ("auto", "python", "numpy")
+
+# 列形式の行列の列番号（`_record_row` の並び）。先頭 4 列は outcome 指標で、
+# まとめて平均・標準偏差を取る。
+_TURN_ID, _SUPPORTED, _UNSUPPORTED, _DRIFT_COUNT, _CONSTRAINTS, _HAS_DRIFT, _MEMORY = range(4, 11)
+_COLUMN_COUNT = 11
+
+
+class ColumnarBackendUnavailableError(RuntimeError):
+    """列形式の集計に必要な numpy を読み込めないことを表す例外。"""
+
+
+def summarize_agent_records_columnar(
+    records: Sequence[AgentTurnEvaluationRecord],
+) -> AgentEvaluationSummary:
+    """`summarize_agent_records` と同じ集計を、numpy の列形式で一括計算する。
+
+    レコードを (ターン数 × 指標) の行列にしてから、平均・母標準偏差・ターンごとの率を
+    列単位のベクトル演算で求める。結果は浮動小数点の誤差の範囲で `summarize_agent_records` と一致する。
+    numpy が導入されていなければ `ColumnarBackendUnavailableError`。
+    """
+    if not records:
+        raise ValueError("records は 1 件以上必要です。")
+    np = _load_numpy()
+
+    matrix = np.fromiter(
+        chain.from_iterable(map(_record_row, records)),
+        dtype=np.float64,
+        count=len(records) * _COLUMN_COUNT,
+    ).reshape(len(records), _COLUMN_COUNT)
+    # 同じ turn_id の並びは入力順を保つ（sorted と同じ安定ソート）。
+    matrix = matrix[np.argsort(matrix[:, _TURN_ID], kind="stable")]
+    outcomes = matrix[:, :4]
+    outcome_mean = outcomes.mean(axis=0).tolist()
+    outcome_std = outcomes.std(axis=0).tolist() if len(matrix) >= 2 else [0.0] * 4
+
+    hallucination_turn_rates = matrix[:, _UNSUPPORTED] / np.maximum(
+        1.0, matrix[:, _SUPPORTED] + matrix[:, _UNSUPPORTED]
+    )
+    drift_mask = (matrix[:, _TURN_ID] >= 2) & (matrix[:, _HAS_DRIFT] > 0)
+    drift_turn_rates = matrix[drift_mask, _DRIFT_COUNT] / np.maximum(
+        1.0, matrix[drift_mask, _CONSTRAINTS]
+    )
+    memory_tokens_by_turn = tuple(matrix[:, _MEMORY].astype(np.int64).tolist())
+
+    return AgentEvaluationSummary(
+        total_turns=len(matrix),
+        outcome_mean=OutcomeScores(*outcome_mean),
+        outcome_std=OutcomeScores(*outcome_std),
+        hallucination_turn_rates=tuple(hallucination_turn_rates.tolist()),
+        hallucination_average=float(hallucination_turn_rates.mean()),
+        drift_turn_rates=tuple(drift_turn_rates.tolist()),
+        drift_average=float(drift_turn_rates.mean()) if len(drift_turn_rates) else None,
+        memory_tokens_by_turn=memory_tokens_by_turn,
+        memory_average=float(matrix[:, _MEMORY].mean()),
+        memory_last_turn=memory_tokens_by_turn[-1],
+    )
+
+
+def build_agent_records_summarizer(
+    backend: str = "python",
+) -> Callable[[Sequence[AgentTurnEvaluationRecord]], AgentEvaluationSummary]:
+    """集計方式に応じた集計関数を返す。`auto` は numpy があれば列形式、なければ Python。"""
+    if backend not in EVALUATION_SUMMARY_BACKENDS:
+        raise ValueError(f"評価集計の backend が不正です: {backend}")
+    if backend == "python":
+        return summarize_agent_records
+    if backend == "numpy":
+        _load_numpy()
+        return summarize_agent_records_columnar
+    try:
+        _load_numpy()
+    except ColumnarBackendUnavailableError:
+        return summarize_agent_records
+    return summarize_agent_records_columnar
+
+
+def _record_row(record: AgentTurnEvaluationRecord) -> tuple[float, ...]:
+    outcome = record.outcome_scores
+    audit = record.hallucination_audit
+    drift = record.drift_audit
+    return (
+        outcome.relevance,
+        outcome.answer_quality,
+        outcome.instruction_following,
+        outcome.coherence,
+        record.turn_id,
+        audit.supported_claims,
+        audit.unsupported_claims,
+        0 if drift is None else drift.violations + drift.omissions,
+        0 if drift is None else len(drift.active_constraints),
+        drift is not None,
+        record.memory_tokens,
+    )
+
+
+def _load_numpy() -> Any:
+    """Numpy が導入済みならモジュールを返す。"""
+    try:
+        module: ModuleType = importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ColumnarBackendUnavailableError(
+            "numpy がインストールされていません（`columnar` extra で導入できます）。"
+        ) from exc
+    return module
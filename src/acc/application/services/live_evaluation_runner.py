@@ -0,0 +1,298 @@
+"""複数のライブ評価 episode をワーカープロセスで並行に実行し、結果を JSONL に追記する。"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, cast
+
+from acc.application.use_cases.agent_judge_evaluation import AgentJudgeEvaluationUseCase
+from acc.application.use_cases.live_multi_agent_evaluation import LiveMultiAgentEvaluationUseCase
+from acc.domain.value_objects.evaluation import (
+    AgentEvaluationSummary,
+    AgentTurnEvaluationRecord,
+    DriftAudit,
+    HallucinationAudit,
+    OutcomeScores,
+)
+from acc.domain.value_objects.live_evaluation import (
+    EvaluationTurnQuery,
+    LiveEvaluationEpisodeResult,
+)
+
+_LOG = logging.getLogger(__name__)
+
+type LiveEvaluationUseCaseFactory = Callable[[], LiveMultiAgentEvaluationUseCase]
+# 失敗は例外オブジェクトではなく (例外クラス名, メッセージ) で返す。例外は独自の `__init__` を
+# 持つと unpickle できず、ワーカーからの受け渡しでプロセスプールごと壊れるため。
+type _EpisodeOutcome = dict[str, object] | tuple[str, str]
+
+# ワーカープロセスごとに 1 回だけ構築するユースケース。
+_WORKER_USE_CASE: LiveMultiAgentEvaluationUseCase | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LiveEvaluationEpisode:
+    """1 episode 分の評価入力。`episode_id` は再開時の照合に使う。"""
+
+    episode_id: str
+    queries: tuple[EvaluationTurnQuery, ...]
+    initial_canonical_memory: dict[str, object] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Episode 定義の最小整合性を検証する。"""
+        if not self.episode_id.strip():
+            raise ValueError("episode_id は空にできません。")
+        if not self.queries:
+            raise ValueError("queries は 1 件以上必要です。")
+
+
+@dataclass(frozen=True, slots=True)
+class LiveEvaluationRunReport:
+    """複数 episode の実行結果。
+
+    `summaries_by_agent` は今回と前回までに完了した episode をまとめた集計値。
+    `failed_episodes` は (episode_id, 例外の要約) で、JSONL には書かず次回の実行で再試行する。
+    """
+
+    completed_episode_ids: tuple[str, ...]
+    resumed_episode_ids: tuple[str, ...]
+    failed_episodes: tuple[tuple[str, str], ...]
+    summaries_by_agent: dict[str, AgentEvaluationSummary]
+
+
+class LiveEvaluationRunner:
+    """`LiveMultiAgentEvaluationUseCase` で多数の episode を並行に評価する。
+
+    ユースケースはワーカーごとに `use_case_factory` で 1 回だけ組み立てる。ワーカープロセスへ
+    渡すため、`use_case_factory` はモジュールの最上位で定義した関数にする。
+    """
+
+    def __init__(
+        self,
+        use_case_factory: LiveEvaluationUseCaseFactory,
+        *,
+        workers: int | None = None,
+        summary_use_case: AgentJudgeEvaluationUseCase | None = None,
+    ) -> None:
+        """ユースケースの組み立て関数とワーカー数を受け取る。
+
+        `workers` は省略時に CPU 数、1 以下なら呼び出し元のプロセスで順に実行する。
+        """
+        self._use_case_factory = use_case_factory
+        self._workers = (os.cpu_count() or 1) if workers is None else workers
+        self._summary_use_case = summary_use_case or AgentJudgeEvaluationUseCase()
+
+    def run(
+        self,
+        episodes: Sequence[LiveEvaluationEpisode],
+        output_path: Path,
+    ) -> LiveEvaluationRunReport:
+        """Episode を評価し、完了するたびに `output_path` へ 1 行ずつ追記する。
+
+        `output_path` に完了済みの episode があれば実行せず、その結果を集計に含める。
+        クラッシュで途中まで書かれた末尾の行は切り捨てる。
+        """
+        episode_ids = [episode.episode_id for episode in episodes]
+        if len(set(episode_ids)) != len(episode_ids):
+            raise ValueError("episode_id が重複しています。")
+
+        finished = _load_completed_results(output_path)
+        resumed_ids = tuple(episode_id for episode_id in episode_ids if episode_id in finished)
+        pending = [episode for episode in episodes if episode.episode_id not in finished]
+        completed_ids: list[str] = []
+        failed: list[tuple[str, str]] = []
+        with output_path.open("a", encoding="utf-8") as output:
+            for episode_id, outcome in self._execute(pending):
+                if isinstance(outcome, tuple):
+                    error_name, message = outcome
+                    _LOG.warning(
+                        "Live evaluation episode failed: episode_id=%s error=%s",
+                        episode_id,
+                        error_name,
+                    )
+                    failed.append((episode_id, f"{error_name}: {message}"))
+                    continue
+                try:
+                    line = json.dumps(
+                        {"episode_id": episode_id, "result": outcome}, ensure_ascii=False
+                    )
+                except TypeError as exc:
+                    # final_canonical_memory に JSON で表せない値が入っている。
+                    failed.append((episode_id, f"{exc.__class__.__name__}: {exc}"))
+                    continue
+                output.write(line + "\n")
+                output.flush()
+                os.fsync(output.fileno())
+                finished[episode_id] = decode_episode_result(outcome)
+                completed_ids.append(episode_id)
+
+        # 完了順は実行ごとに変わるため、集計は入力順に揃える。
+        episodes_by_agent: dict[str, list[tuple[AgentTurnEvaluationRecord, ...]]] = {}
+        for episode_id in episode_ids:
+            result = finished.get(episode_id)
+            if result is None:
+                continue
+            for agent_name, records in result.turn_records_by_agent.items():
+                episodes_by_agent.setdefault(agent_name, []).append(records)
+        return LiveEvaluationRunReport(
+            completed_episode_ids=tuple(completed_ids),
+            resumed_episode_ids=resumed_ids,
+            failed_episodes=tuple(failed),
+            summaries_by_agent=self._summary_use_case.summarize_agents_across_episodes(
+                episodes_by_agent
+            ),
+        )
+
+    def _execute(
+        self,
+        episodes: Sequence[LiveEvaluationEpisode],
+    ) -> Iterator[tuple[str, _EpisodeOutcome]]:
+        """Episode を実行し、完了した順に (episode_id, 結果の payload か失敗の要約) を返す。"""
+        if self._workers <= 1:
+            use_case = self._use_case_factory()
+            try:
+                for episode in episodes:
+                    yield episode.episode_id, _run_episode(use_case, episode)
+            finally:
+                use_case.close()
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._use_case_factory,),
+        ) as executor:
+            remaining = iter(episodes)
+            in_flight: dict[Future[_EpisodeOutcome], str] = {}
+            for episode in remaining:
+                in_flight[executor.submit(_run_episode_in_worker, episode)] = episode.episode_id
+                if len(in_flight) >= self._workers * 2:
+                    break
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    episode_id = in_flight.pop(future)
+                    try:
+                        yield episode_id, future.result()
+                    except Exception as exc:  # ワーカープロセスの異常終了など
+                        yield episode_id, _describe_failure(exc)
+                    next_episode = next(remaining, None)
+                    if next_episode is not None:
+                        in_flight[executor.submit(_run_episode_in_worker, next_episode)] = (
+                            next_episode.episode_id
+                        )
+
+
+def encode_episode_result(result: LiveEvaluationEpisodeResult) -> dict[str, object]:
+    """Episode 結果を JSON に書ける dict へ変換する。"""
+    return cast(dict[str, object], asdict(result))
+
+
+def decode_episode_result(payload: Mapping[str, Any]) -> LiveEvaluationEpisodeResult:
+    """`encode_episode_result` の dict から episode 結果を復元する。"""
+    return LiveEvaluationEpisodeResult(
+        turn_records_by_agent={
+            agent_name: tuple(_decode_turn_record(record) for record in records)
+            for agent_name, records in payload["turn_records_by_agent"].items()
+        },
+        summaries_by_agent={
+            agent_name: _decode_summary(summary)
+            for agent_name, summary in payload["summaries_by_agent"].items()
+        },
+        final_canonical_memory=dict(payload["final_canonical_memory"]),
+    )
+
+
+def _decode_turn_record(payload: Mapping[str, Any]) -> AgentTurnEvaluationRecord:
+    drift_audit = payload["drift_audit"]
+    return AgentTurnEvaluationRecord(
+        turn_id=payload["turn_id"],
+        outcome_scores=OutcomeScores(**payload["outcome_scores"]),
+        hallucination_audit=HallucinationAudit(**payload["hallucination_audit"]),
+        drift_audit=(
+            None
+            if drift_audit is None
+            else DriftAudit(
+                violations=drift_audit["violations"],
+                omissions=drift_audit["omissions"],
+                active_constraints=tuple(drift_audit["active_constraints"]),
+            )
+        ),
+        memory_tokens=payload["memory_tokens"],
+    )
+
+
+def _decode_summary(payload: Mapping[str, Any]) -> AgentEvaluationSummary:
+    return AgentEvaluationSummary(
+        total_turns=payload["total_turns"],
+        outcome_mean=OutcomeScores(**payload["outcome_mean"]),
+        outcome_std=OutcomeScores(**payload["outcome_std"]),
+        hallucination_turn_rates=tuple(payload["hallucination_turn_rates"]),
+        hallucination_average=payload["hallucination_average"],
+        drift_turn_rates=tuple(payload["drift_turn_rates"]),
+        drift_average=payload["drift_average"],
+        memory_tokens_by_turn=tuple(payload["memory_tokens_by_turn"]),
+        memory_average=payload["memory_average"],
+        memory_last_turn=payload["memory_last_turn"],
+    )
+
+
+def _load_completed_results(path: Path) -> dict[str, LiveEvaluationEpisodeResult]:
+    """完了済みの episode 結果を読み込む。改行で終わらない末尾の行は切り捨てる。"""
+    if not path.exists():
+        return {}
+    data = path.read_bytes()
+    complete_length = data.rfind(b"\n") + 1
+    if complete_length < len(data):
+        _LOG.warning(
+            "Truncating partial live evaluation record: path=%s bytes=%s",
+            path,
+            len(data) - complete_length,
+        )
+        with path.open("r+b") as file:
+            file.truncate(complete_length)
+    results: dict[str, LiveEvaluationEpisodeResult] = {}
+    lines = data[:complete_length].decode("utf-8").splitlines()
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            results[record["episode_id"]] = decode_episode_result(record["result"])
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError(f"評価結果の JSONL を読み込めません: {path}:{line_number}") from exc
+    return results
+
+
+def _run_episode(
+    use_case: LiveMultiAgentEvaluationUseCase,
+    episode: LiveEvaluationEpisode,
+) -> _EpisodeOutcome:
+    try:
+        result = use_case.run_episode(
+            episode.queries,
+            initial_canonical_memory=episode.initial_canonical_memory,
+        )
+    except Exception as exc:
+        return _describe_failure(exc)
+    return encode_episode_result(result)
+
+
+def _describe_failure(exc: Exception) -> tuple[str, str]:
+    return exc.__class__.__name__, str(exc)
+
+
+def _init_worker(use_case_factory: LiveEvaluationUseCaseFactory) -> None:
+    global _WORKER_USE_CASE
+    _WORKER_USE_CASE = use_case_factory()
+
+
+def _run_episode_in_worker(episode: LiveEvaluationEpisode) -> _EpisodeOutcome:
+    assert _WORKER_USE_CASE is not None
+    return _run_episode(_WORKER_USE_CASE, episode)
@@ -0,0 +1,398 @@
+"""スレッド安全なセッションレジストリ。"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Literal, Protocol
+
+_LOG = logging.getLogger(__name__)
+
+type SessionEvictionReason = Literal["capacity", "idle_ttl", "byte_budget"]
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRegistryMetrics:
+    """レジストリの保持量と削除理由別の累計件数。"""
+
+    active_sessions: int
+    total_bytes: int
+    evicted_by_capacity: int
+    evicted_by_idle_ttl: int
+    evicted_by_byte_budget: int
+
+
+class _RegistryEntry[T]:
+    """セッション本体とターン直列化用ロック、LRU 管理情報の組。"""
+
+    __slots__ = ("last_access", "lock", "session", "size_bytes")
+
+    def __init__(self, session: T, *, last_access: float, size_bytes: int) -> None:
+        """セッション本体を受け取り専用ロックを作る。"""
+        self.session = session
+        self.lock = threading.Lock()
+        self.last_access = last_access
+        self.size_bytes = size_bytes
+
+
+class _RegistryStripe[T]:
+    """ロックを共有するセッション集合の1区画。entries は最終アクセス昇順に並ぶ。"""
+
+    __slots__ = ("entries", "lock")
+
+    def __init__(self) -> None:
+        """空の区画を作る。"""
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, _RegistryEntry[T]] = OrderedDict()
+
+
+class SessionLease[T]:
+    """セッション専用ロックを保持している間だけセッションを貸し出す。"""
+
+    __slots__ = ("_entry", "_registry", "_session_id")
+
+    def __init__(
+        self,
+        registry: StripedSessionRegistry[T],
+        session_id: str,
+        entry: _RegistryEntry[T],
+    ) -> None:
+        """貸し出し対象エントリを受け取る。"""
+        self._registry = registry
+        self._session_id = session_id
+        self._entry = entry
+
+    def __enter__(self) -> T:
+        """セッション専用ロックを取得してセッションを返す。"""
+        self._entry.lock.acquire()
+        return self._entry.session
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """セッションサイズを再計測してからセッション専用ロックを解放する。"""
+        try:
+            size_bytes = self._registry.measure(self._entry.session)
+        finally:
+            self._entry.lock.release()
+        self._registry.record_size(self._session_id, self._entry, size_bytes)
+
+
+class StripedSessionRegistry[T]:
+    """ロックストライピングと LRU 削除でセッションを保持するレジストリ。
+
+    参照・アクセス更新はセッション ID のハッシュで決まる区画ロックだけを取得し、
+    ターン処理はセッション専用ロックで直列化する。全体の最終アクセス順は専用ロックで守る
+    1つの OrderedDict に持ち、LRU 削除は先頭を取り出すだけの O(1) で行う。
+    ロック順序は「容量ロック → 区画ロック → 最終アクセス順ロック」に固定する。
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int,
+        stripe_count: int = 16,
+        idle_ttl_seconds: float | None = None,
+        max_total_bytes: int | None = None,
+        size_of: Callable[[T], int] | None = None,
+        on_evict: Callable[[str, T, SessionEvictionReason], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """上限セッション数・区画数・idle TTL・バイト上限を受け取る。"""
+        if max_sessions < 1:
+            raise ValueError("max_sessions は 1 以上である必要があります。")
+        if stripe_count < 1:
+            raise ValueError("stripe_count は 1 以上である必要があります。")
+        if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+            raise ValueError("idle_ttl_seconds は 0 より大きい必要があります。")
+        if max_total_bytes is not None and max_total_bytes < 1:
+            raise ValueError("max_total_bytes は 1 以上である必要があります。")
+        self._max_sessions = max_sessions
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._max_total_bytes = max_total_bytes
+        self._size_of = size_of
+        self._on_evict = on_evict
+        self._clock = clock
+        self._stripes: tuple[_RegistryStripe[T], ...] = tuple(
+            _RegistryStripe() for _ in range(stripe_count)
+        )
+        # 件数・バイト数・削除判定だけを守るロック。ターン処理中には保持しない。
+        self._capacity_lock = threading.Lock()
+        # 全体の最終アクセス順。区画ロックの内側でだけ取得し、他のロックは取らない。
+        self._recency_lock = threading.Lock()
+        self._recency: OrderedDict[str, None] = OrderedDict()
+        self._session_count = 0
+        self._total_bytes = 0
+        self._eviction_counts: dict[SessionEvictionReason, int] = {
+            "capacity": 0,
+            "idle_ttl": 0,
+            "byte_budget": 0,
+        }
+
+    def __len__(self) -> int:
+        """登録中のセッション数を返す。"""
+        with self._capacity_lock:
+            return self._session_count
+
+    def __contains__(self, session_id: object) -> bool:
+        """セッションが登録済みかを返す。"""
+        if not isinstance(session_id, str):
+            return False
+        stripe = self._stripe_for(session_id)
+        with stripe.lock:
+            return session_id in stripe.entries
+
+    def register(self, session_id: str, session: T) -> tuple[str, ...]:
+        """セッションを登録し、上限超過で削除したセッション ID を返す。"""
+        size_bytes = self.measure(session)
+        evicted: list[tuple[str, T, SessionEvictionReason]] = []
+        stripe = self._stripe_for(session_id)
+        with self._capacity_lock:
+            with stripe.lock:
+                if session_id in stripe.entries:
+                    raise ValueError(f"session_id が重複しています: {session_id}")
+            while self._session_count >= self._max_sessions:
+                evicted.append(self._evict_least_recent_locked("capacity"))
+
+            with stripe.lock:
+                stripe.entries[session_id] = _RegistryEntry(
+                    session,
+                    last_access=self._clock(),
+                    size_bytes=size_bytes,
+                )
+                with self._recency_lock:
+                    self._recency[session_id] = None
+            self._session_count += 1
+            self._total_bytes += size_bytes
+            evicted.extend(self._enforce_byte_budget_locked(keep_session_id=session_id))
+        self._notify_evicted(evicted)
+        return tuple(evicted_id for evicted_id, _, _ in evicted)
+
+    def lease(self, session_id: str) -> SessionLease[T] | None:
+        """アクセス時刻を更新して貸し出しを返す。未登録・idle 期限切れなら None を返す。"""
+        now = self._clock()
+        stripe = self._stripe_for(session_id)
+        with stripe.lock:
+            entry = stripe.entries.get(session_id)
+            if entry is None:
+                return None
+            expired = self._is_idle_expired(entry, now)
+            if not expired:
+                entry.last_access = now
+                stripe.entries.move_to_end(session_id)
+                with self._recency_lock:
+                    self._recency.move_to_end(session_id)
+        if expired:
+            self._evict_idle_entry(session_id, now)
+            return None
+        return SessionLease(self, session_id, entry)
+
+    def remove(self, session_id: str) -> bool:
+        """セッションを削除し、削除できたかを返す。"""
+        with self._capacity_lock:
+            return self._pop_entry_locked(session_id) is not None
+
+    def evict_idle(self) -> tuple[str, ...]:
+        """Idle TTL を超えたセッションを削除して ID を返す。"""
+        if self._idle_ttl_seconds is None:
+            return ()
+        now = self._clock()
+        evicted: list[tuple[str, T, SessionEvictionReason]] = []
+        with self._capacity_lock:
+            for stripe in self._stripes:
+                with stripe.lock:
+                    while stripe.entries:
+                        session_id, entry = next(iter(stripe.entries.items()))
+                        if not self._is_idle_expired(entry, now):
+                            break
+                        del stripe.entries[session_id]
+                        self._forget_recency(session_id)
+                        self._account_removal_locked(entry, "idle_ttl")
+                        evicted.append((session_id, entry.session, "idle_ttl"))
+        self._notify_evicted(evicted)
+        return tuple(evicted_id for evicted_id, _, _ in evicted)
+
+    def items(self) -> tuple[tuple[str, T], ...]:
+        """登録中のセッションを (session_id, session) の組で返す。"""
+        collected: list[tuple[str, T]] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                collected.extend(
+                    (session_id, entry.session) for session_id, entry in stripe.entries.items()
+                )
+        return tuple(collected)
+
+    def metrics(self) -> SessionRegistryMetrics:
+        """現在の保持量と削除件数のスナップショットを返す。"""
+        with self._capacity_lock:
+            return SessionRegistryMetrics(
+                active_sessions=self._session_count,
+                total_bytes=self._total_bytes,
+                evicted_by_capacity=self._eviction_counts["capacity"],
+                evicted_by_idle_ttl=self._eviction_counts["idle_ttl"],
+                evicted_by_byte_budget=self._eviction_counts["byte_budget"],
+            )
+
+    def measure(self, session: T) -> int:
+        """セッションのメモリ使用量（バイト）を返す。計測関数がなければ 0。"""
+        if self._size_of is None:
+            return 0
+        return max(0, self._size_of(session))
+
+    def record_size(self, session_id: str, entry: _RegistryEntry[T], size_bytes: int) -> None:
+        """ターン後のセッションサイズを反映し、必要ならバイト上限で削除する。"""
+        if self._size_of is None:
+            return
+        stripe = self._stripe_for(session_id)
+        with self._capacity_lock:
+            with stripe.lock:
+                if stripe.entries.get(session_id) is not entry:
+                    return
+                delta = size_bytes - entry.size_bytes
+                entry.size_bytes = size_bytes
+            self._total_bytes += delta
+            evicted = self._enforce_byte_budget_locked(keep_session_id=session_id)
+        self._notify_evicted(evicted)
+
+    def _evict_idle_entry(self, session_id: str, now: float) -> None:
+        stripe = self._stripe_for(session_id)
+        with self._capacity_lock:
+            with stripe.lock:
+                entry = stripe.entries.get(session_id)
+                if entry is None or not self._is_idle_expired(entry, now):
+                    return
+                del stripe.entries[session_id]
+                self._forget_recency(session_id)
+            self._account_removal_locked(entry, "idle_ttl")
+        self._notify_evicted([(session_id, entry.session, "idle_ttl")])
+
+    def _enforce_byte_budget_locked(
+        self,
+        *,
+        keep_session_id: str,
+    ) -> list[tuple[str, T, SessionEvictionReason]]:
+        evicted: list[tuple[str, T, SessionEvictionReason]] = []
+        if self._max_total_bytes is None:
+            return evicted
+        while self._total_bytes > self._max_total_bytes and self._session_count > 1:
+            evicted.append(self._evict_least_recent_locked("byte_budget", exclude=keep_session_id))
+        return evicted
+
+    def _evict_least_recent_locked(
+        self,
+        reason: SessionEvictionReason,
+        *,
+        exclude: str | None = None,
+    ) -> tuple[str, T, SessionEvictionReason]:
+        """最終アクセスが最も古いセッションを削除する。"""
+        with self._recency_lock:
+            oldest = next(
+                (session_id for session_id in self._recency if session_id != exclude),
+                None,
+            )
+        if oldest is None:
+            raise RuntimeError("削除可能なセッションがありません。")
+
+        # 削除は容量ロック下でしか起きないため、最終アクセス順にある ID は区画にも必ず残っている。
+        stripe = self._stripe_for(oldest)
+        with stripe.lock:
+            entry = stripe.entries.pop(oldest)
+            self._forget_recency(oldest)
+        self._account_removal_locked(entry, reason)
+        return oldest, entry.session, reason
+
+    def _pop_entry_locked(self, session_id: str) -> _RegistryEntry[T] | None:
+        stripe = self._stripe_for(session_id)
+        with stripe.lock:
+            entry = stripe.entries.pop(session_id, None)
+            if entry is not None:
+                self._forget_recency(session_id)
+        if entry is not None:
+            self._session_count -= 1
+            self._total_bytes -= entry.size_bytes
+        return entry
+
+    def _forget_recency(self, session_id: str) -> None:
+        with self._recency_lock:
+            del self._recency[session_id]
+
+    def _account_removal_locked(
+        self,
+        entry: _RegistryEntry[T],
+        reason: SessionEvictionReason,
+    ) -> None:
+        self._session_count -= 1
+        self._total_bytes -= entry.size_bytes
+        self._eviction_counts[reason] += 1
+
+    def _notify_evicted(self, evicted: list[tuple[str, T, SessionEvictionReason]]) -> None:
+        if self._on_evict is None:
+            return
+        for session_id, session, reason in evicted:
+            self._on_evict(session_id, session, reason)
+
+    def _is_idle_expired(self, entry: _RegistryEntry[T], now: float) -> bool:
+        if self._idle_ttl_seconds is None:
+            return False
+        return now - entry.last_access > self._idle_ttl_seconds
+
+    def _stripe_for(self, session_id: str) -> _RegistryStripe[T]:
+        return self._stripes[hash(session_id) % len(self._stripes)]
+
+
+class _IdleEvictable(Protocol):
+    """Idle 削除を実行できるレジストリの契約。"""
+
+    def evict_idle(self) -> tuple[str, ...]:
+        """Idle TTL を超えたセッションを削除する。"""
+
+
+class SessionIdleSweeper:
+    """一定間隔で idle セッションを削除するバックグラウンドスレッド。"""
+
+    def __init__(
+        self,
+        registry: _IdleEvictable,
+        *,
+        interval_seconds: float,
+    ) -> None:
+        """対象レジストリと実行間隔を受け取る。"""
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds は 0 より大きい必要があります。")
+        self._registry = registry
+        self._interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """スイーパースレッドを開始する。"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="acc-session-idle-sweeper",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """スイーパースレッドを停止する。"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval_seconds):
+            try:
+                self._registry.evict_idle()
+            except Exception:
+                _LOG.exception("Idle session sweep failed.")
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import logging
+from collections.abc import Generator, Sequence
 from dataclasses import dataclass
 
 from acc.domain.entities.artifact import Artifact
@@ -12,11 +13,14 @@ from acc.domain.entities.interaction import (
     TurnInteractionSignal,
 )
 from acc.domain.value_objects.ccs import CompressedCognitiveState
-from acc.ports.outbound.agent_policy_port import AgentPolicyPort
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
 from acc.ports.outbound.artifact_qualification_port import ArtifactQualificationPort
 from acc.ports.outbound.artifact_recall_port import ArtifactRecallPort
 from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
 from acc.ports.outbound.evidence_store_port import EvidenceStorePort
+from acc.ports.outbound.fused_turn_port import FusedTurnPort, FusedTurnRejectedError
+
+_LOG = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,8 +47,16 @@ class ACCMultiturnControlLoop:
         recall_limit: int = 5,
         role: str = "assistant",
         tools: Sequence[str] = (),
+        streaming_agent_policy: StreamingAgentPolicyPort | None = None,
+        fused_turn: FusedTurnPort | None = None,
     ) -> None:
-        """依存ポートと固定パラメータを受けて初期化する。"""
+        """依存ポートと固定パラメータを受けて初期化する。
+
+        `streaming_agent_policy` は `stream_turn` で使う。未指定なら `agent_policy` の
+        応答全体を 1 つの差分として返す。
+        `fused_turn` を指定すると `run_turn` は CCS 更新と応答生成を 1 回のモデル呼び出しで
+        行い、結果を採用できなかったターンだけ `cognitive_compressor` と `agent_policy` に戻す。
+        """
         if recall_limit < 1:
             raise ValueError("recall_limit は 1 以上である必要があります。")
         self._artifact_recall = artifact_recall
@@ -55,6 +67,8 @@ class ACCMultiturnControlLoop:
         self._recall_limit = recall_limit
         self._role = role
         self._tools = tuple(tools)
+        self._streaming_agent_policy = streaming_agent_policy
+        self._fused_turn = fused_turn
 
     def run_turn(
         self,
@@ -63,36 +77,85 @@ class ACCMultiturnControlLoop:
         recent_dialogue_turns: Sequence[RecentDialogueTurn] = (),
     ) -> ACCTurnResult:
         """1ターン分の ACC 更新と意思決定を実行する。"""
-        recalled_artifacts = tuple(
-            self._artifact_recall.recall_candidate_artifacts(
+        recalled_artifacts, qualified_artifacts = self._recall_qualified_artifacts(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+        )
+        fused = (
+            self._try_fused_turn(
+                self._fused_turn,
                 interaction_signal=interaction_signal,
                 committed_state=committed_state,
-                limit=self._recall_limit,
+                qualified_artifacts=qualified_artifacts,
+                recent_dialogue_turns=recent_dialogue_turns,
             )
-        )[: self._recall_limit]
-
-        qualified_artifacts = tuple(
-            artifact
-            for artifact in recalled_artifacts
-            if self._artifact_qualification.is_decision_relevant(
-                artifact=artifact,
+            if self._fused_turn is not None
+            else None
+        )
+        if fused is not None:
+            next_committed_state, decision = fused
+        else:
+            next_committed_state = self._cognitive_compressor.commit_next_state(
+                interaction_signal=interaction_signal,
                 committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts,
+            )
+            decision = self._agent_policy.decide(
                 interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=next_committed_state,
+                role=self._role,
+                tools=self._tools,
             )
+        self._evidence_store.persist_turn_evidence(
+            interaction_signal=interaction_signal,
+            decision=decision,
         )
 
-        next_committed_state = self._cognitive_compressor.commit_next_state(
-            interaction_signal=interaction_signal,
-            committed_state=committed_state,
+        return ACCTurnResult(
+            committed_state=next_committed_state,
+            recalled_artifacts=recalled_artifacts,
             qualified_artifacts=qualified_artifacts,
+            decision=decision,
         )
-        decision = self._agent_policy.decide(
+
+    def stream_turn(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn] = (),
+    ) -> Generator[str, None, ACCTurnResult]:
+        """1ターンを実行し、応答テキストの差分を生成順に返す。
+
+        応答は次状態を前提に生成するため CCS の更新は最初の差分より前に行う。
+        ターン証拠の保存は応答の末尾まで読み切った後に行い、ジェネレータの戻り値として
+        `run_turn` と同じ結果を返す。途中で閉じられた場合は証拠を保存しない。
+        """
+        recalled_artifacts, qualified_artifacts, next_committed_state = self._commit_turn_state(
             interaction_signal=interaction_signal,
-            recent_dialogue_turns=recent_dialogue_turns,
-            committed_state=next_committed_state,
-            role=self._role,
-            tools=self._tools,
+            committed_state=committed_state,
         )
+        if self._streaming_agent_policy is None:
+            decision = self._agent_policy.decide(
+                interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=next_committed_state,
+                role=self._role,
+                tools=self._tools,
+            )
+            yield decision.response
+        else:
+            deltas: list[str] = []
+            for delta in self._streaming_agent_policy.stream_decide(
+                interaction_signal=interaction_signal,
+                recent_dialogue_turns=recent_dialogue_turns,
+                committed_state=next_committed_state,
+                role=self._role,
+                tools=self._tools,
+            ):
+                deltas.append(delta)
+                yield delta
+            decision = AgentDecision(response="".join(deltas).strip(), tool_actions=())
         self._evidence_store.persist_turn_evidence(
             interaction_signal=interaction_signal,
             decision=decision,
@@ -105,6 +168,77 @@ class ACCMultiturnControlLoop:
             decision=decision,
         )
 
+    def _commit_turn_state(
+        self,
+        *,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+    ) -> tuple[tuple[Artifact, ...], tuple[Artifact, ...], CompressedCognitiveState]:
+        """Artifact の想起・資格判定と CCS 更新を行い、応答生成の前提をそろえる。"""
+        recalled_artifacts, qualified_artifacts = self._recall_qualified_artifacts(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+        )
+        next_committed_state = self._cognitive_compressor.commit_next_state(
+            interaction_signal=interaction_signal,
+            committed_state=committed_state,
+            qualified_artifacts=qualified_artifacts,
+        )
+        return recalled_artifacts, qualified_artifacts, next_committed_state
+
+    def _recall_qualified_artifacts(
+        self,
+        *,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+    ) -> tuple[tuple[Artifact, ...], tuple[Artifact, ...]]:
+        """候補 Artifact を想起し、想起分と資格判定を通った分を返す。"""
+        recalled_artifacts = tuple(
+            self._artifact_recall.recall_candidate_artifacts(
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                limit=self._recall_limit,
+            )
+        )[: self._recall_limit]
+
+        qualified_artifacts = tuple(
+            artifact
+            for artifact in recalled_artifacts
+            if self._artifact_qualification.is_decision_relevant(
+                artifact=artifact,
+                committed_state=committed_state,
+                interaction_signal=interaction_signal,
+            )
+        )
+        return recalled_artifacts, qualified_artifacts
+
+    def _try_fused_turn(
+        self,
+        fused_turn: FusedTurnPort,
+        *,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: tuple[Artifact, ...],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+    ) -> tuple[CompressedCognitiveState, AgentDecision] | None:
+        """1 回呼び出しでターンを確定する。採用できなければ None を返す。"""
+        try:
+            return fused_turn.commit_fused_turn(
+                interaction_signal=interaction_signal,
+                committed_state=committed_state,
+                qualified_artifacts=qualified_artifacts,
+                recent_dialogue_turns=recent_dialogue_turns,
+                role=self._role,
+                tools=self._tools,
+            )
+        except FusedTurnRejectedError as exc:
+            _LOG.info(
+                "Fused turn rejected; falling back to two calls: turn_id=%s reason=%s",
+                interaction_signal.turn_id,
+                exc,
+            )
+            return None
+
     def run_horizon(
         self,
         initial_committed_state: CompressedCognitiveState,
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 
-from acc.domain.services.evaluation_metrics import summarize_agent_records
+from acc.application.services.columnar_evaluation_summary import build_agent_records_summarizer
+from acc.domain.services.evaluation_metrics import summarize_agent_episodes
 from acc.domain.value_objects.evaluation import (
     AgentEvaluationSummary,
     AgentTurnEvaluationRecord,
@@ -14,12 +15,19 @@ from acc.domain.value_objects.evaluation import (
 class AgentJudgeEvaluationUseCase:
     """単一/複数エージェントの評価サマリーを生成する。"""
 
+    def __init__(self, *, summary_backend: str = "python") -> None:
+        """単一 episode の集計方式を受け取る。
+
+        `summary_backend` は `python`（既定）/ `numpy`（列形式）/ `auto`（numpy があれば列形式）。
+        """
+        self._summarize = build_agent_records_summarizer(summary_backend)
+
     def summarize_agent(
         self,
         turn_records: Sequence[AgentTurnEvaluationRecord],
     ) -> AgentEvaluationSummary:
         """単一エージェントの評価を集計する。"""
-        return summarize_agent_records(turn_records)
+        return self._summarize(turn_records)
 
     def summarize_agents(
         self,
@@ -32,3 +40,15 @@ class AgentJudgeEvaluationUseCase:
                 raise ValueError("agent_name は空にできません。")
             summaries[agent_name] = self.summarize_agent(turn_records)
         return summaries
+
+    def summarize_agents_across_episodes(
+        self,
+        episodes_by_agent: Mapping[str, Sequence[Sequence[AgentTurnEvaluationRecord]]],
+    ) -> dict[str, AgentEvaluationSummary]:
+        """複数 episode の評価をエージェント名ごとに集計する。"""
+        summaries: dict[str, AgentEvaluationSummary] = {}
+        for agent_name, episodes in episodes_by_agent.items():
+            if not agent_name:
+                raise ValueError("agent_name は空にできません。")
+            summaries[agent_name] = summarize_agent_episodes(episodes)
+        return summaries
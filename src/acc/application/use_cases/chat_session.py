@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import logging
+import threading
+from collections.abc import Generator, Sequence
 from dataclasses import dataclass
 from uuid import uuid4
 
@@ -12,17 +14,40 @@ from acc.adapters.outbound.in_memory_acc_components import (
     InMemoryEvidenceStoreAdapter,
     TokenOverlapQualificationAdapter,
 )
-from acc.application.use_cases.acc_multiturn_control_loop import ACCMultiturnControlLoop
+from acc.adapters.outbound.token_counters import HeuristicTokenCounterAdapter
+from acc.application.services.ccs_token_accounting import CCSTokenAccountant
+from acc.application.services.session_registry import (
+    SessionEvictionReason,
+    SessionIdleSweeper,
+    SessionLease,
+    SessionRegistryMetrics,
+    StripedSessionRegistry,
+)
+from acc.application.use_cases.acc_multiturn_control_loop import (
+    ACCMultiturnControlLoop,
+    ACCTurnResult,
+)
 from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.services.ccs_delta import CCSDelta, diff_ccs
 from acc.domain.value_objects.ccs import CompressedCognitiveState
-from acc.ports.outbound.agent_policy_port import AgentPolicyPort
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
 from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
+from acc.ports.outbound.fused_turn_port import FusedTurnPort
+from acc.ports.outbound.session_store_port import SessionStoreConflictError, SessionStorePort
+from acc.ports.outbound.token_counter_port import TokenCounterPort
+
+_LOG = logging.getLogger(__name__)
 
 
 class ChatSessionNotFoundError(KeyError):
     """指定セッションが存在しない場合の例外。"""
 
 
+class ChatSessionConflictError(RuntimeError):
+    """セッションが他のワーカーで更新され、このターンを保存できなかった場合の例外。"""
+
+
 @dataclass(frozen=True, slots=True)
 class ChatCommittedStateSummary:
     """UI/API 向けに公開する CCS 全項目。"""
@@ -45,6 +70,7 @@ class ChatMechanismSummary:
     recalled_artifact_count: int
     qualified_artifact_count: int
     committed_state: ChatCommittedStateSummary
+    committed_state_delta: CCSDelta
 
 
 @dataclass(frozen=True, slots=True)
@@ -58,6 +84,16 @@ class ChatReply:
     mechanism: ChatMechanismSummary
 
 
+@dataclass(frozen=True, slots=True)
+class ChatReplyDelta:
+    """ストリーミング応答の途中で返す応答テキストの差分。"""
+
+    text: str
+
+
+type ChatStreamEvent = ChatReplyDelta | ChatReply
+
+
 @dataclass(slots=True)
 class _SessionContext:
     """内部セッション状態。"""
@@ -67,6 +103,18 @@ class _SessionContext:
     turn_id: int
     memory: InMemoryArtifactMemory
     recent_dialogue_turns: list[RecentDialogueTurn]
+    token_accountant: CCSTokenAccountant
+    stored_turn_id: int = 0
+    pending_snapshot: SessionSnapshot | None = None
+    unflushed_turns: int = 0
+
+    def snapshot(self) -> SessionSnapshot:
+        """永続化用の不変スナップショットを返す。"""
+        return SessionSnapshot(
+            committed_state=self.committed_state,
+            turn_id=self.turn_id,
+            recent_dialogue_turns=tuple(self.recent_dialogue_turns),
+        )
 
 
 class ChatSessionUseCase:
@@ -82,27 +130,99 @@ class ChatSessionUseCase:
         recall_limit: int = 5,
         max_sessions: int = 200,
         short_history_turns: int = 2,
+        token_counter: TokenCounterPort | None = None,
+        session_lock_stripes: int = 16,
+        session_idle_ttl_seconds: float | None = None,
+        idle_sweep_interval_seconds: float | None = None,
+        max_session_bytes: int | None = None,
+        session_store: SessionStorePort | None = None,
+        session_store_flush_turns: int = 1,
+        streaming_agent_policy: StreamingAgentPolicyPort | None = None,
+        fused_turn: FusedTurnPort | None = None,
     ) -> None:
-        """セッション生成に必要な依存と制約を初期化する。"""
+        """セッション生成に必要な依存と制約を初期化する。
+
+        `session_idle_ttl_seconds` を指定すると最終アクセスから一定時間経過した
+        セッションをバックグラウンドで削除する。`max_session_bytes` は全セッションの
+        Artifact メモリ合計の上限で、超過時は最終アクセスが古い順に削除する。
+        `session_store` を指定するとプロセス内レジストリを write-back キャッシュとして使い、
+        未保持のセッションはストアから遅延復元する。ストアへの書き込みは
+        `session_store_flush_turns` ターンごと、およびキャッシュからの削除時に行う。
+        書き込みは保存済みの turn_id を照合する compare-and-set で、他のワーカーが先に
+        更新していればキャッシュを捨てる（`send_message` はストアから読み直して 1 回だけ再実行する）。
+        `streaming_agent_policy` は `stream_message` で応答を逐次生成するのに使う。
+        `fused_turn` は `send_message` で CCS 更新と応答生成を 1 回のモデル呼び出しにまとめる。
+        """
         if max_sessions < 1:
             raise ValueError("max_sessions は 1 以上である必要があります。")
         if short_history_turns < 0:
             raise ValueError("short_history_turns は 0 以上である必要があります。")
+        if session_store_flush_turns < 1:
+            raise ValueError("session_store_flush_turns は 1 以上である必要があります。")
         self._cognitive_compressor = cognitive_compressor
         self._agent_policy = agent_policy
+        self._streaming_agent_policy = streaming_agent_policy
+        self._fused_turn = fused_turn
         self._role = role
         self._tools = tuple(tools)
         self._recall_limit = recall_limit
-        self._max_sessions = max_sessions
         self._short_history_turns = short_history_turns
-        self._sessions: dict[str, _SessionContext] = {}
+        self._token_counter = token_counter or HeuristicTokenCounterAdapter()
+        self._session_store = session_store
+        self._session_store_flush_turns = session_store_flush_turns
+        # ストアへの書き出しを同じセッションについて直列化する区画ロック。
+        self._store_locks = tuple(threading.Lock() for _ in range(max(1, session_lock_stripes)))
+        self._sessions: StripedSessionRegistry[_SessionContext] = StripedSessionRegistry(
+            max_sessions=max_sessions,
+            stripe_count=session_lock_stripes,
+            idle_ttl_seconds=session_idle_ttl_seconds,
+            max_total_bytes=max_session_bytes,
+            size_of=_session_size_bytes if max_session_bytes is not None else None,
+            on_evict=self._handle_session_eviction,
+        )
+        self._idle_sweeper: SessionIdleSweeper | None = None
+        if session_idle_ttl_seconds is not None:
+            self._idle_sweeper = SessionIdleSweeper(
+                self._sessions,
+                interval_seconds=idle_sweep_interval_seconds or min(session_idle_ttl_seconds, 60.0),
+            )
+            self._idle_sweeper.start()
+
+    def session_metrics(self) -> SessionRegistryMetrics:
+        """セッション保持量と削除理由別件数を返す。"""
+        return self._sessions.metrics()
+
+    def close(self) -> None:
+        """バックグラウンド処理を停止し、未保存のセッション状態をストアへ書き出す。"""
+        if self._idle_sweeper is not None:
+            self._idle_sweeper.stop()
+            self._idle_sweeper = None
+        self.flush_sessions()
+
+    def flush_sessions(self) -> int:
+        """未保存のセッション状態をストアへ書き出し、書き出した件数を返す。"""
+        if self._session_store is None:
+            return 0
+        flushed = 0
+        for session_id, session in self._sessions.items():
+            try:
+                if self._flush_pending_snapshot(session_id, session):
+                    flushed += 1
+            except SessionStoreConflictError:
+                self._discard_stale_session(session_id, session)
+        return flushed
 
     def create_session(self) -> str:
         """新しいチャットセッションを作成して session_id を返す。"""
-        if len(self._sessions) >= self._max_sessions:
-            self._evict_oldest_session()
-
         session_id = str(uuid4())
+        snapshot = SessionSnapshot.initial()
+        if self._session_store is not None:
+            self._session_store.save(session_id, snapshot)
+        self._sessions.register(session_id, self._build_session_context(snapshot))
+        return session_id
+
+    def _build_session_context(self, snapshot: SessionSnapshot) -> _SessionContext:
+        """スナップショットからプロセス内のセッション状態を組み立てる。"""
         memory = InMemoryArtifactMemory()
         loop = ACCMultiturnControlLoop(
             artifact_recall=InMemoryArtifactRecallAdapter(memory),
@@ -113,46 +233,231 @@ class ChatSessionUseCase:
             recall_limit=self._recall_limit,
             role=self._role,
             tools=self._tools,
+            streaming_agent_policy=self._streaming_agent_policy,
+            fused_turn=self._fused_turn,
         )
-        self._sessions[session_id] = _SessionContext(
+        return _SessionContext(
             loop=loop,
-            committed_state=CompressedCognitiveState.empty(),
-            turn_id=0,
+            committed_state=snapshot.committed_state,
+            turn_id=snapshot.turn_id,
             memory=memory,
-            recent_dialogue_turns=[],
+            recent_dialogue_turns=list(snapshot.recent_dialogue_turns),
+            token_accountant=CCSTokenAccountant(self._token_counter),
+            stored_turn_id=snapshot.turn_id,
         )
-        return session_id
 
     def send_message(self, *, session_id: str, message: str) -> ChatReply:
-        """指定セッションで 1 ターン分のメッセージ処理を行う。"""
-        normalized_message = message.strip()
-        if not normalized_message:
-            raise ValueError("message は空にできません。")
+        """指定セッションで 1 ターン分のメッセージ処理を行う。
+
+        保存時に他のワーカーの更新と衝突した場合は、ストアから読み直して 1 回だけ再実行する。
+        """
+        normalized_message = _normalize_message(message)
+        for attempt in range(2):
+            lease = self._lease_session(session_id)
+
+            # 同一セッションのターンは直列化し、別セッションとは並行に処理する。
+            with lease as session:
+                reply = self._run_session_turn(
+                    session_id=session_id,
+                    session=session,
+                    message=normalized_message,
+                )
+                try:
+                    self._write_back(session_id, session)
+                except ChatSessionConflictError:
+                    if attempt == 1:
+                        raise
+                    continue
+                return reply
+        raise AssertionError("unreachable")
+
+    def stream_message(
+        self,
+        *,
+        session_id: str,
+        message: str,
+    ) -> Generator[ChatStreamEvent, None, None]:
+        """指定セッションで 1 ターンを実行し、応答差分と最後に `ChatReply` を返す。
 
-        session = self._sessions.get(session_id)
-        if session is None:
+        入力検証とセッション解決はこのメソッドの呼び出し時に行う。セッションへの反映と
+        ストアへの書き出しは応答を読み切った後に行い、途中で閉じた場合はターンを破棄する。
+        保存時に他のワーカーの更新と衝突した場合は再実行せず `ChatSessionConflictError` を送出する。
+        セッション専用ロックは最初の要素を取り出してから閉じるまで保持する。
+        """
+        normalized_message = _normalize_message(message)
+        lease = self._lease_session(session_id)
+        return self._stream_session_turn(
+            session_id=session_id,
+            lease=lease,
+            message=normalized_message,
+        )
+
+    def _stream_session_turn(
+        self,
+        *,
+        session_id: str,
+        lease: SessionLease[_SessionContext],
+        message: str,
+    ) -> Generator[ChatStreamEvent, None, None]:
+        with lease as session:
+            previous_state = session.committed_state
+            turn_result = yield from _as_reply_deltas(
+                session.loop.stream_turn(
+                    interaction_signal=_build_interaction_signal(session, message),
+                    committed_state=session.committed_state,
+                    recent_dialogue_turns=tuple(session.recent_dialogue_turns),
+                )
+            )
+            reply = self._apply_turn_result(
+                session_id=session_id,
+                session=session,
+                message=message,
+                previous_state=previous_state,
+                turn_result=turn_result,
+            )
+            self._write_back(session_id, session)
+        yield reply
+
+    def _lease_session(self, session_id: str) -> SessionLease[_SessionContext]:
+        """セッションの貸し出しを返す。プロセス内になければストアから復元する。"""
+        lease = self._sessions.lease(session_id)
+        if lease is None and self._hydrate_session(session_id):
+            lease = self._sessions.lease(session_id)
+        if lease is None:
             raise ChatSessionNotFoundError(f"session_id が存在しません: {session_id}")
+        return lease
 
-        next_turn_id = session.turn_id + 1
-        interaction_signal = TurnInteractionSignal(
-            turn_id=next_turn_id,
-            user_input=normalized_message,
-            active_goal=session.committed_state.goal_orientation or None,
-            active_constraints=session.committed_state.constraints,
-            focus_entities=session.committed_state.focal_entities,
-            expected_next_steps=session.committed_state.predictive_cue,
+    def _hydrate_session(self, session_id: str) -> bool:
+        """ストアにあるセッションをプロセス内へ復元し、復元できたかを返す。"""
+        if self._session_store is None:
+            return False
+        snapshot = self._session_store.load(session_id)
+        if snapshot is None:
+            return False
+        try:
+            self._sessions.register(session_id, self._build_session_context(snapshot))
+        except ValueError:
+            # 同時リクエストが先に復元した場合はそちらを使う。
+            pass
+        return True
+
+    def _write_back(self, session_id: str, session: _SessionContext) -> None:
+        """ターン結果を保存待ちにし、規定ターン数に達したらストアへ書き出す。
+
+        他のワーカーが先に更新していた場合はキャッシュを捨てて `ChatSessionConflictError`。
+        """
+        if self._session_store is None:
+            return
+        with self._store_lock_for(session_id):
+            session.pending_snapshot = session.snapshot()
+            session.unflushed_turns += 1
+            # ターン中にキャッシュから外れた場合は削除時の書き出しに間に合わないため即時保存する。
+            if (
+                session.unflushed_turns < self._session_store_flush_turns
+                and session_id in self._sessions
+            ):
+                return
+            try:
+                self._flush_pending_snapshot_locked(session_id, session)
+            except SessionStoreConflictError as exc:
+                self._discard_stale_session(session_id, session)
+                raise ChatSessionConflictError(
+                    f"session_id が他のワーカーで更新されています: {session_id}"
+                ) from exc
+
+    def _flush_pending_snapshot(self, session_id: str, session: _SessionContext) -> bool:
+        """保存待ちスナップショットがあればストアへ書き出す。"""
+        with self._store_lock_for(session_id):
+            return self._flush_pending_snapshot_locked(session_id, session)
+
+    def _flush_pending_snapshot_locked(self, session_id: str, session: _SessionContext) -> bool:
+        snapshot = session.pending_snapshot
+        if snapshot is None or self._session_store is None:
+            return False
+        self._session_store.save(session_id, snapshot, expected_turn_id=session.stored_turn_id)
+        session.stored_turn_id = snapshot.turn_id
+        session.pending_snapshot = None
+        session.unflushed_turns = 0
+        return True
+
+    def _discard_stale_session(self, session_id: str, session: _SessionContext) -> None:
+        """ストアより古くなったセッションの未保存ターンを捨て、キャッシュから外す。"""
+        _LOG.warning(
+            "Chat session was updated by another worker; dropping cached state:"
+            " session_id=%s stored_turn_id=%s unflushed_turns=%s",
+            session_id,
+            session.stored_turn_id,
+            session.unflushed_turns,
         )
+        session.pending_snapshot = None
+        session.unflushed_turns = 0
+        self._sessions.remove(session_id)
+
+    def _store_lock_for(self, session_id: str) -> threading.Lock:
+        return self._store_locks[hash(session_id) % len(self._store_locks)]
+
+    def _handle_session_eviction(
+        self,
+        session_id: str,
+        session: _SessionContext,
+        reason: SessionEvictionReason,
+    ) -> None:
+        """キャッシュから外れるセッションを書き出してから削除を記録する。
+
+        ターン中のセッションの `_write_back` とは区画ロックで直列化する。
+        """
+        try:
+            self._flush_pending_snapshot(session_id, session)
+        except SessionStoreConflictError:
+            _LOG.warning(
+                "Evicted chat session was updated by another worker; dropping"
+                " unflushed turns: session_id=%s unflushed_turns=%s",
+                session_id,
+                session.unflushed_turns,
+            )
+        except Exception:
+            _LOG.exception("Failed to flush evicted chat session: session_id=%s", session_id)
+        _log_session_eviction(session_id, session, reason)
+
+    def _run_session_turn(
+        self,
+        *,
+        session_id: str,
+        session: _SessionContext,
+        message: str,
+    ) -> ChatReply:
+        """セッションロック取得済みの状態で 1 ターンを実行する。"""
+        previous_state = session.committed_state
         turn_result = session.loop.run_turn(
-            interaction_signal=interaction_signal,
+            interaction_signal=_build_interaction_signal(session, message),
             committed_state=session.committed_state,
             recent_dialogue_turns=tuple(session.recent_dialogue_turns),
         )
+        return self._apply_turn_result(
+            session_id=session_id,
+            session=session,
+            message=message,
+            previous_state=previous_state,
+            turn_result=turn_result,
+        )
+
+    def _apply_turn_result(
+        self,
+        *,
+        session_id: str,
+        session: _SessionContext,
+        message: str,
+        previous_state: CompressedCognitiveState,
+        turn_result: ACCTurnResult,
+    ) -> ChatReply:
+        """ターン結果をセッションへ反映し、API 向けの応答を組み立てる。"""
+        next_turn_id = session.turn_id + 1
         session.turn_id = next_turn_id
         session.committed_state = turn_result.committed_state
         self._append_recent_dialogue_turn(
             session=session,
             turn_id=next_turn_id,
-            user_input=normalized_message,
+            user_input=message,
             assistant_response=turn_result.decision.response,
         )
         committed_state = turn_result.committed_state
@@ -170,21 +475,17 @@ class ChatSessionUseCase:
                 uncertainty_signal=committed_state.uncertainty_signal,
                 retrieved_artifacts=committed_state.retrieved_artifacts,
             ),
+            committed_state_delta=diff_ccs(previous_state, committed_state),
         )
 
         return ChatReply(
             session_id=session_id,
             turn_id=next_turn_id,
             reply=turn_result.decision.response,
-            memory_tokens=_estimate_memory_tokens(session.committed_state),
+            memory_tokens=session.token_accountant.count(session.committed_state),
             mechanism=mechanism,
         )
 
-    def _evict_oldest_session(self) -> None:
-        """最大セッション数超過時に最古セッションを削除する。"""
-        oldest_session_id = next(iter(self._sessions))
-        del self._sessions[oldest_session_id]
-
     def _append_recent_dialogue_turn(
         self,
         *,
@@ -210,21 +511,60 @@ class ChatSessionUseCase:
             del session.recent_dialogue_turns[:overflow]
 
 
-def _estimate_memory_tokens(state: CompressedCognitiveState) -> int:
-    """CCS 文字長ベースの簡易 token 数を返す。"""
-    raw_text = " ".join(
-        [
-            *state.episodic_trace,
-            state.semantic_gist,
-            *state.focal_entities,
-            *state.relational_map,
-            state.goal_orientation,
-            *state.constraints,
-            *state.predictive_cue,
-            state.uncertainty_signal,
-            *state.retrieved_artifacts,
-        ]
+def _normalize_message(message: str) -> str:
+    """前後空白を除いたメッセージを返す。空なら `ValueError`。"""
+    normalized_message = message.strip()
+    if not normalized_message:
+        raise ValueError("message は空にできません。")
+    return normalized_message
+
+
+def _build_interaction_signal(session: _SessionContext, message: str) -> TurnInteractionSignal:
+    """現在の CCS を構造化フィールドへ写した次ターンの入力信号を返す。"""
+    return TurnInteractionSignal(
+        turn_id=session.turn_id + 1,
+        user_input=message,
+        active_goal=session.committed_state.goal_orientation or None,
+        active_constraints=session.committed_state.constraints,
+        focus_entities=session.committed_state.focal_entities,
+        expected_next_steps=session.committed_state.predictive_cue,
+    )
+
+
+def _as_reply_deltas(
+    turn_stream: Generator[str, None, ACCTurnResult],
+) -> Generator[ChatReplyDelta, None, ACCTurnResult]:
+    """応答差分を `ChatReplyDelta` に包み、ターン結果をそのまま返す。
+
+    途中で閉じられた場合は元のジェネレータも閉じ、上流の生成を打ち切る。
+    """
+    try:
+        while True:
+            try:
+                delta = next(turn_stream)
+            except StopIteration as finished:
+                turn_result: ACCTurnResult = finished.value
+                return turn_result
+            yield ChatReplyDelta(text=delta)
+    finally:
+        turn_stream.close()
+
+
+def _session_size_bytes(session: _SessionContext) -> int:
+    """バイト上限の判定に使うセッションの Artifact メモリ量を返す。"""
+    return session.memory.approximate_size_bytes
+
+
+def _log_session_eviction(
+    session_id: str,
+    session: _SessionContext,
+    reason: SessionEvictionReason,
+) -> None:
+    """削除メトリクスをログへ出力する。"""
+    _LOG.info(
+        "Chat session evicted: session_id=%s reason=%s turn_id=%s memory_bytes=%s",
+        session_id,
+        reason,
+        session.turn_id,
+        session.memory.approximate_size_bytes,
     )
-    if not raw_text:
-        return 0
-    return max(1, len(raw_text) // 4)
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 
 from acc.application.use_cases.agent_judge_evaluation import AgentJudgeEvaluationUseCase
 from acc.domain.value_objects.evaluation import AgentTurnEvaluationRecord
 from acc.domain.value_objects.live_evaluation import (
+    AgentTurnResponse,
     EvaluationTurnQuery,
     LiveEvaluationEpisodeResult,
 )
 from acc.ports.outbound.live_evaluation_ports import AgentRunnerPort, JudgeEvaluatorPort
 
 
+class AgentRunTimeoutError(TimeoutError):
+    """エージェントの 1 ターンが `agent_timeout_seconds` 以内に終わらなかったことを表す例外。"""
+
+
 class LiveMultiAgentEvaluationUseCase:
     """judge 駆動の multi-agent 評価 episode を実行する。"""
 
@@ -22,16 +31,49 @@ class LiveMultiAgentEvaluationUseCase:
         agent_runners: Mapping[str, AgentRunnerPort],
         judge_evaluator: JudgeEvaluatorPort,
         summary_use_case: AgentJudgeEvaluationUseCase | None = None,
+        max_concurrent_agents: int | None = None,
+        agent_timeout_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
-        """依存ポートと集計ユースケースを初期化する。"""
+        """依存ポートと集計ユースケース、エージェント実行の並列度と制限時間を初期化する。
+
+        各ターンのエージェントは最大 `max_concurrent_agents` 件（省略時は全件）を並行に実行する。
+        1 を指定し制限時間もなければ、従来どおり呼び出し元のスレッドで順に実行する。
+        `agent_timeout_seconds` はエージェントごとに、実行を始めた時点から数える。
+        制限時間を過ぎた呼び出しは止められないため、スレッドプールを作り直して後続の
+        ターン・episode がその枠を待ち続けないようにする。
+        """
         if not agent_runners:
             raise ValueError("agent_runners は 1 件以上必要です。")
         if any(not name.strip() for name in agent_runners):
             raise ValueError("agent_runners のキー名は空にできません。")
+        if max_concurrent_agents is not None and max_concurrent_agents < 1:
+            raise ValueError("max_concurrent_agents は 1 以上である必要があります。")
+        if agent_timeout_seconds is not None and agent_timeout_seconds <= 0:
+            raise ValueError("agent_timeout_seconds は 0 より大きい必要があります。")
 
         self._agent_runners = dict(agent_runners)
         self._judge_evaluator = judge_evaluator
         self._summary_use_case = summary_use_case or AgentJudgeEvaluationUseCase()
+        self._agent_timeout_seconds = agent_timeout_seconds
+        self._clock = clock
+        self._worker_count = min(
+            max_concurrent_agents or len(self._agent_runners), len(agent_runners)
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        if self._worker_count > 1 or agent_timeout_seconds is not None:
+            self._executor = self._new_executor()
+
+    def close(self) -> None:
+        """エージェント実行用のスレッドプールを止める。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self._worker_count,
+            thread_name_prefix="acc-live-eval-agent",
+        )
 
     def run_episode(
         self,
@@ -39,7 +81,11 @@ class LiveMultiAgentEvaluationUseCase:
         *,
         initial_canonical_memory: Mapping[str, object] | None = None,
     ) -> LiveEvaluationEpisodeResult:
-        """Turn query 列を順に処理し、episode 結果を返す。"""
+        """Turn query 列を順に処理し、episode 結果を返す。
+
+        各ターンの canonical memory は 1 つの読み取り専用ビュー（`MappingProxyType`）として
+        全エージェントと judge に渡す。複製は judge の更新結果を受け取るときの 1 回だけ。
+        """
         if not queries:
             raise ValueError("queries は 1 件以上必要です。")
 
@@ -49,17 +95,13 @@ class LiveMultiAgentEvaluationUseCase:
         }
 
         for query in queries:
-            agent_responses = {
-                agent_name: runner.run_turn(
-                    query=query,
-                    canonical_memory=dict(canonical_memory),
-                )
-                for agent_name, runner in self._agent_runners.items()
-            }
+            # ビューの元の dict はこのユースケースだけが持ち、ターン中は書き換えない。
+            memory_view = MappingProxyType(canonical_memory)
+            agent_responses = self._run_agents(query, memory_view)
 
             judge_result = self._judge_evaluator.evaluate_turn(
                 query=query,
-                canonical_memory=dict(canonical_memory),
+                canonical_memory=memory_view,
                 agent_responses=agent_responses,
             )
             self._validate_judge_result(
@@ -90,6 +132,70 @@ class LiveMultiAgentEvaluationUseCase:
             final_canonical_memory=canonical_memory,
         )
 
+    def _run_agents(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> dict[str, AgentTurnResponse]:
+        """全エージェントの 1 ターンを実行し、`agent_runners` の順に応答を返す。"""
+        if self._executor is None:
+            return {
+                agent_name: runner.run_turn(query=query, canonical_memory=canonical_memory)
+                for agent_name, runner in self._agent_runners.items()
+            }
+
+        calls = {
+            agent_name: _AgentCall(runner, query, canonical_memory, self._clock)
+            for agent_name, runner in self._agent_runners.items()
+        }
+        futures = {
+            agent_name: self._executor.submit(call.run) for agent_name, call in calls.items()
+        }
+        try:
+            # 完了順ではなく登録順に待つため、応答の並びは実行時間に左右されない。
+            return {
+                agent_name: self._await_agent(agent_name, query, calls[agent_name], future)
+                for agent_name, future in futures.items()
+            }
+        except BaseException as exc:
+            for future in futures.values():
+                future.cancel()
+            if isinstance(exc, AgentRunTimeoutError):
+                # 制限時間を過ぎた呼び出しは枠を占有したまま走り続けるので、古いプールは
+                # 見捨てて作り直す（古いスレッドは呼び出しが返った時点で終わる）。
+                stale_executor, self._executor = self._executor, self._new_executor()
+                stale_executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def _await_agent(
+        self,
+        agent_name: str,
+        query: EvaluationTurnQuery,
+        call: _AgentCall,
+        future: Future[AgentTurnResponse],
+    ) -> AgentTurnResponse:
+        timeout_seconds = self._agent_timeout_seconds
+        if timeout_seconds is None:
+            return future.result()
+        # 先に並んだエージェントが枠を空けるまでは待ち時間に数えない。登録順に待つので、
+        # ここに来た時点で先のエージェントは終わっており、開始待ちも制限時間で打ち切れる。
+        if not call.started.wait(timeout_seconds):
+            future.cancel()
+            raise AgentRunTimeoutError(
+                f"エージェント {agent_name} の実行が {timeout_seconds} 秒以内に始まりませんでした。"
+                f" turn_id={query.turn_id}"
+            )
+        remaining = call.started_at + timeout_seconds - self._clock()
+        try:
+            return future.result(timeout=max(remaining, 0.0))
+        except TimeoutError:
+            if not future.done():
+                raise AgentRunTimeoutError(
+                    f"エージェント {agent_name} の応答が {timeout_seconds} 秒以内に返りませんでした。"
+                    f" turn_id={query.turn_id}"
+                ) from None
+            raise
+
     def _validate_judge_result(
         self,
         *,
@@ -103,3 +209,28 @@ class LiveMultiAgentEvaluationUseCase:
                 "judge の評価対象エージェント名が一致しません。"
                 f" missing={missing}, unexpected={unexpected}"
             )
+
+
+class _AgentCall:
+    """スレッドプールで実行する 1 エージェント分の呼び出しと、その開始時刻。"""
+
+    __slots__ = ("canonical_memory", "clock", "query", "runner", "started", "started_at")
+
+    def __init__(
+        self,
+        runner: AgentRunnerPort,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+        clock: Callable[[], float],
+    ) -> None:
+        self.runner = runner
+        self.query = query
+        self.canonical_memory = canonical_memory
+        self.clock = clock
+        self.started = threading.Event()
+        self.started_at = 0.0
+
+    def run(self) -> AgentTurnResponse:
+        self.started_at = self.clock()
+        self.started.set()
+        return self.runner.run_turn(query=self.query, canonical_memory=self.canonical_memory)
@@ -0,0 +1,79 @@
+"""連続する CCS 間のフィールド単位差分を計算・適用する。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any
+
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+type CCSFieldValue = str | tuple[str, ...]
+
+CCS_FIELD_NAMES: tuple[str, ...] = CompressedCognitiveState.__slots__
+CCS_TUPLE_FIELD_NAMES: frozenset[str] = frozenset(
+    name
+    for name in CCS_FIELD_NAMES
+    if isinstance(getattr(CompressedCognitiveState.empty(), name), tuple)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CCSDelta:
+    """前状態から値が変わったフィールドだけを CCS の定義順に保持する差分。"""
+
+    changes: tuple[tuple[str, CCSFieldValue], ...] = ()
+
+    def __post_init__(self) -> None:
+        """フィールド名・順序・値の型を検証する。"""
+        previous_index = -1
+        for name, value in self.changes:
+            if name not in CCS_FIELD_NAMES:
+                raise ValueError(f"未知の CCS フィールドです: {name}")
+            index = CCS_FIELD_NAMES.index(name)
+            if index <= previous_index:
+                raise ValueError("changes は CCS の定義順かつ重複なしである必要があります。")
+            previous_index = index
+            expected_type = tuple if name in CCS_TUPLE_FIELD_NAMES else str
+            if not isinstance(value, expected_type):
+                raise ValueError(f"{name} の値の型が不正です。")
+
+    @property
+    def changed_fields(self) -> tuple[str, ...]:
+        """変化したフィールド名を返す。"""
+        return tuple(name for name, _ in self.changes)
+
+    @property
+    def is_empty(self) -> bool:
+        """変化がないかを返す。"""
+        return not self.changes
+
+
+def diff_ccs(
+    previous: CompressedCognitiveState,
+    current: CompressedCognitiveState,
+) -> CCSDelta:
+    """`previous` から `current` への差分を返す。
+
+    構造共有済みの CCS では不変フィールドが同一オブジェクトなので、多くは同一性判定で済む。
+    """
+    if previous is current:
+        return CCSDelta()
+    changes: list[tuple[str, CCSFieldValue]] = []
+    for name in CCS_FIELD_NAMES:
+        value: CCSFieldValue = getattr(current, name)
+        previous_value = getattr(previous, name)
+        if value is previous_value or value == previous_value:
+            continue
+        changes.append((name, value))
+    return CCSDelta(changes=tuple(changes))
+
+
+def apply_ccs_delta(
+    base: CompressedCognitiveState,
+    delta: CCSDelta,
+) -> CompressedCognitiveState:
+    """`base` に差分を適用した CCS を返す。差分が空なら `base` をそのまま返す。"""
+    if delta.is_empty:
+        return base
+    changes: dict[str, Any] = dict(delta.changes)
+    return replace(base, **changes)
@@ -0,0 +1,127 @@
+"""CCS フィールド値のインターンと前状態との構造共有を提供する。"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+_FIELD_NAMES: tuple[str, ...] = CompressedCognitiveState.__slots__
+
+
+class CCSValueInterner:
+    """CCS の文字列と文字列タプルをセッション横断で共有する。
+
+    文字列・タプルともに上限つき LRU 表で同値の既存オブジェクトへ寄せる。
+    `sys.intern` は CPython 3.12 では登録した文字列を解放しないため使わない。
+    表は参照を保持するだけなので、上限を超えた古い値は通常の GC に任される。
+    """
+
+    def __init__(self, *, max_tuples: int = 8192, max_texts: int = 65536) -> None:
+        """タプル表と文字列表の上限件数を受け取る。"""
+        if max_tuples < 1:
+            raise ValueError("max_tuples は 1 以上である必要があります。")
+        if max_texts < 1:
+            raise ValueError("max_texts は 1 以上である必要があります。")
+        self._max_tuples = max_tuples
+        self._max_texts = max_texts
+        self._lock = threading.Lock()
+        self._tuples: OrderedDict[tuple[str, ...], tuple[str, ...]] = OrderedDict()
+        self._texts: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        """保持中のタプル件数を返す。"""
+        with self._lock:
+            return len(self._tuples)
+
+    def intern_text(self, value: str) -> str:
+        """同値の共有文字列を返す。"""
+        with self._lock:
+            return self._intern_text_locked(value)
+
+    def intern_texts(self, values: tuple[str, ...]) -> tuple[str, ...]:
+        """同値の共有タプルを返す。未登録なら要素を共有文字列にして登録する。"""
+        if not values:
+            return ()
+        with self._lock:
+            cached = self._tuples.get(values)
+            if cached is not None:
+                self._tuples.move_to_end(values)
+                return cached
+            interned = tuple(self._intern_text_locked(value) for value in values)
+            cached = self._tuples.setdefault(interned, interned)
+            self._tuples.move_to_end(interned)
+            while len(self._tuples) > self._max_tuples:
+                self._tuples.popitem(last=False)
+        return cached
+
+    def _intern_text_locked(self, value: str) -> str:
+        cached = self._texts.get(value)
+        if cached is not None:
+            self._texts.move_to_end(value)
+            return cached
+        self._texts[value] = value
+        if len(self._texts) > self._max_texts:
+            self._texts.popitem(last=False)
+        return value
+
+    def share(
+        self,
+        state: CompressedCognitiveState,
+        *,
+        previous: CompressedCognitiveState | None = None,
+    ) -> CompressedCognitiveState:
+        """変化のないフィールドは前状態のオブジェクトを再利用し、残りをインターンする。
+
+        全フィールドが前状態と同値なら前状態そのものを返す。
+        """
+        if previous is None:
+            return CompressedCognitiveState(
+                episodic_trace=self.intern_texts(state.episodic_trace),
+                semantic_gist=self.intern_text(state.semantic_gist),
+                focal_entities=self.intern_texts(state.focal_entities),
+                relational_map=self.intern_texts(state.relational_map),
+                goal_orientation=self.intern_text(state.goal_orientation),
+                constraints=self.intern_texts(state.constraints),
+                predictive_cue=self.intern_texts(state.predictive_cue),
+                uncertainty_signal=self.intern_text(state.uncertainty_signal),
+                retrieved_artifacts=self.intern_texts(state.retrieved_artifacts),
+            )
+        shared = CompressedCognitiveState(
+            episodic_trace=self._share_texts(state.episodic_trace, previous.episodic_trace),
+            semantic_gist=self._share_text(state.semantic_gist, previous.semantic_gist),
+            focal_entities=self._share_texts(state.focal_entities, previous.focal_entities),
+            relational_map=self._share_texts(state.relational_map, previous.relational_map),
+            goal_orientation=self._share_text(state.goal_orientation, previous.goal_orientation),
+            constraints=self._share_texts(state.constraints, previous.constraints),
+            predictive_cue=self._share_texts(state.predictive_cue, previous.predictive_cue),
+            uncertainty_signal=self._share_text(
+                state.uncertainty_signal,
+                previous.uncertainty_signal,
+            ),
+            retrieved_artifacts=self._share_texts(
+                state.retrieved_artifacts,
+                previous.retrieved_artifacts,
+            ),
+        )
+        if all(getattr(shared, name) is getattr(previous, name) for name in _FIELD_NAMES):
+            return previous
+        return shared
+
+    def _share_texts(
+        self,
+        value: tuple[str, ...],
+        previous_value: tuple[str, ...],
+    ) -> tuple[str, ...]:
+        if value is previous_value or value == previous_value:
+            return previous_value
+        return self.intern_texts(value)
+
+    def _share_text(self, value: str, previous_value: str) -> str:
+        if value == previous_value:
+            return previous_value
+        return self.intern_text(value)
+
+
+DEFAULT_CCS_INTERNER = CCSValueInterner()
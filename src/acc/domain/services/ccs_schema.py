@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Literal
 
+from acc.domain.services.ccs_interning import DEFAULT_CCS_INTERNER
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 
 REQUIRED_FIELDS: tuple[str, ...] = (
@@ -18,6 +21,8 @@ REQUIRED_FIELDS: tuple[str, ...] = (
     "retrieved_artifacts",
 )
 
+_REQUIRED_FIELD_SET: frozenset[str] = frozenset(REQUIRED_FIELDS)
+
 DEFAULT_LIST_LIMITS: Mapping[str, int] = {
     "episodic_trace": 3,
     "focal_entities": 8,
@@ -28,74 +33,236 @@ DEFAULT_LIST_LIMITS: Mapping[str, int] = {
 }
 
 
+CCS_REPAIR_MODES: tuple[str, ...] = ("strict", "lenient")
+
+type CCSRepairAction = Literal["coerced_scalar", "dropped_item", "filled_from_previous"]
+
+
 class CCSValidationError(ValueError):
     """CCS スキーマ違反を表す例外。"""
 
 
+@dataclass(frozen=True, slots=True)
+class CCSRepair:
+    """`repair_ccs_list_fields` が 1 フィールドに加えた補修。`count` は対象の要素数。"""
+
+    field_name: str
+    action: CCSRepairAction
+    count: int = 1
+
+
+class CCSValidator:
+    """配列上限を事前に解決しておき、CCS payload を検証して CCS へ変換する検証器。
+
+    `parse_and_validate_ccs_payload` と同じ規則・同じエラーメッセージで検証する。
+    フィールドごとの処理は展開して書き、典型的な入力（`list` / `tuple` の `str` 配列）は
+    中間リストを作らずに正規化する。型違いの入力は汎用の正規化に回し、
+    エラーメッセージをそちらに揃える。
+    """
+
+    __slots__ = (
+        "_constraints_limit",
+        "_episodic_trace_limit",
+        "_field_limits",
+        "_focal_entities_limit",
+        "_predictive_cue_limit",
+        "_relational_map_limit",
+        "_retrieved_artifacts_limit",
+    )
+
+    def __init__(self, list_limits: Mapping[str, int] | None = None) -> None:
+        """`DEFAULT_LIST_LIMITS` に `list_limits` を重ねた配列上限を解決する。"""
+        merged_limits = _merge_list_limits(list_limits)
+        self._field_limits = merged_limits
+        self._episodic_trace_limit = merged_limits["episodic_trace"]
+        self._focal_entities_limit = merged_limits["focal_entities"]
+        self._relational_map_limit = merged_limits["relational_map"]
+        self._constraints_limit = merged_limits["constraints"]
+        self._predictive_cue_limit = merged_limits["predictive_cue"]
+        self._retrieved_artifacts_limit = merged_limits["retrieved_artifacts"]
+
+    def validate(
+        self,
+        payload: Mapping[str, object],
+        *,
+        previous_state: CompressedCognitiveState | None = None,
+        share: bool = True,
+    ) -> CompressedCognitiveState:
+        """モデル出力 payload を検証して CCS へ変換する。
+
+        `previous_state` を渡すと、値が変わらないフィールドは前状態のオブジェクトを再利用する。
+        `share=False` では構造共有（インターン）を省く。CCS を保持しない検証だけの用途向け。
+        """
+        if not _REQUIRED_FIELD_SET <= payload.keys():
+            _validate_required_fields(payload)
+
+        state = CompressedCognitiveState(
+            episodic_trace=_fast_string_sequence(
+                payload["episodic_trace"], "episodic_trace", self._episodic_trace_limit
+            ),
+            semantic_gist=_fast_non_empty_string(payload["semantic_gist"], "semantic_gist"),
+            focal_entities=_fast_string_sequence(
+                payload["focal_entities"], "focal_entities", self._focal_entities_limit
+            ),
+            relational_map=_fast_string_sequence(
+                payload["relational_map"], "relational_map", self._relational_map_limit
+            ),
+            goal_orientation=_fast_non_empty_string(
+                payload["goal_orientation"], "goal_orientation"
+            ),
+            constraints=_fast_string_sequence(
+                payload["constraints"], "constraints", self._constraints_limit
+            ),
+            predictive_cue=_fast_string_sequence(
+                payload["predictive_cue"], "predictive_cue", self._predictive_cue_limit
+            ),
+            uncertainty_signal=_fast_non_empty_string(
+                payload["uncertainty_signal"], "uncertainty_signal"
+            ),
+            retrieved_artifacts=_fast_string_sequence(
+                payload["retrieved_artifacts"],
+                "retrieved_artifacts",
+                self._retrieved_artifacts_limit,
+            ),
+        )
+        if not share:
+            return state
+        return DEFAULT_CCS_INTERNER.share(state, previous=previous_state)
+
+    def validate_field(self, field_name: str, value: object) -> None:
+        """CCS payload の 1 フィールドだけを先行検証する（`validate_ccs_field` と同じ規則）。"""
+        if field_name not in REQUIRED_FIELDS:
+            return
+        limit = self._field_limits.get(field_name)
+        if limit is not None:
+            _fast_string_sequence(value, field_name, limit)
+        elif not isinstance(value, str):
+            raise CCSValidationError(f"{field_name} は文字列である必要があります。")
+
+
+def build_ccs_validator(list_limits: Mapping[str, int] | None = None) -> CCSValidator:
+    """配列上限を解決済みの `CCSValidator` を返す。上限が既定どおりなら共有の検証器を返す。"""
+    if not list_limits:
+        return _DEFAULT_VALIDATOR
+    return CCSValidator(list_limits)
+
+
 def parse_and_validate_ccs_payload(
     payload: Mapping[str, object],
     *,
     list_limits: Mapping[str, int] | None = None,
+    previous_state: CompressedCognitiveState | None = None,
 ) -> CompressedCognitiveState:
-    """モデル出力 payload を検証して CCS へ変換する。"""
-    _validate_required_fields(payload)
+    """モデル出力 payload を検証して CCS へ変換する。
+
+    `previous_state` を渡すと、値が変わらないフィールドは前状態のオブジェクトを再利用する。
+    同じ配列上限で繰り返し検証する場合は `build_ccs_validator` の検証器を使い回す。
+    """
+    return build_ccs_validator(list_limits).validate(payload, previous_state=previous_state)
+
+
+def build_ccs_json_schema(list_limits: Mapping[str, int] | None = None) -> dict[str, object]:
+    """CCS payload の JSON Schema（structured output の strict モード互換）を返す。
+
+    配列フィールドは `DEFAULT_LIST_LIMITS`（`list_limits` で上書き）を `maxItems` にする。
+    空文字の禁止はスキーマでは表さず、`parse_and_validate_ccs_payload` で検証する。
+    """
+    merged_limits = _merge_list_limits(list_limits)
+    properties: dict[str, object] = {
+        field: (
+            {"type": "array", "items": {"type": "string"}, "maxItems": merged_limits[field]}
+            if field in merged_limits
+            else {"type": "string"}
+        )
+        for field in REQUIRED_FIELDS
+    }
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(REQUIRED_FIELDS),
+        "additionalProperties": False,
+    }
+
+
+def validate_ccs_field(
+    field_name: str,
+    value: object,
+    *,
+    list_limits: Mapping[str, int] | None = None,
+) -> None:
+    """CCS payload の 1 フィールドだけを先行検証する。
+
+    生成途中の payload を届いたフィールドから検証するためのもので、後段で補える
+    文字列フィールドの空文字は許す。未知のフィールドは無視する。
+    """
+    build_ccs_validator(list_limits).validate_field(field_name, value)
+
+
+def repair_ccs_list_fields(
+    payload: Mapping[str, object],
+    *,
+    previous_state: CompressedCognitiveState | None = None,
+) -> tuple[Mapping[str, object], tuple[CCSRepair, ...]]:
+    """配列フィールドの形式不正を、検証に通る形へ補修する（lenient モード）。
+
+    - スカラー値（文字列・数値・真偽値）は 1 要素の配列にする。配列内の数値・真偽値は文字列にする。
+    - 空文字・`None`・入れ子の値などの要素は捨てる。
+    - 欠落・`None`・配列でもスカラーでもない値は前状態（なければ空配列）で埋める。
+
+    補修が不要なら `payload` をそのまま返す。文字列フィールドと上限の切り詰めは扱わない。
+    """
+    repaired: dict[str, object] | None = None
+    repairs: list[CCSRepair] = []
+    for field_name in DEFAULT_LIST_LIMITS:
+        value = payload.get(field_name)
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            if all(isinstance(item, str) and item.strip() for item in value):
+                continue
+            kept: list[str] = []
+            coerced = 0
+            for item in value:
+                text = _scalar_text(item)
+                if text is None or not text.strip():
+                    continue
+                if not isinstance(item, str):
+                    coerced += 1
+                kept.append(text)
+            if coerced:
+                repairs.append(CCSRepair(field_name, "coerced_scalar", coerced))
+            if dropped := len(value) - len(kept):
+                repairs.append(CCSRepair(field_name, "dropped_item", dropped))
+            replacement: list[str] = kept
+        elif (text := _scalar_text(value)) is not None:
+            replacement = [text] if text.strip() else []
+            repairs.append(
+                CCSRepair(field_name, "coerced_scalar" if text.strip() else "dropped_item")
+            )
+        else:
+            previous_items = getattr(previous_state, field_name) if previous_state else ()
+            replacement = list(previous_items)
+            repairs.append(CCSRepair(field_name, "filled_from_previous"))
+        if repaired is None:
+            repaired = dict(payload)
+        repaired[field_name] = replacement
+    if repaired is None:
+        return payload, ()
+    return repaired, tuple(repairs)
+
+
+def _scalar_text(value: object) -> str | None:
+    """文字列・数値・真偽値を文字列で返す。それ以外は None。"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool | int | float):
+        return str(value).lower() if isinstance(value, bool) else str(value)
+    return None
+
+
+def _merge_list_limits(list_limits: Mapping[str, int] | None) -> dict[str, int]:
     merged_limits = dict(DEFAULT_LIST_LIMITS)
     if list_limits:
         merged_limits.update(list_limits)
-
-    episodic_trace = _normalize_string_sequence(
-        payload["episodic_trace"],
-        field_name="episodic_trace",
-        limit=merged_limits["episodic_trace"],
-    )
-    semantic_gist = _normalize_non_empty_string(
-        payload["semantic_gist"], field_name="semantic_gist"
-    )
-    focal_entities = _normalize_string_sequence(
-        payload["focal_entities"],
-        field_name="focal_entities",
-        limit=merged_limits["focal_entities"],
-    )
-    relational_map = _normalize_string_sequence(
-        payload["relational_map"],
-        field_name="relational_map",
-        limit=merged_limits["relational_map"],
-    )
-    goal_orientation = _normalize_non_empty_string(
-        payload["goal_orientation"],
-        field_name="goal_orientation",
-    )
-    constraints = _normalize_string_sequence(
-        payload["constraints"],
-        field_name="constraints",
-        limit=merged_limits["constraints"],
-    )
-    predictive_cue = _normalize_string_sequence(
-        payload["predictive_cue"],
-        field_name="predictive_cue",
-        limit=merged_limits["predictive_cue"],
-    )
-    uncertainty_signal = _normalize_non_empty_string(
-        payload["uncertainty_signal"],
-        field_name="uncertainty_signal",
-    )
-    retrieved_artifacts = _normalize_string_sequence(
-        payload["retrieved_artifacts"],
-        field_name="retrieved_artifacts",
-        limit=merged_limits["retrieved_artifacts"],
-    )
-
-    return CompressedCognitiveState(
-        episodic_trace=episodic_trace,
-        semantic_gist=semantic_gist,
-        focal_entities=focal_entities,
-        relational_map=relational_map,
-        goal_orientation=goal_orientation,
-        constraints=constraints,
-        predictive_cue=predictive_cue,
-        uncertainty_signal=uncertainty_signal,
-        retrieved_artifacts=retrieved_artifacts,
-    )
+    return merged_limits
 
 
 def _validate_required_fields(payload: Mapping[str, object]) -> None:
@@ -114,6 +281,30 @@ def _normalize_non_empty_string(value: object, *, field_name: str) -> str:
     return normalized
 
 
+def _fast_non_empty_string(value: object, field_name: str) -> str:
+    if type(value) is str:
+        normalized = value.strip()
+        if normalized:
+            return normalized
+    return _normalize_non_empty_string(value, field_name=field_name)
+
+
+def _fast_string_sequence(value: object, field_name: str, limit: int) -> tuple[str, ...]:
+    """`list` / `tuple` の `str` 配列を正規化する。それ以外の型を含む入力は汎用の正規化に回す。"""
+    if (type(value) is list or type(value) is tuple) and limit >= 1:
+        head = value if len(value) <= limit else value[:limit]
+        try:
+            # `str.strip` は `str` 以外の要素で TypeError になるので、型検査も C 側で済む。
+            normalized = tuple(map(str.strip, head))
+        except TypeError:
+            pass
+        else:
+            if "" not in normalized:
+                return normalized
+            raise CCSValidationError(f"{field_name}[{normalized.index('')}] は空文字にできません。")
+    return _normalize_string_sequence(value, field_name=field_name, limit=limit)
+
+
 def _normalize_string_sequence(value: object, *, field_name: str, limit: int) -> tuple[str, ...]:
     if isinstance(value, str) or not isinstance(value, Sequence):
         raise CCSValidationError(f"{field_name} は文字列配列である必要があります。")
@@ -132,3 +323,6 @@ def _normalize_string_sequence(value: object, *, field_name: str, limit: int) ->
             break
 
     return tuple(normalized_values)
+
+
+_DEFAULT_VALIDATOR = CCSValidator()
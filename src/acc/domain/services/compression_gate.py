@@ -0,0 +1,360 @@
+"""圧縮モデル呼び出しの要否を局所信号だけで判定する事前ゲートと経路選択。"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+type CompressionGateReason = Literal[
+    "initial_state",
+    "structured_signal",
+    "new_artifact",
+    "constraint_marker",
+    "uncertainty_marker",
+    "novel_content",
+    "uncounted_content",
+    "no_content",
+    "low_novelty",
+]
+type CompressionRoute = Literal["rule", "model"]
+type CompressionEscalationSignal = Literal[
+    "initial_state",
+    "new_artifact",
+    "new_entities",
+    "constraint_change",
+    "high_uncertainty",
+    "long_input",
+]
+
+# 判定順。具体的な信号を先に見て、切り替え理由の内訳を読みやすくする。
+ESCALATION_SIGNALS: tuple[CompressionEscalationSignal, ...] = (
+    "initial_state",
+    "constraint_change",
+    "high_uncertainty",
+    "new_artifact",
+    "new_entities",
+    "long_input",
+)
+# 入力に含まれると、推測や未確認の情報を扱っているとみなす表現。
+UNCERTAINTY_MARKERS: tuple[str, ...] = (
+    "不明",
+    "わから",
+    "未確認",
+    "確認できない",
+    "推測",
+    "かもしれ",
+    "不確実",
+    "?",
+    "？",
+)
+_HIGH_UNCERTAINTY_LEVELS: frozenset[str] = frozenset({"高", "high"})
+# 入力に含まれると、制約や目的の追加・変更（前言の撤回・訂正を含む）を述べているとみなす表現。
+_CONSTRAINT_MARKERS: tuple[str, ...] = (
+    "禁止",
+    "してはいけない",
+    "しないで",
+    "やめて",
+    "止めて",
+    "やっぱり",
+    "いいえ",
+    "ちがい",
+    "ちがう",
+    "違い",
+    "違う",
+    "ではなく",
+    "じゃなく",
+    "訂正",
+    "承認",
+    "必須",
+    "必ず",
+    "のみ",
+    "目的",
+    "ゴール",
+    "must",
+    "never",
+    "do not",
+    "don't",
+    "only",
+    "instead",
+)
+
+# 英数字語と、漢字・カタカナの連続（ひらがなは機能語が大半なので内容語として数えない）。
+_CONTENT_TOKEN_PATTERN = re.compile(
+    r"[A-Za-z0-9_]+(?:[.\-][A-Za-z0-9_]+)*|[ァ-ヶー一-龠々〆〤]{2,}"
+)
+# 語として現れると前の提案を断っているとみなす英語（"no" は "nginx" などに含まれるため
+# 部分一致の `_CONSTRAINT_MARKERS` ではなく内容語単位で照合する）。
+_REFUSAL_TOKENS: frozenset[str] = frozenset({"no", "nope", "nah"})
+_ACKNOWLEDGEMENT_TOKENS: frozenset[str] = frozenset(
+    {
+        "ok",
+        "okay",
+        "thanks",
+        "thank",
+        "you",
+        "thx",
+        "yes",
+        "sure",
+        "got",
+        "it",
+        "了解",
+        "承知",
+        "感謝",
+        "大丈夫",
+    }
+)
+# 内容語を含まない入力から取り除く、ひらがなの相づち・定型句。残りに文字があれば圧縮する。
+_ACKNOWLEDGEMENT_PHRASE_PATTERN = re.compile(
+    "|".join(
+        (
+            "ありがとうございます",
+            "ありがとう",
+            "よろしくおねがいします",
+            "おねがいします",
+            "よろしく",
+            "わかりました",
+            "りょうかい",
+            "どうも",
+            "はい",
+            "うん",
+            "でした",
+            "ました",
+            "です",
+            "ます",
+        )
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionGateDecision:
+    """ゲート判定結果。"""
+
+    should_compress: bool
+    reason: CompressionGateReason
+    novelty: float
+
+
+class CompressionGate:
+    """入力の新規性と資格判定済み Artifact から、CCS 更新が必要かを判定する。
+
+    判定はトークン集合と部分文字列照合だけで行い、モデルやネットワークには触れない。
+    迷う場合は圧縮する側に倒す。
+    """
+
+    def __init__(self, *, novelty_threshold: float = 0.34) -> None:
+        """新規内容語の割合がこの値以上なら圧縮する。"""
+        if not 0.0 < novelty_threshold <= 1.0:
+            raise ValueError("novelty_threshold は 0 より大きく 1 以下である必要があります。")
+        self._novelty_threshold = novelty_threshold
+
+    def evaluate(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> CompressionGateDecision:
+        """このターンで圧縮モデルを呼ぶべきかを返す。"""
+        if not committed_state.semantic_gist:
+            return CompressionGateDecision(True, "initial_state", 1.0)
+        if _has_structured_update(interaction_signal, committed_state):
+            return CompressionGateDecision(True, "structured_signal", 1.0)
+        retained_artifacts = set(committed_state.retrieved_artifacts)
+        if any(artifact.artifact_id not in retained_artifacts for artifact in qualified_artifacts):
+            return CompressionGateDecision(True, "new_artifact", 1.0)
+
+        # 制約の撤回・訂正や不確実さの表明は、内容語の多寡にかかわらず取りこぼさない。
+        user_input = interaction_signal.user_input
+        lowered = user_input.lower()
+        if _has_constraint_marker(lowered):
+            return CompressionGateDecision(True, "constraint_marker", 1.0)
+        if any(marker in user_input for marker in UNCERTAINTY_MARKERS):
+            return CompressionGateDecision(True, "uncertainty_marker", 1.0)
+
+        content_tokens = _content_tokens(user_input)
+        if not content_tokens:
+            # ひらがなだけの入力は内容語として数えられないため、相づち以外が残れば圧縮する。
+            if _has_uncounted_content(lowered):
+                return CompressionGateDecision(True, "uncounted_content", 1.0)
+            return CompressionGateDecision(False, "no_content", 0.0)
+
+        state_text = _state_text(committed_state)
+        novel_count = sum(1 for token in content_tokens if token not in state_text)
+        novelty = novel_count / len(content_tokens)
+        if novelty >= self._novelty_threshold:
+            return CompressionGateDecision(True, "novel_content", novelty)
+        return CompressionGateDecision(False, "low_novelty", novelty)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionRoutingPolicy:
+    """規則ベース圧縮からモデルへ切り替える条件。
+
+    `escalate_on` に含めた信号のどれかが立ったターンだけモデルで圧縮する。
+    """
+
+    escalate_on: frozenset[CompressionEscalationSignal] = field(
+        default_factory=lambda: frozenset(ESCALATION_SIGNALS)
+    )
+    min_new_entities: int = 2
+    max_rule_input_chars: int = 120
+
+    def __post_init__(self) -> None:
+        """未知の信号名と 1 未満の閾値を拒否する。"""
+        unknown = set(self.escalate_on) - set(ESCALATION_SIGNALS)
+        if unknown:
+            raise ValueError(f"未知の escalate_on 信号です: {', '.join(sorted(unknown))}")
+        if self.min_new_entities < 1:
+            raise ValueError("min_new_entities は 1 以上である必要があります。")
+        if self.max_rule_input_chars < 1:
+            raise ValueError("max_rule_input_chars は 1 以上である必要があります。")
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionRouteDecision:
+    """経路選択の結果。`reason` はモデルへ切り替えた信号、規則ベースなら `routine`。"""
+
+    route: CompressionRoute
+    reason: CompressionEscalationSignal | Literal["routine"]
+
+
+class CompressionRouter:
+    """入力と現 CCS の局所信号から、規則ベース圧縮で足りるかを判定する。
+
+    `CompressionGate` と同じくトークン集合と部分文字列照合だけで判定する。
+    規則ベース圧縮は入力を要約して構造化フィールドを引き継ぐだけなので、
+    内容の解釈が要る信号が立ったターンをモデルへ回す。
+    """
+
+    def __init__(self, policy: CompressionRoutingPolicy | None = None) -> None:
+        """切り替え条件を受け取る。未指定なら全信号で切り替える。"""
+        self._policy = policy or CompressionRoutingPolicy()
+
+    @property
+    def policy(self) -> CompressionRoutingPolicy:
+        """切り替え条件を返す。"""
+        return self._policy
+
+    def evaluate(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> CompressionRouteDecision:
+        """このターンをどちらの圧縮経路で処理するかを返す。"""
+        for signal_name in ESCALATION_SIGNALS:
+            if signal_name in self._policy.escalate_on and self._fires(
+                signal_name,
+                interaction_signal,
+                committed_state,
+                qualified_artifacts,
+            ):
+                return CompressionRouteDecision("model", signal_name)
+        return CompressionRouteDecision("rule", "routine")
+
+    def _fires(
+        self,
+        signal_name: CompressionEscalationSignal,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> bool:
+        user_input = interaction_signal.user_input
+        if signal_name == "initial_state":
+            return not committed_state.semantic_gist
+        if signal_name == "new_artifact":
+            retained_artifacts = set(committed_state.retrieved_artifacts)
+            return any(
+                artifact.artifact_id not in retained_artifacts for artifact in qualified_artifacts
+            )
+        if signal_name == "new_entities":
+            new_entities = set(interaction_signal.focus_entities) - set(
+                committed_state.focal_entities
+            )
+            state_text = _state_text(committed_state)
+            new_entities.update(
+                token for token in _content_tokens(user_input) if token not in state_text
+            )
+            return len(new_entities) >= self._policy.min_new_entities
+        if signal_name == "constraint_change":
+            lowered = user_input.lower()
+            return (
+                bool(
+                    interaction_signal.active_goal
+                    and interaction_signal.active_goal != committed_state.goal_orientation
+                )
+                or bool(
+                    set(interaction_signal.active_constraints) - set(committed_state.constraints)
+                )
+                or _has_constraint_marker(lowered)
+            )
+        if signal_name == "high_uncertainty":
+            return committed_state.uncertainty_signal.lower() in _HIGH_UNCERTAINTY_LEVELS or any(
+                marker in user_input for marker in UNCERTAINTY_MARKERS
+            )
+        return len(user_input) > self._policy.max_rule_input_chars
+
+
+def _has_constraint_marker(lowered_text: str) -> bool:
+    """制約・訂正の表現か、断りの英単語（"no" など）を含むかを返す。"""
+    if any(marker in lowered_text for marker in _CONSTRAINT_MARKERS):
+        return True
+    return not _REFUSAL_TOKENS.isdisjoint(_CONTENT_TOKEN_PATTERN.findall(lowered_text))
+
+
+def _content_tokens(text: str) -> set[str]:
+    """挨拶・相づちを除いた内容語を小文字で返す。"""
+    return {
+        token
+        for token in (match.lower() for match in _CONTENT_TOKEN_PATTERN.findall(text))
+        if token not in _ACKNOWLEDGEMENT_TOKENS
+    }
+
+
+def _has_uncounted_content(lowered_text: str) -> bool:
+    """相づち語・定型句・記号・空白を除いて文字が残るかを返す。
+
+    内容語が 1 つもない入力に対して使うため、トークンとして一致した語はすべて相づち語。
+    """
+    residual = _CONTENT_TOKEN_PATTERN.sub("", lowered_text)
+    residual = _ACKNOWLEDGEMENT_PHRASE_PATTERN.sub("", residual)
+    return any(character.isalnum() for character in residual)
+
+
+def _has_structured_update(
+    interaction_signal: TurnInteractionSignal,
+    committed_state: CompressedCognitiveState,
+) -> bool:
+    """入力信号の構造化フィールドが現 CCS にない値を含むかを返す。"""
+    if (
+        interaction_signal.active_goal
+        and interaction_signal.active_goal != committed_state.goal_orientation
+    ):
+        return True
+    return bool(
+        set(interaction_signal.new_facts) - set(committed_state.relational_map)
+        or set(interaction_signal.focus_entities) - set(committed_state.focal_entities)
+        or set(interaction_signal.active_constraints) - set(committed_state.constraints)
+        or set(interaction_signal.expected_next_steps) - set(committed_state.predictive_cue)
+    )
+
+
+def _state_text(committed_state: CompressedCognitiveState) -> str:
+    """部分文字列照合用に CCS の自然言語フィールドを小文字で連結する。"""
+    return "\n".join(
+        (
+            *committed_state.episodic_trace,
+            committed_state.semantic_gist,
+            *committed_state.focal_entities,
+            *committed_state.relational_map,
+            committed_state.goal_orientation,
+            *committed_state.constraints,
+            *committed_state.predictive_cue,
+        )
+    ).lower()
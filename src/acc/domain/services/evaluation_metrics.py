@@ -67,6 +67,57 @@ def summarize_agent_records(
     )
 
 
+def summarize_agent_episodes(
+    episodes: Sequence[Sequence[AgentTurnEvaluationRecord]],
+) -> AgentEvaluationSummary:
+    """単一エージェントの複数 episode の評価を集計する。
+
+    平均・標準偏差は全 episode の全ターンをまとめて計算する。ターンごとの系列
+    （`*_turn_rates` / `memory_tokens_by_turn`）は turn_id ごとに episode 間で平均し、
+    turn_id の昇順に並べる。`memory_tokens_by_turn` は平均を丸めた整数。
+    """
+    if not episodes or any(not records for records in episodes):
+        raise ValueError("episodes は 1 件以上、各 episode は 1 ターン以上必要です。")
+
+    records = [record for episode in episodes for record in episode]
+    outcome_mean, outcome_std = _summarize_outcomes([record.outcome_scores for record in records])
+    hallucination_by_turn: dict[int, list[float]] = {}
+    drift_by_turn: dict[int, list[float]] = {}
+    memory_by_turn: dict[int, list[int]] = {}
+    for record in records:
+        hallucination_by_turn.setdefault(record.turn_id, []).append(
+            calculate_hallucination_turn_rate(record.hallucination_audit)
+        )
+        memory_by_turn.setdefault(record.turn_id, []).append(record.memory_tokens)
+        if record.turn_id >= 2 and record.drift_audit is not None:
+            drift_by_turn.setdefault(record.turn_id, []).append(
+                calculate_drift_turn_rate(record.drift_audit)
+            )
+
+    all_drift_rates = [rate for rates in drift_by_turn.values() for rate in rates]
+    memory_tokens_by_turn = tuple(
+        round(_safe_mean(memory_by_turn[turn_id])) for turn_id in sorted(memory_by_turn)
+    )
+    return AgentEvaluationSummary(
+        total_turns=len(records),
+        outcome_mean=outcome_mean,
+        outcome_std=outcome_std,
+        hallucination_turn_rates=tuple(
+            _safe_mean(hallucination_by_turn[turn_id]) for turn_id in sorted(hallucination_by_turn)
+        ),
+        hallucination_average=_safe_mean(
+            [rate for rates in hallucination_by_turn.values() for rate in rates]
+        ),
+        drift_turn_rates=tuple(
+            _safe_mean(drift_by_turn[turn_id]) for turn_id in sorted(drift_by_turn)
+        ),
+        drift_average=_safe_mean(all_drift_rates) if all_drift_rates else None,
+        memory_tokens_by_turn=memory_tokens_by_turn,
+        memory_average=_safe_mean([record.memory_tokens for record in records]),
+        memory_last_turn=memory_tokens_by_turn[-1],
+    )
+
+
 def _summarize_outcomes(scores: Sequence[OutcomeScores]) -> tuple[OutcomeScores, OutcomeScores]:
     relevance_values = [score.relevance for score in scores]
     answer_quality_values = [score.answer_quality for score in scores]
@@ -0,0 +1,27 @@
+"""永続化するチャットセッション状態の値オブジェクト。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """セッション再開に必要な CCS・ターン番号・短期対話バッファ。"""
+
+    committed_state: CompressedCognitiveState
+    turn_id: int
+    recent_dialogue_turns: tuple[RecentDialogueTurn, ...] = ()
+
+    def __post_init__(self) -> None:
+        """最低限の整合性を検証する。"""
+        if self.turn_id < 0:
+            raise ValueError("turn_id は 0 以上である必要があります。")
+
+    @classmethod
+    def initial(cls) -> SessionSnapshot:
+        """作成直後のセッション状態を返す。"""
+        return cls(committed_state=CompressedCognitiveState.empty(), turn_id=0)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Protocol
 
 from acc.domain.entities.interaction import (
@@ -25,3 +25,35 @@ class AgentPolicyPort(Protocol):
         tools: Sequence[str],
     ) -> AgentDecision:
         """最新入力・短期対話・状態・役割・利用可能ツールを受けて結果を返す。"""
+
+
+class StreamingAgentPolicyPort(Protocol):
+    """コミット済み CCS から応答テキストを逐次生成する抽象ポート。"""
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        """`decide` と同じ入力を受け、応答テキストの差分を生成順に返す。
+
+        差分を連結したものが `decide` の `response` に相当する。イテレータを途中で
+        閉じた場合は上流の生成も打ち切る。
+        """
+
+
+class AsyncAgentPolicyPort(Protocol):
+    """コミット済み CCS から応答を非同期に生成する抽象ポート。"""
+
+    async def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        """最新入力・短期対話・状態・役割・利用可能ツールを受けて結果を返す。"""
@@ -20,3 +20,15 @@ class CognitiveCompressorModelPort(Protocol):
         qualified_artifacts: Sequence[Artifact],
     ) -> Mapping[str, object]:
         """次の CCS payload を返す。"""
+
+
+class AsyncCognitiveCompressorModelPort(Protocol):
+    """CCS payload を非同期に生成するモデル呼び出し抽象ポート。"""
+
+    async def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        """次の CCS payload を返す。"""
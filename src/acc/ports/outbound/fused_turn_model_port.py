@@ -0,0 +1,28 @@
+"""CCS 更新と応答生成を 1 回で行うモデル呼び出しの契約。"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Protocol
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+class FusedTurnModelPort(Protocol):
+    """次の CCS payload と応答文を 1 回の呼び出しで生成する抽象ポート。"""
+
+    def generate_fused_turn_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> Mapping[str, object]:
+        """`next_state`（CCS payload）と `response`（応答文）を持つ payload を返す。
+
+        応答が JSON object として読めない場合は `FusedTurnRejectedError` を送出する。
+        """
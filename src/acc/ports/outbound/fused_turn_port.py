@@ -0,0 +1,36 @@
+"""CCS コミットと応答生成を 1 回で行うターン実行の契約。"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import (
+    AgentDecision,
+    RecentDialogueTurn,
+    TurnInteractionSignal,
+)
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+class FusedTurnRejectedError(RuntimeError):
+    """1 回呼び出しの結果を採用できず、2 回呼び出しに戻すべきことを表す例外。"""
+
+
+class FusedTurnPort(Protocol):
+    """次の CCS と応答を 1 回のモデル呼び出しで確定する抽象ポート。"""
+
+    def commit_fused_turn(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> tuple[CompressedCognitiveState, AgentDecision]:
+        """検証済みの次状態と応答を返す。
+
+        モデル出力がスキーマを満たさない場合は `FusedTurnRejectedError` を送出する。
+        """
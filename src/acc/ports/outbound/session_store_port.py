@@ -0,0 +1,34 @@
+"""チャットセッション状態の外部保存契約。"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+
+
+class SessionStoreConflictError(RuntimeError):
+    """保存済みの turn_id が期待値と異なり、保存しなかったことを表す例外。"""
+
+
+class SessionStorePort(Protocol):
+    """プロセス外にセッション状態を保存する抽象ポート。"""
+
+    def load(self, session_id: str) -> SessionSnapshot | None:
+        """保存済みセッション状態を返す。未保存なら None を返す。"""
+
+    def save(
+        self,
+        session_id: str,
+        snapshot: SessionSnapshot,
+        *,
+        expected_turn_id: int | None = None,
+    ) -> None:
+        """セッション状態を保存する。
+
+        `expected_turn_id` を指定すると、保存済みの turn_id が一致する場合だけ不可分に
+        書き換える（compare-and-set）。一致しない・未保存なら `SessionStoreConflictError`。
+        """
+
+    def delete(self, session_id: str) -> None:
+        """セッション状態を削除する。"""
@@ -0,0 +1,12 @@
+"""Token 数計測の契約。"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class TokenCounterPort(Protocol):
+    """テキストの token 数を返す抽象ポート。"""
+
+    def count_tokens(self, text: str) -> int:
+        """テキストの token 数を返す。"""
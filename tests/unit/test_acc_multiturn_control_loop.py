@@ -1,3 +1,4 @@
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime, timedelta
 
 from acc.adapters.outbound.in_memory_acc_components import (
@@ -10,7 +11,7 @@ from acc.adapters.outbound.in_memory_acc_components import (
 )
 from acc.application.use_cases.acc_multiturn_control_loop import ACCMultiturnControlLoop
 from acc.domain.entities.artifact import Artifact
-from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 
 
@@ -151,3 +152,51 @@ def test_recall_supports_japanese_overlap_and_skips_zero_overlap_backfill() -> N
     )
 
     assert tuple(artifact.artifact_id for artifact in recalled) == ("artifact-jp-related",)
+
+
+class _WordStreamingPolicyAdapter:
+    """入力を単語ごとの差分として返すテスト用 policy。"""
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        del recent_dialogue_turns, committed_state, role, tools
+        for word in interaction_signal.user_input.split():
+            yield f"{word} "
+
+
+def test_stream_turn_persists_evidence_only_after_the_stream_is_read_to_the_end() -> None:
+    memory = InMemoryArtifactMemory()
+    loop = ACCMultiturnControlLoop(
+        artifact_recall=InMemoryArtifactRecallAdapter(memory),
+        artifact_qualification=TokenOverlapQualificationAdapter(),
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=EchoAgentPolicyAdapter(),
+        evidence_store=InMemoryEvidenceStoreAdapter(memory),
+        streaming_agent_policy=_WordStreamingPolicyAdapter(),
+    )
+    signal = TurnInteractionSignal(turn_id=1, user_input="check upstream latency first")
+
+    abandoned = loop.stream_turn(signal, CompressedCognitiveState.empty())
+    assert next(abandoned) == "check "
+    abandoned.close()
+    assert memory.turn_records == ()
+
+    stream = loop.stream_turn(signal, CompressedCognitiveState.empty())
+    deltas: list[str] = []
+    while True:
+        try:
+            deltas.append(next(stream))
+        except StopIteration as finished:
+            result = finished.value
+            break
+
+    assert deltas == ["check ", "upstream ", "latency ", "first "]
+    assert result.decision.response == "check upstream latency first"
+    assert result.committed_state.semantic_gist
+    assert len(memory.turn_records) == 1
@@ -1,9 +1,16 @@
 import pytest
 
+from acc.application.services import columnar_evaluation_summary
+from acc.application.services.columnar_evaluation_summary import (
+    ColumnarBackendUnavailableError,
+    build_agent_records_summarizer,
+    summarize_agent_records_columnar,
+)
 from acc.application.use_cases.agent_judge_evaluation import AgentJudgeEvaluationUseCase
 from acc.domain.services.evaluation_metrics import (
     calculate_drift_turn_rate,
     calculate_hallucination_turn_rate,
+    summarize_agent_episodes,
     summarize_agent_records,
 )
 from acc.domain.value_objects.evaluation import (
@@ -95,6 +102,26 @@ def test_summarize_agent_records_matches_formula_definitions() -> None:
     assert summary.outcome_std.coherence == pytest.approx(0.8164965809)
 
 
+def test_summarize_agent_episodes_averages_turn_series_across_episodes() -> None:
+    first = _build_records_for_acc()
+    second = first[:2]
+
+    summary = summarize_agent_episodes((first, second))
+
+    assert summary.total_turns == 5
+    assert summary.hallucination_turn_rates == pytest.approx((0.25, 0.0, 0.5))
+    assert summary.hallucination_average == pytest.approx(0.2)
+    assert summary.drift_turn_rates == pytest.approx((0.5, 0.5))
+    assert summary.drift_average == pytest.approx(0.5)
+    assert summary.memory_tokens_by_turn == (100, 80, 60)
+    assert summary.memory_average == pytest.approx(84.0)
+    assert summary.memory_last_turn == 60
+    assert summary.outcome_mean.relevance == pytest.approx(8.2)
+    assert summarize_agent_episodes((first,)) == summarize_agent_records(first)
+    with pytest.raises(ValueError, match="episodes"):
+        summarize_agent_episodes((first, ()))
+
+
 def test_turn_rate_helpers_handle_zero_division_guards() -> None:
     hallucination_rate = calculate_hallucination_turn_rate(
         HallucinationAudit(
@@ -147,3 +174,48 @@ def test_use_case_summarizes_multiple_agents_independently() -> None:
     assert summaries["acc"].total_turns == 3
     assert summaries["acc"].memory_last_turn == 60
     assert summaries["acc"].hallucination_average == pytest.approx(0.25)
+
+
+def test_columnar_summary_matches_python_summary_within_float_tolerance() -> None:
+    pytest.importorskip("numpy")
+    acc_records = _build_records_for_acc()
+    # turn_id の順が崩れた入力と、drift 監査が 1 件もない入力も確かめる。
+    shuffled = (acc_records[2], acc_records[0], acc_records[1])
+    single_turn = acc_records[:1]
+
+    for records in (acc_records, shuffled, single_turn):
+        expected = summarize_agent_records(records)
+        actual = summarize_agent_records_columnar(records)
+
+        assert actual.total_turns == expected.total_turns
+        assert actual.memory_tokens_by_turn == expected.memory_tokens_by_turn
+        assert actual.memory_last_turn == expected.memory_last_turn
+        assert actual.memory_average == pytest.approx(expected.memory_average)
+        assert actual.hallucination_turn_rates == pytest.approx(expected.hallucination_turn_rates)
+        assert actual.hallucination_average == pytest.approx(expected.hallucination_average)
+        assert actual.drift_turn_rates == pytest.approx(expected.drift_turn_rates)
+        assert actual.drift_average == pytest.approx(expected.drift_average)
+        for name in ("relevance", "answer_quality", "instruction_following", "coherence"):
+            assert getattr(actual.outcome_mean, name) == pytest.approx(
+                getattr(expected.outcome_mean, name)
+            )
+            assert getattr(actual.outcome_std, name) == pytest.approx(
+                getattr(expected.outcome_std, name)
+            )
+    summary = AgentJudgeEvaluationUseCase(summary_backend="numpy").summarize_agent(acc_records)
+    assert summary.hallucination_average == pytest.approx(0.25)
+
+
+def test_summary_backend_falls_back_or_fails_without_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _unavailable() -> None:
+        raise ColumnarBackendUnavailableError("numpy がインストールされていません。")
+
+    monkeypatch.setattr(columnar_evaluation_summary, "_load_numpy", _unavailable)
+
+    assert build_agent_records_summarizer("auto") is summarize_agent_records
+    with pytest.raises(ColumnarBackendUnavailableError):
+        AgentJudgeEvaluationUseCase(summary_backend="numpy")
+    with pytest.raises(ValueError, match="backend"):
+        build_agent_records_summarizer("polars")
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from acc.application.services.ccs_batch_validation import (
+    iter_validate_ccs_jsonl,
+    validate_ccs_jsonl,
+)
+from acc.domain.services.ccs_schema import parse_and_validate_ccs_payload
+
+
+def _payload(turn_id: int) -> dict[str, object]:
+    return {
+        "episodic_trace": [f"t{turn_id}: 502 を確認"],
+        "semantic_gist": "web-01 の 502 を調査中",
+        "focal_entities": ["web-01", "nginx"],
+        "relational_map": ["web-01 -> app-02"],
+        "goal_orientation": "502 の原因を特定する",
+        "constraints": ["no_restart"],
+        "predictive_cue": ["upstream を見る"],
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": ["a1", "a2", "a3"],
+    }
+
+
+def _lines() -> list[str]:
+    return [
+        json.dumps(_payload(1), ensure_ascii=False),
+        json.dumps({**_payload(2), "focal_entities": ["web-01", " "]}, ensure_ascii=False),
+        "",
+        "{not json",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({**_payload(6), "constraints": ["", "x"]}, ensure_ascii=False),
+        json.dumps(_payload(7), ensure_ascii=False),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_validation_reports_per_line_results_and_aggregates_errors(workers: int) -> None:
+    report = validate_ccs_jsonl(
+        _lines(),
+        list_limits={"retrieved_artifacts": 2},
+        workers=workers,
+        chunk_size=2,
+        keep_states=True,
+    )
+
+    assert [(record.line_number, record.ok) for record in report.records] == [
+        (1, True),
+        (2, False),
+        (4, False),
+        (5, False),
+        (6, False),
+        (7, True),
+    ]
+    assert report.records[0].state == parse_and_validate_ccs_payload(
+        _payload(1), list_limits={"retrieved_artifacts": 2}
+    )
+    assert report.records[1].error == "focal_entities[1] は空文字にできません。"
+    assert report.error_counts == (
+        ("focal_entities[] は空文字にできません。", 1),
+        ("JSON として解釈できません。", 1),
+        ("CCS payload は JSON object である必要があります。", 1),
+        ("constraints[] は空文字にできません。", 1),
+    )
+    assert (report.total, report.valid, report.invalid) == (6, 2, 4)
+
+
+def test_batch_validation_drops_states_by_default_and_rejects_bad_chunk_size() -> None:
+    records = list(iter_validate_ccs_jsonl(_lines()[:1], workers=1))
+
+    assert records[0].ok
+    assert records[0].state is None
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(iter_validate_ccs_jsonl(_lines(), chunk_size=0))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_validation_reports_too_deeply_nested_line_as_json_error(workers: int) -> None:
+    nested = "[" * 100_000 + "]" * 100_000
+    lines = [json.dumps(_payload(1), ensure_ascii=False), '{"semantic_gist": ' + nested + "}"]
+
+    report = validate_ccs_jsonl(lines, workers=workers, chunk_size=1)
+
+    assert [(record.line_number, record.ok) for record in report.records] == [(1, True), (2, False)]
+    assert report.records[1].error == "JSON として解釈できません。"
@@ -0,0 +1,126 @@
+import json
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from acc.adapters.outbound.ccs_binary_codec import (
+    CCS_CODEC_VERSION,
+    CCSCodecError,
+    decode_artifact,
+    decode_ccs,
+    decode_recent_dialogue_turn,
+    decode_session_snapshot,
+    encode_artifact,
+    encode_ccs,
+    encode_recent_dialogue_turn,
+    encode_session_snapshot,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+
+
+def _sample_state() -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("t1: 要件確認", "t2: schema draft 🚀", ""),
+        semantic_gist="日本語と English が混在する要約" * 20,
+        focal_entities=("API", "データベース"),
+        relational_map=("API -> DB",),
+        goal_orientation="",
+        constraints=(),
+        predictive_cue=("次の一手",),
+        uncertainty_signal="medium",
+        retrieved_artifacts=("artifact-1", "artifact-2"),
+    )
+
+
+def test_ccs_round_trip_preserves_all_fields() -> None:
+    state = _sample_state()
+
+    assert decode_ccs(encode_ccs(state)) == state
+    assert decode_ccs(encode_ccs(CompressedCognitiveState.empty())) == (
+        CompressedCognitiveState.empty()
+    )
+
+
+def test_artifact_round_trip_preserves_timestamp_and_offset() -> None:
+    jst = timezone(timedelta(hours=9))
+    artifacts = [
+        Artifact(
+            artifact_id="a-1",
+            content="本文",
+            source="user",
+            created_at=datetime(2026, 10, 19, 18, 0, 0, 123456, tzinfo=jst),
+        ),
+        Artifact(
+            artifact_id="a-2",
+            content="old",
+            source="tool",
+            created_at=datetime(1901, 1, 1, tzinfo=UTC),
+        ),
+    ]
+
+    for artifact in artifacts:
+        restored = decode_artifact(encode_artifact(artifact))
+        assert restored == artifact
+        assert restored.created_at.utcoffset() == artifact.created_at.utcoffset()
+
+
+def test_recent_dialogue_turn_and_snapshot_round_trip() -> None:
+    turn = RecentDialogueTurn(turn_id=300, user_input="質問", assistant_response="回答")
+    snapshot = SessionSnapshot(
+        committed_state=_sample_state(),
+        turn_id=300,
+        recent_dialogue_turns=(turn,),
+    )
+
+    assert decode_recent_dialogue_turn(encode_recent_dialogue_turn(turn)) == turn
+    assert decode_session_snapshot(encode_session_snapshot(snapshot)) == snapshot
+
+
+def test_encoded_ccs_is_smaller_than_json() -> None:
+    state = _sample_state()
+    json_bytes = json.dumps(asdict(state), ensure_ascii=False, separators=(",", ":")).encode()
+
+    assert len(encode_ccs(state)) < len(json_bytes)
+
+
+def test_decode_rejects_malformed_payloads() -> None:
+    encoded = encode_ccs(_sample_state())
+
+    with pytest.raises(CCSCodecError, match="形式ではありません"):
+        decode_ccs(b"{}" + encoded[2:])
+    with pytest.raises(CCSCodecError, match="コーデック版"):
+        decode_ccs(encoded[:2] + bytes([CCS_CODEC_VERSION + 1]) + encoded[3:])
+    with pytest.raises(CCSCodecError, match="種別"):
+        decode_artifact(encoded)
+    with pytest.raises(CCSCodecError, match="途中で終わって"):
+        decode_ccs(encoded[:-1])
+    with pytest.raises(CCSCodecError, match="余分"):
+        decode_ccs(encoded + b"\x00")
+
+
+def test_decode_rejects_corrupt_array_length_before_allocating() -> None:
+    header = encode_ccs(_sample_state())[:4]
+    snapshot_header = encode_session_snapshot(
+        SessionSnapshot(turn_id=1, committed_state=_sample_state())
+    )[:4]
+    corrupt_count = b"\xff" * 9 + b"\x7f\x00"
+
+    with pytest.raises(CCSCodecError, match="途中で終わって"):
+        decode_ccs(header + corrupt_count)
+    with pytest.raises(CCSCodecError, match="途中で終わって"):
+        decode_ccs(header + b"\x05\x03" + b"\x00" * 8)
+    with pytest.raises(CCSCodecError, match="途中で終わって"):
+        decode_session_snapshot(snapshot_header + corrupt_count)
+
+
+def test_decode_reports_domain_invariant_violation() -> None:
+    turn = RecentDialogueTurn(turn_id=1, user_input="q", assistant_response="a")
+    encoded = bytearray(encode_recent_dialogue_turn(turn))
+    encoded[6] = 0  # 整数配列の先頭（turn_id）
+
+    with pytest.raises(CCSCodecError, match="RecentDialogueTurn"):
+        decode_recent_dialogue_turn(bytes(encoded))
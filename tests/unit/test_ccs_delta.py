@@ -0,0 +1,85 @@
+import pytest
+
+from acc.adapters.outbound.ccs_binary_codec import (
+    CCSCodecError,
+    apply_session_snapshot_delta,
+    decode_ccs_delta,
+    encode_ccs,
+    encode_ccs_delta,
+    encode_session_snapshot_delta,
+)
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.services.ccs_delta import CCSDelta, apply_ccs_delta, diff_ccs
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+
+
+def _state(**overrides: object) -> CompressedCognitiveState:
+    values: dict[str, object] = {
+        "episodic_trace": ("t1",),
+        "semantic_gist": "gist",
+        "focal_entities": ("API",),
+        "relational_map": (),
+        "goal_orientation": "goal",
+        "constraints": ("後方互換",),
+        "predictive_cue": ("next",),
+        "uncertainty_signal": "中",
+        "retrieved_artifacts": (),
+    }
+    values.update(overrides)
+    return CompressedCognitiveState(**values)  # type: ignore[arg-type]
+
+
+def test_diff_contains_only_changed_fields_and_apply_reconstructs_state() -> None:
+    previous = _state()
+    current = _state(episodic_trace=("t1", "t2"), semantic_gist="gist2", constraints=())
+
+    delta = diff_ccs(previous, current)
+
+    assert delta.changed_fields == ("episodic_trace", "semantic_gist", "constraints")
+    assert apply_ccs_delta(previous, delta) == current
+
+
+def test_diff_of_equal_states_is_empty_and_apply_returns_base() -> None:
+    previous = _state()
+
+    delta = diff_ccs(previous, _state())
+
+    assert delta.is_empty
+    assert apply_ccs_delta(previous, delta) is previous
+
+
+def test_delta_rejects_unknown_fields_wrong_types_and_order() -> None:
+    with pytest.raises(ValueError, match="未知"):
+        CCSDelta(changes=(("unknown", "x"),))
+    with pytest.raises(ValueError, match="型"):
+        CCSDelta(changes=(("constraints", "x"),))
+    with pytest.raises(ValueError, match="定義順"):
+        CCSDelta(changes=(("semantic_gist", "x"), ("episodic_trace", ())))
+
+
+def test_binary_delta_is_smaller_than_full_state() -> None:
+    previous = _state(semantic_gist="長い要約" * 50)
+    current = _state(semantic_gist="長い要約" * 50, episodic_trace=("t1", "t2"))
+    delta = diff_ccs(previous, current)
+
+    encoded = encode_ccs_delta(delta)
+
+    assert decode_ccs_delta(encoded) == delta
+    assert len(encoded) < len(encode_ccs(current)) // 4
+
+
+def test_session_snapshot_delta_checks_base_turn() -> None:
+    base = SessionSnapshot(committed_state=_state(), turn_id=1)
+    snapshot = SessionSnapshot(
+        committed_state=_state(semantic_gist="next"),
+        turn_id=2,
+        recent_dialogue_turns=(
+            RecentDialogueTurn(turn_id=2, user_input="q", assistant_response="a"),
+        ),
+    )
+    encoded = encode_session_snapshot_delta(base, snapshot)
+
+    assert apply_session_snapshot_delta(base, encoded) == snapshot
+    with pytest.raises(CCSCodecError, match="基準ターン"):
+        apply_session_snapshot_delta(snapshot, encoded)
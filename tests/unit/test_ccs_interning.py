@@ -0,0 +1,109 @@
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.ccs_interning import CCSValueInterner
+from acc.domain.services.ccs_schema import parse_and_validate_ccs_payload
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+def _fresh(text: str) -> str:
+    """同値だが別オブジェクトの文字列を作る。"""
+    return "".join(list(text))
+
+
+def _state(*, constraints: tuple[str, ...], gist: str = "gist") -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("t1",),
+        semantic_gist=gist,
+        focal_entities=("API",),
+        relational_map=(),
+        goal_orientation=_fresh("設計を固める"),
+        constraints=constraints,
+        predictive_cue=("next",),
+        uncertainty_signal="中",
+        retrieved_artifacts=(),
+    )
+
+
+def test_share_reuses_previous_objects_for_unchanged_fields() -> None:
+    interner = CCSValueInterner()
+    previous = _state(constraints=("後方互換",))
+    current = _state(constraints=(_fresh("後方互換"),), gist="changed")
+
+    shared = interner.share(current, previous=previous)
+
+    assert shared == current
+    assert shared.constraints is previous.constraints
+    assert shared.goal_orientation is previous.goal_orientation
+    assert shared.semantic_gist == "changed"
+
+
+def test_share_returns_previous_state_when_nothing_changed() -> None:
+    interner = CCSValueInterner()
+    previous = _state(constraints=("a",))
+
+    assert interner.share(_state(constraints=(_fresh("a"),)), previous=previous) is previous
+
+
+def test_intern_texts_deduplicates_across_sessions_with_bounded_table() -> None:
+    interner = CCSValueInterner(max_tuples=2)
+    first = interner.intern_texts((_fresh("制約A"), _fresh("制約B")))
+    second = interner.intern_texts((_fresh("制約A"), _fresh("制約B")))
+
+    assert second is first
+    assert first[0] is second[0]
+    interner.intern_texts(("x",))
+    interner.intern_texts(("y",))
+    assert len(interner) == 2
+    assert interner.intern_texts(()) == ()
+
+
+def test_intern_text_shares_equal_strings_with_bounded_table() -> None:
+    interner = CCSValueInterner(max_texts=2)
+    first = interner.intern_text(_fresh("制約A"))
+
+    assert interner.intern_text(_fresh("制約A")) is first
+    interner.intern_text(_fresh("制約B"))
+    interner.intern_text(_fresh("制約C"))
+    # 上限を超えて表から外れた値は共有されない（表が参照を持ち続けない）。
+    assert interner.intern_text(_fresh("制約A")) is not first
+
+
+def test_parse_and_simple_compressor_share_unchanged_fields() -> None:
+    previous = parse_and_validate_ccs_payload(
+        {
+            "episodic_trace": ["t1"],
+            "semantic_gist": "gist",
+            "focal_entities": ["API"],
+            "relational_map": [],
+            "goal_orientation": "goal",
+            "constraints": ["後方互換", "日本語"],
+            "predictive_cue": [],
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        }
+    )
+    parsed = parse_and_validate_ccs_payload(
+        {
+            "episodic_trace": ["t1", "t2"],
+            "semantic_gist": "gist2",
+            "focal_entities": ["API"],
+            "relational_map": [],
+            "goal_orientation": "goal",
+            "constraints": [_fresh("後方互換"), _fresh("日本語")],
+            "predictive_cue": [],
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        },
+        previous_state=previous,
+    )
+    assert parsed.constraints is previous.constraints
+
+    compressor = SimpleCognitiveCompressorAdapter()
+    signal = TurnInteractionSignal(
+        turn_id=3,
+        user_input="続き",
+        active_constraints=(_fresh("後方互換"), _fresh("日本語")),
+    )
+    next_state = compressor.commit_next_state(signal, parsed, ())
+    assert next_state.constraints is previous.constraints
+    assert next_state.goal_orientation is parsed.goal_orientation
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 import pytest
 
@@ -7,6 +7,8 @@ from acc.adapters.outbound.in_memory_acc_components import (
     SimpleCognitiveCompressorAdapter,
 )
 from acc.application.use_cases.chat_session import (
+    ChatReply,
+    ChatReplyDelta,
     ChatSessionNotFoundError,
     ChatSessionUseCase,
 )
@@ -119,3 +121,99 @@ def test_short_history_turns_zero_disables_recent_history() -> None:
     use_case.send_message(session_id=session_id, message="beta")
 
     assert [len(history) for history in policy.received_histories] == [0, 0]
+
+
+class FixedTokenCounter:
+    """常に 1 文字 1 token とみなすテスト用 counter。"""
+
+    def count_tokens(self, text: str) -> int:
+        return len(text)
+
+
+def test_memory_tokens_uses_injected_token_counter() -> None:
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=EchoAgentPolicyAdapter(),
+        token_counter=FixedTokenCounter(),
+    )
+    session_id = use_case.create_session()
+
+    reply = use_case.send_message(session_id=session_id, message="営業時間中は再起動しない")
+    state = reply.mechanism.committed_state
+    expected = sum(
+        len(text)
+        for text in (
+            *state.episodic_trace,
+            state.semantic_gist,
+            *state.focal_entities,
+            *state.relational_map,
+            state.goal_orientation,
+            *state.constraints,
+            *state.predictive_cue,
+            state.uncertainty_signal,
+            *state.retrieved_artifacts,
+        )
+    )
+
+    assert reply.memory_tokens == expected
+
+
+class SplitStreamingPolicyAdapter:
+    """固定応答を 2 つの差分に分けて返すテスト用 policy。"""
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        del recent_dialogue_turns, committed_state, role, tools
+        yield f"turn={interaction_signal.turn_id}"
+        yield " done"
+
+
+def _build_streaming_use_case() -> ChatSessionUseCase:
+    return ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=EchoAgentPolicyAdapter(),
+        streaming_agent_policy=SplitStreamingPolicyAdapter(),
+    )
+
+
+def test_stream_message_yields_deltas_then_the_committed_reply() -> None:
+    use_case = _build_streaming_use_case()
+    session_id = use_case.create_session()
+
+    events = list(use_case.stream_message(session_id=session_id, message="状況をまとめて"))
+    follow_up = use_case.send_message(session_id=session_id, message="次は？")
+
+    assert events[:2] == [ChatReplyDelta(text="turn=1"), ChatReplyDelta(text=" done")]
+    reply = events[2]
+    assert isinstance(reply, ChatReply)
+    assert reply.turn_id == 1
+    assert reply.reply == "turn=1 done"
+    assert reply.mechanism.committed_state.semantic_gist
+    assert follow_up.turn_id == 2
+
+
+def test_closed_stream_discards_the_turn_and_releases_the_session() -> None:
+    use_case = _build_streaming_use_case()
+    session_id = use_case.create_session()
+
+    events = use_case.stream_message(session_id=session_id, message="状況をまとめて")
+    assert next(events) == ChatReplyDelta(text="turn=1")
+    events.close()
+    reply = use_case.send_message(session_id=session_id, message="状況をまとめて")
+
+    assert reply.turn_id == 1
+
+
+def test_stream_message_validates_before_the_first_event() -> None:
+    use_case = _build_streaming_use_case()
+
+    with pytest.raises(ChatSessionNotFoundError):
+        use_case.stream_message(session_id="missing-session", message="hello")
+    with pytest.raises(ValueError):
+        use_case.stream_message(session_id=use_case.create_session(), message="   ")
@@ -0,0 +1,140 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.adapters.outbound.routing_cognitive_compressor import (
+    CompressionRouteLatency,
+    RoutingCognitiveCompressorAdapter,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.services.compression_gate import CompressionRouter, CompressionRoutingPolicy
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
+
+
+def _previous_state(*, uncertainty_signal: str = "中") -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("turn:1:web-01 の 502 を調べたい",),
+        semantic_gist="web-01 の nginx が 502 を返している",
+        focal_entities=("web-01", "nginx"),
+        relational_map=("web-01 -> app-02",),
+        goal_orientation="502 の原因を特定する",
+        constraints=("本番の設定変更は承認後に行う",),
+        predictive_cue=("upstream のログを見る",),
+        uncertainty_signal=uncertainty_signal,
+        retrieved_artifacts=("a1",),
+    )
+
+
+def _artifact(artifact_id: str) -> Artifact:
+    return Artifact(
+        artifact_id=artifact_id,
+        content="log",
+        source="incident-log",
+        created_at=datetime(2026, 2, 8, 12, 0, tzinfo=UTC),
+    )
+
+
+@pytest.mark.parametrize(
+    ("user_input", "artifact_ids", "state", "expected"),
+    [
+        ("nginx のログを続けて見ます", ("a1",), _previous_state(), ("rule", "routine")),
+        ("ok", (), CompressedCognitiveState.empty(), ("model", "initial_state")),
+        ("nginx を見ます", ("a1", "a2"), _previous_state(), ("model", "new_artifact")),
+        ("PostgreSQL と pgbouncer も見たい", (), _previous_state(), ("model", "new_entities")),
+        ("再起動は禁止です", (), _previous_state(), ("model", "constraint_change")),
+        ("nginx の原因はわからないです", (), _previous_state(), ("model", "high_uncertainty")),
+        (
+            "nginx を見ます",
+            (),
+            _previous_state(uncertainty_signal="高"),
+            ("model", "high_uncertainty"),
+        ),
+        ("nginx " * 30, (), _previous_state(), ("model", "long_input")),
+    ],
+)
+def test_router_escalates_only_on_enabled_confidence_signals(
+    user_input: str,
+    artifact_ids: tuple[str, ...],
+    state: CompressedCognitiveState,
+    expected: tuple[str, str],
+) -> None:
+    decision = CompressionRouter().evaluate(
+        TurnInteractionSignal(turn_id=2, user_input=user_input),
+        state,
+        tuple(_artifact(artifact_id) for artifact_id in artifact_ids),
+    )
+
+    assert (decision.route, decision.reason) == expected
+
+
+def test_policy_limits_signals_and_rejects_unknown_names() -> None:
+    router = CompressionRouter(CompressionRoutingPolicy(escalate_on=frozenset({"long_input"})))
+
+    decision = router.evaluate(
+        TurnInteractionSignal(turn_id=2, user_input="PostgreSQL と pgbouncer も見たい"),
+        _previous_state(),
+        (),
+    )
+
+    assert decision.route == "rule"
+    with pytest.raises(ValueError, match="escalate_on"):
+        CompressionRoutingPolicy(escalate_on=frozenset({"sentiment"}))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        CompressionRoutingPolicy(max_rule_input_chars=0)
+
+
+class _CountingCompressor(CognitiveCompressorPort):
+    """呼び出し回数を数え、前状態をそのまま返す圧縮アダプタ。"""
+
+    def __init__(self) -> None:
+        """呼び出し回数 0 で始める。"""
+        self.call_count = 0
+
+    def commit_next_state(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> CompressedCognitiveState:
+        del interaction_signal, qualified_artifacts
+        self.call_count += 1
+        return committed_state
+
+
+def test_routing_adapter_uses_rule_compressor_and_records_per_route_latency() -> None:
+    model = _CountingCompressor()
+    ticks = iter([0.0, 0.001, 1.0, 3.0])
+    compressor = RoutingCognitiveCompressorAdapter(
+        SimpleCognitiveCompressorAdapter(),
+        model,
+        clock=lambda: next(ticks),
+    )
+    previous_state = _previous_state()
+
+    routine = compressor.commit_next_state(
+        interaction_signal=TurnInteractionSignal(
+            turn_id=2, user_input="nginx のログを続けて見ます"
+        ),
+        committed_state=previous_state,
+        qualified_artifacts=(_artifact("a1"),),
+    )
+    escalated = compressor.commit_next_state(
+        interaction_signal=TurnInteractionSignal(turn_id=3, user_input="再起動は禁止です"),
+        committed_state=routine,
+        qualified_artifacts=(),
+    )
+
+    assert model.call_count == 1
+    assert routine.semantic_gist == "nginx のログを続けて見ます"
+    assert escalated is routine
+    stats = compressor.route_stats()
+    assert stats.routes == (
+        CompressionRouteLatency(route="rule", turns=1, seconds=0.001),
+        CompressionRouteLatency(route="model", turns=1, seconds=2.0),
+    )
+    assert stats.escalation_reasons == (("constraint_change", 1),)
+    assert stats.escalation_rate == 0.5
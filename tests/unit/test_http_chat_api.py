@@ -1,9 +1,17 @@
-from collections.abc import Sequence
+import asyncio
+import json
+import threading
+from collections.abc import Iterator, MutableMapping, Sequence
+from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
+from acc.adapters.inbound.http import app as app_module
 from acc.adapters.inbound.http.app import (
+    _resolve_choice_env,
     _resolve_model_name,
+    _resolve_model_temperatures,
     _resolve_non_negative_int_env,
     create_app,
 )
@@ -11,9 +19,10 @@ from acc.adapters.outbound.in_memory_acc_components import (
     EchoAgentPolicyAdapter,
     SimpleCognitiveCompressorAdapter,
 )
+from acc.adapters.outbound.resilient_model_adapters import ModelCallGuard
 from acc.application.use_cases.chat_session import ChatSessionUseCase
 from acc.domain.entities.artifact import Artifact
-from acc.domain.entities.interaction import TurnInteractionSignal
+from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
 from acc.domain.services.ccs_schema import CCSValidationError
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 from acc.ports.outbound.cognitive_compressor_port import CognitiveCompressorPort
@@ -82,6 +91,33 @@ def test_chat_session_flow_works() -> None:
     assert isinstance(payload["mechanism"]["committed_state"]["retrieved_artifacts"], list)
 
 
+def test_delta_state_mode_returns_only_changed_fields() -> None:
+    client = _build_test_client()
+    session_id = client.post("/api/chat/sessions").json()["session_id"]
+    full_state = client.post(
+        "/api/chat/messages",
+        json={"session_id": session_id, "message": "状況をまとめて"},
+    ).json()["mechanism"]["committed_state"]
+
+    delta_payload = client.post(
+        "/api/chat/messages",
+        json={"session_id": session_id, "message": "続きをお願い", "state_mode": "delta"},
+    ).json()
+    mechanism = delta_payload["mechanism"]
+
+    assert mechanism["committed_state"] is None
+    assert mechanism["committed_state_delta"]["base_turn_id"] == 1
+    changes = mechanism["committed_state_delta"]["changes"]
+    assert set(changes) == {"episodic_trace", "semantic_gist"}
+
+    next_full_state = client.post(
+        "/api/chat/messages",
+        json={"session_id": session_id, "message": "続きをお願い"},
+    ).json()["mechanism"]["committed_state"]
+    assert {**full_state, **changes}["goal_orientation"] == next_full_state["goal_orientation"]
+    assert {**full_state, **changes}["semantic_gist"] == next_full_state["semantic_gist"]
+
+
 def test_chat_message_with_unknown_session_returns_404() -> None:
     client = _build_test_client()
 
@@ -93,6 +129,133 @@ def test_chat_message_with_unknown_session_returns_404() -> None:
     assert response.status_code == 404
 
 
+def _parse_sse(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_endpoint_sends_deltas_then_the_committed_turn() -> None:
+    client = _build_test_client()
+    session_id = client.post("/api/chat/sessions").json()["session_id"]
+
+    response = client.post(
+        "/api/chat/messages/stream",
+        json={"session_id": session_id, "message": "状況をまとめて", "state_mode": "delta"},
+    )
+    events = _parse_sse(response.text)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [name for name, _ in events] == ["delta", "done"]
+    done = events[-1][1]
+    assert events[0][1]["text"] == done["reply"]
+    assert done["turn_id"] == 1
+    assert done["mechanism"]["committed_state_delta"]["base_turn_id"] == 0
+
+
+def test_stream_endpoint_reports_errors_before_streaming_as_http_status() -> None:
+    client = _build_test_client()
+
+    response = client.post(
+        "/api/chat/messages/stream",
+        json={"session_id": "missing-session", "message": "hello"},
+    )
+
+    assert response.status_code == 404
+
+
+class PausingStreamingPolicy(EchoAgentPolicyAdapter):
+    """最初の差分を返した後、クライアント切断まで待ってから続きを返すポリシー。"""
+
+    def __init__(self) -> None:
+        """切断通知と、ストリームが閉じられたかの記録を初期化する。"""
+        self.disconnected = threading.Event()
+        self.closed = False
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        try:
+            yield "前半"
+            self.disconnected.wait(timeout=5)
+            yield "後半"
+        except GeneratorExit:
+            self.closed = True
+            raise
+
+
+def test_stream_endpoint_releases_the_session_when_the_client_disconnects() -> None:
+    policy = PausingStreamingPolicy()
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=policy,
+        streaming_agent_policy=policy,
+        max_sessions=10,
+    )
+    app = create_app(chat_session_use_case=use_case)
+    session_id = use_case.create_session()
+    sent: list[MutableMapping[str, Any]] = []
+
+    async def disconnect_after_first_delta() -> None:
+        first_chunk = asyncio.Event()
+        request_body = json.dumps({"session_id": session_id, "message": "状況をまとめて"})
+        messages = iter([{"type": "http.request", "body": request_body.encode()}])
+
+        async def receive() -> dict[str, Any]:
+            message = next(messages, None)
+            if message is not None:
+                return message
+            await first_chunk.wait()
+            policy.disconnected.set()
+            return {"type": "http.disconnect"}
+
+        async def send(message: MutableMapping[str, Any]) -> None:
+            sent.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_chunk.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/chat/messages/stream",
+            "raw_path": b"/api/chat/messages/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    asyncio.run(disconnect_after_first_delta())
+
+    bodies = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    assert [name for name, _ in _parse_sse(bodies.decode())] == ["delta"]
+    assert policy.closed
+    # ロックが残っていると次のターンが待ち続けるため、別スレッドで時間を区切って確かめる。
+    replies: list[int] = []
+    follow_up = threading.Thread(
+        target=lambda: replies.append(
+            use_case.send_message(session_id=session_id, message="続けて").turn_id
+        ),
+        daemon=True,
+    )
+    follow_up.start()
+    follow_up.join(timeout=5)
+    assert replies == [1]
+
+
 def test_root_serves_html() -> None:
     client = _build_test_client()
 
@@ -156,3 +319,40 @@ def test_resolve_non_negative_int_env_accepts_zero_and_positive(monkeypatch) ->
 
     monkeypatch.setenv("ACC_SHORT_HISTORY_TURNS", "5")
     assert _resolve_non_negative_int_env("ACC_SHORT_HISTORY_TURNS", default=2) == 5
+
+
+def test_resolve_choice_env_accepts_known_values_only(monkeypatch) -> None:
+    choices = ("auto", "tiktoken", "heuristic")
+    monkeypatch.delenv("ACC_TOKEN_COUNTER", raising=False)
+    assert _resolve_choice_env("ACC_TOKEN_COUNTER", choices=choices, default="auto") == "auto"
+
+    monkeypatch.setenv("ACC_TOKEN_COUNTER", " Heuristic ")
+    assert _resolve_choice_env("ACC_TOKEN_COUNTER", choices=choices, default="auto") == "heuristic"
+
+    monkeypatch.setenv("ACC_TOKEN_COUNTER", "bpe")
+    assert _resolve_choice_env("ACC_TOKEN_COUNTER", choices=choices, default="auto") == "auto"
+
+
+def test_lifespan_closes_model_call_guards(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[ModelCallGuard] = []
+
+    class RecordingModelCallGuard(ModelCallGuard):
+        def close(self) -> None:
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(app_module, "ModelCallGuard", RecordingModelCallGuard)
+    monkeypatch.setenv("ACC_OPENAI_WARMUP", "off")
+    monkeypatch.setenv("ACC_MODEL_RESILIENCE", "on")
+    monkeypatch.setenv("ACC_MODEL_HEDGE", "on")
+
+    with TestClient(create_app()) as client:
+        assert client.get("/api/health").status_code == 200
+        assert closed == []
+
+    assert len(closed) == 2
+
+
+def test_model_cache_switches_both_models_to_deterministic_temperature() -> None:
+    assert _resolve_model_temperatures(cache_enabled=False) == (0.1, 0.2)
+    assert _resolve_model_temperatures(cache_enabled=True) == (0.0, 0.0)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from acc.adapters.outbound.incremental_json import IncrementalJSONObjectParser
+
+
+def test_members_are_returned_as_soon_as_their_values_close() -> None:
+    document = {
+        "a": 'x,}{"y',
+        "b": [1, {"c": "]"}],
+        "empty": {},
+        "text": "日本語\\n",
+    }
+    text = json.dumps(document, ensure_ascii=False)
+    parser = IncrementalJSONObjectParser()
+
+    completed: list[tuple[str, object]] = []
+    arrivals: list[int] = []
+    for index in range(0, len(text), 3):
+        members = parser.feed(text[index : index + 3])
+        completed.extend(members)
+        arrivals.extend(index for _ in members)
+
+    assert completed == list(document.items())
+    assert arrivals == sorted(arrivals)
+    assert arrivals[0] < len(text) // 2
+    assert parser.closed
+    assert parser.finish() == document
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['["not an object"]', '{"a": 1,}', '{"a": 1,, "b": 2}', '{"a": 1} trailing', '{"a": tru}'],
+)
+def test_malformed_input_raises_value_error(text: str) -> None:
+    parser = IncrementalJSONObjectParser()
+    with pytest.raises(ValueError):
+        parser.feed(text)
+        parser.finish()
+
+
+def test_truncated_object_is_rejected_on_finish() -> None:
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"a": 1, "b": [2') == [("a", 1)]
+    with pytest.raises(ValueError, match="閉じる前"):
+        parser.finish()
@@ -0,0 +1,167 @@
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from acc.application.services.live_evaluation_runner import (
+    LiveEvaluationEpisode,
+    LiveEvaluationRunner,
+    decode_episode_result,
+    encode_episode_result,
+)
+from acc.application.use_cases.live_multi_agent_evaluation import LiveMultiAgentEvaluationUseCase
+from acc.domain.value_objects.evaluation import DriftAudit, HallucinationAudit, OutcomeScores
+from acc.domain.value_objects.live_evaluation import (
+    AgentTurnResponse,
+    EvaluationTurnQuery,
+    JudgeAgentEvaluation,
+    JudgeTurnResult,
+)
+
+
+class _KeywordOnlyError(Exception):
+    """キーワード専用引数を取るため、既定の方法では unpickle できない例外。"""
+
+    def __init__(self, *, code: int) -> None:
+        """エラーコードを受け取る。"""
+        super().__init__(f"code={code}")
+        self.code = code
+
+
+class _EchoAgentRunner:
+    """クエリ長を memory token とする固定応答のエージェントランナー。"""
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """クエリをそのまま返す。"""
+        if query.user_query == "boom":
+            raise RuntimeError("agent failed")
+        if query.user_query == "kwonly":
+            raise _KeywordOnlyError(code=7)
+        del canonical_memory
+        return AgentTurnResponse(response_text=query.user_query, memory_tokens=10 * query.turn_id)
+
+
+class _FixedJudge:
+    """全エージェントにクエリ番号に応じた評価を返す judge。"""
+
+    def evaluate_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+        agent_responses: Mapping[str, AgentTurnResponse],
+    ) -> JudgeTurnResult:
+        """turn_id ごとに固定の評価を返し、最終ターンを canonical memory に残す。"""
+        evaluation = JudgeAgentEvaluation(
+            outcome_scores=OutcomeScores(
+                relevance=float(query.turn_id),
+                answer_quality=7.0,
+                instruction_following=7.0,
+                coherence=7.0,
+            ),
+            hallucination_audit=HallucinationAudit(supported_claims=1, unsupported_claims=1),
+            drift_audit=(
+                None
+                if query.turn_id == 1
+                else DriftAudit(violations=1, omissions=0, active_constraints=("no_restart",))
+            ),
+        )
+        return JudgeTurnResult(
+            updated_canonical_memory={**canonical_memory, "last_turn": query.turn_id},
+            evaluations_by_agent={name: evaluation for name in agent_responses},
+        )
+
+
+def _build_use_case() -> LiveMultiAgentEvaluationUseCase:
+    return LiveMultiAgentEvaluationUseCase(
+        agent_runners={"acc": _EchoAgentRunner(), "baseline": _EchoAgentRunner()},
+        judge_evaluator=_FixedJudge(),
+        max_concurrent_agents=1,
+    )
+
+
+def _episodes(*turn_counts: int) -> list[LiveEvaluationEpisode]:
+    return [
+        LiveEvaluationEpisode(
+            episode_id=f"ep-{index}",
+            queries=tuple(
+                EvaluationTurnQuery(turn_id=turn_id, user_query=f"q{turn_id}")
+                for turn_id in range(1, turn_count + 1)
+            ),
+        )
+        for index, turn_count in enumerate(turn_counts)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_runner_streams_episodes_and_aggregates_across_them(
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    output_path = tmp_path / "results.jsonl"
+
+    report = LiveEvaluationRunner(_build_use_case, workers=workers).run(
+        _episodes(1, 3, 2), output_path
+    )
+
+    assert sorted(report.completed_episode_ids) == ["ep-0", "ep-1", "ep-2"]
+    assert report.resumed_episode_ids == ()
+    assert report.failed_episodes == ()
+    lines = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(line["episode_id"] for line in lines) == ["ep-0", "ep-1", "ep-2"]
+    summary = report.summaries_by_agent["acc"]
+    assert summary.total_turns == 6
+    assert summary.memory_tokens_by_turn == (10, 20, 30)
+    assert summary.drift_turn_rates == pytest.approx((1.0, 1.0))
+    assert summary.outcome_mean.relevance == pytest.approx(10 / 6)
+    assert report.summaries_by_agent["baseline"] == summary
+
+
+def test_runner_resumes_after_partial_write_and_retries_failed_episodes(tmp_path: Path) -> None:
+    output_path = tmp_path / "results.jsonl"
+    episodes = _episodes(2, 1)
+    failing = LiveEvaluationEpisode(
+        episode_id="ep-boom",
+        queries=(EvaluationTurnQuery(turn_id=1, user_query="boom"),),
+    )
+    runner = LiveEvaluationRunner(_build_use_case, workers=1)
+    first = runner.run([episodes[0], failing], output_path)
+    assert first.failed_episodes == (("ep-boom", "RuntimeError: agent failed"),)
+    with output_path.open("a", encoding="utf-8") as output:
+        output.write('{"episode_id": "ep-1", "res')
+
+    resumed = runner.run(episodes, output_path)
+
+    assert resumed.resumed_episode_ids == ("ep-0",)
+    assert resumed.completed_episode_ids == ("ep-1",)
+    assert resumed.summaries_by_agent["acc"].total_turns == 3
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["episode_id"] for line in lines] == ["ep-0", "ep-1"]
+
+
+def test_episode_result_round_trips_through_json() -> None:
+    result = _build_use_case().run_episode(_episodes(2)[0].queries)
+
+    restored = decode_episode_result(json.loads(json.dumps(encode_episode_result(result))))
+
+    assert restored == result
+
+
+def test_worker_failure_with_unpicklable_exception_does_not_break_the_pool(
+    tmp_path: Path,
+) -> None:
+    failing = LiveEvaluationEpisode(
+        episode_id="ep-kwonly",
+        queries=(EvaluationTurnQuery(turn_id=1, user_query="kwonly"),),
+    )
+
+    report = LiveEvaluationRunner(_build_use_case, workers=2).run(
+        [failing, *_episodes(1, 2, 1)], tmp_path / "results.jsonl"
+    )
+
+    assert report.failed_episodes == (("ep-kwonly", "_KeywordOnlyError: code=7"),)
+    assert sorted(report.completed_episode_ids) == ["ep-0", "ep-1", "ep-2"]
@@ -1,8 +1,11 @@
+import threading
+import time
 from collections.abc import Mapping
 
 import pytest
 
 from acc.application.use_cases.live_multi_agent_evaluation import (
+    AgentRunTimeoutError,
     LiveMultiAgentEvaluationUseCase,
 )
 from acc.domain.value_objects.evaluation import DriftAudit, HallucinationAudit, OutcomeScores
@@ -37,12 +40,65 @@ class ScriptedAgentRunner(AgentRunnerPort):
         )
 
 
+class SleepingAgentRunner(AgentRunnerPort):
+    """指定秒数だけ待ってから応答する、同時実行数を記録するエージェントランナー。"""
+
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, name: str, *, seconds: float) -> None:
+        """エージェント名と待機秒数を初期化する。"""
+        self._name = name
+        self._seconds = seconds
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """待機してから固定応答を返す。"""
+        del canonical_memory
+        with SleepingAgentRunner.lock:
+            SleepingAgentRunner.active += 1
+            SleepingAgentRunner.max_active = max(
+                SleepingAgentRunner.max_active, SleepingAgentRunner.active
+            )
+        time.sleep(self._seconds)
+        with SleepingAgentRunner.lock:
+            SleepingAgentRunner.active -= 1
+        return AgentTurnResponse(response_text=f"{self._name}: {query.user_query}", memory_tokens=1)
+
+
+class HangOnceAgentRunner(AgentRunnerPort):
+    """1 回目の呼び出しだけ `release` が立つまで返らないエージェントランナー。"""
+
+    def __init__(self, name: str) -> None:
+        """エージェント名を初期化する。"""
+        self._name = name
+        self.release = threading.Event()
+        self.calls = 0
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """1 回目だけ待ってから固定応答を返す。"""
+        del canonical_memory
+        self.calls += 1
+        if self.calls == 1:
+            self.release.wait()
+        return AgentTurnResponse(response_text=f"{self._name}: {query.user_query}", memory_tokens=1)
+
+
 class ScriptedJudgeEvaluator(JudgeEvaluatorPort):
     """テスト用の scripted judge evaluator。"""
 
     def __init__(self) -> None:
         """テスト観測用の履歴を初期化する。"""
         self.observed_canonical_memories: list[dict[str, object]] = []
+        self.observed_agent_responses: list[dict[str, str]] = []
 
     def evaluate_turn(
         self,
@@ -52,6 +108,9 @@ class ScriptedJudgeEvaluator(JudgeEvaluatorPort):
     ) -> JudgeTurnResult:
         """Agent 応答を機械的に評価し次 canonical memory を返す。"""
         self.observed_canonical_memories.append(dict(canonical_memory))
+        self.observed_agent_responses.append(
+            {name: response.response_text for name, response in agent_responses.items()}
+        )
         updated_canonical_memory = dict(canonical_memory)
         updated_canonical_memory["last_turn"] = query.turn_id
 
@@ -159,3 +218,139 @@ def test_run_episode_raises_when_judge_agent_name_mismatch() -> None:
 
     with pytest.raises(ValueError, match="評価対象エージェント名"):
         use_case.run_episode(queries=(EvaluationTurnQuery(turn_id=1, user_query="q1"),))
+
+
+@pytest.mark.parametrize(("max_concurrent_agents", "expected_max_active"), [(None, 3), (2, 2)])
+def test_run_episode_runs_agents_concurrently_in_registration_order(
+    max_concurrent_agents: int | None,
+    expected_max_active: int,
+) -> None:
+    SleepingAgentRunner.max_active = 0
+    judge = ScriptedJudgeEvaluator()
+    use_case = LiveMultiAgentEvaluationUseCase(
+        agent_runners={
+            "slow": SleepingAgentRunner("slow", seconds=0.15),
+            "acc": SleepingAgentRunner("acc", seconds=0.05),
+            "fast": SleepingAgentRunner("fast", seconds=0.01),
+        },
+        judge_evaluator=judge,
+        max_concurrent_agents=max_concurrent_agents,
+        agent_timeout_seconds=5.0,
+    )
+
+    started = time.perf_counter()
+    result = use_case.run_episode(queries=(EvaluationTurnQuery(turn_id=1, user_query="q1"),))
+    elapsed = time.perf_counter() - started
+    use_case.close()
+
+    assert SleepingAgentRunner.max_active == expected_max_active
+    assert elapsed < 0.15 + 0.05 + 0.01
+    assert list(judge.observed_agent_responses[0].items()) == [
+        ("slow", "slow: q1"),
+        ("acc", "acc: q1"),
+        ("fast", "fast: q1"),
+    ]
+    assert list(result.turn_records_by_agent) == ["slow", "acc", "fast"]
+
+
+def test_run_episode_raises_when_agent_exceeds_timeout() -> None:
+    use_case = LiveMultiAgentEvaluationUseCase(
+        agent_runners={
+            "acc": SleepingAgentRunner("acc", seconds=0.0),
+            "stuck": SleepingAgentRunner("stuck", seconds=0.5),
+        },
+        judge_evaluator=ScriptedJudgeEvaluator(),
+        agent_timeout_seconds=0.05,
+    )
+
+    started = time.perf_counter()
+    with pytest.raises(AgentRunTimeoutError, match="エージェント stuck .* turn_id=1"):
+        use_case.run_episode(queries=(EvaluationTurnQuery(turn_id=1, user_query="q1"),))
+    assert time.perf_counter() - started < 0.4
+    use_case.close()
+    with pytest.raises(ValueError, match="max_concurrent_agents"):
+        LiveMultiAgentEvaluationUseCase(
+            agent_runners={"acc": SleepingAgentRunner("acc", seconds=0.0)},
+            judge_evaluator=ScriptedJudgeEvaluator(),
+            max_concurrent_agents=0,
+        )
+
+
+class SnapshotRecordingAgentRunner(AgentRunnerPort):
+    """受け取った canonical memory をそのまま記録し、書き込みを試すエージェントランナー。"""
+
+    def __init__(self) -> None:
+        """観測用の履歴を初期化する。"""
+        self.observed: list[Mapping[str, object]] = []
+        self.write_errors = 0
+
+    def run_turn(
+        self,
+        query: EvaluationTurnQuery,
+        canonical_memory: Mapping[str, object],
+    ) -> AgentTurnResponse:
+        """Memory を記録し、書き込みが拒否されることを数える。"""
+        self.observed.append(canonical_memory)
+        try:
+            canonical_memory["tampered"] = True  # type: ignore[index]
+        except TypeError:
+            self.write_errors += 1
+        return AgentTurnResponse(response_text=query.user_query, memory_tokens=1)
+
+
+def test_run_episode_shares_one_read_only_memory_snapshot_per_turn() -> None:
+    first = SnapshotRecordingAgentRunner()
+    second = SnapshotRecordingAgentRunner()
+    judge = ScriptedJudgeEvaluator()
+    use_case = LiveMultiAgentEvaluationUseCase(
+        agent_runners={"baseline": first, "acc": second},
+        judge_evaluator=judge,
+    )
+    initial = {"policy": "safe"}
+
+    result = use_case.run_episode(
+        queries=(
+            EvaluationTurnQuery(turn_id=1, user_query="q1"),
+            EvaluationTurnQuery(turn_id=2, user_query="q2"),
+        ),
+        initial_canonical_memory=initial,
+    )
+    use_case.close()
+
+    assert first.observed[0] is second.observed[0]
+    assert first.observed[1] is second.observed[1]
+    assert first.write_errors == second.write_errors == 2
+    assert dict(first.observed[0]) == {"policy": "safe"}
+    assert dict(first.observed[1]) == {"policy": "safe", "last_turn": 1}
+    assert judge.observed_canonical_memories == [
+        {"policy": "safe"},
+        {"policy": "safe", "last_turn": 1},
+    ]
+    initial["policy"] = "changed"
+    assert first.observed[0]["policy"] == "safe"
+    assert result.final_canonical_memory == {"policy": "safe", "last_turn": 2}
+
+
+def test_timed_out_agent_does_not_hold_the_worker_for_later_episodes() -> None:
+    hung = HangOnceAgentRunner("hung")
+    use_case = LiveMultiAgentEvaluationUseCase(
+        agent_runners={"hung": hung, "acc": SleepingAgentRunner("acc", seconds=0.0)},
+        judge_evaluator=ScriptedJudgeEvaluator(),
+        max_concurrent_agents=1,
+        agent_timeout_seconds=0.05,
+    )
+    queries = (EvaluationTurnQuery(turn_id=1, user_query="q1"),)
+
+    try:
+        with pytest.raises(AgentRunTimeoutError, match="エージェント hung"):
+            use_case.run_episode(queries=queries)
+        started = time.perf_counter()
+        result = use_case.run_episode(queries=queries)
+        elapsed = time.perf_counter() - started
+    finally:
+        hung.release.set()
+        use_case.close()
+
+    assert elapsed < 0.5
+    assert hung.calls == 2
+    assert list(result.turn_records_by_agent) == ["hung", "acc"]
@@ -0,0 +1,268 @@
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from acc.adapters.outbound.model_response_cache import (
+    CachingAgentPolicyAdapter,
+    CachingCognitiveCompressorModelAdapter,
+    CachingStreamingAgentPolicyAdapter,
+    ModelResponseCache,
+    cache_key,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+_DETERMINISTIC = {"model": "m", "temperature": 0.0, "max_output_tokens": 900}
+_SAMPLED = {"model": "m", "temperature": 0.2, "max_output_tokens": 900}
+
+
+class CountingCompressorModel(CognitiveCompressorModelPort):
+    """呼び出し回数を数え、入力文を要約に写すモデル。"""
+
+    def __init__(self) -> None:
+        """呼び出し回数を初期化する。"""
+        self.call_count = 0
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        del committed_state, qualified_artifacts
+        self.call_count += 1
+        return {"semantic_gist": interaction_signal.user_input, "constraints": ["no_restart"]}
+
+
+class CountingPolicy(AgentPolicyPort, StreamingAgentPolicyPort):
+    """呼び出し回数を数え、固定形式の応答を返すポリシー。"""
+
+    def __init__(self) -> None:
+        """呼び出し回数を初期化する。"""
+        self.call_count = 0
+        self.stream_count = 0
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        del recent_dialogue_turns, committed_state
+        self.call_count += 1
+        return AgentDecision(
+            response=f"{role}:{interaction_signal.user_input}",
+            tool_actions=tuple(f"use:{tool}" for tool in tools),
+        )
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        del recent_dialogue_turns, committed_state, tools
+        self.stream_count += 1
+        yield f"{role}:"
+        yield interaction_signal.user_input
+
+
+def _artifact(artifact_id: str) -> Artifact:
+    return Artifact(
+        artifact_id=artifact_id,
+        content="log",
+        source="incident-log",
+        created_at=datetime(2026, 2, 8, 12, 0, tzinfo=UTC),
+    )
+
+
+def _compress(
+    adapter: CachingCognitiveCompressorModelAdapter,
+    user_input: str = "Nginx 502",
+    artifact_ids: tuple[str, ...] = ("a1",),
+) -> Mapping[str, object]:
+    return adapter.generate_next_state_payload(
+        interaction_signal=TurnInteractionSignal(turn_id=1, user_input=user_input),
+        committed_state=CompressedCognitiveState.empty(),
+        qualified_artifacts=tuple(_artifact(artifact_id) for artifact_id in artifact_ids),
+    )
+
+
+def test_compressor_cache_hits_on_identical_inputs_only() -> None:
+    model = CountingCompressorModel()
+    adapter = CachingCognitiveCompressorModelAdapter(
+        model,
+        cache=ModelResponseCache(),
+        model_parameters=_DETERMINISTIC,
+    )
+
+    first = _compress(adapter)
+    second = _compress(adapter)
+    _compress(adapter, artifact_ids=("a2",))
+
+    assert first == second
+    assert model.call_count == 2
+    stats = adapter.cache.stats()
+    assert (stats.memory_hits, stats.misses) == (1, 2)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_sampled_model_is_cached_only_when_opted_in() -> None:
+    model = CountingCompressorModel()
+    cache = ModelResponseCache()
+    adapter = CachingCognitiveCompressorModelAdapter(
+        model,
+        cache=cache,
+        model_parameters=_SAMPLED,
+        sampling_opt_in=lambda signal: signal.user_input.startswith("replay:"),
+    )
+
+    _compress(adapter, user_input="live")
+    _compress(adapter, user_input="live")
+    _compress(adapter, user_input="replay:1")
+    _compress(adapter, user_input="replay:1")
+
+    assert model.call_count == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.bypassed) == (1, 1, 2)
+
+
+def test_policy_cache_restores_decision() -> None:
+    policy = CountingPolicy()
+    adapter = CachingAgentPolicyAdapter(
+        policy,
+        cache=ModelResponseCache(),
+        model_parameters=_DETERMINISTIC,
+    )
+    arguments = {
+        "interaction_signal": TurnInteractionSignal(turn_id=2, user_input="次は？"),
+        "recent_dialogue_turns": (
+            RecentDialogueTurn(turn_id=1, user_input="q", assistant_response="a"),
+        ),
+        "committed_state": CompressedCognitiveState.empty(),
+        "role": "ops",
+        "tools": ("search",),
+    }
+
+    first = adapter.decide(**arguments)  # type: ignore[arg-type]
+    second = adapter.decide(**arguments)  # type: ignore[arg-type]
+
+    assert first == second == AgentDecision(response="ops:次は？", tool_actions=("use:search",))
+    assert policy.call_count == 1
+
+
+def test_memory_layer_evicts_least_recently_used_entry() -> None:
+    model = CountingCompressorModel()
+    adapter = CachingCognitiveCompressorModelAdapter(
+        model,
+        cache=ModelResponseCache(max_entries=1),
+        model_parameters=_DETERMINISTIC,
+    )
+
+    _compress(adapter, user_input="a")
+    _compress(adapter, user_input="b")
+    _compress(adapter, user_input="a")
+
+    assert model.call_count == 3
+
+
+def test_disk_layer_survives_new_cache_and_ignores_corrupt_entries(tmp_path: Path) -> None:
+    model = CountingCompressorModel()
+
+    def _adapter() -> CachingCognitiveCompressorModelAdapter:
+        return CachingCognitiveCompressorModelAdapter(
+            model,
+            cache=ModelResponseCache(directory=tmp_path),
+            model_parameters=_DETERMINISTIC,
+        )
+
+    _compress(_adapter())
+    restarted = _adapter()
+    assert _compress(restarted) == {"semantic_gist": "Nginx 502", "constraints": ["no_restart"]}
+    assert restarted.cache.stats().disk_hits == 1
+
+    for path in tmp_path.rglob("*.json"):
+        path.write_text("{broken", encoding="utf-8")
+    _compress(_adapter())
+    assert model.call_count == 2
+
+
+def test_cache_key_is_canonical() -> None:
+    assert cache_key("policy", {"a": (1, 2), "b": "x"}) == cache_key(
+        "policy",
+        {"b": "x", "a": [1, 2]},
+    )
+    assert cache_key("policy", {"a": 1}) != cache_key("compressor", {"a": 1})
+
+
+def test_streamed_policy_reply_shares_the_policy_cache() -> None:
+    policy = CountingPolicy()
+    cache = ModelResponseCache()
+    streaming = CachingStreamingAgentPolicyAdapter(
+        policy,
+        cache=cache,
+        model_parameters=_DETERMINISTIC,
+    )
+    batch = CachingAgentPolicyAdapter(policy, cache=cache, model_parameters=_DETERMINISTIC)
+    arguments = {
+        "interaction_signal": TurnInteractionSignal(turn_id=1, user_input="q"),
+        "recent_dialogue_turns": (),
+        "committed_state": CompressedCognitiveState.empty(),
+        "role": "ops",
+        "tools": (),
+    }
+
+    partial = streaming.stream_decide(**arguments)  # type: ignore[arg-type]
+    assert next(partial) == "ops:"
+    partial.close()  # type: ignore[attr-defined]
+    assert list(streaming.stream_decide(**arguments)) == ["ops:", "q"]  # type: ignore[arg-type]
+    assert list(streaming.stream_decide(**arguments)) == ["ops:q"]  # type: ignore[arg-type]
+    decision = batch.decide(**arguments)  # type: ignore[arg-type]
+
+    assert decision.response == "ops:q"
+    assert (policy.stream_count, policy.call_count) == (2, 0)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+
+
+def test_sampled_streamed_policy_reply_bypasses_the_cache() -> None:
+    policy = CountingPolicy()
+    cache = ModelResponseCache()
+    streaming = CachingStreamingAgentPolicyAdapter(policy, cache=cache, model_parameters=_SAMPLED)
+    arguments = {
+        "interaction_signal": TurnInteractionSignal(turn_id=1, user_input="q"),
+        "recent_dialogue_turns": (),
+        "committed_state": CompressedCognitiveState.empty(),
+        "role": "ops",
+        "tools": (),
+    }
+
+    for _ in range(2):
+        assert "".join(streaming.stream_decide(**arguments)) == "ops:q"  # type: ignore[arg-type]
+
+    assert policy.stream_count == 2
+    assert cache.stats().bypassed == 2
+
+
+def test_cached_payload_is_not_shared_with_callers() -> None:
+    adapter = CachingCognitiveCompressorModelAdapter(
+        CountingCompressorModel(),
+        cache=ModelResponseCache(),
+        model_parameters=_DETERMINISTIC,
+    )
+
+    first = _compress(adapter)
+    first["constraints"].append("tampered")  # type: ignore[attr-defined]
+    second = _compress(adapter)
+    second["constraints"].append("tampered")  # type: ignore[attr-defined]
+    third = _compress(adapter)
+
+    assert third == {"semantic_gist": "Nginx 502", "constraints": ["no_restart"]}
+    assert adapter.cache.stats().hits == 2
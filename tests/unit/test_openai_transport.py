@@ -0,0 +1,525 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from acc.adapters.outbound.openai_chat_adapters import (
+    AsyncOpenAIAgentPolicyAdapter,
+    AsyncOpenAICognitiveCompressorModelAdapter,
+    OpenAIAgentPolicyAdapter,
+    OpenAICognitiveCompressorModelAdapter,
+    OpenAIConfigurationError,
+    OpenAIFusedTurnModelAdapter,
+    OpenAIRequestError,
+)
+from acc.adapters.outbound.openai_transport import (
+    AsyncOpenAITransport,
+    InFlightLimiter,
+    OpenAITransport,
+    OpenAITransportConfig,
+)
+from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.services.ccs_schema import CCSValidationError
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+class _ResponsesStandInHandler(BaseHTTPRequestHandler):
+    """Responses API の `POST /v1/responses` と `GET /v1/models` だけを模すハンドラ。"""
+
+    protocol_version = "HTTP/1.1"
+    server: _ResponsesStandInServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        """モデル一覧を返す。"""
+        self.server.record(self.client_address, "GET", self.path)
+        self._send_json({"object": "list", "data": []})
+
+    def do_POST(self) -> None:  # noqa: N802
+        """入力に応じた固定テキストを返す。
+
+        `slow` / `wait` を含む入力は応答を遅らせ、`unavailable` を含む入力には 503 を返す。
+        `bad-field` を含む入力には episodic_trace が数値配列の CCS を返す。
+        応答形式が `fused_turn` のときは CCS を `next_state` に入れ、`response` と組にして返す。
+        """
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.record(self.client_address, "POST", self.path, body=body)
+        if "unavailable" in body["input"]:
+            self._send_json({"error": {"message": "overloaded"}}, status=503)
+            return
+        with self.server.track_active():
+            if "slow" in body["input"]:
+                time.sleep(1.0)
+            elif "wait" in body["input"]:
+                time.sleep(0.1)
+        state = {
+            "episodic_trace": [1] if "bad-field" in body["input"] else ["t1"],
+            "semantic_gist": "要約",
+            "focal_entities": [],
+            "relational_map": [],
+            "goal_orientation": "目的",
+            "constraints": [],
+            "predictive_cue": [],
+            "uncertainty_signal": "中",
+            "retrieved_artifacts": [],
+        }
+        if body.get("text", {}).get("format", {}).get("name") == "fused_turn":
+            text = json.dumps({"next_state": state, "response": "fused reply"}, ensure_ascii=False)
+        elif "Cognitive Compressor" in body["instructions"]:
+            text = json.dumps(state, ensure_ascii=False)
+        else:
+            text = f"reply via {body['model']}"
+        if body.get("stream"):
+            self._send_events(["  ", *text.split(" ")])
+            return
+        self._send_json(
+            {
+                "id": "resp_stub",
+                "object": "response",
+                "created_at": 0,
+                "status": "completed",
+                "model": body["model"],
+                "output": [
+                    {
+                        "type": "message",
+                        "id": "msg_stub",
+                        "status": "completed",
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": text, "annotations": []}],
+                    }
+                ],
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+            }
+        )
+
+    def log_message(self, format: str, *args: object) -> None:
+        """テスト出力を汚さないようにアクセスログを捨てる。"""
+        del format, args
+
+    def _send_events(self, words: list[str]) -> None:
+        """単語ごとの `response.output_text.delta` を chunked の SSE で返す。"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events: list[dict[str, object]] = [
+            {
+                "type": "response.output_text.delta",
+                "item_id": "msg_stub",
+                "output_index": 0,
+                "content_index": 0,
+                "delta": word if index < 2 else f" {word}",
+                "logprobs": [],
+                "sequence_number": index,
+            }
+            for index, word in enumerate(words)
+        ]
+        events.append({"type": "response.completed", "sequence_number": len(words)})
+        for event in events:
+            chunk = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, payload: dict[str, object], *, status: int = 200) -> None:
+        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+class _ResponsesStandInServer(ThreadingHTTPServer):
+    """受信したリクエストと接続元ポートを記録するスタブサーバ。"""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """空きポートで待ち受ける。"""
+        super().__init__(("127.0.0.1", 0), _ResponsesStandInHandler)
+        self.requests: list[tuple[str, str]] = []
+        self.bodies: list[dict[str, Any]] = []
+        self.client_ports: set[int] = set()
+        self.active_requests = 0
+        self.peak_active_requests = 0
+        self._record_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI クライアントに渡す base URL を返す。"""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/v1"
+
+    def record(
+        self,
+        client_address: tuple[str, int],
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+    ) -> None:
+        """リクエスト・接続元ポート・JSON 本文を記録する。"""
+        with self._record_lock:
+            self.requests.append((method, path))
+            if body is not None:
+                self.bodies.append(body)
+            self.client_ports.add(client_address[1])
+
+    @contextmanager
+    def track_active(self) -> Iterator[None]:
+        """処理中リクエスト数とその最大値を数える。"""
+        with self._record_lock:
+            self.active_requests += 1
+            self.peak_active_requests = max(self.peak_active_requests, self.active_requests)
+        try:
+            yield
+        finally:
+            with self._record_lock:
+                self.active_requests -= 1
+
+
+@pytest.fixture
+def responses_server() -> Iterator[_ResponsesStandInServer]:
+    server = _ResponsesStandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _transport(server: _ResponsesStandInServer) -> OpenAITransport:
+    return OpenAITransport(
+        OpenAITransportConfig(base_url=server.base_url, max_retries=0),
+        api_key="sk-test",
+    )
+
+
+def test_adapters_share_one_keep_alive_connection(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    transport = _transport(responses_server)
+    compressor = OpenAICognitiveCompressorModelAdapter(model="stub-ccm", transport=transport)
+    policy = OpenAIAgentPolicyAdapter(model="stub-policy", transport=transport)
+    signal = TurnInteractionSignal(turn_id=1, user_input="Nginx 502")
+
+    assert transport.warm_up()
+    for _ in range(2):
+        payload = compressor.generate_next_state_payload(
+            interaction_signal=signal,
+            committed_state=CompressedCognitiveState.empty(),
+            qualified_artifacts=(),
+        )
+        decision = policy.decide(
+            interaction_signal=signal,
+            recent_dialogue_turns=(),
+            committed_state=CompressedCognitiveState.empty(),
+            role="ops",
+            tools=(),
+        )
+    transport.close()
+
+    assert payload["semantic_gist"] == "要約"
+    assert decision.response == "reply via stub-policy"
+    assert responses_server.requests[0] == ("GET", "/v1/models")
+    assert responses_server.requests.count(("POST", "/v1/responses")) == 4
+    assert len(responses_server.client_ports) == 1
+
+
+def test_prompts_keep_stable_sections_first_and_forward_cache_key(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    transport = _transport(responses_server)
+    policy = OpenAIAgentPolicyAdapter(
+        model="stub", transport=transport, prompt_cache_key="acc-test"
+    )
+    state = CompressedCognitiveState(
+        episodic_trace=("t1: 502 を確認",),
+        semantic_gist="web-01 の 502 を調査中",
+        focal_entities=("web-01",),
+        relational_map=(),
+        goal_orientation="原因を特定する",
+        constraints=("本番変更は承認後",),
+        predictive_cue=(),
+        uncertainty_signal="中",
+        retrieved_artifacts=(),
+    )
+    previous_turn = RecentDialogueTurn(
+        turn_id=1, user_input="502 です", assistant_response="確認します"
+    )
+
+    for turn_id, history in ((2, (previous_turn,)), (3, (previous_turn,))):
+        policy.decide(
+            interaction_signal=TurnInteractionSignal(turn_id=turn_id, user_input=f"質問 {turn_id}"),
+            recent_dialogue_turns=history,
+            committed_state=state,
+            role="ops",
+            tools=(),
+        )
+    transport.close()
+
+    first, second = (body["input"] for body in responses_server.bodies)
+    assert all(body["prompt_cache_key"] == "acc-test" for body in responses_server.bodies)
+    payload = json.loads(first.split("\n")[3])
+    assert list(payload) == [
+        "role",
+        "committed_state",
+        "recent_dialogue_turns",
+        "interaction_signal",
+    ]
+    assert list(payload["committed_state"])[:2] == ["constraints", "goal_orientation"]
+    shared = next(
+        index
+        for index, (left, right) in enumerate(zip(first, second, strict=False))
+        if left != right
+    )
+    assert first[:shared].endswith('"interaction_signal":{"turn_id":')
+
+
+def test_compressor_schema_modes_send_strict_schema_and_validate_streamed_fields(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    transport = _transport(responses_server)
+    state = CompressedCognitiveState.empty()
+
+    def _generate(output_mode: str, user_input: str) -> Mapping[str, object]:
+        compressor = OpenAICognitiveCompressorModelAdapter(
+            model="stub", transport=transport, output_mode=output_mode
+        )
+        return compressor.generate_next_state_payload(
+            TurnInteractionSignal(turn_id=1, user_input=user_input), state, ()
+        )
+
+    assert _generate("schema", "hello")["semantic_gist"] == "要約"
+    assert _generate("schema_stream", "hello")["episodic_trace"] == ["t1"]
+    with pytest.raises(CCSValidationError, match="episodic_trace"):
+        _generate("schema_stream", "bad-field")
+    with pytest.raises(ValueError, match="output_mode"):
+        _generate("yaml", "hello")
+    transport.close()
+
+    text_format = responses_server.bodies[0]["text"]["format"]
+    assert text_format["type"] == "json_schema"
+    assert text_format["strict"] is True
+    assert text_format["schema"]["properties"]["episodic_trace"]["maxItems"] == 3
+    assert responses_server.bodies[1]["stream"] is True
+
+
+def test_fused_adapter_requests_state_and_reply_in_one_strict_schema(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    transport = _transport(responses_server)
+    fused = OpenAIFusedTurnModelAdapter(model="stub", transport=transport)
+
+    payload = fused.generate_fused_turn_payload(
+        interaction_signal=TurnInteractionSignal(turn_id=1, user_input="hello"),
+        committed_state=CompressedCognitiveState.empty(),
+        qualified_artifacts=(),
+        recent_dialogue_turns=(),
+        role="ops",
+        tools=(),
+    )
+    transport.close()
+
+    assert payload["response"] == "fused reply"
+    next_state = payload["next_state"]
+    assert isinstance(next_state, Mapping)
+    assert next_state["semantic_gist"] == "要約"
+    (body,) = responses_server.bodies
+    schema = body["text"]["format"]["schema"]
+    assert body["text"]["format"]["strict"] is True
+    assert schema["required"] == ["next_state", "response"]
+    assert schema["properties"]["next_state"]["additionalProperties"] is False
+    assert list(json.loads(body["input"].split("\n")[2])) == [
+        "role",
+        "previous_committed_state",
+        "interaction_signal",
+    ]
+
+
+def test_per_call_timeout_overrides_transport_default(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    transport = _transport(responses_server)
+    policy = OpenAIAgentPolicyAdapter(model="stub", transport=transport, timeout_seconds=0.2)
+
+    with pytest.raises(OpenAIRequestError, match="APITimeoutError"):
+        policy.decide(
+            interaction_signal=TurnInteractionSignal(turn_id=1, user_input="slow please"),
+            recent_dialogue_turns=(),
+            committed_state=CompressedCognitiveState.empty(),
+            role="ops",
+            tools=(),
+        )
+    transport.close()
+
+
+def test_policy_stream_yields_text_deltas_without_leading_whitespace(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    policy = OpenAIAgentPolicyAdapter(model="policy-model", transport=_transport(responses_server))
+
+    deltas = list(
+        policy.stream_decide(
+            TurnInteractionSignal(turn_id=1, user_input="hello"),
+            (),
+            CompressedCognitiveState.empty(),
+            "ops",
+            (),
+        )
+    )
+
+    assert deltas == ["reply", " via", " policy-model"]
+
+
+def test_upstream_errors_are_classified_as_retryable(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    policy = OpenAIAgentPolicyAdapter(model="policy-model", transport=_transport(responses_server))
+
+    with pytest.raises(OpenAIRequestError) as server_error:
+        policy.decide(
+            TurnInteractionSignal(turn_id=1, user_input="unavailable"),
+            (),
+            CompressedCognitiveState.empty(),
+            "ops",
+            (),
+        )
+    timeout_policy = OpenAIAgentPolicyAdapter(
+        model="policy-model",
+        transport=_transport(responses_server),
+        timeout_seconds=0.2,
+    )
+    with pytest.raises(OpenAIRequestError) as timeout_error:
+        timeout_policy.decide(
+            TurnInteractionSignal(turn_id=1, user_input="slow"),
+            (),
+            CompressedCognitiveState.empty(),
+            "ops",
+            (),
+        )
+
+    assert server_error.value.retryable is True
+    assert timeout_error.value.retryable is True
+
+
+def test_transport_requires_api_key_and_warm_up_does_not_raise(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    transport = OpenAITransport()
+
+    assert transport.warm_up() is False
+    with pytest.raises(OpenAIConfigurationError):
+        _ = transport.client
+
+
+def test_transport_config_rejects_inconsistent_pool_sizes() -> None:
+    with pytest.raises(ValueError, match="max_keepalive_connections"):
+        OpenAITransportConfig(max_connections=2, max_keepalive_connections=3)
+    with pytest.raises(ValueError, match="タイムアウト"):
+        OpenAITransportConfig(read_timeout_seconds=0)
+
+
+def _async_transport(
+    server: _ResponsesStandInServer,
+    *,
+    max_in_flight: int,
+) -> AsyncOpenAITransport:
+    return AsyncOpenAITransport(
+        OpenAITransportConfig(base_url=server.base_url, max_retries=0),
+        api_key="sk-test",
+        max_in_flight=max_in_flight,
+    )
+
+
+def test_async_adapters_cap_in_flight_requests(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    async def _run() -> tuple[list[str], int]:
+        transport = _async_transport(responses_server, max_in_flight=2)
+        policy = AsyncOpenAIAgentPolicyAdapter(model="stub-policy", transport=transport)
+        compressor = AsyncOpenAICognitiveCompressorModelAdapter(model="stub", transport=transport)
+        signal = TurnInteractionSignal(turn_id=1, user_input="wait a moment")
+        decisions = await asyncio.gather(
+            *(
+                policy.decide(
+                    interaction_signal=signal,
+                    recent_dialogue_turns=(),
+                    committed_state=CompressedCognitiveState.empty(),
+                    role="ops",
+                    tools=(),
+                )
+                for _ in range(6)
+            )
+        )
+        payload = await compressor.generate_next_state_payload(
+            interaction_signal=signal,
+            committed_state=CompressedCognitiveState.empty(),
+            qualified_artifacts=(),
+        )
+        assert payload["goal_orientation"] == "目的"
+        peak = transport.limiter.peak_in_flight
+        await transport.aclose()
+        return [decision.response for decision in decisions], peak
+
+    responses, peak_in_flight = asyncio.run(_run())
+
+    assert responses == ["reply via stub-policy"] * 6
+    assert peak_in_flight == 2
+    assert responses_server.peak_active_requests == 2
+
+
+def test_cancelled_async_call_releases_its_slot_immediately(
+    responses_server: _ResponsesStandInServer,
+) -> None:
+    async def _run() -> tuple[float, int]:
+        transport = _async_transport(responses_server, max_in_flight=1)
+        policy = AsyncOpenAIAgentPolicyAdapter(model="stub", transport=transport)
+        task = asyncio.create_task(
+            policy.decide(
+                interaction_signal=TurnInteractionSignal(turn_id=1, user_input="slow please"),
+                recent_dialogue_turns=(),
+                committed_state=CompressedCognitiveState.empty(),
+                role="ops",
+                tools=(),
+            )
+        )
+        await asyncio.sleep(0.2)
+        started = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        elapsed = time.perf_counter() - started
+        in_flight = transport.limiter.in_flight
+        await transport.aclose()
+        return elapsed, in_flight
+
+    elapsed, in_flight = asyncio.run(_run())
+
+    assert elapsed < 0.5
+    assert in_flight == 0
+
+
+def test_in_flight_limiter_rejects_a_second_event_loop() -> None:
+    limiter = InFlightLimiter(2)
+
+    async def _enter() -> None:
+        async with limiter:
+            pass
+
+    asyncio.run(_enter())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_enter())
+    assert limiter.in_flight == 0
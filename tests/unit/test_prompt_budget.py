@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from acc.adapters.outbound.openai_chat_adapters import OpenAIAgentPolicyAdapter
+from acc.adapters.outbound.openai_transport import OpenAITransport
+from acc.adapters.outbound.prompt_budget import (
+    JSONValue,
+    PromptBudget,
+    PromptBudgeter,
+    PromptSizeReport,
+)
+from acc.adapters.outbound.token_counters import HeuristicTokenCounterAdapter
+
+
+def test_empty_fields_are_dropped_and_json_is_compact() -> None:
+    reports: list[PromptSizeReport] = []
+    budgeter = PromptBudgeter(on_report=reports.append)
+
+    rendered = budgeter.render(
+        "policy",
+        {
+            "interaction_signal": {"turn_id": 0, "user_input": "状況は？", "focus_entities": []},
+            "role": "",
+            "tools": [],
+            "committed_state": {"semantic_gist": "要約", "constraints": [""], "flag": False},
+        },
+    )
+
+    assert rendered == (
+        '{"interaction_signal":{"turn_id":0,"user_input":"状況は？"},'
+        '"committed_state":{"semantic_gist":"要約","flag":false}}'
+    )
+    assert len(reports) == 1
+    assert reports[0].kind == "policy"
+    assert reports[0].truncated_sections == ()
+    assert reports[0].saved_tokens > 0
+    assert budgeter.stats().prompts == 1
+
+
+def test_artifacts_are_truncated_to_per_item_and_section_budgets() -> None:
+    counter = HeuristicTokenCounterAdapter()
+    budgeter = PromptBudgeter(
+        PromptBudget(artifact_tokens=200, artifacts_tokens=300),
+        token_counter=counter,
+    )
+    artifacts: list[JSONValue] = [
+        {"artifact_id": f"log-{index}", "content": f"HEAD{index} " + "x" * 4000 + f" TAIL{index}"}
+        for index in range(3)
+    ]
+
+    rendered = budgeter.render(
+        "compressor",
+        {"interaction_signal": {"user_input": "原因は？"}, "qualified_artifacts": artifacts},
+    )
+
+    payload = json.loads(rendered)
+    section = payload["qualified_artifacts"]
+    assert (
+        counter.count_tokens(json.dumps(section, ensure_ascii=False, separators=(",", ":"))) <= 300
+    )
+    for index, artifact in enumerate(section):
+        assert artifact["artifact_id"] == f"log-{index}"
+        assert counter.count_tokens(artifact["content"]) <= 200
+        assert artifact["content"].startswith(f"HEAD{index}")
+        assert "…[省略]…" in artifact["content"]
+    stats = budgeter.stats()
+    assert stats.truncated_prompts == 1
+    assert stats.saved_ratio > 0.8
+
+
+def test_dialogue_section_is_fitted_and_budget_changes_model_parameters() -> None:
+    budgeter = PromptBudgeter(PromptBudget(dialogue_tokens=100))
+    turns: list[JSONValue] = [
+        {"turn_id": 1, "user_input": "短い質問", "assistant_response": "y" * 2000},
+        {"turn_id": 2, "user_input": "次の質問", "assistant_response": "了解です"},
+    ]
+
+    rendered = budgeter.render("policy", {"recent_dialogue_turns": turns})
+
+    fitted = json.loads(rendered)["recent_dialogue_turns"]
+    assert [turn["turn_id"] for turn in fitted] == [1, 2]
+    assert fitted[1]["assistant_response"] == "了解です"
+    assert len(fitted[0]["assistant_response"]) < 2000
+
+    transport = OpenAITransport(api_key="sk-test")
+    default_adapter = OpenAIAgentPolicyAdapter(model="m", transport=transport)
+    tight_adapter = OpenAIAgentPolicyAdapter(
+        model="m", transport=transport, prompt_budgeter=budgeter
+    )
+    assert default_adapter.model_parameters != tight_adapter.model_parameters
+    transport.close()
+
+
+def test_budget_below_minimum_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        PromptBudget(artifact_tokens=4)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+
+import pytest
+
+from acc.adapters.outbound.openai_chat_adapters import (
+    OpenAIRequestError,
+    OpenAIResponseFormatError,
+)
+from acc.adapters.outbound.resilient_model_adapters import (
+    CircuitBreaker,
+    HedgePolicy,
+    ModelCallGuard,
+    ModelCircuitOpenError,
+    ResilientAgentPolicyAdapter,
+    ResilientCognitiveCompressorModelAdapter,
+    ResilientStreamingAgentPolicyAdapter,
+    RetryPolicy,
+)
+from acc.domain.entities.artifact import Artifact
+from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.ports.outbound.agent_policy_port import AgentPolicyPort, StreamingAgentPolicyPort
+from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+
+
+class FaultInjectingCompressorModel(CognitiveCompressorModelPort):
+    """指定した順に失敗または成功を返すテスト用モデル。"""
+
+    def __init__(self, outcomes: Sequence[Exception | None]) -> None:
+        """呼び出しごとの結果（None は成功）を受け取る。"""
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    def generate_next_state_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+    ) -> Mapping[str, object]:
+        del committed_state, qualified_artifacts
+        outcome = self._outcomes[min(self.calls, len(self._outcomes) - 1)]
+        self.calls += 1
+        if outcome is not None:
+            raise outcome
+        return {"semantic_gist": interaction_signal.user_input}
+
+
+class SlowFirstPolicy(AgentPolicyPort):
+    """1 回目の呼び出しだけ遅いテスト用ポリシー。"""
+
+    def __init__(self, first_call_seconds: float) -> None:
+        """1 回目の遅延秒数を受け取る。"""
+        self._first_call_seconds = first_call_seconds
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        del interaction_signal, recent_dialogue_turns, committed_state, role, tools
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+        if call_number == 1:
+            time.sleep(self._first_call_seconds)
+            return AgentDecision(response="primary")
+        return AgentDecision(response="hedge")
+
+
+class FaultInjectingStreamingPolicy(StreamingAgentPolicyPort):
+    """呼び出しごとに、指定した差分を返した後に指定した失敗を送出するテスト用ポリシー。"""
+
+    def __init__(self, outcomes: Sequence[tuple[tuple[str, ...], Exception | None]]) -> None:
+        """呼び出しごとの (差分, 最後に送出する失敗) を受け取る。"""
+        self._outcomes = list(outcomes)
+        self.calls = 0
+        self.closed = 0
+
+    def stream_decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> Iterator[str]:
+        del interaction_signal, recent_dialogue_turns, committed_state, role, tools
+        deltas, error = self._outcomes[min(self.calls, len(self._outcomes) - 1)]
+        self.calls += 1
+        try:
+            yield from deltas
+            if error is not None:
+                raise error
+        except GeneratorExit:
+            self.closed += 1
+            raise
+
+
+class FakeClock:
+    """手動で進めるテスト用時計。"""
+
+    def __init__(self) -> None:
+        """0 秒から始める。"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _transient() -> OpenAIRequestError:
+    return OpenAIRequestError("timeout", retryable=True)
+
+
+def _generate(adapter: CognitiveCompressorModelPort) -> Mapping[str, object]:
+    return adapter.generate_next_state_payload(
+        TurnInteractionSignal(turn_id=1, user_input="hello"),
+        CompressedCognitiveState.empty(),
+        (),
+    )
+
+
+def test_transient_failures_are_retried_with_capped_jittered_backoff() -> None:
+    model = FaultInjectingCompressorModel([_transient(), _transient(), None])
+    sleeps: list[float] = []
+    guard = ModelCallGuard(
+        retry=RetryPolicy(max_attempts=3, base_delay_seconds=0.1, max_delay_seconds=0.15),
+        sleep=sleeps.append,
+        rng=random.Random(7),
+    )
+
+    payload = _generate(ResilientCognitiveCompressorModelAdapter(model, guard=guard))
+
+    assert payload == {"semantic_gist": "hello"}
+    assert model.calls == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.1
+    assert 0 <= sleeps[1] <= 0.15
+    assert guard.stats().retries == 2
+    assert guard.breaker.state == "closed"
+
+
+def test_non_transient_failures_and_exhausted_retries_are_raised() -> None:
+    format_error = FaultInjectingCompressorModel([OpenAIResponseFormatError("broken")])
+    guard = ModelCallGuard(sleep=lambda _: None)
+    with pytest.raises(OpenAIResponseFormatError):
+        _generate(ResilientCognitiveCompressorModelAdapter(format_error, guard=guard))
+    assert format_error.calls == 1
+
+    always_down = FaultInjectingCompressorModel([_transient()])
+    with pytest.raises(OpenAIRequestError):
+        _generate(ResilientCognitiveCompressorModelAdapter(always_down, guard=guard))
+    assert always_down.calls == 3
+    assert guard.stats().failures == 2
+
+
+def test_open_circuit_fails_fast_and_recovers_through_one_probe() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10.0, clock=clock)
+    model = FaultInjectingCompressorModel([_transient(), _transient(), None])
+    adapter = ResilientCognitiveCompressorModelAdapter(
+        model,
+        guard=ModelCallGuard(
+            retry=RetryPolicy(max_attempts=1),
+            breaker=breaker,
+            sleep=lambda _: None,
+        ),
+    )
+
+    for _ in range(2):
+        with pytest.raises(OpenAIRequestError):
+            _generate(adapter)
+    with pytest.raises(ModelCircuitOpenError):
+        _generate(adapter)
+    assert model.calls == 2
+
+    clock.now = 10.0
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20.0
+    assert _generate(adapter) == {"semantic_gist": "hello"}
+    assert breaker.state == "closed"
+    assert adapter.guard.stats().short_circuits == 1
+
+
+def test_slow_call_is_hedged_and_the_faster_reply_wins() -> None:
+    policy = SlowFirstPolicy(first_call_seconds=1.0)
+    guard = ModelCallGuard(hedge=HedgePolicy(min_samples=20, initial_delay_seconds=0.05))
+    adapter = ResilientAgentPolicyAdapter(policy, guard=guard)
+
+    started = time.perf_counter()
+    decision = adapter.decide(
+        TurnInteractionSignal(turn_id=1, user_input="hello"),
+        (),
+        CompressedCognitiveState.empty(),
+        "ops",
+        (),
+    )
+    elapsed = time.perf_counter() - started
+    guard.close()
+
+    assert decision.response == "hedge"
+    assert elapsed < 0.5
+    stats = guard.stats()
+    assert (stats.hedges, stats.hedge_wins) == (1, 1)
+
+
+def _stream(adapter: StreamingAgentPolicyPort) -> Iterator[str]:
+    return adapter.stream_decide(
+        TurnInteractionSignal(turn_id=1, user_input="hello"),
+        (),
+        CompressedCognitiveState.empty(),
+        "ops",
+        (),
+    )
+
+
+def test_stream_retries_only_failures_before_the_first_delta() -> None:
+    policy = FaultInjectingStreamingPolicy(
+        [((), _transient()), (("he", "llo"), None), (("par",), _transient())]
+    )
+    guard = ModelCallGuard(sleep=lambda _: None)
+    adapter = ResilientStreamingAgentPolicyAdapter(policy, guard=guard)
+
+    assert list(_stream(adapter)) == ["he", "llo"]
+    assert policy.calls == 2
+
+    received: list[str] = []
+    with pytest.raises(OpenAIRequestError):
+        for delta in _stream(adapter):
+            received.append(delta)
+    assert received == ["par"]
+    assert policy.calls == 3
+    stats = guard.stats()
+    assert (stats.calls, stats.retries, stats.failures) == (2, 1, 1)
+
+
+def test_stream_honours_the_shared_breaker_and_closes_upstream_on_early_exit() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10.0, clock=FakeClock())
+    guard = ModelCallGuard(retry=RetryPolicy(max_attempts=1), breaker=breaker)
+    policy = FaultInjectingStreamingPolicy([(("a", "b"), None)])
+    adapter = ResilientStreamingAgentPolicyAdapter(policy, guard=guard)
+
+    stream = _stream(adapter)
+    assert next(stream) == "a"
+    stream.close()  # type: ignore[attr-defined]
+    assert policy.closed == 1
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    with pytest.raises(ModelCircuitOpenError):
+        next(_stream(adapter))
+    assert policy.calls == 1
+    assert guard.stats().short_circuits == 1
@@ -12,13 +12,22 @@ from acc.adapters.outbound.in_memory_acc_components import (
 )
 from acc.adapters.outbound.schema_aware_cognitive_compressor import (
     SchemaAwareCognitiveCompressorAdapter,
+    SchemaAwareFusedTurnAdapter,
 )
 from acc.application.use_cases.acc_multiturn_control_loop import ACCMultiturnControlLoop
 from acc.domain.entities.artifact import Artifact
-from acc.domain.entities.interaction import TurnInteractionSignal
-from acc.domain.services.ccs_schema import CCSValidationError, parse_and_validate_ccs_payload
+from acc.domain.entities.interaction import RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.services.ccs_schema import (
+    CCSRepair,
+    CCSValidationError,
+    build_ccs_validator,
+    parse_and_validate_ccs_payload,
+    repair_ccs_list_fields,
+)
+from acc.domain.services.compression_gate import CompressionGate
 from acc.domain.value_objects.ccs import CompressedCognitiveState
 from acc.ports.outbound.cognitive_compressor_model_port import CognitiveCompressorModelPort
+from acc.ports.outbound.fused_turn_model_port import FusedTurnModelPort
 
 
 def _valid_payload() -> dict[str, object]:
@@ -67,6 +76,55 @@ def test_parse_and_validate_payload_rejects_invalid_field_type() -> None:
         parse_and_validate_ccs_payload(payload)
 
 
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"episodic_trace": "t1"}, "episodic_trace は文字列配列である必要があります。"),
+        ({"focal_entities": ["nginx", 1]}, "focal_entities[1] は文字列である必要があります。"),
+        ({"constraints": ("ok", "  ")}, "constraints[1] は空文字にできません。"),
+        ({"semantic_gist": "  "}, "semantic_gist は空文字にできません。"),
+        ({"uncertainty_signal": None}, "uncertainty_signal は文字列である必要があります。"),
+        ({"episodic_trace": {"t1"}}, "episodic_trace は文字列配列である必要があります。"),
+    ],
+)
+def test_compiled_validator_keeps_error_messages(
+    overrides: dict[str, object],
+    message: str,
+) -> None:
+    payload = {**_valid_payload(), **overrides}
+
+    with pytest.raises(CCSValidationError) as compiled_error:
+        build_ccs_validator({"retrieved_artifacts": 2}).validate(payload)
+    with pytest.raises(CCSValidationError) as generic_error:
+        parse_and_validate_ccs_payload(payload, list_limits={"retrieved_artifacts": 2})
+
+    assert str(compiled_error.value) == str(generic_error.value) == message
+
+
+def test_compiled_validator_matches_generic_path_and_reports_missing_fields() -> None:
+    validator = build_ccs_validator({"episodic_trace": 1, "retrieved_artifacts": 2})
+    payload = {**_valid_payload(), "focal_entities": ("nginx", "nginx ", "upstream")}
+
+    assert validator.validate(payload) == parse_and_validate_ccs_payload(
+        payload, list_limits={"episodic_trace": 1, "retrieved_artifacts": 2}
+    )
+    assert validator.validate(payload).focal_entities == ("nginx", "nginx", "upstream")
+    assert build_ccs_validator() is build_ccs_validator(None)
+    with pytest.raises(
+        CCSValidationError,
+        match="必須フィールドが不足しています: semantic_gist, constraints$",
+    ):
+        validator.validate(
+            {
+                key: value
+                for key, value in _valid_payload().items()
+                if key not in {"semantic_gist", "constraints"}
+            }
+        )
+    with pytest.raises(CCSValidationError, match="上限値は 1 以上"):
+        build_ccs_validator({"predictive_cue": 0}).validate(_valid_payload())
+
+
 class DummyCompressorModel(CognitiveCompressorModelPort):
     """テスト用の固定 payload 返却モデル。"""
 
@@ -179,3 +237,316 @@ def test_schema_aware_compressor_runs_in_acc_loop() -> None:
     assert result.committed_state.semantic_gist == "mitigate 502 safely"
     assert result.committed_state.retrieved_artifacts == ("a1", "a2")
     assert len(memory.turn_records) == 1
+
+
+def _repair_previous_state() -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("turn:0:準備",),
+        semantic_gist="準備中",
+        focal_entities=("nginx",),
+        relational_map=(),
+        goal_orientation="502 を抑える",
+        constraints=("no_restart",),
+        predictive_cue=("check_upstream_latency",),
+        uncertainty_signal="中",
+        retrieved_artifacts=(),
+    )
+
+
+def test_repair_ccs_list_fields_coerces_drops_and_fills_from_previous() -> None:
+    payload = _valid_payload()
+    payload["constraints"] = "no_restart"
+    payload["focal_entities"] = ["nginx", " ", None, 443]
+    payload["relational_map"] = 7
+    del payload["predictive_cue"]
+
+    repaired, repairs = repair_ccs_list_fields(payload, previous_state=_repair_previous_state())
+
+    assert repaired["constraints"] == ["no_restart"]
+    assert repaired["focal_entities"] == ["nginx", "443"]
+    assert repaired["relational_map"] == ["7"]
+    assert repaired["predictive_cue"] == ["check_upstream_latency"]
+    assert repairs == (
+        CCSRepair(field_name="focal_entities", action="coerced_scalar"),
+        CCSRepair(field_name="focal_entities", action="dropped_item", count=2),
+        CCSRepair(field_name="relational_map", action="coerced_scalar"),
+        CCSRepair(field_name="constraints", action="coerced_scalar"),
+        CCSRepair(field_name="predictive_cue", action="filled_from_previous"),
+    )
+    untouched = _valid_payload()
+    assert repair_ccs_list_fields(untouched) == (untouched, ())
+
+
+def test_lenient_compressor_repairs_list_fields_and_reports_per_field_stats() -> None:
+    payload = _valid_payload()
+    payload["constraints"] = "no_restart"
+    payload["focal_entities"] = ["nginx", ""]
+    payload["semantic_gist"] = " "
+    del payload["predictive_cue"]
+    compressor = SchemaAwareCognitiveCompressorAdapter(
+        model=DummyCompressorModel(payload),
+        repair_mode="lenient",
+    )
+    interaction_signal = TurnInteractionSignal(turn_id=1, user_input="Nginx 502 を抑えたい")
+
+    next_state = compressor.commit_next_state(
+        interaction_signal=interaction_signal,
+        committed_state=_repair_previous_state(),
+        qualified_artifacts=(),
+    )
+
+    assert next_state.constraints == ("no_restart",)
+    assert next_state.focal_entities == ("nginx",)
+    assert next_state.predictive_cue == ("check_upstream_latency",)
+    stats = compressor.repair_stats()
+    assert (stats.validated_payloads, stats.repaired_payloads, stats.rejected_payloads) == (1, 1, 0)
+    assert stats.repair_rate == 1.0
+    assert stats.field_repairs == (
+        ("constraints", "coerced_scalar", 1),
+        ("focal_entities", "dropped_item", 1),
+        ("predictive_cue", "filled_from_previous", 1),
+        ("semantic_gist", "semantic_fallback", 1),
+    )
+
+    strict = SchemaAwareCognitiveCompressorAdapter(model=DummyCompressorModel(payload))
+    with pytest.raises(CCSValidationError, match="predictive_cue"):
+        strict.commit_next_state(
+            interaction_signal=interaction_signal,
+            committed_state=_repair_previous_state(),
+            qualified_artifacts=(),
+        )
+    assert strict.repair_stats().rejected_payloads == 1
+    with pytest.raises(ValueError, match="repair_mode"):
+        SchemaAwareCognitiveCompressorAdapter(model=DummyCompressorModel(payload), repair_mode="x")
+
+
+class DummyFusedTurnModel(FusedTurnModelPort):
+    """テスト用の固定 payload 返却 1 回呼び出しモデル。"""
+
+    def __init__(self, payload: dict[str, object]) -> None:
+        """返却 payload を受け取り初期化する。"""
+        self._payload = payload
+        self.call_count = 0
+
+    def generate_fused_turn_payload(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        committed_state: CompressedCognitiveState,
+        qualified_artifacts: Sequence[Artifact],
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        role: str,
+        tools: Sequence[str],
+    ) -> dict[str, object]:
+        del interaction_signal, committed_state, qualified_artifacts
+        del recent_dialogue_turns, role, tools
+        self.call_count += 1
+        return self._payload
+
+
+def _fused_loop(
+    fused_payload: dict[str, object],
+) -> tuple[ACCMultiturnControlLoop, DummyFusedTurnModel, DummyCompressorModel]:
+    memory = InMemoryArtifactMemory()
+    fused_model = DummyFusedTurnModel(fused_payload)
+    compressor_model = DummyCompressorModel(_valid_payload())
+    loop = ACCMultiturnControlLoop(
+        artifact_recall=InMemoryArtifactRecallAdapter(memory),
+        artifact_qualification=TokenOverlapQualificationAdapter(),
+        cognitive_compressor=SchemaAwareCognitiveCompressorAdapter(model=compressor_model),
+        agent_policy=EchoAgentPolicyAdapter(),
+        evidence_store=InMemoryEvidenceStoreAdapter(memory),
+        fused_turn=SchemaAwareFusedTurnAdapter(fused_model, list_limits={"retrieved_artifacts": 2}),
+    )
+    return loop, fused_model, compressor_model
+
+
+def test_fused_turn_commits_validated_state_and_reply_in_one_call() -> None:
+    loop, fused_model, compressor_model = _fused_loop(
+        {"next_state": _valid_payload(), "response": " 1 行目\n2 行目 "}
+    )
+
+    result = loop.run_turn(
+        interaction_signal=TurnInteractionSignal(turn_id=1, user_input="502 の対処は？"),
+        committed_state=CompressedCognitiveState.empty(),
+    )
+
+    assert fused_model.call_count == 1
+    assert compressor_model.call_count == 0
+    assert result.committed_state.semantic_gist == "mitigate 502 safely"
+    assert result.committed_state.retrieved_artifacts == ("a1", "a2")
+    assert result.decision.response == "1 行目\n2 行目"
+
+
+@pytest.mark.parametrize(
+    "fused_payload",
+    [
+        {"next_state": {**_valid_payload(), "constraints": "no_restart"}, "response": "回答"},
+        {"next_state": _valid_payload(), "response": "  "},
+        {"next_state": "not-an-object", "response": "回答"},
+    ],
+)
+def test_fused_turn_falls_back_to_two_calls_when_output_is_rejected(
+    fused_payload: dict[str, object],
+) -> None:
+    loop, fused_model, compressor_model = _fused_loop(fused_payload)
+
+    result = loop.run_turn(
+        interaction_signal=TurnInteractionSignal(turn_id=1, user_input="502 の対処は？"),
+        committed_state=CompressedCognitiveState.empty(),
+    )
+
+    assert fused_model.call_count == 1
+    assert compressor_model.call_count == 1
+    assert result.committed_state.constraints == ("no_restart", "safe_change")
+    assert result.decision.response
+
+
+def _gated_previous_state() -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("turn:1:Nginx 502 を抑えたい",),
+        semantic_gist="Nginx 502 を再起動なしで抑える",
+        focal_entities=("nginx", "upstream"),
+        relational_map=("http2 有効化後に 502 増加",),
+        goal_orientation="502 発生率を下げる",
+        constraints=("no_restart",),
+        predictive_cue=("upstream latency を確認する",),
+        uncertainty_signal="中",
+        retrieved_artifacts=("a1",),
+    )
+
+
+@pytest.mark.parametrize(
+    ("signal", "artifact_ids", "expected"),
+    [
+        (TurnInteractionSignal(turn_id=2, user_input="ok, thanks!"), (), (False, "no_content")),
+        (TurnInteractionSignal(turn_id=2, user_input="了解です"), ("a1",), (False, "no_content")),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="nginx の upstream をもう一度"),
+            (),
+            (False, "low_novelty"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="PostgreSQL の接続数も見たい"),
+            (),
+            (True, "novel_content"),
+        ),
+        (TurnInteractionSignal(turn_id=2, user_input="ok"), ("a9",), (True, "new_artifact")),
+        (
+            TurnInteractionSignal(
+                turn_id=2, user_input="やっぱりやめて、さいきどうはしないでください"
+            ),
+            (),
+            (True, "constraint_marker"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="いいえ、ちがいます"),
+            (),
+            (True, "constraint_marker"),
+        ),
+        (TurnInteractionSignal(turn_id=2, user_input="no"), (), (True, "constraint_marker")),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="No thanks"),
+            (),
+            (True, "constraint_marker"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="Nope."),
+            (),
+            (True, "constraint_marker"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="nginx はあとでみます？"),
+            (),
+            (True, "uncertainty_marker"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="それはまだあとにしましょう"),
+            (),
+            (True, "uncounted_content"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="はい、ありがとうございます！"),
+            (),
+            (False, "no_content"),
+        ),
+        (
+            TurnInteractionSignal(turn_id=2, user_input="ok", active_constraints=("safe_change",)),
+            (),
+            (True, "structured_signal"),
+        ),
+    ],
+)
+def test_compression_gate_uses_novelty_and_artifacts(
+    signal: TurnInteractionSignal,
+    artifact_ids: tuple[str, ...],
+    expected: tuple[bool, str],
+) -> None:
+    artifacts = tuple(
+        Artifact(
+            artifact_id=artifact_id,
+            content="log",
+            source="incident-log",
+            created_at=datetime(2026, 2, 8, 12, 0, tzinfo=UTC),
+        )
+        for artifact_id in artifact_ids
+    )
+
+    decision = CompressionGate().evaluate(signal, _gated_previous_state(), artifacts)
+
+    assert (decision.should_compress, decision.reason) == expected
+
+
+def test_compression_gate_always_compresses_initial_state() -> None:
+    decision = CompressionGate().evaluate(
+        TurnInteractionSignal(turn_id=1, user_input="ok"),
+        CompressedCognitiveState.empty(),
+        (),
+    )
+
+    assert decision.should_compress
+    assert decision.reason == "initial_state"
+
+
+def test_gated_compressor_carries_state_forward_and_records_savings() -> None:
+    model = DummyCompressorModel(_valid_payload())
+    ticks = iter([0.0, 1.5])
+    compressor = SchemaAwareCognitiveCompressorAdapter(
+        model=model,
+        gate=CompressionGate(),
+        clock=lambda: next(ticks),
+    )
+    previous_state = _gated_previous_state()
+
+    compressed = compressor.commit_next_state(
+        interaction_signal=TurnInteractionSignal(turn_id=2, user_input="PostgreSQL も確認したい"),
+        committed_state=previous_state,
+        qualified_artifacts=(),
+    )
+    carried = compressor.commit_next_state(
+        interaction_signal=TurnInteractionSignal(turn_id=3, user_input="ありがとう、OK です"),
+        committed_state=compressed,
+        qualified_artifacts=(),
+    )
+
+    assert model.call_count == 1
+    assert carried is compressed
+    stats = compressor.gate_stats()
+    assert stats.evaluated_turns == 2
+    assert stats.skip_rate == 0.5
+    assert stats.skip_reasons == (("no_content", 1),)
+    assert stats.estimated_saved_seconds == 1.5
+    assert stats.estimated_saved_input_tokens > 0
+
+
+def test_ungated_compressor_reports_no_evaluated_turns() -> None:
+    model = DummyCompressorModel(_valid_payload())
+    compressor = SchemaAwareCognitiveCompressorAdapter(model=model)
+
+    compressor.commit_next_state(
+        interaction_signal=TurnInteractionSignal(turn_id=1, user_input="ok"),
+        committed_state=_gated_previous_state(),
+        qualified_artifacts=(),
+    )
+
+    stats = compressor.gate_stats()
+    assert (stats.evaluated_turns, stats.model_calls, stats.skip_rate) == (0, 1, 0.0)
@@ -0,0 +1,284 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from acc.adapters.outbound.in_memory_acc_components import SimpleCognitiveCompressorAdapter
+from acc.application.services.session_registry import SessionIdleSweeper, StripedSessionRegistry
+from acc.application.use_cases.chat_session import ChatSessionNotFoundError, ChatSessionUseCase
+from acc.domain.entities.interaction import AgentDecision, RecentDialogueTurn, TurnInteractionSignal
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+class InFlightTrackingPolicyAdapter:
+    """セッションごとの同時実行数を記録するテスト用 policy。"""
+
+    def __init__(self) -> None:
+        """計測領域を初期化する。"""
+        self._lock = threading.Lock()
+        self._in_flight_by_session: dict[str, int] = defaultdict(int)
+        self.max_in_flight_same_session = 0
+        self.max_in_flight_total = 0
+        self._in_flight_total = 0
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        del recent_dialogue_turns, role, tools
+        session_key = interaction_signal.user_input.split(":", 1)[0]
+        with self._lock:
+            self._in_flight_by_session[session_key] += 1
+            self._in_flight_total += 1
+            self.max_in_flight_same_session = max(
+                self.max_in_flight_same_session,
+                self._in_flight_by_session[session_key],
+            )
+            self.max_in_flight_total = max(self.max_in_flight_total, self._in_flight_total)
+        time.sleep(0.001)
+        with self._lock:
+            self._in_flight_by_session[session_key] -= 1
+            self._in_flight_total -= 1
+        return AgentDecision(
+            response=f"{session_key}:{interaction_signal.turn_id}:{committed_state.semantic_gist}"
+        )
+
+
+class RendezvousPolicyAdapter:
+    """2 セッションのターンが同時に進行できるかを確かめるテスト用 policy。"""
+
+    def __init__(self) -> None:
+        """待ち合わせ用バリアを初期化する。"""
+        self.barrier = threading.Barrier(2, timeout=2.0)
+
+    def decide(
+        self,
+        interaction_signal: TurnInteractionSignal,
+        recent_dialogue_turns: Sequence[RecentDialogueTurn],
+        committed_state: CompressedCognitiveState,
+        role: str,
+        tools: Sequence[str],
+    ) -> AgentDecision:
+        del recent_dialogue_turns, committed_state, role, tools
+        self.barrier.wait()
+        return AgentDecision(response=f"turn={interaction_signal.turn_id}")
+
+
+def test_turns_are_serialized_per_session_under_heavy_load() -> None:
+    policy = InFlightTrackingPolicyAdapter()
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=policy,
+        short_history_turns=3,
+    )
+    session_ids = [use_case.create_session() for _ in range(8)]
+    messages_per_session = 40
+
+    def _send(session_index: int, message_index: int) -> tuple[str, int]:
+        session_id = session_ids[session_index]
+        reply = use_case.send_message(
+            session_id=session_id,
+            message=f"s{session_index}:message-{message_index}",
+        )
+        return session_id, reply.turn_id
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [
+            executor.submit(_send, session_index, message_index)
+            for message_index in range(messages_per_session)
+            for session_index in range(len(session_ids))
+        ]
+        results = [future.result() for future in futures]
+
+    turn_ids_by_session: dict[str, list[int]] = defaultdict(list)
+    for session_id, turn_id in results:
+        turn_ids_by_session[session_id].append(turn_id)
+
+    assert policy.max_in_flight_same_session == 1
+    assert policy.max_in_flight_total > 1
+    for session_id in session_ids:
+        assert sorted(turn_ids_by_session[session_id]) == list(range(1, messages_per_session + 1))
+
+
+def test_unrelated_sessions_do_not_block_each_other() -> None:
+    policy = RendezvousPolicyAdapter()
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=policy,
+        session_lock_stripes=1,
+    )
+    first_session = use_case.create_session()
+    second_session = use_case.create_session()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(use_case.send_message, session_id=first_session, message="a")
+        second = executor.submit(use_case.send_message, session_id=second_session, message="b")
+
+        assert first.result(timeout=5).turn_id == 1
+        assert second.result(timeout=5).turn_id == 1
+
+
+def test_concurrent_session_creation_respects_max_sessions() -> None:
+    registry: StripedSessionRegistry[int] = StripedSessionRegistry(max_sessions=50, stripe_count=8)
+
+    def _register_many(worker_index: int) -> int:
+        evicted_count = 0
+        for item_index in range(200):
+            evicted = registry.register(f"{worker_index}-{item_index}", item_index)
+            evicted_count += len(evicted)
+        return evicted_count
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        total_evicted = sum(executor.map(_register_many, range(16)))
+
+    assert len(registry) == 50
+    assert total_evicted == 16 * 200 - 50
+
+
+def test_registry_rejects_duplicate_and_reports_missing_session() -> None:
+    registry: StripedSessionRegistry[str] = StripedSessionRegistry(max_sessions=2)
+    registry.register("a", "session-a")
+
+    with pytest.raises(ValueError, match="重複"):
+        registry.register("a", "session-a2")
+    assert registry.lease("missing") is None
+    assert registry.remove("a") is True
+    assert registry.remove("a") is False
+    assert "a" not in registry
+
+
+class ManualClock:
+    """テストから進める単調時計。"""
+
+    def __init__(self) -> None:
+        """時刻 0 から開始する。"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_capacity_eviction_drops_least_recently_used_session() -> None:
+    clock = ManualClock()
+    registry: StripedSessionRegistry[str] = StripedSessionRegistry(
+        max_sessions=2,
+        stripe_count=4,
+        clock=clock,
+    )
+    registry.register("busy", "busy-session")
+    clock.now = 1.0
+    registry.register("idle", "idle-session")
+    clock.now = 2.0
+    lease = registry.lease("busy")
+    assert lease is not None
+    with lease as session:
+        assert session == "busy-session"
+
+    clock.now = 3.0
+    evicted = registry.register("new", "new-session")
+
+    assert evicted == ("idle",)
+    assert "busy" in registry
+    assert registry.metrics().evicted_by_capacity == 1
+
+
+def test_capacity_eviction_follows_global_access_order_across_stripes() -> None:
+    clock = ManualClock()
+    registry: StripedSessionRegistry[str] = StripedSessionRegistry(
+        max_sessions=6,
+        stripe_count=8,
+        clock=clock,
+    )
+    for index in range(6):
+        registry.register(f"s{index}", f"session-{index}")
+    for index in (3, 0, 5):
+        lease = registry.lease(f"s{index}")
+        assert lease is not None
+    assert registry.remove("s1")
+
+    evicted = [
+        evicted_id
+        for index in range(5)
+        for evicted_id in registry.register(f"new{index}", f"new-session-{index}")
+    ]
+
+    assert evicted == ["s2", "s4", "s3", "s0"]
+    assert len(registry) == 6
+
+
+def test_idle_ttl_expires_on_lease_and_background_sweep() -> None:
+    clock = ManualClock()
+    evicted_reasons: list[tuple[str, str]] = []
+    registry: StripedSessionRegistry[str] = StripedSessionRegistry(
+        max_sessions=10,
+        idle_ttl_seconds=5.0,
+        on_evict=lambda session_id, _, reason: evicted_reasons.append((session_id, reason)),
+        clock=clock,
+    )
+    registry.register("a", "session-a")
+    registry.register("b", "session-b")
+    clock.now = 4.0
+    assert registry.lease("b") is not None
+
+    clock.now = 6.0
+    assert registry.lease("a") is None
+    assert registry.evict_idle() == ()
+    clock.now = 10.0
+    assert registry.evict_idle() == ("b",)
+
+    assert evicted_reasons == [("a", "idle_ttl"), ("b", "idle_ttl")]
+    assert registry.metrics().evicted_by_idle_ttl == 2
+    assert len(registry) == 0
+
+
+def test_idle_sweeper_thread_evicts_expired_sessions() -> None:
+    clock = ManualClock()
+    evicted = threading.Event()
+    registry: StripedSessionRegistry[str] = StripedSessionRegistry(
+        max_sessions=10,
+        idle_ttl_seconds=1.0,
+        on_evict=lambda *_: evicted.set(),
+        clock=clock,
+    )
+    registry.register("a", "session-a")
+    clock.now = 5.0
+    sweeper = SessionIdleSweeper(registry, interval_seconds=0.01)
+    sweeper.start()
+    try:
+        assert evicted.wait(timeout=2.0)
+    finally:
+        sweeper.stop(timeout=2.0)
+
+    assert "a" not in registry
+
+
+def test_byte_budget_evicts_least_recent_session_by_artifact_memory_size() -> None:
+    use_case = ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=InFlightTrackingPolicyAdapter(),
+        max_session_bytes=1_000,
+    )
+    first_session = use_case.create_session()
+    second_session = use_case.create_session()
+
+    use_case.send_message(session_id=first_session, message=f"s1:{'x' * 80}")
+    use_case.send_message(session_id=first_session, message=f"s1:{'x' * 80}")
+    assert use_case.session_metrics().evicted_by_byte_budget == 0
+
+    use_case.send_message(session_id=second_session, message=f"s2:{'y' * 200}")
+    use_case.send_message(session_id=second_session, message=f"s2:{'z' * 200}")
+
+    metrics = use_case.session_metrics()
+    assert metrics.evicted_by_byte_budget == 1
+    assert metrics.active_sessions == 1
+    assert 0 < metrics.total_bytes <= 1_000
+    assert use_case.send_message(session_id=second_session, message="s2:again").turn_id == 3
+    with pytest.raises(ChatSessionNotFoundError):
+        use_case.send_message(session_id=first_session, message="s1:again")
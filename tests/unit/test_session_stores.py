@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import socketserver
+import struct
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from acc.adapters.outbound.ccs_binary_codec import encode_session_snapshot_delta
+from acc.adapters.outbound.in_memory_acc_components import (
+    EchoAgentPolicyAdapter,
+    SimpleCognitiveCompressorAdapter,
+)
+from acc.adapters.outbound.session_stores import (
+    RedisSessionStoreAdapter,
+    SessionStoreError,
+    SQLiteSessionStoreAdapter,
+    build_session_store,
+)
+from acc.application.use_cases.chat_session import (
+    ChatReply,
+    ChatSessionConflictError,
+    ChatSessionNotFoundError,
+    ChatSessionUseCase,
+)
+from acc.domain.entities.interaction import RecentDialogueTurn
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+from acc.domain.value_objects.session_snapshot import SessionSnapshot
+from acc.ports.outbound.session_store_port import SessionStoreConflictError, SessionStorePort
+
+
+class _RespStandInHandler(socketserver.StreamRequestHandler):
+    """GET/SET/APPEND/EXPIRE/DEL/SELECT/PING と WATCH/MULTI/EXEC を解釈するハンドラ。"""
+
+    server: _RespStandInServer
+
+    def handle(self) -> None:
+        watched: dict[bytes, int] = {}
+        queued: list[list[bytes]] | None = None
+        while True:
+            header = self.rfile.readline()
+            if not header:
+                return
+            arguments = []
+            for _ in range(int(header[1:-2])):
+                length = int(self.rfile.readline()[1:-2])
+                arguments.append(self.rfile.read(length + 2)[:-2])
+            command = arguments[0].upper()
+            with self.server.lock:
+                if command == b"WATCH":
+                    watched.update((key, self.server.revision(key)) for key in arguments[1:])
+                    reply = b"+OK\r\n"
+                elif command == b"UNWATCH":
+                    watched.clear()
+                    reply = b"+OK\r\n"
+                elif command == b"MULTI":
+                    queued = []
+                    reply = b"+OK\r\n"
+                elif command == b"EXEC" and queued is not None:
+                    if any(self.server.revision(key) != seen for key, seen in watched.items()):
+                        reply = b"*-1\r\n"
+                    else:
+                        replies = [self.server.dispatch(queued_args) for queued_args in queued]
+                        reply = b"*%d\r\n" % len(replies) + b"".join(replies)
+                    watched.clear()
+                    queued = None
+                elif queued is not None:
+                    queued.append(arguments)
+                    reply = b"+QUEUED\r\n"
+                else:
+                    reply = self.server.dispatch(arguments)
+            self.wfile.write(reply)
+
+
+class _RespStandInServer(socketserver.ThreadingTCPServer):
+    """テスト用のインプロセス Redis 代替サーバ。"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        """ループバックの空きポートで待ち受ける。"""
+        super().__init__(("127.0.0.1", 0), _RespStandInHandler)
+        self.values: dict[bytes, bytes] = {}
+        self.expirations: dict[bytes, int] = {}
+        self.commands: list[bytes] = []
+        self.lock = threading.Lock()
+        self._revisions: dict[bytes, int] = {}
+
+    def revision(self, key: bytes) -> int:
+        return self._revisions.get(key, 0)
+
+    def dispatch(self, arguments: list[bytes]) -> bytes:
+        command = arguments[0].upper()
+        self.commands.append(command)
+        if command in (b"SET", b"APPEND", b"DEL"):
+            for key in arguments[1:] if command == b"DEL" else arguments[1:2]:
+                self._revisions[key] = self.revision(key) + 1
+        if command == b"PING":
+            return b"+PONG\r\n"
+        if command == b"SELECT":
+            return b"+OK\r\n"
+        if command == b"GET":
+            value = self.values.get(arguments[1])
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            self.values[arguments[1]] = arguments[2]
+            if len(arguments) == 5 and arguments[3].upper() == b"EX":
+                self.expirations[arguments[1]] = int(arguments[4])
+            else:
+                self.expirations.pop(arguments[1], None)
+            return b"+OK\r\n"
+        if command == b"APPEND":
+            self.values[arguments[1]] = self.values.get(arguments[1], b"") + arguments[2]
+            return b":%d\r\n" % len(self.values[arguments[1]])
+        if command == b"EXPIRE":
+            self.expirations[arguments[1]] = int(arguments[2])
+            return b":1\r\n"
+        if command == b"DEL":
+            removed = [self.values.pop(key, None) for key in arguments[1:]]
+            return b":%d\r\n" % sum(value is not None for value in removed)
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def resp_server() -> Iterator[_RespStandInServer]:
+    server = _RespStandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _sample_snapshot() -> SessionSnapshot:
+    return SessionSnapshot(
+        committed_state=CompressedCognitiveState(
+            episodic_trace=("t1: 要件を確認",),
+            semantic_gist="API 設計の相談",
+            focal_entities=("API",),
+            relational_map=("API -> DB",),
+            goal_orientation="設計を固める",
+            constraints=("後方互換",),
+            predictive_cue=("スキーマ案を出す",),
+            uncertainty_signal="low",
+            retrieved_artifacts=("artifact-1",),
+        ),
+        turn_id=3,
+        recent_dialogue_turns=(
+            RecentDialogueTurn(turn_id=3, user_input="こんにちは", assistant_response="はい"),
+        ),
+    )
+
+
+def test_sqlite_store_round_trips_snapshot_across_connections(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.sqlite3"
+    store = SQLiteSessionStoreAdapter(path)
+    store.save("s1", SessionSnapshot.initial())
+    store.save("s1", _sample_snapshot())
+    store.close()
+
+    reopened = SQLiteSessionStoreAdapter(path)
+    assert reopened.load("s1") == _sample_snapshot()
+    assert reopened.load("missing") is None
+    reopened.delete("s1")
+    assert reopened.load("s1") is None
+
+
+def test_redis_store_round_trips_snapshot_with_ttl(resp_server: _RespStandInServer) -> None:
+    host, port = resp_server.server_address[:2]
+    store = RedisSessionStoreAdapter(host=str(host), port=int(port), db=2, ttl_seconds=60)
+
+    store.save("s1", _sample_snapshot())
+
+    assert store.load("s1") == _sample_snapshot()
+    assert resp_server.expirations == {b"acc:session:s1": 60, b"acc:session:s1:turn_id": 60}
+    assert resp_server.commands[0] == b"SELECT"
+    store.delete("s1")
+    assert store.load("s1") is None
+    assert resp_server.values == {}
+    store.close()
+
+
+def test_redis_store_reconnects_after_server_side_disconnect(
+    resp_server: _RespStandInServer,
+) -> None:
+    host, port = resp_server.server_address[:2]
+    store = RedisSessionStoreAdapter(host=str(host), port=int(port))
+    store.save("s1", _sample_snapshot())
+    store._connection._socket.close()  # type: ignore[union-attr]
+
+    assert store.load("s1") == _sample_snapshot()
+
+
+def test_redis_store_reports_unreachable_server() -> None:
+    store = RedisSessionStoreAdapter(host="127.0.0.1", port=1, socket_timeout_seconds=0.2)
+
+    with pytest.raises(SessionStoreError):
+        store.load("s1")
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def shared_store(request: pytest.FixtureRequest, tmp_path: Path) -> SessionStorePort:
+    if request.param == "sqlite":
+        return SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    server: _RespStandInServer = request.getfixturevalue("resp_server")
+    host, port = server.server_address[:2]
+    return RedisSessionStoreAdapter(host=str(host), port=int(port))
+
+
+def test_store_save_compare_and_sets_turn_id(shared_store: SessionStorePort) -> None:
+    with pytest.raises(SessionStoreConflictError):
+        shared_store.save("s1", SessionSnapshot.initial(), expected_turn_id=0)
+    shared_store.save("s1", SessionSnapshot.initial())
+    shared_store.save("s1", _sample_snapshot(), expected_turn_id=0)
+
+    with pytest.raises(SessionStoreConflictError):
+        shared_store.save("s1", SessionSnapshot.initial(), expected_turn_id=0)
+    assert shared_store.load("s1") == _sample_snapshot()
+
+
+def test_build_session_store_parses_urls(tmp_path: Path) -> None:
+    assert isinstance(
+        build_session_store(f"sqlite:///{tmp_path / 'a.sqlite3'}"),
+        SQLiteSessionStoreAdapter,
+    )
+    assert isinstance(build_session_store("redis://localhost:6380/1"), RedisSessionStoreAdapter)
+    with pytest.raises(ValueError, match="未対応"):
+        build_session_store("memcached://localhost")
+
+
+def _build_use_case(
+    store: SessionStorePort,
+    *,
+    flush_turns: int = 1,
+    max_sessions: int = 200,
+) -> ChatSessionUseCase:
+    return ChatSessionUseCase(
+        cognitive_compressor=SimpleCognitiveCompressorAdapter(),
+        agent_policy=EchoAgentPolicyAdapter(),
+        max_sessions=max_sessions,
+        session_store=store,
+        session_store_flush_turns=flush_turns,
+    )
+
+
+def test_session_hydrates_lazily_in_another_worker(tmp_path: Path) -> None:
+    store = SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    first_worker = _build_use_case(store)
+    session_id = first_worker.create_session()
+    first_worker.send_message(session_id=session_id, message="最初の質問")
+    first_worker.send_message(session_id=session_id, message="次の質問")
+
+    second_worker = _build_use_case(store)
+    reply = second_worker.send_message(session_id=session_id, message="別ワーカーから")
+
+    assert reply.turn_id == 3
+    snapshot = store.load(session_id)
+    assert snapshot is not None
+    assert snapshot.turn_id == 3
+    assert [turn.turn_id for turn in snapshot.recent_dialogue_turns] == [2, 3]
+    with pytest.raises(ChatSessionNotFoundError):
+        second_worker.send_message(session_id="missing", message="x")
+
+
+def test_write_back_defers_saves_until_flush_threshold_or_eviction(tmp_path: Path) -> None:
+    store = SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    use_case = _build_use_case(store, flush_turns=3, max_sessions=1)
+    session_id = use_case.create_session()
+
+    use_case.send_message(session_id=session_id, message="one")
+    use_case.send_message(session_id=session_id, message="two")
+    assert store.load(session_id) == SessionSnapshot.initial()
+
+    use_case.send_message(session_id=session_id, message="three")
+    use_case.send_message(session_id=session_id, message="four")
+    snapshot = store.load(session_id)
+    assert snapshot is not None and snapshot.turn_id == 3
+
+    use_case.create_session()
+    snapshot = store.load(session_id)
+    assert snapshot is not None and snapshot.turn_id == 4
+    assert use_case.send_message(session_id=session_id, message="five").turn_id == 5
+
+
+def test_close_flushes_pending_sessions(tmp_path: Path) -> None:
+    store = SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    use_case = _build_use_case(store, flush_turns=10)
+    session_id = use_case.create_session()
+    use_case.send_message(session_id=session_id, message="one")
+
+    use_case.close()
+
+    snapshot = store.load(session_id)
+    assert snapshot is not None and snapshot.turn_id == 1
+
+
+def test_sqlite_store_rejects_payload_not_in_binary_format(tmp_path: Path) -> None:
+    store = SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    store._connection.execute(
+        "INSERT INTO chat_sessions (session_id, turn_id, payload) VALUES (?, ?, ?)",
+        ("json", 3, b'{"version": 1, "turn_id": 3}'),
+    )
+
+    with pytest.raises(SessionStoreError, match="復元"):
+        store.load("json")
+
+
+def _turn_snapshot(turn_id: int) -> SessionSnapshot:
+    base = _sample_snapshot()
+    return SessionSnapshot(
+        committed_state=CompressedCognitiveState(
+            episodic_trace=(*base.committed_state.episodic_trace, f"t{turn_id}"),
+            semantic_gist=f"gist {turn_id}",
+            focal_entities=base.committed_state.focal_entities,
+            relational_map=base.committed_state.relational_map,
+            goal_orientation=base.committed_state.goal_orientation,
+            constraints=base.committed_state.constraints,
+            predictive_cue=base.committed_state.predictive_cue,
+            uncertainty_signal=base.committed_state.uncertainty_signal,
+            retrieved_artifacts=base.committed_state.retrieved_artifacts,
+        ),
+        turn_id=turn_id,
+        recent_dialogue_turns=base.recent_dialogue_turns,
+    )
+
+
+def test_sqlite_delta_frames_are_folded_on_load_and_compacted(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.sqlite3"
+    store = SQLiteSessionStoreAdapter(path, delta_frames_per_snapshot=2)
+    for turn_id in range(1, 4):
+        store.save("s1", _turn_snapshot(turn_id))
+
+    def _delta_rows() -> int:
+        return int(
+            store._connection.execute("SELECT COUNT(*) FROM chat_session_deltas").fetchone()[0]
+        )
+
+    assert _delta_rows() == 2
+    assert SQLiteSessionStoreAdapter(path).load("s1") == _turn_snapshot(3)
+    store.save("s1", _turn_snapshot(4))
+    assert _delta_rows() == 0
+    assert SQLiteSessionStoreAdapter(path).load("s1") == _turn_snapshot(4)
+
+
+def test_redis_delta_log_appends_frames_and_refreshes_ttl(
+    resp_server: _RespStandInServer,
+) -> None:
+    host, port = resp_server.server_address[:2]
+    store = RedisSessionStoreAdapter(
+        host=str(host),
+        port=int(port),
+        ttl_seconds=30,
+        delta_frames_per_snapshot=8,
+    )
+    store.save("s1", _turn_snapshot(1))
+    full_size = len(resp_server.values[b"acc:session:s1"])
+    store.save("s1", _turn_snapshot(2))
+
+    appended = len(resp_server.values[b"acc:session:s1"]) - full_size
+    assert 0 < appended < full_size // 2
+    assert resp_server.commands[-3:] == [b"APPEND", b"EXPIRE", b"SET"]
+    reader = RedisSessionStoreAdapter(host=str(host), port=int(port))
+    assert reader.load("s1") == _turn_snapshot(2)
+
+
+def test_workers_without_affinity_reload_instead_of_overwriting_newer_turns(
+    shared_store: SessionStorePort,
+) -> None:
+    first_worker = _build_use_case(shared_store)
+    second_worker = _build_use_case(shared_store)
+    session_id = first_worker.create_session()
+
+    first_worker.send_message(session_id=session_id, message="alpha")
+    second_worker.send_message(session_id=session_id, message="beta")
+    reply = first_worker.send_message(session_id=session_id, message="gamma")
+
+    assert reply.turn_id == 3
+    snapshot = shared_store.load(session_id)
+    assert snapshot is not None and snapshot.turn_id == 3
+    assert [turn.user_input for turn in snapshot.recent_dialogue_turns] == ["beta", "gamma"]
+
+
+def test_stale_streamed_turn_is_rejected_and_the_next_turn_reloads(tmp_path: Path) -> None:
+    store = SQLiteSessionStoreAdapter(tmp_path / "sessions.sqlite3")
+    first_worker = _build_use_case(store)
+    second_worker = _build_use_case(store)
+    session_id = first_worker.create_session()
+    first_worker.send_message(session_id=session_id, message="alpha")
+    second_worker.send_message(session_id=session_id, message="beta")
+
+    with pytest.raises(ChatSessionConflictError):
+        list(first_worker.stream_message(session_id=session_id, message="gamma"))
+
+    snapshot = store.load(session_id)
+    assert snapshot is not None and snapshot.turn_id == 2
+    events = list(first_worker.stream_message(session_id=session_id, message="gamma"))
+    assert isinstance(events[-1], ChatReply) and events[-1].turn_id == 3
+
+
+def test_redis_delta_is_not_appended_over_another_workers_write(
+    resp_server: _RespStandInServer,
+) -> None:
+    host, port = resp_server.server_address[:2]
+    first, second = (
+        RedisSessionStoreAdapter(host=str(host), port=int(port), delta_frames_per_snapshot=8)
+        for _ in range(2)
+    )
+    first.save("s1", _turn_snapshot(1))
+    assert second.load("s1") == _turn_snapshot(1)
+    second.save("s1", _turn_snapshot(2))
+
+    # first の基準（turn 1）は古いので、差分ではなく全量で書き直す。
+    first.save("s1", _turn_snapshot(3))
+
+    assert resp_server.commands.count(b"APPEND") == 1
+    assert RedisSessionStoreAdapter(host=str(host), port=int(port)).load("s1") == _turn_snapshot(3)
+    with pytest.raises(SessionStoreConflictError):
+        second.save("s1", _turn_snapshot(3), expected_turn_id=2)
+
+
+def test_redis_delta_log_rejects_frame_with_mismatched_base(
+    resp_server: _RespStandInServer,
+) -> None:
+    host, port = resp_server.server_address[:2]
+    store = RedisSessionStoreAdapter(host=str(host), port=int(port), delta_frames_per_snapshot=8)
+    store.save("s1", _turn_snapshot(1))
+    stale_delta = encode_session_snapshot_delta(_turn_snapshot(2), _turn_snapshot(3))
+    resp_server.values[b"acc:session:s1"] += struct.pack("<I", len(stale_delta)) + stale_delta
+
+    with pytest.raises(SessionStoreError, match="差分"):
+        store.load("s1")
+
+
+def test_sqlite_delta_is_not_appended_over_another_workers_write(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.sqlite3"
+    first = SQLiteSessionStoreAdapter(path, delta_frames_per_snapshot=8)
+    second = SQLiteSessionStoreAdapter(path, delta_frames_per_snapshot=8)
+    first.save("s1", _turn_snapshot(1))
+    assert second.load("s1") == _turn_snapshot(1)
+    second.save("s1", _turn_snapshot(2))
+
+    first.save("s1", _turn_snapshot(3))
+
+    assert SQLiteSessionStoreAdapter(path).load("s1") == _turn_snapshot(3)
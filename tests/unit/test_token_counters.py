@@ -0,0 +1,96 @@
+from collections.abc import Sequence
+from dataclasses import replace
+
+import pytest
+
+from acc.adapters.outbound import token_counters
+from acc.adapters.outbound.token_counters import (
+    HeuristicTokenCounterAdapter,
+    TiktokenTokenCounterAdapter,
+    TokenizerUnavailableError,
+    build_token_counter,
+)
+from acc.application.services.ccs_token_accounting import CCSTokenAccountant
+from acc.domain.value_objects.ccs import CompressedCognitiveState
+
+
+class FakeBPEEncoding:
+    """空白区切りで token 化するテスト用 encoding。"""
+
+    def encode_ordinary(self, text: str) -> Sequence[int]:
+        return [len(token) for token in text.split()]
+
+
+class CountingTokenCounter:
+    """計測対象テキストを記録するテスト用 counter。"""
+
+    def __init__(self) -> None:
+        """記録領域を初期化する。"""
+        self.counted_texts: list[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        self.counted_texts.append(text)
+        return len(text)
+
+
+def _state() -> CompressedCognitiveState:
+    return CompressedCognitiveState(
+        episodic_trace=("turn:1:Nginx 502 の緩和策を教えて",),
+        semantic_gist="Nginx 502 を抑制しつつ原因確認",
+        focal_entities=("nginx", "upstream"),
+        relational_map=("http2有効化後に502増加",),
+        goal_orientation="障害影響を最小化する",
+        constraints=("営業時間中は再起動しない",),
+        predictive_cue=("upstream latency を確認する",),
+        uncertainty_signal="中",
+        retrieved_artifacts=("turn-evidence-1-1",),
+    )
+
+
+def test_heuristic_counter_weights_japanese_higher_than_character_quarter() -> None:
+    counter = HeuristicTokenCounterAdapter()
+    japanese = "営業時間中は再起動しない"
+
+    assert counter.count_tokens("") == 0
+    assert counter.count_tokens("   ") == 0
+    assert counter.count_tokens("hello world") == 4
+    assert counter.count_tokens(japanese) > len(japanese) // 4
+    assert counter.count_tokens(japanese) == 11
+
+
+def test_tiktoken_counter_uses_injected_encoding() -> None:
+    counter = TiktokenTokenCounterAdapter(encoding=FakeBPEEncoding())
+
+    assert counter.count_tokens("a bb ccc") == 3
+    assert counter.count_tokens("") == 0
+
+
+def test_build_token_counter_falls_back_to_heuristic(monkeypatch) -> None:
+    def _unavailable(encoding_name: str) -> FakeBPEEncoding:
+        raise TokenizerUnavailableError(encoding_name)
+
+    monkeypatch.setattr(token_counters, "_load_tiktoken_encoding", _unavailable)
+
+    assert isinstance(build_token_counter("auto"), HeuristicTokenCounterAdapter)
+    assert isinstance(build_token_counter("heuristic"), HeuristicTokenCounterAdapter)
+    with pytest.raises(TokenizerUnavailableError):
+        build_token_counter("tiktoken")
+    with pytest.raises(ValueError, match="モード"):
+        build_token_counter("unknown")
+
+
+def test_accountant_recounts_only_changed_fields() -> None:
+    counter = CountingTokenCounter()
+    accountant = CCSTokenAccountant(counter)
+    state = _state()
+
+    first_total = accountant.count(state)
+    first_call_count = len(counter.counted_texts)
+    next_state = replace(state, semantic_gist="upstream を確認する")
+    second_total = accountant.count(next_state)
+
+    assert first_call_count == 10
+    assert counter.counted_texts[first_call_count:] == ["upstream を確認する"]
+    assert second_total == first_total - len(state.semantic_gist) + len("upstream を確認する")
+    assert accountant.count(next_state) == second_total
+    assert len(counter.counted_texts) == first_call_count + 1